@@ -7,8 +7,8 @@ from pathlib import Path
 from typing import Literal
 
 from nwave_ai.doctor.context import DoctorContext
-from nwave_ai.doctor.formatter import render_human, render_json
-from nwave_ai.doctor.runner import run_doctor
+from nwave_ai.doctor.formatter import render_human, render_json, render_timings
+from nwave_ai.doctor.runner import run_doctor_cached
 from scripts.install.attribution_utils import (
     install_attribution_hook,
     read_attribution_preference,
@@ -323,25 +323,33 @@ def _handle_attribution(args: list[str]) -> int:
 
 
 def _handle_doctor(args: list[str]) -> int:
-    """Handle 'doctor [--json] [--fix] [--help]' subcommand."""
+    """Handle 'doctor [--json] [--no-cache] [--timings] [--fix] [--help]' subcommand."""
     json_output = False
     fix = False
+    no_cache = False
+    timings = False
 
     for arg in args:
         if arg in ("--help", "-h"):
-            print("Usage: nwave-ai doctor [--json] [--fix]")
+            print("Usage: nwave-ai doctor [--json] [--no-cache] [--timings] [--fix]")
             print()
             print("Run diagnostic checks on the nWave installation.")
             print()
             print("Options:")
-            print("  --json    Emit JSON output instead of human-readable text.")
-            print("  --fix     Attempt to fix detected issues (not yet implemented).")
-            print("  --help    Show this message and exit.")
+            print("  --json      Emit JSON output instead of human-readable text.")
+            print("  --no-cache  Run every check even if the install is unchanged.")
+            print("  --timings   Report how long each check took (implies --no-cache).")
+            print("  --fix       Attempt to fix detected issues (not yet implemented).")
+            print("  --help      Show this message and exit.")
             return 0
         elif arg == "--json":
             json_output = True
         elif arg == "--fix":
             fix = True
+        elif arg == "--no-cache":
+            no_cache = True
+        elif arg == "--timings":
+            timings = True
         else:
             print(f"Unknown option for doctor: {arg}", file=sys.stderr)
             print("Run 'nwave-ai doctor --help' for usage.", file=sys.stderr)
@@ -355,12 +363,16 @@ def _handle_doctor(args: list[str]) -> int:
         return 2
 
     context = DoctorContext.from_defaults()
-    results = run_doctor(context)
+    # Cached results carry no durations, so --timings always runs the checks
+    results = run_doctor_cached(context, refresh=no_cache or timings)
 
     if json_output:
-        print(render_json(results))
+        print(render_json(results, timings=timings))
     else:
         print(render_human(results))
+        if timings:
+            print()
+            print(render_timings(results))
 
     if any(not r.passed for r in results):
         return 1
@@ -442,12 +454,20 @@ def _handle_migrate_feature(args: list[str]) -> int:
 
 def _handle_validate_feature_delta(args: list[str]) -> int:
     """Handle 'validate-feature-delta <path> [--warn-only|--enforce] [--maturity-manifest <path>]'."""
-    from nwave_ai.feature_delta.cli import validate_feature_delta_command
+    from nwave_ai.feature_delta.cli import (
+        _is_batch,
+        _parse_jobs,
+        validate_feature_delta_command,
+        validate_feature_deltas_command,
+    )
 
     if not args or args[0] in ("--help", "-h"):
         print("Usage: nwave-ai validate-feature-delta <path> [--warn-only | --enforce]")
+        print("       nwave-ai validate-feature-delta <path|glob>... [--jobs N]")
         print()
         print("Validate a feature-delta.md file for cross-wave drift.")
+        print("Several paths or quoted glob patterns validate every match in one")
+        print("run; the exit code is the worst file's.")
         print()
         print("Options:")
         print("  --warn-only            (default) Exit 0 even when violations found.")
@@ -461,6 +481,10 @@ def _handle_validate_feature_delta(args: list[str]) -> int:
         print(
             "  --maturity-manifest    Path to rule maturity manifest (overrides default)."
         )
+        print(
+            "  --jobs N               Worker processes for several files (default: CPUs)."
+        )
+        print("  --no-cache             Revalidate files unchanged since the last run.")
         print()
         print("Exit codes:")
         print("  0   No violations (or warn-only mode — violations non-blocking)")
@@ -474,6 +498,8 @@ def _handle_validate_feature_delta(args: list[str]) -> int:
     fmt = "human"
     maturity_manifest_path: Path | None = None
     extra_rules: set[str] = set()
+    jobs_arg: str | None = None
+    use_cache = True
     cleaned: list[str] = []
     i = 0
     while i < len(args):
@@ -495,11 +521,24 @@ def _handle_validate_feature_delta(args: list[str]) -> int:
             i += 1
         elif token.startswith("--rule="):
             extra_rules.add(token[len("--rule=") :].upper())
+        elif token == "--jobs" and i + 1 < len(args):
+            jobs_arg = args[i + 1]
+            i += 1
+        elif token.startswith("--jobs="):
+            jobs_arg = token[len("--jobs=") :]
+        elif token == "--no-cache":
+            use_cache = False
         else:
             cleaned.append(token)
         i += 1
 
-    if not cleaned:
+    jobs = _parse_jobs(jobs_arg) if jobs_arg is not None else None
+    if jobs_arg is not None and jobs is None:
+        print(
+            f"ERROR: --jobs expects a positive integer, got '{jobs_arg}'",
+            file=sys.stderr,
+        )
+    if not cleaned or (jobs_arg is not None and jobs is None):
         print(
             "Usage: nwave-ai validate-feature-delta <path> [--warn-only | --enforce] [--format=json]",
             file=sys.stderr,
@@ -507,6 +546,16 @@ def _handle_validate_feature_delta(args: list[str]) -> int:
         return 2
 
     enabled_rules = frozenset(extra_rules) if extra_rules else None
+    if _is_batch(cleaned, jobs):
+        return validate_feature_deltas_command(
+            cleaned,
+            mode=mode,
+            fmt=fmt,
+            maturity_manifest_path=maturity_manifest_path,
+            enabled_rules=enabled_rules,
+            jobs=jobs,
+            use_cache=use_cache,
+        )
     return validate_feature_delta_command(
         cleaned[0],
         mode=mode,
@@ -0,0 +1,44 @@
+"""Shared helper to replace a file's content atomically.
+
+Mirrors des.domain.atomic_write for the nwave_ai caches (doctor results,
+feature-delta batch reports): DES is deployed as its own tree under
+~/.claude/lib/python, so nwave_ai cannot import it. write_atomic writes the
+new content to a temporary sibling file and renames it over the target, so a
+reader sees either the old or the new content, never a partial write.
+
+Behavior contract:
+- The temporary file is ``.<name>.<pid>.tmp`` in the target's directory (the
+  rename stays on one filesystem)
+- On any failure the temporary file is removed and the error re-raised; the
+  target is left untouched
+- The parent directory must already exist
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_atomic(path: Path, content: str | bytes) -> None:
+    """Replace the content of ``path`` with ``content`` (str as UTF-8).
+
+    Raises:
+        OSError: If the content cannot be written or renamed into place
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if isinstance(content, bytes):
+            tmp.write_bytes(content)
+        else:
+            tmp.write_text(content, encoding="utf-8")
+        tmp.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        raise
@@ -5,7 +5,7 @@ preflight layer and the doctor diagnostic command share the same type without
 a cross-boundary import.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -21,6 +21,10 @@ class CheckResult:
         message: Human-readable description of the check result.
         remediation: Instructions to fix the issue (None if passed).
         check_name: Identifier of the check that produced this result (set by runner).
+        timed_out: Whether the check was abandoned at its deadline (set by runner).
+        duration_seconds: Wall-clock time the check took (set by runner; None
+            when the result was not measured, e.g. reused from a cache).
+            Not part of equality.
     """
 
     passed: bool
@@ -28,6 +32,8 @@ class CheckResult:
     message: str
     remediation: str | None
     check_name: str = ""
+    timed_out: bool = False
+    duration_seconds: float | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         if self.passed and self.error_code is not None:
@@ -0,0 +1,132 @@
+"""Doctor result cache keyed by an install fingerprint.
+
+The SessionStart substrate probe runs the full doctor suite on every new
+session. FrameworkFilesCheck alone walks every .md file under
+~/.claude/agents and ~/.claude/skills, and three checks parse settings.json.
+The results only change when the installation does, so they are stored in
+~/.nwave/doctor-cache.json together with a fingerprint of what the checks
+read:
+
+- size, mtime and mode of settings.json, the install manifest
+  (nwave-manifest.txt, rewritten by every install), the DES lib, the
+  agents/, skills/ and bin/ directories, each des-* shim and the global config
+- the Python version and executable, and the PATH used to resolve binaries
+- the names of the registered checks
+
+A stored result is reused while the fingerprint matches and it is younger
+than MAX_AGE_SECONDS. The age limit bounds what the fingerprint cannot see
+cheaply, such as a hook interpreter deleted outside nWave or a skill file
+edited in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nwave_ai.common.atomic_write import write_atomic
+from nwave_ai.common.check_result import CheckResult
+from nwave_ai.doctor.checks.shims_deployed import EXPECTED_SHIMS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nwave_ai.doctor.context import DoctorContext
+
+
+CACHE_RELATIVE_PATH = Path(".nwave") / "doctor-cache.json"
+MAX_AGE_SECONDS = 24 * 60 * 60
+
+_VERSION = 1
+
+
+def cache_path(context: DoctorContext) -> Path:
+    """Return the cache file for the installation described by *context*."""
+    return context.home_dir / CACHE_RELATIVE_PATH
+
+
+def _stat_entry(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, stat.st_mode]
+
+
+def install_fingerprint(context: DoctorContext, check_names: Iterable[str]) -> str:
+    """Return a digest of everything the doctor checks depend on.
+
+    Costs a few stat() calls; never reads or walks the installation.
+    """
+    claude_dir = context.claude_dir
+    des_lib = claude_dir / "lib" / "python" / "des"
+    paths = [
+        context.settings_path,
+        claude_dir / "nwave-manifest.txt",
+        des_lib,
+        des_lib / "domain",
+        claude_dir / "agents",
+        claude_dir / "skills",
+        claude_dir / "bin",
+        *(claude_dir / "bin" / shim for shim in EXPECTED_SHIMS),
+        context.home_dir / ".nwave" / "global-config.json",
+    ]
+    material = {
+        "paths": [[str(path), _stat_entry(path)] for path in paths],
+        "python": [sys.version, sys.executable],
+        "env_path": os.environ.get("PATH", ""),
+        "checks": list(check_names),
+    }
+    encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_cached_results(
+    context: DoctorContext, fingerprint: str
+) -> list[CheckResult] | None:
+    """Return stored results for *fingerprint*, or None if stale or unusable."""
+    try:
+        data = json.loads(cache_path(context).read_text(encoding="utf-8"))
+        if (
+            data.get("version") != _VERSION
+            or data.get("fingerprint") != fingerprint
+            or time.time() - float(data["created_at"]) > MAX_AGE_SECONDS
+        ):
+            return None
+        return [CheckResult(**result) for result in data["results"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_results(
+    context: DoctorContext, fingerprint: str, results: list[CheckResult]
+) -> None:
+    """Store *results* for *fingerprint* (write to tmp, then rename).
+
+    Raises:
+        OSError: If the cache cannot be written
+    """
+    path = cache_path(context)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": _VERSION,
+        "fingerprint": fingerprint,
+        "created_at": time.time(),
+        "results": [
+            {
+                "passed": r.passed,
+                "error_code": r.error_code,
+                "message": r.message,
+                "remediation": r.remediation,
+                "check_name": r.check_name,
+            }
+            for r in results
+        ],
+    }
+    write_atomic(path, json.dumps(payload, indent=2))
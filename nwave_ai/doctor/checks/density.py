@@ -87,6 +87,7 @@ class DensityCheck:
     description: str = (
         "Documentation density resolved from global config (D6 + D12 cascade)"
     )
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return a CheckResult capturing the resolved density and provenance.
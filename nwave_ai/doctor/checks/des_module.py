@@ -22,6 +22,7 @@ class DesModuleCheck:
 
     name: str = "des_module"
     description: str = "DES module (des.domain) is present under ~/.claude/lib/python"
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when des.domain is findable in the context lib/python path.
@@ -46,6 +46,7 @@ class FrameworkFilesCheck:
     description: str = (
         "Framework directories (agents/, skills/) exist and are populated"
     )
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when every required directory contains >= 1 .md file (recursive).
@@ -93,6 +93,7 @@ class HookPythonPathCheck:
 
     name: str = "hook_python_path"
     description: str = "Python binary referenced in hook commands is resolvable"
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when every hook binary is resolvable.
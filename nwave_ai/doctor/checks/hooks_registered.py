@@ -26,6 +26,7 @@ class HooksRegisteredCheck:
 
     name: str = "hooks_registered"
     description: str = "All 5 required hook types are registered in settings.json"
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when all required hook type keys are present.
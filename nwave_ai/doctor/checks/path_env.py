@@ -17,6 +17,7 @@ class PathEnvCheck:
 
     name: str = "path_env"
     description: str = "$HOME/.claude/bin is included in env.PATH in settings.json"
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when claude_dir/bin is a member of env.PATH entries.
@@ -17,6 +17,7 @@ class PythonVersionCheck:
 
     name: str = "python_version"
     description: str = "Python interpreter version is 3.10 or newer"
+    blocking_io: bool = False
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when sys.version_info >= (3, 10).
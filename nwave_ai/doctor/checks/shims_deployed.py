@@ -26,6 +26,7 @@ class ShimsDeployedCheck:
 
     name: str = "shims_deployed"
     description: str = "All 5 des-* shim scripts exist and are executable in ~/.claude/bin/"
+    blocking_io: bool = True
 
     def run(self, context: DoctorContext) -> CheckResult:
         """Return passed=True when all shims are present and executable.
@@ -2,6 +2,7 @@
 
 Step 01-01: stubs returning empty string / empty JSON object.
 Step 01-03: implement render_human (emoji-prefixed lines) and render_json (stable structure).
+render_timings() and render_json(timings=True) report per-check durations.
 """
 
 from __future__ import annotations
@@ -45,29 +46,63 @@ def render_human(results: list[CheckResult]) -> str:
     return "\n".join(lines)
 
 
-def render_json(results: list[CheckResult]) -> str:
+def _duration_ms(result: CheckResult) -> float | None:
+    if result.duration_seconds is None:
+        return None
+    return round(result.duration_seconds * 1000, 1)
+
+
+def render_timings(results: list[CheckResult]) -> str:
+    """Render per-check durations as an aligned text table.
+
+    One line per check in registration order: "<ms> ms  <check_name>",
+    with "(timed out)" appended to checks abandoned at their deadline and
+    "-" for results that were not measured.
+
+    Args:
+        results: Ordered list of CheckResult objects from run_doctor().
+
+    Returns:
+        Multi-line string headed by "Timings:".
+    """
+    lines = ["Timings:"]
+    for result in results:
+        ms = _duration_ms(result)
+        duration = "-" if ms is None else f"{ms:.1f}"
+        suffix = " (timed out)" if result.timed_out else ""
+        lines.append(f"  {duration:>9} ms  {result.check_name}{suffix}")
+    return "\n".join(lines)
+
+
+def render_json(results: list[CheckResult], *, timings: bool = False) -> str:
     """Render check results as a JSON string.
 
     Structure: {"checks": [{"name", "passed", "message", "remediation"}],
                 "summary": {"total", "passed", "failed"}}.
+    With timings=True each check also carries "duration_ms" and "timed_out".
 
     Args:
         results: Ordered list of CheckResult objects from run_doctor().
+        timings: Include per-check durations.
 
     Returns:
         JSON string with stable keys.
     """
+    checks: list[dict[str, object]] = []
+    for r in results:
+        check: dict[str, object] = {
+            "name": r.check_name,
+            "passed": r.passed,
+            "message": r.message,
+            "remediation": r.remediation,
+        }
+        if timings:
+            check["duration_ms"] = _duration_ms(r)
+            check["timed_out"] = r.timed_out
+        checks.append(check)
     return json.dumps(
         {
-            "checks": [
-                {
-                    "name": r.check_name,
-                    "passed": r.passed,
-                    "message": r.message,
-                    "remediation": r.remediation,
-                }
-                for r in results
-            ],
+            "checks": checks,
             "summary": {
                 "total": len(results),
                 "passed": sum(1 for r in results if r.passed),
@@ -2,12 +2,25 @@
 
 Step 01-01: stub returning empty list.
 Step 01-03: wire 7 checks in fixed order; annotate results with check_name.
+run_doctor_cached() reuses results stored for an unchanged installation
+(see nwave_ai.doctor.cache).
+
+Checks that declare blocking_io run concurrently, each on its own daemon
+thread with its own deadline: one check stalled on a slow filesystem no
+longer holds up the others, and is reported as timed out instead of hanging
+the report (or the SessionStart substrate probe). Daemon threads are used
+rather than a ThreadPoolExecutor because pool workers are joined at
+interpreter exit, which would turn an abandoned check back into a hang.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Protocol
 
+from nwave_ai.common.check_result import CheckResult
+from nwave_ai.doctor import cache
 from nwave_ai.doctor.checks.density import DensityCheck
 from nwave_ai.doctor.checks.des_module import DesModuleCheck
 from nwave_ai.doctor.checks.framework_files import FrameworkFilesCheck
@@ -19,14 +32,22 @@ from nwave_ai.doctor.checks.shims_deployed import ShimsDeployedCheck
 
 
 if TYPE_CHECKING:
-    from nwave_ai.common.check_result import CheckResult
     from nwave_ai.doctor.context import DoctorContext
 
 
+CHECK_TIMEOUT_SECONDS = 5.0
+
+
 class _DiagnosticCheck(Protocol):
-    """Structural type for all diagnostic check classes."""
+    """Structural type for all diagnostic check classes.
+
+    blocking_io declares whether run() touches the filesystem or other
+    processes; such checks run concurrently under a deadline, the rest run
+    inline on the calling thread.
+    """
 
     name: str
+    blocking_io: bool
 
     def run(self, context: DoctorContext) -> CheckResult: ...
 
@@ -43,20 +64,110 @@ _CHECKS: list[_DiagnosticCheck] = [
 ]
 
 
-def run_doctor(context: DoctorContext) -> list[CheckResult]:
+def _execute(
+    check: _DiagnosticCheck, context: DoctorContext, outcome: dict[str, Any]
+) -> None:
+    """Run *check*, storing its result (or exception) and duration in *outcome*."""
+    start = time.perf_counter()
+    try:
+        outcome["result"] = check.run(context)
+    except BaseException as exc:
+        outcome["error"] = exc
+    finally:
+        outcome["seconds"] = time.perf_counter() - start
+
+
+def _timed_out_result(timeout: float) -> CheckResult:
+    return CheckResult(
+        passed=False,
+        error_code="CHECK_TIMED_OUT",
+        message=f"Check did not finish within {timeout:g}s",
+        remediation=(
+            "Re-run `nwave-ai doctor --no-cache`. If the check keeps timing out,\n"
+            "look for a slow or unresponsive filesystem under ~/.claude."
+        ),
+        timed_out=True,
+        duration_seconds=timeout,
+    )
+
+
+def run_doctor(
+    context: DoctorContext, *, timeout: float = CHECK_TIMEOUT_SECONDS
+) -> list[CheckResult]:
     """Run all doctor checks and return results in registration order.
 
-    Each CheckResult is annotated with the originating check's name attribute.
+    Checks declaring blocking_io start together on daemon threads; each
+    gets *timeout* seconds from its start. A check still running at its
+    deadline is abandoned and reported as a timed_out CheckResult. Each
+    CheckResult is annotated with the originating check's name attribute and
+    its duration.
 
     Args:
         context: Filesystem roots for this run (injected for testability).
+        timeout: Per-check deadline in seconds for blocking_io checks.
 
     Returns:
         Ordered list of CheckResult objects, one per check.
     """
-    results: list[CheckResult] = []
+    pending: list[tuple[_DiagnosticCheck, threading.Thread | None, dict, float]] = []
     for check in _CHECKS:
-        result = check.run(context)
+        outcome: dict[str, Any] = {}
+        thread = None
+        if check.blocking_io:
+            thread = threading.Thread(
+                target=_execute,
+                args=(check, context, outcome),
+                name=f"nwave-doctor-{check.name}",
+                daemon=True,
+            )
+            thread.start()
+        pending.append((check, thread, outcome, time.monotonic() + timeout))
+
+    results: list[CheckResult] = []
+    for check, thread, outcome, deadline in pending:
+        if thread is None:
+            _execute(check, context, outcome)
+        else:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if "error" in outcome:
+            raise outcome["error"]
+        if "result" in outcome:
+            result = outcome["result"]
+            result.duration_seconds = outcome["seconds"]
+        else:
+            result = _timed_out_result(timeout)
         result.check_name = check.name
         results.append(result)
     return results
+
+
+def run_doctor_cached(
+    context: DoctorContext, *, refresh: bool = False
+) -> list[CheckResult]:
+    """Run all doctor checks unless the installation is unchanged since the last run.
+
+    Results are stored under an install fingerprint; a later call with the
+    same fingerprint returns them without running any check. Storing is
+    best-effort: an unwritable cache never fails the run.
+
+    Args:
+        context: Filesystem roots for this run (injected for testability).
+        refresh: Ignore stored results and run every check (the stored
+            results are replaced).
+
+    Returns:
+        Ordered list of CheckResult objects, one per check.
+    """
+    fingerprint = cache.install_fingerprint(context, (c.name for c in _CHECKS))
+    if not refresh:
+        cached = cache.load_cached_results(context, fingerprint)
+        if cached is not None:
+            return cached
+    results = run_doctor(context)
+    if any(r.timed_out for r in results):
+        return results  # Inconclusive; never replay a timeout from the cache
+    try:
+        cache.save_results(context, fingerprint, results)
+    except OSError:
+        pass  # Best-effort: the next run simply runs the checks again
+    return results
@@ -0,0 +1,73 @@
+"""JsonResultCache — per-file validation reports in ``.nwave/feature-delta-cache.json``.
+
+One JSON document maps each validated path to the digest it was validated
+under and the report it produced. It is read on the first lookup and written
+once per run by flush() (to a temporary file, then renamed). Entries for
+files that no longer exist are dropped on flush. A missing, corrupt or
+unwritable cache behaves as empty: the files are simply validated again.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from nwave_ai.common.atomic_write import write_atomic
+
+
+CACHE_RELATIVE_PATH = Path(".nwave") / "feature-delta-cache.json"
+
+_VERSION = 1
+
+
+class JsonResultCache:
+    """ResultCachePort adapter backed by a single JSON file.
+
+    Args:
+        path: the cache file. Defaults to ``.nwave/feature-delta-cache.json``
+            under the current working directory.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path if path is not None else Path.cwd() / CACHE_RELATIVE_PATH
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+                entries = data["entries"] if data.get("version") == _VERSION else {}
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, file: str, digest: str) -> dict[str, Any] | None:
+        """Return the report stored for ``file`` if it was stored under ``digest``."""
+        stored = self._load().get(file)
+        if not isinstance(stored, dict) or stored.get("digest") != digest:
+            return None
+        report = stored.get("report")
+        return report if isinstance(report, dict) else None
+
+    def put(self, file: str, digest: str, entry: dict[str, Any]) -> None:
+        """Record ``entry`` as the report for ``file`` at ``digest``."""
+        self._load()[file] = {"digest": digest, "report": entry}
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the entries back if any changed (best effort)."""
+        if not self._dirty:
+            return
+        entries = {
+            file: stored for file, stored in self._load().items() if Path(file).exists()
+        }
+        payload = {"version": _VERSION, "entries": entries}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self._path, json.dumps(payload))
+        except OSError:
+            return  # The next run validates these files again
+        self._dirty = False
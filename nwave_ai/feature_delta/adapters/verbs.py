@@ -20,6 +20,10 @@ _OVERRIDE_RELPATH = ".nwave/protocol-verbs.txt"
 #   - (A+)+, (A*)*, (A+)*, (A*)+ — a group with + or * followed by + or *
 _REDOS_NESTED_QUANTIFIER = re.compile(r"\([^)]*[+*][^)]*\)[+*?]*[+*]")
 
+# (mtime_ns, size) of a verb file, or None when it does not exist.
+_FileStamp = tuple[int, int] | None
+_PROTOCOL_VERBS_CACHE_SIZE = 32
+
 
 class ReDoSError(ValueError):
     """Raised when a user-supplied verb pattern contains a ReDoS-prone construct."""
@@ -42,6 +46,13 @@ class PlaintextVerbLoader:
         # with tests that used the old parameter name.
         resolved_cwd = cwd_root if cwd_root is not None else repo_root
         self._cwd_root = resolved_cwd if resolved_cwd is not None else _PACKAGE_ROOT
+        # Loaded protocol-verb lists, keyed by (lang, framework file, framework
+        # stamp, override stamp). Returning the same tuple while both files are
+        # unchanged lets the rules reuse the VerbMatcher compiled for it (see
+        # domain.verb_matcher).
+        self._protocol_verbs: dict[
+            tuple[str, Path, _FileStamp, _FileStamp], tuple[str, ...]
+        ] = {}
 
     def load_protocol_verbs(self, lang: str = "en") -> tuple[str, ...]:
         """Return protocol-surface verbs for ``lang``.
@@ -49,12 +60,33 @@ class PlaintextVerbLoader:
         Loads framework defaults from ``nWave/data/protocol-verbs/{lang}.txt``
         (always relative to the installed package root). If a per-repo override
         exists at ``.nwave/protocol-verbs.txt`` relative to ``cwd_root``, its
-        patterns are unioned with the framework defaults.
+        patterns are unioned with the framework defaults. The result is
+        reused by this loader until either file's mtime or size changes; an
+        empty framework list is never reused.
         """
-        framework_verbs = self._load(_VERB_DIR / f"{lang}.txt")
-
+        framework_path = _VERB_DIR / f"{lang}.txt"
         override_path = self._cwd_root / _OVERRIDE_RELPATH
-        if not override_path.exists():
+        override_stamp = _stamp(override_path)
+        cache_key = (lang, framework_path, _stamp(framework_path), override_stamp)
+        cached = self._protocol_verbs.get(cache_key)
+        if cached is not None:
+            return cached
+
+        framework_verbs = self._load(framework_path)
+        verbs = self._union_override(framework_verbs, override_path, override_stamp)
+        if framework_verbs:
+            if len(self._protocol_verbs) >= _PROTOCOL_VERBS_CACHE_SIZE:
+                self._protocol_verbs.clear()  # Stale file versions
+            self._protocol_verbs[cache_key] = verbs
+        return verbs
+
+    def _union_override(
+        self,
+        framework_verbs: tuple[str, ...],
+        override_path: Path,
+        override_stamp: _FileStamp,
+    ) -> tuple[str, ...]:
+        if override_stamp is None:
             return framework_verbs
 
         override_verbs = self._load(override_path)
@@ -97,6 +129,14 @@ class PlaintextVerbLoader:
         )
 
 
+def _stamp(path: Path) -> _FileStamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def _check_redos(pattern: str) -> None:
     """Raise ``ReDoSError`` if ``pattern`` contains a nested-unbounded-quantifier.
 
@@ -0,0 +1,247 @@
+"""BatchValidator — validate many feature-delta files in one run.
+
+CI used to fork ``validate-feature-delta`` once per file, repeating the
+startup probes, the verb-list load and the interpreter start each time.
+BatchValidator validates a list of files on a process pool with one
+ValidationOrchestrator per worker (the caller runs the probes once), captures
+each file's report output, and returns one FileReport per file in input
+order.
+
+A file whose bytes and validation settings are unchanged since a previous
+run is answered from the ResultCachePort without being dispatched. The
+digest covers the file content plus the settings key: mode, output format,
+enabled rules, language, both verb lists, the package version and the
+size/mtime of the feature_delta modules.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from nwave_ai.feature_delta.application.validator import ValidationOrchestrator
+from nwave_ai.feature_delta.domain.violations import ValidationViolation
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from nwave_ai.feature_delta.ports.result_cache import ResultCachePort
+    from nwave_ai.feature_delta.ports.verbs import VerbListProviderPort
+
+
+_FEATURE_DELTA_ROOT = Path(__file__).parents[1]
+
+
+@dataclass(frozen=True)
+class ValidationSettings:
+    """Everything besides the file itself that decides a validation report."""
+
+    mode: str = "warn-only"
+    output_format: str = "human"
+    enabled_rules: frozenset[str] | None = None
+    lang: str = "en"
+
+
+@dataclass(frozen=True)
+class FileReport:
+    """Outcome of validating one file, with the output it would have printed."""
+
+    file: str
+    exit_code: int
+    violations: tuple[ValidationViolation, ...]
+    stdout: str
+    stderr: str
+    duration_ms: float
+    cached: bool = False
+
+    def to_entry(self) -> dict[str, Any]:
+        return {
+            "exit_code": self.exit_code,
+            "violations": [dataclasses.asdict(v) for v in self.violations],
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+
+    @classmethod
+    def from_entry(cls, file: str, entry: dict[str, Any]) -> FileReport:
+        return cls(
+            file=file,
+            exit_code=int(entry["exit_code"]),
+            violations=tuple(ValidationViolation(**v) for v in entry["violations"]),
+            stdout=entry["stdout"],
+            stderr=entry["stderr"],
+            duration_ms=0.0,
+            cached=True,
+        )
+
+
+@functools.cache
+def _code_stamp() -> str:
+    """Size and mtime of the feature_delta modules, read once per process."""
+    from nwave_ai import __version__
+
+    entries = [__version__]
+    for module in sorted(_FEATURE_DELTA_ROOT.rglob("*.py")):
+        try:
+            stat = module.stat()
+        except OSError:
+            continue  # Removed mid-upgrade: the other entries still differ
+        entries.append(
+            f"{module.relative_to(_FEATURE_DELTA_ROOT)}:{stat.st_size}:{stat.st_mtime_ns}"
+        )
+    return ";".join(entries)
+
+
+def validate_file(
+    orchestrator: ValidationOrchestrator, path: str, settings: ValidationSettings
+) -> FileReport:
+    """Validate ``path`` with its stdout/stderr output captured into the report."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            result = orchestrator.validate(
+                path,
+                mode=settings.mode,
+                output_format=settings.output_format,
+                enabled_rules=settings.enabled_rules,
+            )
+        except (OSError, UnicodeDecodeError) as exc:
+            print(f"ERROR {path}: {exc}", file=stderr)
+            violations: tuple[ValidationViolation, ...] = ()
+            exit_code = 65
+        else:
+            violations = result.violations
+            if result.exit_code_hint is not None:
+                exit_code = result.exit_code_hint
+            else:
+                exit_code = 0 if result.passed else 1
+    return FileReport(
+        file=path,
+        exit_code=exit_code,
+        violations=violations,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        duration_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+# One orchestrator per pool worker, built by the pool initializer.
+_worker_orchestrator: ValidationOrchestrator | None = None
+
+
+def _init_worker(lang: str) -> None:
+    global _worker_orchestrator
+    _worker_orchestrator = ValidationOrchestrator(lang=lang)
+
+
+def _validate_in_worker(path: str, settings: ValidationSettings) -> FileReport:
+    orchestrator = _worker_orchestrator or ValidationOrchestrator(lang=settings.lang)
+    return validate_file(orchestrator, path, settings)
+
+
+class BatchValidator:
+    """Validate many feature-delta files, in parallel and incrementally.
+
+    Args:
+        settings: validation settings shared by every file.
+        jobs: worker processes; ``None`` uses ``os.cpu_count()``. With one
+            job, or one file left to validate, files run in this process.
+        cache: stored reports; ``None`` validates every file.
+        verb_loader: verb lists folded into the cache key. Defaults to the
+            PlaintextVerbLoader the workers' orchestrators use.
+    """
+
+    def __init__(
+        self,
+        settings: ValidationSettings,
+        *,
+        jobs: int | None = None,
+        cache: ResultCachePort | None = None,
+        verb_loader: VerbListProviderPort | None = None,
+    ) -> None:
+        if verb_loader is None:
+            from nwave_ai.feature_delta.adapters.verbs import PlaintextVerbLoader
+
+            verb_loader = PlaintextVerbLoader()
+        self._settings = settings
+        self._jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+        self._cache = cache
+        self._verbs = verb_loader
+
+    def _settings_key(self) -> bytes:
+        settings = self._settings
+        material = {
+            "code": _code_stamp(),
+            "mode": settings.mode,
+            "output_format": settings.output_format,
+            "enabled_rules": sorted(settings.enabled_rules or ()),
+            "lang": settings.lang,
+            "protocol_verbs": list(self._verbs.load_protocol_verbs(settings.lang)),
+            "substantive_verbs": list(
+                self._verbs.load_substantive_verbs(settings.lang)
+            ),
+        }
+        return json.dumps(material, sort_keys=True).encode("utf-8")
+
+    def validate(self, paths: Sequence[Path | str]) -> list[FileReport]:
+        """Return one FileReport per path, in the order given."""
+        files = [str(path) for path in paths]
+        reports: dict[int, FileReport] = {}
+        pending: list[tuple[int, str, str | None]] = []
+        settings_key = self._settings_key() if self._cache is not None else b""
+
+        for index, file in enumerate(files):
+            digest = None
+            if self._cache is not None:
+                try:
+                    content = Path(file).read_bytes()
+                except OSError:
+                    content = None  # Unreadable: let the orchestrator report it
+                if content is not None:
+                    digest = hashlib.sha256(settings_key + b"\0" + content).hexdigest()
+                    entry = self._cache.get(file, digest)
+                    if entry is not None:
+                        try:
+                            reports[index] = FileReport.from_entry(file, entry)
+                            continue
+                        except (KeyError, TypeError, ValueError):
+                            pass  # Malformed entry: validate again
+            pending.append((index, file, digest))
+
+        fresh = self._run([file for _, file, _ in pending])
+        for (index, file, digest), report in zip(pending, fresh, strict=True):
+            reports[index] = report
+            if digest is not None and self._cache is not None:
+                self._cache.put(file, digest, report.to_entry())
+        if self._cache is not None:
+            self._cache.flush()
+        return [reports[index] for index in range(len(files))]
+
+    def _run(self, files: list[str]) -> list[FileReport]:
+        settings = self._settings
+        workers = min(self._jobs, len(files))
+        if workers <= 1:
+            orchestrator = ValidationOrchestrator(lang=settings.lang)
+            return [validate_file(orchestrator, file, settings) for file in files]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(settings.lang,)
+        ) as pool:
+            return list(
+                pool.map(
+                    functools.partial(_validate_in_worker, settings=settings),
+                    files,
+                    chunksize=max(1, len(files) // (workers * 4)),
+                )
+            )
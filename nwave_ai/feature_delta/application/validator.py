@@ -18,6 +18,7 @@ from nwave_ai.feature_delta.domain.rules import (
     e4_substantive_impact,
     e5_protocol_surface,
 )
+from nwave_ai.feature_delta.domain.tokenizer import tokenize
 from nwave_ai.feature_delta.domain.violations import (
     ValidationResult,
     ValidationViolation,
@@ -25,6 +26,9 @@ from nwave_ai.feature_delta.domain.violations import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from nwave_ai.feature_delta.domain.tokenizer import LineEvent
     from nwave_ai.feature_delta.ports.filesystem import FileSystemReadPort
     from nwave_ai.feature_delta.ports.verbs import VerbListProviderPort
 
@@ -70,17 +74,18 @@ def _emit_pass_marker(label: str, emit: bool) -> None:
         print(f"[PASS] {label}", file=sys.stdout)
 
 
-def _find_nested_fence(text: str, file_path: str) -> ValidationViolation | None:
+def _find_nested_fence(
+    lines: Sequence[LineEvent], file_path: str
+) -> ValidationViolation | None:
     """Return a violation if a fenced block appears inside a table row."""
-    lines = text.splitlines()
-    for lineno, line in enumerate(lines, start=1):
-        stripped = line.strip()
+    for event in lines:
+        stripped = event.text.strip()
         if stripped.startswith("|") and "```" in stripped:
             return ValidationViolation(
                 rule="E0-NESTED-FENCE",
                 severity="error",
                 file=file_path,
-                line=lineno,
+                line=event.lineno,
                 offender=stripped[:80],
                 remediation=(
                     "Remove the nested fenced code block from the "
@@ -148,12 +153,12 @@ class ValidationOrchestrator:
         violation_prefix = "[WARN]" if mode == "warn-only" else "[FAIL]"
         emit_pass = resolved_output_format != "json"
 
-        early_exit, text = self._read_and_check_preconditions(target, file_path, start)
+        early_exit, lines = self._read_and_check_preconditions(target, file_path, start)
         if early_exit is not None:
             return early_exit
 
-        # E1 — section heading structure (operates on raw text)
-        e1_violations = e1_section_present.check(text, file_path)
+        # E1 — section heading structure (operates on the line tokens)
+        e1_violations = e1_section_present.check_lines(lines, file_path)
         if e1_violations:
             for v in e1_violations:
                 msg = (
@@ -166,8 +171,8 @@ class ValidationOrchestrator:
         elif emit_pass:
             _emit_pass_marker("E1", True)
 
-        # E2 — column presence (operates on raw text)
-        e2_violations = e2_columns_present.check(text, file_path)
+        # E2 — column presence (operates on the line tokens)
+        e2_violations = e2_columns_present.check_lines(lines, file_path)
         if e2_violations:
             for v in e2_violations:
                 print(
@@ -178,7 +183,7 @@ class ValidationOrchestrator:
         elif emit_pass:
             _emit_pass_marker("E2", True)
 
-        model = self._parser.parse(text)
+        model = self._parser.parse_lines(lines)
 
         # E3 — non-empty rows
         e3_violations = e3_non_empty_rows.check(model)
@@ -298,10 +303,10 @@ class ValidationOrchestrator:
         target: Path,
         file_path: str,
         start: float,
-    ) -> tuple[ValidationResult | None, str]:
-        """Read the file and check preconditions.
+    ) -> tuple[ValidationResult | None, tuple[LineEvent, ...]]:
+        """Read the file, tokenize it once and check preconditions.
 
-        Returns (None, text) on success, or (early_result, "") on failure.
+        Returns (None, lines) on success, or (early_result, ()) on failure.
         """
         try:
             text = self._fs.read_text(target)
@@ -323,7 +328,7 @@ class ValidationOrchestrator:
                     duration_ms=elapsed,
                     exit_code_hint=65,
                 ),
-                "",
+                (),
             )
 
         if not text.strip():
@@ -348,10 +353,11 @@ class ValidationOrchestrator:
                     duration_ms=elapsed,
                     exit_code_hint=65,
                 ),
-                "",
+                (),
             )
 
-        nested_fence = _find_nested_fence(text, file_path)
+        lines = tuple(tokenize(text))
+        nested_fence = _find_nested_fence(lines, file_path)
         if nested_fence is not None:
             elapsed = int((time.monotonic() - start) * 1000)
             print(
@@ -364,10 +370,10 @@ class ValidationOrchestrator:
                 ValidationResult(
                     violations=(nested_fence,), duration_ms=elapsed, exit_code_hint=65
                 ),
-                "",
+                (),
             )
 
-        return None, text
+        return None, lines
 
     @staticmethod
     def _emit_json_result(
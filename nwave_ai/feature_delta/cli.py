@@ -41,10 +41,41 @@ def validate_feature_delta_command(
       70 — startup refused (bad config)
       78 — misconfiguration (enforce mode + pending rules in maturity manifest)
     """
+    from nwave_ai.feature_delta.application.validator import ValidationOrchestrator
+
+    refusal = _startup_refusal(mode, maturity_manifest_path)
+    if refusal is not None:
+        return refusal
+
+    target = Path(path)
+    if not target.exists():
+        # Exit 2: usage error — path doesn't exist. Suggest closest match.
+        print(f"ERROR: file not found: {path}", file=sys.stderr)
+        _suggest_closest_path(path)
+        return 2
+
+    orchestrator = ValidationOrchestrator(lang=lang)
+    result = orchestrator.validate(
+        target,
+        mode=mode,
+        output_format=fmt,
+        maturity_manifest_path=maturity_manifest_path,
+        enabled_rules=enabled_rules,
+    )
+
+    if result.exit_code_hint is not None:
+        return result.exit_code_hint
+
+    if result.passed:
+        return 0
+    return 1
+
+
+def _startup_refusal(mode: str, maturity_manifest_path: Path | None) -> int | None:
+    """Run the startup health checks; return the refusal exit code, if any."""
     from nwave_ai.feature_delta.adapters.schema import JsonSchemaFileLoader
     from nwave_ai.feature_delta.adapters.verbs import PlaintextVerbLoader, ReDoSError
     from nwave_ai.feature_delta.application.validator import (
-        ValidationOrchestrator,
         _check_enforce_eligibility,
     )
 
@@ -65,29 +96,146 @@ def validate_feature_delta_command(
         if error_msg is not None:
             print(error_msg, file=sys.stderr)
             return 78
+    return None
 
-    target = Path(path)
-    if not target.exists():
-        # Exit 2: usage error — path doesn't exist. Suggest closest match.
-        print(f"ERROR: file not found: {path}", file=sys.stderr)
-        _suggest_closest_path(path)
-        return 2
 
-    orchestrator = ValidationOrchestrator(lang=lang)
-    result = orchestrator.validate(
-        target,
-        mode=mode,
-        output_format=fmt,
-        maturity_manifest_path=maturity_manifest_path,
-        enabled_rules=enabled_rules,
+def validate_feature_deltas_command(
+    patterns: list[str],
+    *,
+    mode: str = "warn-only",
+    fmt: str = "human",
+    maturity_manifest_path: Path | None = None,
+    enabled_rules: frozenset[str] | None = None,
+    lang: str = "en",
+    jobs: int | None = None,
+    use_cache: bool = True,
+) -> int:
+    """
+    Validate every feature-delta.md matched by paths or glob patterns.
+
+    The startup health checks run once for the whole set. Files are
+    validated on ``jobs`` worker processes (default: one per CPU), and files
+    unchanged since the last run are answered from
+    ``.nwave/feature-delta-cache.json`` unless ``use_cache`` is False.
+
+    fmt:  "human" (default) — each file's report under a ``==> path <==``
+          header, then a one-line summary on stderr.
+          "json"  — one JSON document on stdout: the single-file schema
+          (schema_version 1, flat "results") plus "files" with each file's
+          exit code, violation count, duration_ms and cached flag, and
+          "summary" with startup_ms and wall_ms.
+
+    Exit code: the highest per-file exit code (see
+    validate_feature_delta_command), or 2 when a path does not exist or a
+    pattern matches no file.
+    """
+    import glob
+    import json
+    import time
+
+    from nwave_ai.feature_delta.adapters.result_cache import JsonResultCache
+    from nwave_ai.feature_delta.application.batch import (
+        BatchValidator,
+        ValidationSettings,
     )
 
-    if result.exit_code_hint is not None:
-        return result.exit_code_hint
+    start = time.perf_counter()
+    refusal = _startup_refusal(mode, maturity_manifest_path)
+    if refusal is not None:
+        return refusal
+
+    paths: dict[str, None] = {}
+    for pattern in patterns:
+        if _has_glob(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                print(f"ERROR: no files match: {pattern}", file=sys.stderr)
+                return 2
+            paths.update(dict.fromkeys(matches))
+        elif Path(pattern).exists():
+            paths[pattern] = None
+        else:
+            print(f"ERROR: file not found: {pattern}", file=sys.stderr)
+            _suggest_closest_path(pattern)
+            return 2
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    validator = BatchValidator(
+        ValidationSettings(
+            mode=mode, output_format=fmt, enabled_rules=enabled_rules, lang=lang
+        ),
+        jobs=jobs,
+        cache=JsonResultCache() if use_cache else None,
+    )
+    reports = validator.validate(list(paths))
+    wall_ms = (time.perf_counter() - start) * 1000
+    cached = sum(report.cached for report in reports)
+
+    if fmt == "json":
+        document = {
+            "schema_version": 1,
+            "results": [
+                {
+                    "check": v.rule,
+                    "severity": v.severity,
+                    "file": v.file,
+                    "line": v.line,
+                    "offender": v.offender,
+                    "remediation": v.remediation,
+                }
+                for report in reports
+                for v in report.violations
+            ],
+            "files": [
+                {
+                    "file": report.file,
+                    "exit_code": report.exit_code,
+                    "violations": len(report.violations),
+                    "duration_ms": round(report.duration_ms, 3),
+                    "cached": report.cached,
+                }
+                for report in reports
+            ],
+            "summary": {
+                "files": len(reports),
+                "cached": cached,
+                "violations": sum(len(report.violations) for report in reports),
+                "startup_ms": round(startup_ms, 3),
+                "wall_ms": round(wall_ms, 3),
+            },
+        }
+        print(json.dumps(document))
+    else:
+        for report in reports:
+            print(f"==> {report.file} <==")
+            sys.stdout.write(report.stdout)
+            sys.stdout.flush()
+            sys.stderr.write(report.stderr)
+            sys.stderr.flush()
+        print(
+            f"validated {len(reports)} files ({cached} unchanged) in {wall_ms:.0f} ms",
+            file=sys.stderr,
+        )
 
-    if result.passed:
-        return 0
-    return 1
+    return max(report.exit_code for report in reports)
+
+
+def _has_glob(path: str) -> bool:
+    return any(char in path for char in "*?[")
+
+
+def _parse_jobs(value: str) -> int | None:
+    """Return ``--jobs`` as a positive worker count, or None if it is not one."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        return None
+    return jobs if jobs > 0 else None
+
+
+def _is_batch(paths: list[str], jobs: int | None) -> bool:
+    """True when the arguments ask for more than the single-file command."""
+    return len(paths) > 1 or jobs is not None or any(map(_has_glob, paths))
 
 
 def _suggest_closest_path(path: str) -> None:
@@ -232,6 +380,7 @@ nwave-ai feature-delta subcommands
 
 USAGE
   nwave-ai validate-feature-delta <path> [--warn-only | --enforce]
+  nwave-ai validate-feature-delta <path|glob>... [--jobs N] [--no-cache]
   nwave-ai extract-gherkin
   nwave-ai migrate-feature
 
@@ -250,6 +399,17 @@ SUBCOMMANDS
           Refused (exit 78) when the rule maturity manifest marks any
           required rule as pending (DD-A2 gate).
 
+      Several paths or glob patterns (quote them, e.g.
+      'docs/feature/*/feature-delta.md') validate every match in one run,
+      with the startup checks done once. Exit code: the worst file's.
+
+      --jobs N
+          Worker processes (default: one per CPU).
+
+      --no-cache
+          Validate every file, even those unchanged since the last run
+          (results are kept in .nwave/feature-delta-cache.json).
+
 EXIT CODES
   0   no violations (or warn-only mode — violations present but non-blocking)
   1   violations found (enforce mode only)
@@ -283,6 +443,8 @@ def main(argv: list[str] | None = None) -> int:
         lang = "en"
         maturity_manifest_path: Path | None = None
         extra_rules: set[str] = set()
+        jobs_arg: str | None = None
+        use_cache = True
         cleaned: list[str] = []
         remaining = list(rest)
         i = 0
@@ -312,18 +474,42 @@ def main(argv: list[str] | None = None) -> int:
                 i += 1
             elif token.startswith("--lang="):
                 lang = token[len("--lang=") :]
+            elif token == "--jobs" and i + 1 < len(remaining):
+                jobs_arg = remaining[i + 1]
+                i += 1
+            elif token.startswith("--jobs="):
+                jobs_arg = token[len("--jobs=") :]
+            elif token == "--no-cache":
+                use_cache = False
             else:
                 cleaned.append(token)
             i += 1
 
-        if not cleaned:
+        jobs = _parse_jobs(jobs_arg) if jobs_arg is not None else None
+        if jobs_arg is not None and jobs is None:
+            print(
+                f"ERROR: --jobs expects a positive integer, got '{jobs_arg}'",
+                file=sys.stderr,
+            )
+        if not cleaned or (jobs_arg is not None and jobs is None):
             print(
                 "Usage: validate-feature-delta <path> [--warn-only | --enforce] [--format=json]",
                 file=sys.stderr,
             )
             return 2
-        path_arg = cleaned[0]
         enabled_rules = frozenset(extra_rules) if extra_rules else None
+        if _is_batch(cleaned, jobs):
+            return validate_feature_deltas_command(
+                cleaned,
+                mode=mode,
+                fmt=fmt,
+                maturity_manifest_path=maturity_manifest_path,
+                enabled_rules=enabled_rules,
+                lang=lang,
+                jobs=jobs,
+                use_cache=use_cache,
+            )
+        path_arg = cleaned[0]
         return validate_feature_delta_command(
             path_arg,
             mode=mode,
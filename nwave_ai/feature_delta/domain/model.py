@@ -11,6 +11,8 @@ class CommitmentRow:
     commitment: str
     ddd: str
     impact: str
+    # 1-based source line; 0 when the row was not parsed from a document.
+    line: int = field(default=0, compare=False)
 
 
 @dataclass(frozen=True)
@@ -25,6 +27,8 @@ class WaveSection:
     rows: tuple[CommitmentRow, ...]
     ddd_entries: tuple[DDDEntry, ...]
     gherkin_blocks: tuple[str, ...] = field(default_factory=tuple)
+    # 1-based line of the ``## Wave:`` heading; 0 when not parsed.
+    line: int = field(default=0, compare=False)
 
 
 @dataclass(frozen=True)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING
 
 from nwave_ai.feature_delta.domain.model import (
     CommitmentRow,
@@ -10,25 +11,23 @@ from nwave_ai.feature_delta.domain.model import (
     FeatureDeltaModel,
     WaveSection,
 )
+from nwave_ai.feature_delta.domain.tokenizer import tokenize
 
 
-_WAVE_HEADING = re.compile(r"^##\s+Wave:\s+(\w+)")
-_TABLE_SEPARATOR = re.compile(r"^\|[-|: ]+\|")
-_TABLE_ROW = re.compile(r"^\|(.+)\|")
-_DESIGN_DECISIONS_HEADING = re.compile(
-    r"^###\s+\[REF\]\s+Design Decisions", re.IGNORECASE
-)
-_DDD_BULLET = re.compile(r"^-\s+DDD-(\d+):\s+(.+)")
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nwave_ai.feature_delta.domain.tokenizer import LineEvent
 
+
+_COMMITMENTS_HEADING = "### [REF] Inherited commitments"
+_TABLE_ROW = re.compile(r"^\|(.+)\|")
 _HEADER_ROW = re.compile(r"^\|\s*Origin\s*\|", re.IGNORECASE)
-_FENCED_GHERKIN_OPEN = re.compile(r"^```gherkin\s*$")
-_FENCED_CLOSE = re.compile(r"^```\s*$")
 
 
-def _parse_row(line: str) -> CommitmentRow | None:
+def _parse_row(event: LineEvent) -> CommitmentRow | None:
     """Parse a pipe-delimited table data row into a CommitmentRow."""
-    if _TABLE_SEPARATOR.match(line):
-        return None
+    line = event.text
     if _HEADER_ROW.match(line):
         return None
     match = _TABLE_ROW.match(line)
@@ -42,6 +41,7 @@ def _parse_row(line: str) -> CommitmentRow | None:
         commitment=cells[1],
         ddd=cells[2],
         impact=cells[3],
+        line=event.lineno,
     )
 
 
@@ -53,11 +53,19 @@ class MarkdownSectionParser:
       IN_WAVE_HEADING       — just saw ## Wave: NAME
       IN_COMMITMENTS_TABLE  — inside ### [REF] Inherited commitments table
       IN_GHERKIN_BLOCK      — inside ```gherkin ... ``` fenced block
+
+    Transitions are driven by the LineEvent kinds from ``tokenize``; sections
+    and rows carry the line numbers of their source lines.
     """
 
     def parse(self, text: str) -> FeatureDeltaModel:
+        return self.parse_lines(tokenize(text))
+
+    def parse_lines(self, lines: Iterable[LineEvent]) -> FeatureDeltaModel:
+        """Build the model from already tokenized lines."""
         sections: list[WaveSection] = []
         current_wave: str | None = None
+        current_wave_line = 0
         current_rows: list[CommitmentRow] = []
         current_ddd_entries: list[DDDEntry] = []
         current_gherkin_blocks: list[str] = []
@@ -67,24 +75,24 @@ class MarkdownSectionParser:
         gherkin_block_lines: list[str] = []
         feature_id = ""
 
-        for line in text.splitlines():
+        for event in lines:
+            kind = event.kind
             # Feature title (first # heading)
-            if line.startswith("# ") and not feature_id:
-                feature_id = line[2:].strip()
+            if kind == "title" and not feature_id:
+                feature_id = event.text[2:].strip()
                 continue
 
             # Handle gherkin fenced block state (highest priority — spans headings)
             if in_gherkin_block:
-                if _FENCED_CLOSE.match(line):
+                if kind == "fence_close":
                     in_gherkin_block = False
                     current_gherkin_blocks.append("\n".join(gherkin_block_lines))
                     gherkin_block_lines = []
                 else:
-                    gherkin_block_lines.append(line)
+                    gherkin_block_lines.append(event.text)
                 continue
 
-            wave_match = _WAVE_HEADING.match(line)
-            if wave_match:
+            if kind == "wave_heading":
                 # Flush previous wave
                 if current_wave is not None:
                     sections.append(
@@ -93,9 +101,11 @@ class MarkdownSectionParser:
                             rows=tuple(current_rows),
                             ddd_entries=tuple(current_ddd_entries),
                             gherkin_blocks=tuple(current_gherkin_blocks),
+                            line=current_wave_line,
                         )
                     )
-                current_wave = wave_match.group(1)
+                current_wave = event.groups[0]
+                current_wave_line = event.lineno
                 current_rows = []
                 current_ddd_entries = []
                 current_gherkin_blocks = []
@@ -105,42 +115,39 @@ class MarkdownSectionParser:
 
             if current_wave is None:
                 # Check for gherkin blocks before first wave heading too
-                if _FENCED_GHERKIN_OPEN.match(line):
+                if kind == "gherkin_open":
                     in_gherkin_block = True
                     gherkin_block_lines = []
                 continue
 
             # Detect gherkin fenced block open
-            if _FENCED_GHERKIN_OPEN.match(line):
+            if kind == "gherkin_open":
                 in_gherkin_block = True
                 gherkin_block_lines = []
                 in_table = False
                 in_ddd_section = False
                 continue
 
-            if "### [REF] Inherited commitments" in line:
+            if event.commitments_heading and _COMMITMENTS_HEADING in event.text:
                 in_table = True
                 in_ddd_section = False
                 continue
 
-            if _DESIGN_DECISIONS_HEADING.match(line):
+            if kind == "design_decisions_heading":
                 in_ddd_section = True
                 in_table = False
                 continue
 
             if in_ddd_section:
-                ddd_match = _DDD_BULLET.match(line)
-                if ddd_match:
+                if kind == "ddd_bullet":
+                    number, text = event.groups
                     current_ddd_entries.append(
-                        DDDEntry(
-                            number=int(ddd_match.group(1)),
-                            text=ddd_match.group(2).strip(),
-                        )
+                        DDDEntry(number=int(number), text=text.strip())
                     )
                 continue
 
-            if in_table and line.startswith("|"):
-                row = _parse_row(line)
+            if in_table and kind == "table_row":
+                row = _parse_row(event)
                 if row is not None:
                     current_rows.append(row)
                 continue
@@ -156,6 +163,7 @@ class MarkdownSectionParser:
                     rows=tuple(current_rows),
                     ddd_entries=tuple(current_ddd_entries),
                     gherkin_blocks=tuple(current_gherkin_blocks),
+                    line=current_wave_line,
                 )
             )
 
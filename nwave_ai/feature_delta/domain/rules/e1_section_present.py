@@ -10,29 +10,21 @@ Empty files are handled by the orchestrator before calling this rule.
 from __future__ import annotations
 
 import difflib
-import re
+from typing import TYPE_CHECKING
 
+from nwave_ai.feature_delta.domain.tokenizer import tokenize
 from nwave_ai.feature_delta.domain.violations import ValidationViolation
 
 
-# Canonical wave names for did-you-mean matching.
-_KNOWN_WAVES = ("DISCOVER", "DISCUSS", "DESIGN", "DEVOPS", "DISTILL", "DELIVER")
-_KNOWN_WAVES_UPPER = frozenset(_KNOWN_WAVES)
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-# Correct format: ## Wave: <NAME> — captures the wave name.
-_FORMAT_CORRECT = re.compile(r"^##\s+Wave:\s+(\w+)")
+    from nwave_ai.feature_delta.domain.tokenizer import LineEvent
 
-# Loose detector: any line that looks like a wave heading attempt.
-# Catches "## Wave : DISCUSS" (extra space before colon) and similar.
-_LOOSE_HEADING = re.compile(r"^##\s+Wave\s*[:\s]+\s*(\w+)", re.IGNORECASE)
 
-
-def _is_fully_valid(line: str) -> bool:
-    """Return True only when the heading is format-correct AND wave name is known."""
-    match = _FORMAT_CORRECT.match(line)
-    if not match:
-        return False
-    return match.group(1).upper() in _KNOWN_WAVES_UPPER
+# Canonical wave names for did-you-mean matching.
+_KNOWN_WAVES = ("DISCOVER", "DISCUSS", "DESIGN", "DEVOPS", "DISTILL", "DELIVER")
+_KNOWN_WAVES_UPPER = frozenset(_KNOWN_WAVES)
 
 
 def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
@@ -42,27 +34,25 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
     Any line that looks like a wave heading but is not fully valid
     (correct format + known name) is reported as an E1 violation.
     """
-    violations: list[ValidationViolation] = []
+    return check_lines(tokenize(text), file_path)
 
-    lines = text.splitlines()
-    for lineno, line in enumerate(lines, start=1):
-        # Skip lines that clearly are not wave headings.
-        if "Wave" not in line and "wave" not in line:
-            continue
-        if not line.startswith("#"):
-            continue
 
-        # Does this line look like a wave heading attempt?
-        loose = _LOOSE_HEADING.match(line)
-        if loose is None:
+def check_lines(
+    lines: Iterable[LineEvent], file_path: str
+) -> tuple[ValidationViolation, ...]:
+    """Check E1 rule on tokenized lines (see ``check``)."""
+    violations: list[ValidationViolation] = []
+
+    for event in lines:
+        if event.kind not in ("wave_heading", "malformed_wave_heading"):
             continue
 
         # Is it fully valid (format-correct + known name)?
-        if _is_fully_valid(line):
+        wave_name = event.groups[0].upper()
+        if event.kind == "wave_heading" and wave_name in _KNOWN_WAVES_UPPER:
             continue
 
         # It's a near-miss — compute did-you-mean.
-        wave_name = loose.group(1).upper()
         suggestions = difflib.get_close_matches(
             wave_name, _KNOWN_WAVES, n=1, cutoff=0.4
         )
@@ -77,8 +67,8 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
                 rule="E1",
                 severity="error",
                 file=file_path,
-                line=lineno,
-                offender=line.strip(),
+                line=event.lineno,
+                offender=event.text.strip(),
                 remediation=(
                     "Replace the malformed heading with the canonical form: "
                     "'## Wave: <NAME>' (e.g., '## Wave: DISCUSS')."
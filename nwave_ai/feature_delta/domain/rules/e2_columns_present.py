@@ -10,20 +10,21 @@ and a remediation string.
 
 from __future__ import annotations
 
-import re
+from typing import TYPE_CHECKING
 
+from nwave_ai.feature_delta.domain.tokenizer import tokenize
 from nwave_ai.feature_delta.domain.violations import ValidationViolation
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nwave_ai.feature_delta.domain.tokenizer import LineEvent
+
+
 # The four required column names, in order.
 _REQUIRED_COLUMNS = ("Origin", "Commitment", "DDD", "Impact")
 
-_COMMITMENTS_HEADING = re.compile(
-    r"###\s+\[REF\]\s+Inherited commitments", re.IGNORECASE
-)
-_TABLE_HEADER = re.compile(r"^\|(.+)\|")
-_SEPARATOR_ROW = re.compile(r"^\|[-|: ]+\|")
-
 
 def _parse_header_columns(line: str) -> list[str]:
     """Extract column names from a pipe-delimited header row."""
@@ -40,14 +41,21 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
     missing one or more of the required columns the violation is reported
     at that line number.
     """
+    return check_lines(tokenize(text), file_path)
+
+
+def check_lines(
+    lines: Iterable[LineEvent], file_path: str
+) -> tuple[ValidationViolation, ...]:
+    """Check E2 rule on tokenized lines (see ``check``)."""
     violations: list[ValidationViolation] = []
 
-    lines = text.splitlines()
     in_commitments_block = False
     awaiting_header = False
 
-    for lineno, line in enumerate(lines, start=1):
-        if _COMMITMENTS_HEADING.search(line):
+    for event in lines:
+        kind = event.kind
+        if event.commitments_heading:
             in_commitments_block = True
             awaiting_header = True
             continue
@@ -57,11 +65,12 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
 
         if awaiting_header:
             # Skip blank lines before the header.
-            if not line.strip():
+            if kind == "blank":
                 continue
 
-            if line.startswith("|") and not _SEPARATOR_ROW.match(line):
+            if kind == "table_row":
                 # This is the header row — validate it.
+                line = event.text
                 columns = _parse_header_columns(line)
                 columns_upper = [c.upper() for c in columns]
                 missing = [
@@ -74,7 +83,7 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
                             rule="E2",
                             severity="error",
                             file=file_path,
-                            line=lineno,
+                            line=event.lineno,
                             offender=line.strip(),
                             remediation=(
                                 f"Add missing column(s) {missing_str} to the "
@@ -84,13 +93,13 @@ def check(text: str, file_path: str) -> tuple[ValidationViolation, ...]:
                         )
                     )
                 awaiting_header = False
-            elif not line.startswith("|"):
+            elif kind != "table_separator":
                 # Non-table line encountered before finding the header.
                 awaiting_header = False
                 in_commitments_block = False
 
         # Once we've processed the header, reset on the next ## Wave heading.
-        elif line.startswith("## Wave"):
+        elif event.text.startswith("## Wave"):
             in_commitments_block = False
             awaiting_header = False
 
@@ -37,7 +37,7 @@ def check(model: FeatureDeltaModel) -> tuple[ValidationViolation, ...]:
                             rule="E3",
                             severity="error",
                             file=model.feature_id,
-                            line=row_index,
+                            line=row.line or row_index,
                             offender=f"[{section.name}] row {row_index}: empty '{label}' cell",
                             remediation=(
                                 f"Fill the '{label}' column in "
@@ -77,7 +77,7 @@ def check(model: FeatureDeltaModel) -> tuple[ValidationViolation, ...]:
                         rule="E3b",
                         severity="error",
                         file=model.feature_id,
-                        line=1,
+                        line=row.line or 1,
                         offender=commitment,
                         remediation="Add DDD entry OR restore row",
                     )
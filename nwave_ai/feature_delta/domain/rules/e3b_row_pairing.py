@@ -82,7 +82,7 @@ def check_row_pairing(model: FeatureDeltaModel) -> tuple[ValidationViolation, ..
         ddd_authorized = bool(downstream.ddd_entries)
 
         # Check each upstream row.
-        for row_index, _row in enumerate(upstream.rows, start=1):
+        for row_index, row in enumerate(upstream.rows, start=1):
             row_id = f"{upstream_wave}#row{row_index}"
             if row_id not in cited_upstream_ids and not ddd_authorized:
                 violations.append(
@@ -90,7 +90,7 @@ def check_row_pairing(model: FeatureDeltaModel) -> tuple[ValidationViolation, ..
                         rule="E3b-row",
                         severity="error",
                         file=model.feature_id,
-                        line=row_index,
+                        line=row.line or row_index,
                         offender=row_id,
                         remediation=(
                             f"Add 'Origin: {row_id}' to a downstream row in "
@@ -15,6 +15,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+from nwave_ai.feature_delta.domain.verb_matcher import compile_verbs
 from nwave_ai.feature_delta.domain.violations import ValidationViolation
 
 
@@ -47,7 +48,7 @@ def check_v1_0(
                 rule="E4",
                 severity="error",
                 file=model.feature_id,
-                line=row_index,
+                line=row.line or row_index,
                 offender=impact[:80] if impact else "(empty)",
                 remediation=(
                     "Provide an Impact value with >= 10 words OR a consequence verb "
@@ -87,7 +88,7 @@ def check_v1_1(
                 rule="E4",
                 severity="error",
                 file=model.feature_id,
-                line=row_index,
+                line=row.line or row_index,
                 offender=impact[:80] if impact else "(empty)",
                 remediation=(
                     "E4 v1.1 requires a structural citation: DDD-N or row#N. "
@@ -104,5 +105,4 @@ def _passes_v1_0(impact: str, verbs: tuple[str, ...]) -> bool:
     words = impact.split()
     if len(words) >= 10:
         return True
-    impact_lower = impact.lower()
-    return any(verb.lower() in impact_lower for verb in verbs)
+    return compile_verbs(verbs).search(impact)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from nwave_ai.feature_delta.domain.verb_matcher import compile_verbs
 from nwave_ai.feature_delta.domain.violations import ValidationViolation
 
 
@@ -20,7 +21,8 @@ def check(
 
     For each pattern in `patterns`, if any DISCUSS commitment contains it
     but no DESIGN commitment contains it AND no DESIGN row has a non-empty
-    DDD ratification, it is a violation.
+    DDD ratification, it is a violation. All patterns are matched in one
+    pass over each section's text.
 
     Returns a tuple of ValidationViolation objects (empty = clean).
     """
@@ -43,17 +45,29 @@ def check(
         if r.ddd.strip() and r.ddd.strip().lower() not in ("n/a", "(none)", "none", "")
     }
 
+    # Any DDD entry ratifies the downgrade of every dropped pattern.
+    if ratified_ddds:
+        return ()
+
+    matcher = compile_verbs(patterns, fold=str.upper)
+    discussed = matcher.hits(discuss_text)
+    if not discussed:
+        return ()
+    dropped = discussed - matcher.hits(design_text)
+
     violations: list[ValidationViolation] = []
     for pattern in patterns:
-        if pattern.upper() not in discuss_text.upper():
+        if pattern not in dropped:
             continue
-        if pattern.upper() in design_text.upper():
-            continue
-        # Pattern present in DISCUSS but missing from DESIGN.
-        # Check if any DDD entry ratifies the downgrade.
-        if ratified_ddds:
-            continue
-        line_hint = 1  # Line numbers not tracked in v1; use 1 as sentinel.
+        # Report the first DISCUSS row that carries the pattern.
+        line_hint = next(
+            (
+                row.line
+                for row in discuss_section.rows
+                if row.line and pattern.upper() in row.commitment.upper()
+            ),
+            discuss_section.line or 1,
+        )
         offender_file = model.feature_id
         violations.append(
             ValidationViolation(
@@ -0,0 +1,123 @@
+"""Line tokenizer for feature-delta.md — one classification pass per document.
+
+The nested-fence precondition, E1, E2 and MarkdownSectionParser used to split
+the document and test the same regexes on every line independently.
+``tokenize`` splits once and yields a LineEvent per line carrying its 1-based
+line number, its character offset in the document, and its kind:
+
+  blank                     — empty or whitespace-only
+  title                     — ``# <feature title>``
+  wave_heading              — ``## Wave: NAME`` (groups: NAME)
+  malformed_wave_heading    — a near-miss such as ``## Wave : NAME`` or
+                              ``## wave: NAME`` (groups: NAME); like E1
+                              always did, only lines containing "Wave" or
+                              "wave" qualify
+  design_decisions_heading  — ``### [REF] Design Decisions``
+  table_separator           — ``|---|---|``
+  table_row                 — any other line starting with ``|``
+  ddd_bullet                — ``- DDD-N: text`` (groups: N, text)
+  gherkin_open              — a ```` ```gherkin ```` fence
+  fence_close               — a bare ```` ``` ```` fence
+  text                      — anything else
+
+Independently of its kind, ``commitments_heading`` is set on any line
+containing ``### [REF] Inherited commitments`` in any letter case, the E2
+heading search. The parser only opens a table on the exact spelling.
+
+Kinds describe a line in isolation; the consumers keep their own state
+(inside a table, inside a Gherkin block, ...).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+LineKind = Literal[
+    "blank",
+    "title",
+    "wave_heading",
+    "malformed_wave_heading",
+    "design_decisions_heading",
+    "table_separator",
+    "table_row",
+    "ddd_bullet",
+    "gherkin_open",
+    "fence_close",
+    "text",
+]
+
+_WAVE_HEADING = re.compile(r"^##\s+Wave:\s+(\w+)")
+# Any line that looks like a wave heading attempt, e.g. "## Wave : DISCUSS".
+_LOOSE_WAVE_HEADING = re.compile(r"^##\s+Wave\s*[:\s]+\s*(\w+)", re.IGNORECASE)
+_COMMITMENTS_HEADING = re.compile(
+    r"###\s+\[REF\]\s+Inherited commitments", re.IGNORECASE
+)
+_DESIGN_DECISIONS_HEADING = re.compile(
+    r"^###\s+\[REF\]\s+Design Decisions", re.IGNORECASE
+)
+_TABLE_SEPARATOR = re.compile(r"^\|[-|: ]+\|")
+_DDD_BULLET = re.compile(r"^-\s+DDD-(\d+):\s+(.+)")
+_FENCED_GHERKIN_OPEN = re.compile(r"^```gherkin\s*$")
+_FENCED_CLOSE = re.compile(r"^```\s*$")
+
+# Characters str.splitlines() treats as line boundaries.
+_LINE_BOUNDARIES = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+@dataclass(frozen=True)
+class LineEvent:
+    kind: LineKind
+    lineno: int
+    offset: int
+    text: str
+    groups: tuple[str, ...] = ()
+    commitments_heading: bool = False
+
+
+def _classify(line: str) -> tuple[LineKind, tuple[str, ...]]:
+    if not line.strip():
+        return "blank", ()
+    if line.startswith("# "):
+        return "title", ()
+    first = line[0]
+    if first == "#":
+        match = _WAVE_HEADING.match(line)
+        if match:
+            return "wave_heading", match.groups()
+        match = _LOOSE_WAVE_HEADING.match(line)
+        if match and ("Wave" in line or "wave" in line):
+            return "malformed_wave_heading", match.groups()
+        if _DESIGN_DECISIONS_HEADING.match(line):
+            return "design_decisions_heading", ()
+    elif first == "|":
+        if _TABLE_SEPARATOR.match(line):
+            return "table_separator", ()
+        return "table_row", ()
+    elif first == "-":
+        match = _DDD_BULLET.match(line)
+        if match:
+            return "ddd_bullet", match.groups()
+    elif first == "`":
+        if _FENCED_GHERKIN_OPEN.match(line):
+            return "gherkin_open", ()
+        if _FENCED_CLOSE.match(line):
+            return "fence_close", ()
+    return "text", ()
+
+
+def tokenize(text: str) -> Iterator[LineEvent]:
+    """Yield one LineEvent per line of ``text`` (lines as str.splitlines())."""
+    offset = 0
+    for lineno, raw in enumerate(text.splitlines(keepends=True), start=1):
+        line = raw.rstrip(_LINE_BOUNDARIES)
+        kind, groups = _classify(line)
+        commitments = "[" in line and _COMMITMENTS_HEADING.search(line) is not None
+        yield LineEvent(kind, lineno, offset, line, groups, commitments)
+        offset += len(raw)
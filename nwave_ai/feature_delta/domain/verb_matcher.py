@@ -0,0 +1,122 @@
+"""VerbMatcher — Aho-Corasick automaton over a verb list.
+
+E4 and E5 ask the same question of many texts: which of these verbs occur in
+it, as case-insensitive substrings? Testing each verb with ``in`` costs one
+pass over the text per verb, and a per-repo ``.nwave/protocol-verbs.txt`` can
+add hundreds of them. VerbMatcher compiles the list once into a
+deterministic automaton (trie + failure links, flattened so every state has
+a direct transition per character) and reports every verb present in a
+single left-to-right pass over the text.
+
+Matching semantics are those of ``fold(verb) in fold(text)``: overlapping
+and nested verbs are all reported, and the empty verb matches every text.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import deque
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class VerbMatcher:
+    """All-occurrences substring matcher for a fixed tuple of verbs.
+
+    Args:
+        verbs: the verbs to look for; duplicates are allowed.
+        fold: case folding applied to both verbs and texts (``str.lower``
+            for E4, ``str.upper`` for E5).
+    """
+
+    def __init__(
+        self, verbs: Iterable[str], fold: Callable[[str], str] = str.lower
+    ) -> None:
+        self._fold = fold
+        self._verbs = tuple(verbs)
+        folded_ids: dict[str, int] = {}
+        for verb in self._verbs:
+            folded_ids.setdefault(fold(verb), len(folded_ids))
+        self._folded = tuple(folded_ids)
+        # Verb ids of each folded form, so "GET" and "get" both hit on "get".
+        self._verb_ids = tuple(folded_ids[fold(verb)] for verb in self._verbs)
+
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[set[int]] = [set()]
+        for folded_id, folded in enumerate(self._folded):
+            state = 0
+            for char in folded:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(folded_id)
+
+        # Breadth-first over the trie: a state's failure target is shallower,
+        # so its transitions and outputs are already complete when needed.
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+        self._steps = tuple(transitions.get for transitions in delta)
+        self._outputs = tuple(frozenset(out) for out in outputs)
+        self._hit_states = frozenset(s for s, out in enumerate(outputs) if out)
+
+    def hits(self, text: str) -> frozenset[str]:
+        """Return the verbs (as given, not folded) that occur in ``text``."""
+        found = set(self._outputs[0])  # The empty verb occurs everywhere
+        total = len(self._folded)
+        if len(found) < total:
+            steps, outputs, hit_states = self._steps, self._outputs, self._hit_states
+            state = 0
+            for char in self._fold(text):
+                state = steps[state](char, 0)
+                if state in hit_states and not outputs[state] <= found:
+                    found |= outputs[state]
+                    if len(found) == total:
+                        break
+        return frozenset(
+            verb
+            for verb, folded_id in zip(self._verbs, self._verb_ids, strict=True)
+            if folded_id in found
+        )
+
+    def search(self, text: str) -> bool:
+        """Return True if any verb occurs in ``text``, stopping at the first."""
+        if self._outputs[0]:
+            return True
+        steps, hit_states = self._steps, self._hit_states
+        state = 0
+        for char in self._fold(text):
+            state = steps[state](char, 0)
+            if state in hit_states:
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled(verbs: tuple[str, ...], fold: Callable[[str], str]) -> VerbMatcher:
+    return VerbMatcher(verbs, fold)
+
+
+def compile_verbs(
+    verbs: Iterable[str], fold: Callable[[str], str] = str.lower
+) -> VerbMatcher:
+    """Return the VerbMatcher for ``verbs``, building it once per verb list.
+
+    The verb loaders return the same tuple for as long as their source files
+    are unchanged, so each rule compiles its automaton once per process.
+    """
+    return _compiled(tuple(verbs), fold)
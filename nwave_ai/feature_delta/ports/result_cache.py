@@ -0,0 +1,11 @@
+"""ResultCachePort — stored per-file validation reports keyed by content digest."""
+
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+
+class ResultCachePort(Protocol):
+    def get(self, file: str, digest: str) -> dict[str, Any] | None: ...
+    def put(self, file: str, digest: str, entry: dict[str, Any]) -> None: ...
+    def flush(self) -> None: ...
@@ -10,6 +10,9 @@ Verdict matrix (per DESIGN spec):
     | YES          | NO            | ambiguous |
     | NO           | YES           | ambiguous |
     | NO           | NO            | clean     |
+
+Both tiers are answered from a RegistryIndex (shape hash map + inverted
+keyword index) instead of a linear scan of the snapshot.
 """
 
 from __future__ import annotations
@@ -17,7 +20,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Literal
 
-from nwave_ai.outcomes.domain.jaccard import score, tokenize
+from nwave_ai.outcomes.application.registry_index import RegistryIndex, tokens_for
 from nwave_ai.outcomes.domain.outcome import Outcome  # noqa: TC001  # runtime
 from nwave_ai.outcomes.domain.shape import normalize_shape
 
@@ -47,7 +50,15 @@ class CollisionReport:
 
 
 class CollisionDetector:
-    """Detect collisions between a target shape and the registry snapshot."""
+    """Detect collisions between a target shape and the registry snapshot.
+
+    Checks run against a RegistryIndex. ``check`` builds one per snapshot
+    and reuses it while the same snapshot object is passed again;
+    ``check_against`` takes a prebuilt index (many checks, one registry).
+    """
+
+    def __init__(self) -> None:
+        self._index: RegistryIndex | None = None
 
     def check(
         self,
@@ -55,8 +66,27 @@ class CollisionDetector:
         snapshot: tuple[Outcome, ...],
     ) -> CollisionReport:
         """Return Tier-1 IDs, Tier-2 (id, score) pairs, and a verdict."""
-        tier1 = _tier1_matches(target, snapshot)
-        tier2 = _tier2_matches(target, snapshot)
+        if self._index is None or self._index.snapshot is not snapshot:
+            self._index = RegistryIndex.build(snapshot)
+        return self.check_against(target, self._index)
+
+    def check_against(
+        self,
+        target: TargetShape,
+        index: RegistryIndex,
+        exclude_id: str | None = None,
+    ) -> CollisionReport:
+        """Like ``check``, over an index, ignoring outcomes with `exclude_id`."""
+        tier1 = index.shape_matches(
+            (normalize_shape(target.input_shape), normalize_shape(target.output_shape)),
+            exclude_id,
+        )
+        tier2 = tuple(
+            (outcome_id, _round_score(s))
+            for outcome_id, s in index.keyword_matches(
+                tokens_for(target.keywords), _TIER2_THRESHOLD, exclude_id
+            )
+        )
         return CollisionReport(
             tier1_matches=tier1,
             tier2_matches=tier2,
@@ -64,31 +94,6 @@ class CollisionDetector:
         )
 
 
-def _tier1_matches(
-    target: TargetShape, snapshot: tuple[Outcome, ...]
-) -> tuple[str, ...]:
-    """Return ids of outcomes whose normalized (input, output) tuple equals target."""
-    target_tuple = (
-        normalize_shape(target.input_shape),
-        normalize_shape(target.output_shape),
-    )
-    return tuple(o.id for o in snapshot if _shape_tuple(o) == target_tuple)
-
-
-def _tier2_matches(
-    target: TargetShape, snapshot: tuple[Outcome, ...]
-) -> tuple[tuple[str, float], ...]:
-    """Return (id, rounded_score) pairs for outcomes meeting Tier-2 threshold."""
-    target_tokens = _tokens_for(target.keywords)
-    return tuple(
-        (o.id, _round_score(s))
-        for o, s in (
-            (o, score(_tokens_for(o.keywords), target_tokens)) for o in snapshot
-        )
-        if s >= _TIER2_THRESHOLD
-    )
-
-
 def _verdict(tier1_fired: bool, tier2_fired: bool) -> Verdict:
     """Map (Tier-1, Tier-2) firing flags to a verdict."""
     if tier1_fired and tier2_fired:
@@ -98,23 +103,6 @@ def _verdict(tier1_fired: bool, tier2_fired: bool) -> Verdict:
     return "clean"
 
 
-def _shape_tuple(outcome: Outcome) -> tuple[str, str]:
-    """Canonical (input, output) tuple for the first input shape."""
-    if not outcome.inputs:
-        return ("", normalize_shape(outcome.output.shape))
-    return (
-        normalize_shape(outcome.inputs[0].shape),
-        normalize_shape(outcome.output.shape),
-    )
-
-
-def _tokens_for(keywords: tuple[str, ...]) -> frozenset[str]:
-    """Tokenise a tuple of keyword fragments into a single set."""
-    if not keywords:
-        return frozenset()
-    return tokenize(" ".join(keywords))
-
-
 def _round_score(value: float) -> float:
     """Round Jaccard score to 2 decimals for stable stdout/reporting."""
     return round(value, 2)
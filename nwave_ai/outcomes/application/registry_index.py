@@ -0,0 +1,116 @@
+"""RegistryIndex — lookup structures for collision checks over a snapshot.
+
+Built once per registry snapshot so each collision check costs time
+proportional to the candidates it touches, not to the registry size:
+
+  - Tier-1: hash map from the normalized (input, output) shape tuple to
+    snapshot positions.
+  - Tier-2: inverted index from keyword token to snapshot positions.
+    Only outcomes sharing at least one token with the target can score
+    above zero; of those, outcomes whose token-set size alone bounds
+    Jaccard below the threshold (``min(|A|,|B|) / max(|A|,|B|)``) are
+    skipped before scoring.
+
+Matches are returned in snapshot order, exactly as a linear scan would.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from nwave_ai.outcomes.domain.jaccard import tokenize
+from nwave_ai.outcomes.domain.outcome import Outcome  # noqa: TC001  # runtime
+from nwave_ai.outcomes.domain.shape import normalize_shape
+
+
+@dataclass(frozen=True)
+class RegistryIndex:
+    """Shape and keyword indexes over an immutable registry snapshot."""
+
+    snapshot: tuple[Outcome, ...]
+    token_sets: tuple[frozenset[str], ...]
+    by_id: dict[str, int]
+    by_shape: dict[tuple[str, str], tuple[int, ...]]
+    by_token: dict[str, tuple[int, ...]]
+
+    @classmethod
+    def build(cls, snapshot: tuple[Outcome, ...]) -> RegistryIndex:
+        """Index every outcome of `snapshot` (one normalize/tokenize each)."""
+        by_id: dict[str, int] = {}
+        by_shape: dict[tuple[str, str], list[int]] = {}
+        by_token: dict[str, list[int]] = {}
+        token_sets: list[frozenset[str]] = []
+        for position, outcome in enumerate(snapshot):
+            by_id.setdefault(outcome.id, position)
+            by_shape.setdefault(shape_tuple(outcome), []).append(position)
+            tokens = tokens_for(outcome.keywords)
+            token_sets.append(tokens)
+            for token in tokens:
+                by_token.setdefault(token, []).append(position)
+        return cls(
+            snapshot=snapshot,
+            token_sets=tuple(token_sets),
+            by_id=by_id,
+            by_shape={k: tuple(v) for k, v in by_shape.items()},
+            by_token={k: tuple(v) for k, v in by_token.items()},
+        )
+
+    def find(self, outcome_id: str) -> Outcome | None:
+        """Return the first outcome registered under `outcome_id`, if any."""
+        position = self.by_id.get(outcome_id)
+        return None if position is None else self.snapshot[position]
+
+    def shape_matches(
+        self, shape: tuple[str, str], exclude_id: str | None = None
+    ) -> tuple[str, ...]:
+        """Ids of outcomes whose normalized shape tuple equals `shape`."""
+        return tuple(
+            self.snapshot[p].id
+            for p in self.by_shape.get(shape, ())
+            if self.snapshot[p].id != exclude_id
+        )
+
+    def keyword_matches(
+        self,
+        tokens: frozenset[str],
+        threshold: float,
+        exclude_id: str | None = None,
+    ) -> tuple[tuple[str, float], ...]:
+        """(id, Jaccard score) of outcomes scoring `>= threshold` against `tokens`.
+
+        `threshold` must be positive: outcomes sharing no token score 0.0
+        and are never visited.
+        """
+        target_size = len(tokens)
+        shared: dict[int, int] = {}
+        for token in tokens:
+            for position in self.by_token.get(token, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        matches: list[tuple[int, float]] = []
+        for position, intersection in shared.items():
+            size = len(self.token_sets[position])
+            if min(size, target_size) / max(size, target_size) < threshold:
+                continue
+            jaccard = intersection / (size + target_size - intersection)
+            if jaccard >= threshold and self.snapshot[position].id != exclude_id:
+                matches.append((position, jaccard))
+        matches.sort()
+        return tuple((self.snapshot[p].id, s) for p, s in matches)
+
+
+def shape_tuple(outcome: Outcome) -> tuple[str, str]:
+    """Canonical (input, output) tuple for the first input shape."""
+    if not outcome.inputs:
+        return ("", normalize_shape(outcome.output.shape))
+    return (
+        normalize_shape(outcome.inputs[0].shape),
+        normalize_shape(outcome.output.shape),
+    )
+
+
+def tokens_for(keywords: tuple[str, ...]) -> frozenset[str]:
+    """Tokenise a tuple of keyword fragments into a single set."""
+    if not keywords:
+        return frozenset()
+    return tokenize(" ".join(keywords))
@@ -12,6 +12,7 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from jsonschema import Draft7Validator
 from jsonschema import ValidationError as JsonSchemaValidationError
@@ -24,6 +25,11 @@ from nwave_ai.outcomes.ports.registry_io import (  # noqa: TC001  # runtime DI
 )
 
 
+if TYPE_CHECKING:
+    from nwave_ai.outcomes.application.collision_detector import CollisionReport
+    from nwave_ai.outcomes.application.registry_index import RegistryIndex
+
+
 _SCHEMA_PATH = (
     Path(__file__).resolve().parents[3]
     / "docs"
@@ -81,12 +87,29 @@ class RegistryService:
         """Return an immutable snapshot of all registered outcomes."""
         return self._reader.read_outcomes()
 
-    def collision_check_for_id(self, outcome_id: str) -> CollisionReport:
+    def collision_index(self) -> RegistryIndex:
+        """Build a RegistryIndex over the current registry snapshot.
+
+        Reuse it across ``collision_check_for_id`` calls that check many
+        ids against the same registry (US-3 aggregate scan).
+        """
+        from nwave_ai.outcomes.application.registry_index import RegistryIndex
+
+        return RegistryIndex.build(self._reader.read_outcomes())
+
+    def collision_check_for_id(
+        self, outcome_id: str, index: RegistryIndex | None = None
+    ) -> CollisionReport:
         """Run a collision check for `outcome_id` excluding itself from the
         snapshot, so an outcome cannot collide with its own registry entry.
 
         Drives US-3 aggregate scan over feature-delta.md.
 
+        Args:
+            outcome_id: Id of the registered outcome to check.
+            index: Prebuilt ``collision_index()``; the registry is read and
+                indexed for this call when omitted.
+
         Raises:
             UnknownOutcomeIdError: when `outcome_id` is not in the registry.
         """
@@ -98,17 +121,19 @@ class RegistryService:
             TargetShape,
         )
 
-        snapshot = self._reader.read_outcomes()
-        target = self._find_outcome(snapshot, outcome_id)
-        others = tuple(o for o in snapshot if o.id != outcome_id)
-        detector = CollisionDetector()
-        return detector.check(
-            target=TargetShape(
+        if index is None:
+            index = self.collision_index()
+        target = index.find(outcome_id)
+        if target is None:
+            raise UnknownOutcomeIdError(f"unknown outcome id: {outcome_id}")
+        return CollisionDetector().check_against(
+            TargetShape(
                 input_shape=target.inputs[0].shape if target.inputs else "",
                 output_shape=target.output.shape,
                 keywords=target.keywords,
             ),
-            snapshot=others,
+            index,
+            exclude_id=outcome_id,
         )
 
     def _validate_against_schema(self, outcome: Outcome) -> None:
@@ -123,9 +148,3 @@ class RegistryService:
         existing_ids = tuple(o.id for o in self._reader.read_outcomes())
         if outcome.id in existing_ids:
             raise DuplicateOutcomeIdError(f"duplicate outcome id: {outcome.id}")
-
-    def _find_outcome(self, snapshot: tuple[Outcome, ...], outcome_id: str) -> Outcome:
-        for outcome in snapshot:
-            if outcome.id == outcome_id:
-                return outcome
-        raise UnknownOutcomeIdError(f"unknown outcome id: {outcome_id}")
@@ -161,11 +161,12 @@ def _run_check_delta(args: argparse.Namespace, registry_path: Path) -> int:
     adapter = YamlRegistryAdapter(registry_path)
     service = RegistryService(reader=adapter, writer=adapter)
 
+    index = service.collision_index()
     collision_count = 0
     colliding_ids: list[str] = []
     for out_id in out_ids:
         try:
-            report = service.collision_check_for_id(out_id)
+            report = service.collision_check_for_id(out_id, index)
         except UnknownOutcomeIdError:
             print(f"WARNING: {out_id} referenced in delta but not in registry")
             continue
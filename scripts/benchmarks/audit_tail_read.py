@@ -0,0 +1,125 @@
+"""Benchmark JsonlAuditLogReader.read_last_entry on a large daily audit log.
+
+Builds a daily log of roughly ``--size-mb`` megabytes through the hook
+audit writer (batched, with the sidecar offset index) with one event at
+the start of the day and one at the end, then times:
+
+- full read: the previous implementation (read_text + reversed splitlines)
+- reverse scan: block-wise backward read without the index, for the oldest
+  event (worst case) and the most recent one (typical hook lookup)
+- indexed: sidecar offset index present (one seek), oldest event
+
+Usage:
+    python -m scripts.benchmarks.audit_tail_read [--size-mb N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from des.adapters.driven.logging import audit_offset_index
+from des.adapters.driven.logging.batching_jsonl_audit_log_writer import (
+    BatchingJsonlAuditLogWriter,
+)
+from des.adapters.driven.logging.jsonl_audit_log_reader import JsonlAuditLogReader
+from des.ports.driven_ports.audit_log_writer import AuditEvent
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_OLD_EVENT = "HOOK_SUBAGENT_STOP_PASSED"
+_RECENT_EVENT = "HOOK_SUBAGENT_STOP_FAILED"
+
+
+def _build_log(log_dir: Path, size_mb: int) -> Path:
+    writer = BatchingJsonlAuditLogWriter(log_dir=log_dir, offset_index=True)
+    writer.log_event(AuditEvent(_OLD_EVENT, "2026-01-01T00:00:00Z"))
+    padding = "x" * 200
+    target_bytes = size_mb * 1024 * 1024
+    log_file = writer._get_log_file()
+    index = 0
+    written = 0
+    while written < target_bytes:
+        for _ in range(1000):
+            writer.log_event(
+                AuditEvent(
+                    event_type="AGENT_USAGE_OBSERVED",
+                    timestamp="2026-01-01T00:00:01Z",
+                    feature_name="bench",
+                    step_id=f"02-{index % 50:02d}",
+                    data={"index": index, "payload": padding},
+                )
+            )
+            index += 1
+        writer.flush()
+        written = log_file.stat().st_size
+    writer.log_event(AuditEvent(_RECENT_EVENT, "2026-01-01T23:59:59Z"))
+    writer.close()
+    return log_file
+
+
+def _full_read(log_file: Path) -> dict | None:
+    for line in reversed(log_file.read_text().strip().splitlines()):
+        entry = json.loads(line)
+        if entry.get("event") == _OLD_EVENT:
+            return entry
+    return None
+
+
+def _time(fn, iterations: int) -> list[int]:
+    samples: list[int] = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        result = fn()
+        samples.append(time.perf_counter_ns() - start)
+        assert result is not None
+    return samples
+
+
+def run_benchmark(size_mb: int, iterations: int) -> list[LatencySummary]:
+    """Time the lookup strategies on a freshly built log."""
+    with tempfile.TemporaryDirectory(prefix="des-audit-bench-") as tmp:
+        log_dir = Path(tmp)
+        log_file = _build_log(log_dir, size_mb)
+        reader = JsonlAuditLogReader(log_dir=log_dir)
+
+        def lookup(event_type: str):
+            return lambda: reader.read_last_entry(event_type=event_type)
+
+        indexed = _time(lookup(_OLD_EVENT), iterations)
+        full = _time(lambda: _full_read(log_file), iterations)
+        audit_offset_index.index_path_for(log_file).unlink()
+        scan_old = _time(lookup(_OLD_EVENT), iterations)
+        scan_recent = _time(lookup(_RECENT_EVENT), iterations)
+
+    return [
+        summarize(f"full read, oldest ({size_mb} MB)", full),
+        summarize(f"reverse scan, oldest ({size_mb} MB)", scan_old),
+        summarize(f"reverse scan, recent ({size_mb} MB)", scan_recent),
+        summarize(f"indexed, oldest ({size_mb} MB)", indexed),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    summaries = run_benchmark(args.size_mb, args.iterations)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Benchmark the PreToolUse/Bash execution-log guard over a payload corpus.
+
+Runs every payload in the corpus through ``sh -c <guard>`` and times:
+
+- python extract: the previous guard, which started python3 on every call
+  to pull tool_input.command out of the JSON before grepping it
+- substring fast path: the current _BASH_EXECUTION_LOG_GUARD, which only
+  starts python3 when the raw payload mentions ``execution-log``
+
+The corpus is a JSONL file with one recorded hook payload per line
+(``--corpus``); without one, a built-in sample of typical agent Bash
+commands is used, with a few execution-log writes mixed in. Exit codes of
+both guards are compared payload by payload.
+
+Usage:
+    python -m scripts.benchmarks.bash_guard [--corpus FILE] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+from scripts.shared.hook_definitions import _BASH_EXECUTION_LOG_GUARD
+
+
+_PREFILTER = 'case "$INPUT" in *execution-log*) ;; *) exit 0 ;; esac; '
+
+_SAMPLE_COMMANDS = (
+    "git status",
+    "git diff --stat HEAD",
+    "pytest -q tests/des/unit",
+    "ls -la src/des/application",
+    "rg -n 'def validate' src/des",
+    "python -m compileall -q .",
+    "git add src/des/cli/log_phase.py && git commit -m 'fix: step 02-01'",
+    "cat docs/feature/auth/deliver/roadmap.json",
+    "npm test -- --watch=false",
+    "make lint",
+    "cat docs/feature/auth/deliver/execution-log.json",
+    "sed -i 's/FAIL/PASS/' docs/feature/auth/deliver/execution-log.json",
+    "PYTHONPATH=~/.claude/lib/python python3 -m des.cli.log_phase "
+    "--project-dir docs/feature/auth/deliver --step-id 01-01 --phase RED_UNIT "
+    "--status EXECUTED --data PASS",
+)
+
+
+def _sample_corpus() -> list[str]:
+    return [
+        json.dumps(
+            {
+                "session_id": "bench",
+                "hook_event_name": "PreToolUse",
+                "tool_name": "Bash",
+                "tool_input": {"command": command, "description": "bench"},
+            }
+        )
+        for command in _SAMPLE_COMMANDS
+    ]
+
+
+def _load_corpus(path: Path) -> list[str]:
+    return [line for line in path.read_text().splitlines() if line.strip()]
+
+
+def _run(guard: str, payload: str) -> tuple[int, int]:
+    start = time.perf_counter_ns()
+    result = subprocess.run(
+        ["sh", "-c", guard],
+        input=payload,
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    return time.perf_counter_ns() - start, result.returncode
+
+
+def run_benchmark(corpus: list[str], rounds: int) -> list[LatencySummary]:
+    """Time both guards over every payload, ``rounds`` times each."""
+    baseline_guard = _BASH_EXECUTION_LOG_GUARD.replace(_PREFILTER, "")
+    assert baseline_guard != _BASH_EXECUTION_LOG_GUARD, "guard prefilter not found"
+
+    baseline: list[int] = []
+    fast: list[int] = []
+    for _ in range(rounds):
+        for payload in corpus:
+            elapsed, expected = _run(baseline_guard, payload)
+            baseline.append(elapsed)
+            elapsed, actual = _run(_BASH_EXECUTION_LOG_GUARD, payload)
+            fast.append(elapsed)
+            assert actual == expected, f"guard verdict changed for {payload!r}"
+
+    return [
+        summarize(f"python extract ({len(corpus)} payloads)", baseline),
+        summarize(f"substring fast path ({len(corpus)} payloads)", fast),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--corpus", type=Path, help="JSONL file of recorded Bash hook payloads"
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    corpus = _load_corpus(args.corpus) if args.corpus else _sample_corpus()
+    summaries = run_benchmark(corpus, args.rounds)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Benchmark execution-log appends: v3.0 read-modify-write vs v4.0 append-only.
+
+For each log size, a log with that many existing events is created in both
+formats and single-event appends (``des-log-phase``'s storage call) are
+timed. v3.0 cost grows with the log; v4.0 should stay flat.
+
+Usage:
+    python -m scripts.benchmarks.execution_log_append [--sizes 1000,10000,20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from des.domain.execution_log_store import append_event, create_execution_log
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+def _event(n: int) -> dict:
+    return {
+        "sid": f"{n // 7:02d}-01",
+        "p": "GREEN",
+        "s": "EXECUTED",
+        "d": "PASS",
+        "t": "2026-02-10T20:28:18Z",
+    }
+
+
+def _time_appends(log_path: Path, iterations: int) -> list[int]:
+    samples: list[int] = []
+    for n in range(iterations):
+        start = time.perf_counter_ns()
+        append_event(log_path, _event(n))
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run_benchmark(sizes: list[int], iterations: int) -> list[LatencySummary]:
+    """Time appends for each (format, existing event count) pair."""
+    summaries: list[LatencySummary] = []
+    with tempfile.TemporaryDirectory(prefix="des-exec-log-bench-") as tmp:
+        for size in sizes:
+            existing = [_event(n) for n in range(size)]
+            for version in ("3.0", "4.0"):
+                log_dir = Path(tmp) / f"v{version}-{size}"
+                log_dir.mkdir()
+                log_path = log_dir / "execution-log.json"
+                create_execution_log(
+                    log_path, {"feature_id": "bench"}, existing, schema_version=version
+                )
+                samples = _time_appends(log_path, iterations)
+                summaries.append(
+                    summarize(f"v{version} append @ {size} events", samples)
+                )
+    return summaries
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,20000")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    summaries = run_benchmark(sizes, args.iterations)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Benchmark the E4/E5 verb rules on large synthetic feature-delta documents.
+
+Each document has ``--rows`` commitments per DISCUSS and DESIGN wave, built
+from protocol and consequence verbs mixed into filler prose. The verb lists
+are the framework's en.txt defaults plus ``--override`` synthetic patterns,
+the way a repo's ``.nwave/protocol-verbs.txt`` extends them. Two variants are
+compared, each running E4 v1.0 and E5 on the parsed model:
+
+- per-verb scans: the previous rules, which upper-cased both section texts
+  for every E5 pattern and tested each E4 verb against each impact
+  (reproduced below)
+- compiled matcher: the current rules, one pass per text through the
+  VerbMatcher automaton (compiled once per verb list, outside the timing)
+
+Both variants must report the same violations for every document.
+
+Usage:
+    python -m scripts.benchmarks.feature_delta_verbs [--rows 100,1000] [--override 300] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from nwave_ai.feature_delta.adapters.verbs import PlaintextVerbLoader
+from nwave_ai.feature_delta.domain.parser import MarkdownSectionParser
+from nwave_ai.feature_delta.domain.rules import (
+    e4_substantive_impact,
+    e5_protocol_surface,
+)
+
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_FILLER = (
+    "the", "service", "keeps", "its", "existing", "contract", "while", "the",
+    "team", "evaluates", "latency", "budgets", "retry", "policies", "and",
+    "operational", "runbooks", "for", "rollout",
+)  # fmt: skip
+
+
+def _override_patterns(rng: random.Random, count: int) -> tuple[str, ...]:
+    return tuple(
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz-") for _ in range(8)) + "-api"
+        for _ in range(count)
+    )
+
+
+def build_document(
+    rng: random.Random, rows: int, protocol: tuple[str, ...], consequence: tuple
+) -> str:
+    """Render a feature-delta.md with *rows* commitments per wave."""
+
+    def prose(words: int) -> str:
+        return " ".join(rng.choice(_FILLER) for _ in range(words))
+
+    lines = ["# synthetic-feature", ""]
+    for wave in ("DISCUSS", "DESIGN"):
+        lines += [
+            f"## Wave: {wave}",
+            "",
+            "### [REF] Inherited commitments",
+            "",
+            "| Origin | Commitment | DDD | Impact |",
+            "|--------|------------|-----|--------|",
+        ]
+        for row in range(1, rows + 1):
+            commitment = f"{prose(6)} {rng.choice(protocol)} {prose(4)}"
+            if wave == "DESIGN" and rng.random() < 0.3:
+                commitment = prose(10)  # Drops the protocol verb
+            impact = (
+                f"{rng.choice(consequence)} {prose(3)}"
+                if rng.random() < 0.6
+                else prose(rng.randint(2, 12))
+            )
+            lines.append(f"| DISCUSS#row{row} | {commitment} | n/a | {impact} |")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _legacy_rules(model, protocol: tuple[str, ...], consequence: tuple) -> tuple:
+    """E4 v1.0 and E5 offenders as computed before the VerbMatcher."""
+    sections = {s.name: s for s in model.sections}
+    vague = []
+    for row in sections["DESIGN"].rows:
+        impact = row.impact.strip()
+        impact_lower = impact.lower()
+        if len(impact.split()) < 10 and not any(
+            verb.lower() in impact_lower for verb in consequence
+        ):
+            vague.append(impact[:80] if impact else "(empty)")
+
+    discuss_text = " ".join(r.commitment for r in sections["DISCUSS"].rows)
+    design_text = " ".join(r.commitment for r in sections["DESIGN"].rows)
+    dropped = [
+        pattern
+        for pattern in protocol
+        if pattern.upper() in discuss_text.upper()
+        and pattern.upper() not in design_text.upper()
+    ]
+    return tuple(vague), tuple(dropped)
+
+
+def _current_rules(model, protocol: tuple[str, ...], consequence: tuple) -> tuple:
+    return (
+        tuple(v.offender for v in e4_substantive_impact.check_v1_0(model, consequence)),
+        tuple(v.offender for v in e5_protocol_surface.check(model, protocol)),
+    )
+
+
+def _timed(fn, rounds: int) -> list[int]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run_benchmark(
+    row_counts: list[int], override: int, rounds: int
+) -> list[LatencySummary]:
+    """Time both variants on one document per row count."""
+    rng = random.Random(23)
+    loader = PlaintextVerbLoader()
+    protocol = loader.load_protocol_verbs("en") + _override_patterns(rng, override)
+    consequence = loader.load_substantive_verbs("en")
+    parser = MarkdownSectionParser()
+    summaries = []
+    for rows in row_counts:
+        document = build_document(rng, rows, protocol, consequence)
+        model = parser.parse(document)
+        assert _current_rules(model, protocol, consequence) == _legacy_rules(
+            model, protocol, consequence
+        )
+        label = f"({rows} rows, {len(protocol)} patterns, {len(document) // 1024} KB)"
+        summaries.append(
+            summarize(
+                f"per-verb scans {label}",
+                _timed(lambda m=model: _legacy_rules(m, protocol, consequence), rounds),
+            )
+        )
+        summaries.append(
+            summarize(
+                f"compiled matcher {label}",
+                _timed(
+                    lambda m=model: _current_rules(m, protocol, consequence), rounds
+                ),
+            )
+        )
+    return summaries
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", default="100,1000", help="comma-separated commitments per wave"
+    )
+    parser.add_argument(
+        "--override", type=int, default=300, help="synthetic override patterns"
+    )
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    row_counts = [int(rows) for rows in args.rows.split(",")]
+    summaries = run_benchmark(row_counts, args.override, args.rounds)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Benchmark DES hook latency: one-shot interpreter vs resident hook server.
+
+Each sample is a full hook round trip as Claude Code performs it: spawn a
+process, pipe the JSON payload on stdin, wait for exit. The one-shot mode
+runs the installed adapter module; the server mode runs the thin client
+script against a hook server started for the duration of the benchmark.
+
+Usage:
+    python -m scripts.benchmarks.hook_latency [--iterations N] [--json]
+    python -m scripts.benchmarks.hook_latency --command pre-write
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+_CLIENT = _SRC / "des" / "adapters" / "drivers" / "hooks" / "hook_client.py"
+
+# Representative payloads: cheap handlers, so interpreter start-up and
+# import cost dominate — exactly what the server removes.
+_PAYLOADS: dict[str, dict] = {
+    "pre-write": {
+        "tool_name": "Write",
+        "tool_input": {"file_path": "src/app.py", "content": "x = 1\n"},
+    },
+    "pre-task": {
+        "tool_name": "Agent",
+        "tool_input": {"subagent_type": "general-purpose", "prompt": "hello"},
+    },
+    "subagent-start": {"agent_type": "nw-software-crafter"},
+}
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(_SRC), env.get("PYTHONPATH", "")) if p
+    )
+    return env
+
+
+def _time_runs(
+    argv: list[str], payload: bytes, cwd: Path, iterations: int
+) -> list[int]:
+    env = _env()
+    samples: list[int] = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        subprocess.run(argv, input=payload, cwd=cwd, env=env, capture_output=True)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run_benchmark(
+    command: str, iterations: int, warmup: int = 3
+) -> list[LatencySummary]:
+    """Measure *command* in both modes inside a scratch project directory."""
+    payload = json.dumps(_PAYLOADS[command]).encode()
+    one_shot = [
+        sys.executable,
+        "-m",
+        "des.adapters.drivers.hooks.claude_code_hook_adapter",
+        command,
+    ]
+    via_client = [sys.executable, str(_CLIENT), command]
+    server_ctl = [sys.executable, "-m", "des.adapters.drivers.hooks.hook_server"]
+
+    with tempfile.TemporaryDirectory(prefix="des-hook-bench-") as tmp:
+        cwd = Path(tmp)
+        _time_runs(one_shot, payload, cwd, warmup)
+        cold = _time_runs(one_shot, payload, cwd, iterations)
+
+        subprocess.run([*server_ctl, "start"], cwd=cwd, env=_env(), check=True)
+        try:
+            _time_runs(via_client, payload, cwd, warmup)
+            warm = _time_runs(via_client, payload, cwd, iterations)
+        finally:
+            subprocess.run([*server_ctl, "stop"], cwd=cwd, env=_env())
+
+    return [
+        summarize(f"{command} one-shot", cold),
+        summarize(f"{command} hook server", warm),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--command", choices=sorted(_PAYLOADS), default="pre-write")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    summaries = run_benchmark(args.command, args.iterations)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
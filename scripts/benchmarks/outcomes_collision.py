@@ -0,0 +1,133 @@
+"""Benchmark outcomes collision checks on a large synthetic registry.
+
+Builds ``--outcomes`` synthetic outcomes (shapes drawn from a few hundred
+types, 3-6 keywords each from a 2,000-word vocabulary) and times:
+
+- linear scan: the previous CollisionDetector (normalize + tokenize every
+  outcome on every check)
+- indexed check: CollisionDetector.check_against a prebuilt RegistryIndex
+- index build: RegistryIndex.build over the whole snapshot (once per
+  registry read; ``check-delta`` shares it across all OUT-ids)
+
+Usage:
+    python -m scripts.benchmarks.outcomes_collision [--outcomes N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from nwave_ai.outcomes.application.collision_detector import (
+    CollisionDetector,
+    TargetShape,
+)
+from nwave_ai.outcomes.application.registry_index import RegistryIndex
+from nwave_ai.outcomes.domain.jaccard import score, tokenize
+from nwave_ai.outcomes.domain.outcome import InputShape, Outcome, OutputShape
+from nwave_ai.outcomes.domain.shape import normalize_shape
+
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+def _snapshot(rng: random.Random, size: int) -> tuple[Outcome, ...]:
+    vocabulary = [f"term{n:04d}" for n in range(2000)]
+    shapes = [f"Model{n}" for n in range(300)] + ["(text: str, path: str)"]
+    return tuple(
+        Outcome(
+            id=f"OUT-{n}",
+            kind="specification",
+            summary="",
+            feature="bench",
+            inputs=(InputShape(shape=rng.choice(shapes)),),
+            output=OutputShape(shape=f"tuple[{rng.choice(shapes)}, ...]"),
+            keywords=tuple(rng.sample(vocabulary, rng.randint(3, 6))),
+            artifact="",
+            related=(),
+            superseded_by=None,
+        )
+        for n in range(size)
+    )
+
+
+def _linear_check(target: TargetShape, snapshot: tuple[Outcome, ...]) -> tuple:
+    """The detector before RegistryIndex, inlined as baseline."""
+    shape = (normalize_shape(target.input_shape), normalize_shape(target.output_shape))
+    tier1 = tuple(
+        o.id
+        for o in snapshot
+        if (normalize_shape(o.inputs[0].shape), normalize_shape(o.output.shape))
+        == shape
+    )
+    target_tokens = tokenize(" ".join(target.keywords))
+    tier2 = tuple(
+        (o.id, round(s, 2))
+        for o in snapshot
+        if (s := score(tokenize(" ".join(o.keywords)), target_tokens)) >= 0.4
+    )
+    return tier1, tier2
+
+
+def _targets(snapshot: tuple[Outcome, ...], count: int) -> list[TargetShape]:
+    return [
+        TargetShape(
+            input_shape=o.inputs[0].shape,
+            output_shape=o.output.shape,
+            keywords=o.keywords,
+        )
+        for o in snapshot[:count]
+    ]
+
+
+def run_benchmark(size: int, checks: int) -> list[LatencySummary]:
+    """Time linear and indexed checks plus the one-off index build."""
+    snapshot = _snapshot(random.Random(42), size)
+    targets = _targets(snapshot, checks)
+
+    build: list[int] = []
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        index = RegistryIndex.build(snapshot)
+        build.append(time.perf_counter_ns() - start)
+
+    detector = CollisionDetector()
+    indexed: list[int] = []
+    linear: list[int] = []
+    for target in targets:
+        start = time.perf_counter_ns()
+        report = detector.check_against(target, index)
+        indexed.append(time.perf_counter_ns() - start)
+        start = time.perf_counter_ns()
+        expected = _linear_check(target, snapshot)
+        linear.append(time.perf_counter_ns() - start)
+        assert (report.tier1_matches, report.tier2_matches) == expected
+
+    return [
+        summarize(f"linear scan ({size} outcomes)", linear),
+        summarize(f"indexed check ({size} outcomes)", indexed),
+        summarize(f"index build ({size} outcomes)", build),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outcomes", type=int, default=10_000)
+    parser.add_argument("--checks", type=int, default=50)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    summaries = run_benchmark(args.outcomes, args.checks)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
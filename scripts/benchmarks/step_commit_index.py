@@ -0,0 +1,166 @@
+"""Benchmark Step-ID commit verification on a large synthetic repository.
+
+Builds a repository of ``--commits`` empty commits with git fast-import
+(one in ``--trailer-every`` carries a ``Step-ID:`` trailer) and times the
+lookup of a step that has no commit yet -- the common verification failure
+path:
+
+- git log --grep: the previous GitCommitVerifier, walking the whole history
+- index lookup: GitCommitVerifier with a current Step-ID index
+- incremental refresh: the same lookup after ``--new-commits`` commits land
+- index rebuild: a cold index built from the full history (once per rewrite)
+
+Usage:
+    python -m scripts.benchmarks.step_commit_index [--commits N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from des.adapters.driven.git import step_commit_index
+from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_MISSING_STEP = "99-99"
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def _step_id(n: int) -> str:
+    """Step-ID of synthetic commit *n*; never _MISSING_STEP."""
+    return f"{n // 100 % 99:02d}-{n % 100:02d}"
+
+
+def _fast_import(repo: Path, first: int, count: int, trailer_every: int) -> None:
+    """Append *count* empty commits to refs/heads/main via git fast-import."""
+    chunks = []
+    for n in range(first, first + count):
+        message = f"chore: synthetic commit {n}\n"
+        if n % trailer_every == 0:
+            message += f"\nStep-ID: {_step_id(n)}\n"
+        data = message.encode()
+        parent = b"from refs/heads/main^0\n" if n == first and first else b""
+        chunks.append(
+            b"commit refs/heads/main\n"
+            + f"committer Bench <bench@example.com> {1_700_000_000 + n} +0000\n".encode()
+            + f"data {len(data)}\n".encode()
+            + data
+            + parent
+            + b"\n"
+        )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo,
+        input=b"".join(chunks),
+        check=True,
+        capture_output=True,
+    )
+
+
+def _synthetic_repo(root: Path, commits: int, trailer_every: int) -> Path:
+    repo = root / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=repo, check=True
+    )
+    _fast_import(repo, 0, commits, trailer_every)
+    return repo
+
+
+def _grep_lookup(repo: Path) -> str:
+    """The verifier before the Step-ID index, inlined as baseline."""
+    return subprocess.run(
+        ["git", "log", "--format=%H|%ai|%s", f"--grep=Step-ID: {_MISSING_STEP}", "-1"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def _timed(fn, rounds: int) -> list[int]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run_benchmark(
+    commits: int, trailer_every: int, new_commits: int, rounds: int
+) -> list[LatencySummary]:
+    """Time grep lookups, indexed lookups, incremental refreshes and rebuilds."""
+    os.environ.update(_GIT_ENV)
+    verifier = GitCommitVerifier()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _synthetic_repo(Path(tmp), commits, trailer_every)
+        index_file = repo / step_commit_index.INDEX_RELATIVE_PATH
+
+        def rebuild() -> None:
+            index_file.unlink(missing_ok=True)
+            step_commit_index.refresh_index(str(repo))
+
+        rebuilt = _timed(rebuild, 3)
+        grep = _timed(lambda: _grep_lookup(repo), rounds)
+        indexed = _timed(
+            lambda: verifier.verify_commit(_MISSING_STEP, str(repo)), rounds
+        )
+
+        incremental = []
+        total = commits
+        for _ in range(rounds):
+            _fast_import(repo, total, new_commits, trailer_every)
+            total += new_commits
+            start = time.perf_counter_ns()
+            result = verifier.verify_commit(_MISSING_STEP, str(repo))
+            incremental.append(time.perf_counter_ns() - start)
+            assert not result.verified and _grep_lookup(repo) == ""
+
+        assert verifier.verify_commit(_step_id(trailer_every), str(repo)).verified
+
+    return [
+        summarize(f"git log --grep ({commits} commits)", grep),
+        summarize(f"index lookup ({commits} commits)", indexed),
+        summarize(f"incremental refresh (+{new_commits} commits)", incremental),
+        summarize(f"index rebuild ({commits} commits)", rebuilt),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=100_000)
+    parser.add_argument("--trailer-every", type=int, default=20)
+    parser.add_argument("--new-commits", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    summaries = run_benchmark(
+        args.commits, args.trailer_every, args.new_commits, args.rounds
+    )
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Benchmark TemplateValidator on rendered /nw-execute prompts of 10-200 KB.
+
+This is the validation the PreToolUse hook runs for every Agent invocation
+that carries a DES marker. Each prompt is the DES template from the
+nw-execute skill, with placeholders filled and DESIGN_CONTEXT padded with
+the framework's own skill documents to the requested size, the way an
+orchestrator pastes architecture notes into a step prompt. Two variants are
+compared:
+
+- per-checker scans: the previous validate_prompt(), where each checker
+  searched the whole prompt (reproduced below)
+- shared scan: the current validate_prompt(), where all checkers read one
+  PromptScan
+
+Both variants must report the same errors for every prompt.
+
+Usage:
+    python -m scripts.benchmarks.template_validation [--sizes 10,50,200] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from des.application.validator import TemplateValidator
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SKILLS = _ROOT / "nWave" / "skills"
+_PLACEHOLDERS = {
+    "{feature-id}": "checkout-redesign",
+    "{step-id}": "02-03",
+    "{agent-name}": "nw-software-crafter",
+    "{agent}": "nw-software-crafter",
+    "{skill-name}": "software-crafter",
+    "{PHASE_NAME}": "GREEN",
+}
+
+
+def _execute_template() -> str:
+    """The DES prompt template embedded in the nw-execute skill."""
+    text = (_SKILLS / "nw-execute" / "SKILL.md").read_text(encoding="utf-8")
+    start = text.index("<!-- DES-VALIDATION")
+    end = text.index("\n```", text.index("# TIMEOUT_INSTRUCTION", start))
+    return text[start:end] + "\n"
+
+
+def build_prompt(size_kb: int) -> str:
+    """Render the template with DESIGN_CONTEXT padded to about *size_kb* KB."""
+    prompt = _execute_template()
+    for placeholder, value in _PLACEHOLDERS.items():
+        prompt = prompt.replace(placeholder, value)
+    prompt = re.sub(
+        r"\{step context from roadmap[^\n]*\}",
+        "name: Apply discount codes at checkout\n"
+        "criteria: totals include the discount; invalid codes are rejected\n"
+        "files_to_modify: src/checkout/discounts.py",
+        prompt,
+    )
+
+    budget = size_kb * 1024 - len(prompt)
+    context: list[str] = []
+    for skill in sorted(_SKILLS.glob("*/SKILL.md")):
+        if budget <= 0:
+            break
+        document = skill.read_text(encoding="utf-8")[:budget]
+        context.append(document)
+        budget -= len(document)
+    return re.sub(
+        r"\{Summary of architectural decisions[^\n]*\}",
+        lambda _: "\n".join(context),
+        prompt,
+    )
+
+
+def _legacy_validate(validator: TemplateValidator, prompt: str) -> list[str]:
+    """validate_prompt() errors as computed before the shared PromptScan."""
+    errors = validator.marker_validator.validate(prompt)
+
+    for section in validator.section_checker.MANDATORY_SECTIONS:
+        if f"# {section}" not in prompt:
+            errors.append(f"MISSING: Mandatory section '{section}' not found")
+
+    shorthand = r"(?i)all\s+\d+\s+phases?\s+(listed|mentioned|included|present)"
+    if not re.search(shorthand, prompt):
+        for phase in validator.phase_validator.MANDATORY_PHASES:
+            lines = [line.strip() for line in prompt.split("\n") if phase in line]
+            if not any(
+                not (
+                    re.search(rf"\(.*\b{phase}\b.*\)", line)
+                    or re.search(
+                        rf"\b(without|missing|no)\s+{phase}\b", line, re.IGNORECASE
+                    )
+                    or re.search(rf"# MISSING:\s*{phase}", line)
+                )
+                for line in lines
+            ):
+                errors.append(f"INCOMPLETE: TDD phase '{phase}' not mentioned")
+
+    log_markers = ("STATUS", "ISSUE", "PROBLEM", "ERRORS", "WITH_SKIP", "COMPLETE")
+    if any(f"# EXECUTION_LOG_{marker}" in prompt for marker in log_markers):
+        raise ValueError("benchmark prompts carry no execution log")
+    return errors
+
+
+def _timed(fn, rounds: int) -> list[int]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run_benchmark(sizes_kb: list[int], rounds: int) -> list[LatencySummary]:
+    """Time both variants on one rendered prompt per size."""
+    validator = TemplateValidator()
+    summaries = []
+    for size_kb in sizes_kb:
+        prompt = build_prompt(size_kb)
+        assert validator.validate_prompt(prompt).errors == _legacy_validate(
+            validator, prompt
+        )
+        label = f"({len(prompt) // 1024} KB)"
+        summaries.append(
+            summarize(
+                f"per-checker scans {label}",
+                _timed(lambda p=prompt: _legacy_validate(validator, p), rounds),
+            )
+        )
+        summaries.append(
+            summarize(
+                f"shared scan {label}",
+                _timed(lambda p=prompt: validator.validate_prompt(p), rounds),
+            )
+        )
+    return summaries
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="10,50,200", help="comma-separated prompt sizes in KB"
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    summaries = run_benchmark(sizes, args.rounds)
+    if args.json:
+        print(json.dumps([s.to_dict() for s in summaries], indent=2))
+    else:
+        print(render_table(summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
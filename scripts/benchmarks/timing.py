@@ -0,0 +1,69 @@
+"""Shared latency statistics for the benchmark scripts in this package.
+
+Benchmarks collect raw samples in nanoseconds (time.perf_counter_ns) and
+hand them to ``summarize``; ``render_table`` prints the comparison rows
+every benchmark reports (p50 / p99 / mean, in milliseconds).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """Order statistics of one benchmark variant, in milliseconds."""
+
+    label: str
+    samples: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "samples": self.samples,
+            "p50_ms": round(self.p50_ms, 4),
+            "p99_ms": round(self.p99_ms, 4),
+            "mean_ms": round(self.mean_ms, 4),
+            "min_ms": round(self.min_ms, 4),
+            "max_ms": round(self.max_ms, 4),
+        }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(label: str, samples_ns: list[int]) -> LatencySummary:
+    """Reduce raw nanosecond samples to a LatencySummary."""
+    if not samples_ns:
+        raise ValueError(f"no samples collected for {label!r}")
+    values = sorted(s / 1_000_000 for s in samples_ns)
+    return LatencySummary(
+        label=label,
+        samples=len(values),
+        p50_ms=percentile(values, 0.50),
+        p99_ms=percentile(values, 0.99),
+        mean_ms=sum(values) / len(values),
+        min_ms=values[0],
+        max_ms=values[-1],
+    )
+
+
+def render_table(summaries: list[LatencySummary]) -> str:
+    """Render summaries as a fixed-width text table, fastest p50 first."""
+    header = f"{'variant':<32} {'n':>6} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10}"
+    lines = [header, "-" * len(header)]
+    for s in sorted(summaries, key=lambda s: s.p50_ms):
+        lines.append(
+            f"{s.label:<32} {s.samples:>6} {s.p50_ms:>10.3f} {s.p99_ms:>10.3f}"
+            f" {s.mean_ms:>10.3f}"
+        )
+    return "\n".join(lines)
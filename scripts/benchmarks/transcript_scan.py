@@ -0,0 +1,194 @@
+"""Benchmark the SubagentStop transcript walk on large agent transcripts.
+
+Builds a synthetic transcript of roughly ``--size-mb`` megabytes (a DES
+Task prompt, then assistant turns with usage blocks alternating with
+large tool results, plus occasional skill Reads) and compares:
+
+- three walks: the previous handler (marker scan, then every line loaded
+  into a list for token usage, then a separate skill-tracking walk)
+- single pass: scan_transcript with marker, token-usage and skill visitors
+
+Wall time is sampled ``--iterations`` times; peak traced memory
+(tracemalloc) is measured in one extra run per variant.
+
+Usage:
+    python -m scripts.benchmarks.transcript_scan [--size-mb N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from des.adapters.driven.time.system_time import SystemTimeProvider
+from des.adapters.driven.tracking.null_skill_tracker import NullSkillTracker
+from des.adapters.drivers.hooks.skill_tracking_hooks import SkillLoadVisitor
+from des.adapters.drivers.hooks.subagent_stop_handler import (
+    _DesMarkerVisitor,
+    _normalize_message_content,
+)
+from des.adapters.drivers.hooks.token_usage_extractor import (
+    TokenUsageVisitor,
+    extract_token_usage_events,
+)
+from des.adapters.drivers.hooks.transcript_scanner import scan_transcript
+from des.application.skill_tracking_service import SkillTrackingService
+from scripts.benchmarks.timing import LatencySummary, render_table, summarize
+
+
+_PROMPT = (
+    "<!-- DES-VALIDATION: required -->\n"
+    "<!-- DES-PROJECT-ID: bench -->\n"
+    "<!-- DES-STEP-ID: 01-01 -->\n"
+)
+
+
+def _build_transcript(path: Path, size_mb: int) -> int:
+    """Write the synthetic transcript; returns the number of assistant turns."""
+    target = size_mb * 1024 * 1024
+    tool_output = "def f():\n    return 1\n" * 200
+    turns = 0
+    with open(path, "w") as f:
+        f.write(json.dumps({"type": "user", "message": {"content": _PROMPT}}) + "\n")
+        while f.tell() < target:
+            assistant = {
+                "type": "assistant",
+                "timestamp": "2026-02-06T21:00:00Z",
+                "message": {
+                    "model": "model-x",
+                    "content": [{"type": "text", "text": "Running the tests."}],
+                    "usage": {
+                        "input_tokens": turns,
+                        "cache_creation_input_tokens": 0,
+                        "cache_read_input_tokens": 1000,
+                        "output_tokens": 50,
+                    },
+                },
+            }
+            result = {
+                "type": "user",
+                "message": {
+                    "content": [{"type": "tool_result", "content": tool_output}]
+                },
+            }
+            f.write(json.dumps(assistant) + "\n" + json.dumps(result) + "\n")
+            if turns % 100 == 0:
+                skill_read = {
+                    "type": "tool_use",
+                    "name": "Read",
+                    "input": {"file_path": f"/x/skills/nw/crafter/s{turns}.md"},
+                }
+                f.write(json.dumps(skill_read) + "\n")
+            turns += 1
+    return turns
+
+
+def _skill_service() -> SkillTrackingService:
+    return SkillTrackingService(
+        tracker=NullSkillTracker(),
+        time_provider=SystemTimeProvider(),
+        strategy="passive-logging",
+    )
+
+
+def _three_walks(path: str) -> int:
+    """The handler before the single-pass scanner, inlined as baseline."""
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            content = _normalize_message_content(entry["message"].get("content"))
+            if "DES-VALIDATION" in content:
+                break
+    entries = []
+    with open(path) as f:
+        for line in f:
+            entries.append(json.loads(line))
+    events = extract_token_usage_events(entries, agent_name="bench")
+    _skill_service().track_from_transcript(path)
+    return len(events)
+
+
+def _single_pass(path: str) -> int:
+    count = [0]
+
+    def emit(_event) -> None:
+        count[0] += 1
+
+    skills = SkillLoadVisitor(_skill_service())
+    scan_transcript(
+        path,
+        (_DesMarkerVisitor(), TokenUsageVisitor(emit, agent_name="bench"), skills),
+    )
+    skills.track()
+    return count[0]
+
+
+def _time(fn, path: str, iterations: int) -> list[int]:
+    samples: list[int] = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn(path)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def _peak_mb(fn, path: str) -> float:
+    tracemalloc.start()
+    try:
+        fn(path)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(size_mb: int, iterations: int) -> tuple[list[LatencySummary], dict]:
+    """Time both variants and record their peak memory."""
+    with tempfile.TemporaryDirectory(prefix="des-transcript-bench-") as tmp:
+        path = Path(tmp) / "agent.jsonl"
+        turns = _build_transcript(path, size_mb)
+        assert _three_walks(str(path)) == _single_pass(str(path)) == turns
+        variants = {
+            f"three walks ({size_mb} MB)": _three_walks,
+            f"single pass ({size_mb} MB)": _single_pass,
+        }
+        summaries = [
+            summarize(label, _time(fn, str(path), iterations))
+            for label, fn in variants.items()
+        ]
+        peaks = {
+            label: round(_peak_mb(fn, str(path)), 1) for label, fn in variants.items()
+        }
+    return summaries, peaks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--json", action="store_true", help="emit JSON instead of a table"
+    )
+    args = parser.parse_args(argv)
+
+    summaries, peaks = run_benchmark(args.size_mb, args.iterations)
+    if args.json:
+        print(
+            json.dumps(
+                [{**s.to_dict(), "peak_mb": peaks[s.label]} for s in summaries],
+                indent=2,
+            )
+        )
+    else:
+        print(render_table(summaries))
+        for label, peak in peaks.items():
+            print(f"peak memory, {label}: {peak} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
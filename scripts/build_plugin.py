@@ -7,6 +7,7 @@ a plugin layout:
   nWave/tasks/nw/*.md   -> plugin/commands/*.md         (flat — plugin name provides /nw: prefix)
   nWave/skills/*/       -> plugin/skills/*/           (preserving structure)
   src/des/              -> plugin/scripts/des/         (imports rewritten)
+  (compiled)            -> plugin/scripts/des/**/__pycache__ (unchecked-hash .pyc)
   nWave/templates/*.json-> plugin/scripts/templates/   (DES runtime templates)
   pyproject.toml        -> plugin/.claude-plugin/plugin.json (version extraction)
   (generated)           -> plugin/hooks/hooks.json     (5 DES hook events)
@@ -40,6 +41,7 @@ _project_root = str(Path(__file__).resolve().parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from scripts.shared import bytecode  # noqa: E402
 from scripts.shared import hook_definitions as shared_hooks  # noqa: E402
 from scripts.shared.agent_catalog import (  # noqa: E402
     is_public_agent,
@@ -469,20 +471,31 @@ def validate_python_syntax(content: str, filename: str) -> str | None:
 
 # Plugin-path command template with self-discovery fallback.
 # Claude Code bug #24529: CLAUDE_PLUGIN_ROOT is not set in hook execution.
-# Workaround: Python one-liner discovers plugin path via pathlib glob.
-# Priority: CLAUDE_PLUGIN_ROOT > plugin cache glob > CLI install path.
+# Workaround: the Python one-liner discovers the plugin scripts root.
+# Priority: CLAUDE_PLUGIN_ROOT > cached path > plugin cache glob > CLI path.
+# The cached path lives in ~/.nwave/plugin-scripts-<version>.path and is
+# trusted only while <path>/des/__init__.py exists, so a warm hook costs
+# two stats and one small read however many plugin versions are cached.
+# The glob prefers this build's version directory and, when it finds a
+# hit, persists it via des...plugin_scripts_cache.remember.
 _PLUGIN_DISCOVERY_SCRIPT = (
     "import os,sys,pwd;"
-    "from pathlib import Path;"
     "r=os.environ.get('CLAUDE_PLUGIN_ROOT','');"
     "p=r+'/scripts' if r else '';"
     "h=os.environ.get('HOME') or '';"
     "h=h if len(h)>1 else pwd.getpwuid(os.getuid()).pw_dir;"
-    "p=p or next((str(s) for s in sorted("
-    "Path(h).joinpath('.claude/plugins/cache').glob('*/nw/*/scripts'))"
-    " if (s/'des'/'__init__.py').exists()),None);"
-    "p=p or str(Path(h)/'.claude/lib/python');"
+    "c=h+'/.nwave/plugin-scripts-{version}.path';"
+    "k='' if p or not os.path.isfile(c) else open(c).read().strip();"
+    "k=k if k and os.path.isfile(k+'/des/__init__.py') else '';"
+    "d=h+'/.claude/plugins/cache/*/nw/';"
+    "g='' if p or k else next((s for s in"
+    " sorted(__import__('glob').glob(d+'{version}/scripts'))"
+    "+sorted(__import__('glob').glob(d+'*/scripts'))"
+    " if os.path.isfile(s+'/des/__init__.py')),'');"
+    "p=p or k or g or h+'/.claude/lib/python';"
     "sys.path.insert(0,p);"
+    "g and __import__('des.adapters.drivers.hooks.plugin_scripts_cache',"
+    "fromlist=['remember']).remember(c,g);"
     "sys.argv=['des-hook','{action}'];"
     "from des.adapters.drivers.hooks.claude_code_hook_adapter import main;"
     "main()"
@@ -490,20 +503,25 @@ _PLUGIN_DISCOVERY_SCRIPT = (
 
 _PLUGIN_COMMAND_TEMPLATE = 'python3 -c "' + _PLUGIN_DISCOVERY_SCRIPT + '"'
 
+# Cache key used when a hook config is generated without a plugin version.
+_UNVERSIONED = "dev"
 
-def _plugin_command(action: str) -> str:
+
+def _plugin_command(action: str, version: str = "") -> str:
     """Generate a hook command using plugin-relative paths."""
-    return _PLUGIN_COMMAND_TEMPLATE.format(action=action)
+    return _PLUGIN_COMMAND_TEMPLATE.format(
+        action=action, version=version or _UNVERSIONED
+    )
 
 
-def _plugin_guard_command(action: str) -> str:
+def _plugin_guard_command(action: str, version: str = "") -> str:
     """Generate a Write/Edit guard command using plugin-relative paths."""
-    python_cmd = _PLUGIN_COMMAND_TEMPLATE.format(action=action)
-    return shared_hooks.build_guard_command(python_cmd)
+    return shared_hooks.build_guard_command(_plugin_command(action, version))
 
 
 def generate_hook_config(
     command_template: str | None = None,
+    version: str = "",
 ) -> dict[str, list[dict]]:
     """Generate hooks config in Claude Code settings.json format.
 
@@ -511,7 +529,8 @@ def generate_hook_config(
     https://code.claude.com/docs/en/plugins-reference#hooks
 
     Uses the shared hook definitions as single source of truth for
-    events, matchers, and actions.
+    events, matchers, and actions. *version* keys the bootstrap's cached
+    scripts-root, so each plugin release rediscovers it once.
     """
     if command_template is not None:
         # Legacy path: use template string directly (for tests with overrides)
@@ -521,7 +540,8 @@ def generate_hook_config(
         return shared_hooks.generate_hook_config(_legacy_command)
 
     return shared_hooks.generate_hook_config(
-        _plugin_command, guard_command_fn=_plugin_guard_command
+        lambda action: _plugin_command(action, version),
+        guard_command_fn=lambda action: _plugin_guard_command(action, version),
     )
 
 
@@ -577,7 +597,8 @@ def copy_des_module(config: BuildConfig, plugin_dir: Path) -> StepResult:
     dest_dir = plugin_dir / "scripts" / "des"
     shutil.copytree(config.des_dir, dest_dir, dirs_exist_ok=True)
 
-    # __pycache__ contains absolute paths from the build machine — ship source only
+    # Copied __pycache__ holds absolute paths from the build machine; the
+    # des_bytecode step recompiles reproducibly once imports are rewritten
     for cache_dir in dest_dir.rglob("__pycache__"):
         if cache_dir.is_dir():
             shutil.rmtree(cache_dir)
@@ -599,6 +620,20 @@ def copy_des_module(config: BuildConfig, plugin_dir: Path) -> StepResult:
     return StepResult.ok("des_module", files_rewritten)
 
 
+def compile_des_bytecode(plugin_dir: Path) -> StepResult:
+    """Precompile plugin/scripts/des/ to unchecked-hash bytecode.
+
+    Compiles once per supported Python version found on PATH, so hook
+    processes in a read-only plugin cache never compile DES at startup.
+    """
+    des_dir = plugin_dir / "scripts" / "des"
+    interpreters = bytecode.available_interpreters()
+    error = bytecode.compile_tree(des_dir, interpreters)
+    if error is not None:
+        return StepResult.fail("des_bytecode", error)
+    return StepResult.ok("des_bytecode", len(interpreters))
+
+
 def copy_templates(config: BuildConfig, plugin_dir: Path) -> StepResult:
     """Copy DES runtime templates to plugin/scripts/templates/."""
     templates_dir = config.nwave_dir / "templates"
@@ -621,7 +656,9 @@ def copy_templates(config: BuildConfig, plugin_dir: Path) -> StepResult:
 
 
 def generate_hooks_json(
-    plugin_dir: Path, hook_template_override: dict | None = None
+    plugin_dir: Path,
+    hook_template_override: dict | None = None,
+    version: str = "",
 ) -> StepResult:
     """Generate hooks/hooks.json with all 5 DES enforcement events.
 
@@ -634,7 +671,7 @@ def generate_hooks_json(
     if hook_template_override is not None:
         config = hook_template_override.get("hooks", {})
     else:
-        config = generate_hook_config()
+        config = generate_hook_config(version=version)
 
     validation_error = validate_hook_config(config)
     if validation_error is not None:
@@ -721,7 +758,8 @@ def build(config: BuildConfig, *, version_override: str | None = None) -> BuildR
     """Execute the plugin assembly pipeline.
 
     Pipeline: validate -> read_version -> copy_agents -> copy_commands
-              -> copy_skills -> copy_des_module -> copy_templates
+              -> copy_skills -> copy_des_module -> compile_des_bytecode
+              -> copy_templates
               -> generate_hooks_json -> generate_hook_wrapper
               -> generate_metadata -> write_metadata
 
@@ -799,12 +837,19 @@ def build(config: BuildConfig, *, version_override: str | None = None) -> BuildR
     if not des_result.success:
         return _fail(des_result.error, tuple(steps))
 
+    bytecode_result = compile_des_bytecode(plugin_dir)
+    steps.append(bytecode_result)
+    if not bytecode_result.success:
+        return _fail(bytecode_result.error, tuple(steps))
+
     # Step 8: DES runtime templates
     templates_result = copy_templates(config, plugin_dir)
     steps.append(templates_result)
 
     # Step 9: Hook configuration
-    hooks_result = generate_hooks_json(plugin_dir, config.hook_template_override)
+    hooks_result = generate_hooks_json(
+        plugin_dir, config.hook_template_override, version
+    )
     steps.append(hooks_result)
     if not hooks_result.success:
         return _fail(hooks_result.error, tuple(steps))
@@ -937,6 +982,15 @@ def _validate_des_module(plugin_dir: Path) -> tuple[bool, list[str]]:
     return True, errors
 
 
+def _validate_des_bytecode(plugin_dir: Path) -> tuple[bool, list[str]]:
+    """Validate scripts/des/ ships current unchecked-hash bytecode."""
+    des_dir = plugin_dir / "scripts" / "des"
+    if not des_dir.is_dir():
+        return False, []
+    errors = [f"Invalid DES bytecode: {p}" for p in bytecode.bytecode_problems(des_dir)]
+    return len(errors) == 0, errors
+
+
 def generate_marketplace_manifest(
     plugin_dir: Path,
     download_url: str = "",
@@ -1012,6 +1066,11 @@ def validate(plugin_dir: Path) -> ValidationResult:
     sections["des_module"] = des_ok
     all_errors.extend(des_errors)
 
+    # DES bytecode validation
+    bytecode_ok, bytecode_errors = _validate_des_bytecode(plugin_dir)
+    sections["des_bytecode"] = bytecode_ok
+    all_errors.extend(bytecode_errors)
+
     return ValidationResult(
         success=len(all_errors) == 0,
         errors=tuple(all_errors),
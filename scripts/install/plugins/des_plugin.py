@@ -7,6 +7,7 @@ import subprocess
 import sys
 from pathlib import Path
 
+from scripts.shared import bytecode
 from scripts.shared import hook_definitions as shared_hooks
 
 from .base import InstallationPlugin, InstallContext, PluginResult
@@ -270,8 +271,10 @@ class DESPlugin(InstallationPlugin):
                 if not using_prebuilt:
                     self._rewrite_import_paths(target_dir, context)
 
-                # Clear bytecode cache to prevent stale .pyc files
+                # Clear bytecode cache to prevent stale .pyc files, then
+                # precompile so hook cold starts never compile DES
                 self._clear_bytecode_cache(target_dir, context)
+                self._compile_bytecode(target_dir, context)
 
             return PluginResult(
                 success=True,
@@ -376,6 +379,22 @@ class DESPlugin(InstallationPlugin):
                 f"  🧹 Cleared {cleared} __pycache__ directories from {target_dir}"
             )
 
+    def _compile_bytecode(self, target_dir: Path, context: InstallContext) -> None:
+        """Precompile the installed DES module for the hook interpreter.
+
+        Writes unchecked-hash .pyc files (see scripts/shared/bytecode.py)
+        with the same Python that _resolve_python_path puts in hook
+        commands. Best effort: on failure hooks still run from source.
+        """
+        interpreter = sys.executable
+        if self._resolve_python_path() == "python3":
+            interpreter = shutil.which("python3") or sys.executable
+        error = bytecode.compile_tree(target_dir, [interpreter])
+        if error is not None:
+            context.logger.warn(f"  ⚠️ {error}")
+        else:
+            context.logger.info(f"  ⚡ Precompiled DES bytecode in {target_dir}")
+
     def _install_des_scripts(self, context: InstallContext) -> PluginResult:
         """Install DES utility scripts."""
         try:
@@ -573,6 +592,21 @@ class DESPlugin(InstallationPlugin):
                 if not all_up_to_date:
                     break
 
+            # Migration: a DES entry that matches no desired entry was
+            # superseded (e.g. the separate subagent-stop / deliver-progress
+            # SubagentStop pair, now one subagent-stop-composite entry), so
+            # the DES hooks are rewritten below even if all desired exist.
+            if all_up_to_date:
+                all_up_to_date = not any(
+                    shared_hooks.is_des_hook_entry(existing)
+                    and not any(
+                        _entry_matches(existing, desired)
+                        for desired in desired_hooks.get(event, [])
+                    )
+                    for event in self.HOOK_EVENTS
+                    for existing in config["hooks"].get(event, [])
+                )
+
             # Ensure slash command budget is sufficient for nWave commands
             # Without this, commands disappear in long sessions (>50% context)
             env_changed = False
@@ -0,0 +1,141 @@
+"""Precompiled bytecode for the DES module -- shared by plugin and installer.
+
+Hook processes import ``des`` on every invocation. Without bytecode next
+to the source (read-only plugin caches, freshly synced ~/.claude), each
+process recompiles the whole package first. Both distribution paths
+therefore ship ``unchecked-hash`` .pyc files: no mtime in the header, a
+source hash instead, and no source stat or hash check at import time.
+
+Builds are reproducible: files are compiled with a fixed PYTHONHASHSEED
+and a relative ``ddir``, so the same source and interpreter produce the
+same bytes on any machine.
+
+Usage::
+
+    from scripts.shared.bytecode import compile_tree, bytecode_problems
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+
+# Python minor versions nWave supports (pyproject.toml classifiers).
+SUPPORTED_PYTHON_VERSIONS = ("3.10", "3.11", "3.12", "3.13")
+
+# PEP 552 flags word: bit 0 = hash-based, bit 1 = check_source.
+_UNCHECKED_HASH_FLAGS = 0b01
+_HEADER_SIZE = 16
+
+
+def available_interpreters() -> list[str]:
+    """Return one interpreter per supported minor version found on PATH.
+
+    The running interpreter is always first, so at least its cache tag is
+    covered even when no other pythonX.Y is installed. A candidate must
+    run and report its version: version-manager shims (pyenv, asdf) put
+    pythonX.Y on PATH even when that version is not installed.
+    """
+    interpreters = [sys.executable]
+    current = f"{sys.version_info.major}.{sys.version_info.minor}"
+    for version in SUPPORTED_PYTHON_VERSIONS:
+        if version == current:
+            continue
+        found = shutil.which(f"python{version}")
+        if found and _reports_version(found, version):
+            interpreters.append(found)
+    return interpreters
+
+
+def _reports_version(python: str, version: str) -> bool:
+    """Return True if *python* runs and is the expected minor version."""
+    try:
+        result = subprocess.run(
+            [python, "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0 and result.stdout.strip() == version
+
+
+def compile_tree(root: Path, interpreters: list[str] | None = None) -> str | None:
+    """Compile every module under *root* to unchecked-hash bytecode.
+
+    Args:
+        root: Package directory (e.g. .../scripts/des); its name becomes
+            the recorded source prefix.
+        interpreters: Python executables to compile with, one cache tag
+            each. Defaults to ``available_interpreters()``.
+
+    Returns:
+        None on success, or an error message naming the failing interpreter.
+    """
+    env = {**os.environ, "PYTHONHASHSEED": "0"}
+    env.pop("SOURCE_DATE_EPOCH", None)
+    for python in interpreters or available_interpreters():
+        try:
+            result = subprocess.run(
+                [
+                    python,
+                    "-m",
+                    "compileall",
+                    "-q",
+                    "-f",
+                    "--invalidation-mode",
+                    "unchecked-hash",
+                    "-d",
+                    root.name,
+                    str(root),
+                ],
+                capture_output=True,
+                text=True,
+                env=env,
+                timeout=300,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            return f"Bytecode compilation with {python} failed: {exc}"
+        if result.returncode != 0:
+            detail = (result.stdout + result.stderr).strip().splitlines()
+            return f"Bytecode compilation with {python} failed: " + (
+                detail[-1] if detail else f"exit code {result.returncode}"
+            )
+    return None
+
+
+def bytecode_problems(root: Path) -> list[str]:
+    """Report modules under *root* whose bytecode is missing or not current.
+
+    Every module must have an unchecked-hash .pyc for the running
+    interpreter whose source hash matches the source. Bytecode for other
+    cache tags must be unchecked-hash too; its hash uses that version's
+    key and is not re-derived here.
+    """
+    problems: list[str] = []
+    for source in sorted(root.rglob("*.py")):
+        if "__pycache__" in source.parts:
+            continue
+        relative = source.relative_to(root.parent).as_posix()
+        own = Path(importlib.util.cache_from_source(str(source)))
+        if not own.exists():
+            problems.append(f"Missing bytecode: {relative}")
+        for pyc in sorted(source.parent.glob(f"__pycache__/{source.stem}.*.pyc")):
+            header = pyc.read_bytes()[:_HEADER_SIZE]
+            flags = int.from_bytes(header[4:8], "little")
+            if flags != _UNCHECKED_HASH_FLAGS:
+                problems.append(
+                    "Bytecode is not unchecked-hash: "
+                    + pyc.relative_to(root.parent).as_posix()
+                )
+            elif pyc == own and header[8:16] != importlib.util.source_hash(
+                source.read_bytes()
+            ):
+                problems.append(f"Stale bytecode: {relative}")
+    return problems
@@ -12,9 +12,43 @@ not in WHAT hooks are registered.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class FileExists:
+    """Pre-filter predicate: a path under the project directory exists.
+
+    Attributes:
+        path: Path relative to the hook's working directory (the project
+            root). A trailing ``*`` matches any file with that prefix,
+            e.g. the namespaced ``des-task-active-*`` signals.
+    """
+
+    path: str
+
+
+@dataclass(frozen=True)
+class PayloadContains:
+    """Pre-filter predicate: the raw hook JSON payload contains ``text``.
+
+    JSON encoders leave printable ASCII unescaped (apart from quote and
+    backslash), so an ASCII needle found in a decoded field is also found
+    in the raw payload.
+
+    Attributes:
+        text: Substring to look for.
+        ignore_case: Match ASCII letters case-insensitively.
+    """
+
+    text: str
+    ignore_case: bool = False
+
+
+Prefilter = FileExists | PayloadContains
+
+
 @dataclass(frozen=True)
 class HookEvent:
     """A single DES hook event registration.
@@ -30,6 +64,9 @@ class HookEvent:
         shell_command: Verbatim shell command string. When set,
             generate_hook_config uses this directly instead of
             command_fn or guard_command_fn. No Python handler needed.
+        prefilter: Predicates compiled into a shell guard in front of the
+            Python command (see build_prefilter_command). Python starts
+            only when at least one holds; empty means it always starts.
     """
 
     event: str
@@ -37,14 +74,20 @@ class HookEvent:
     action: str
     is_guard: bool = False
     shell_command: str | None = None
+    prefilter: tuple[Prefilter, ...] = ()
 
 
-# Pure-shell guard for Bash commands that target execution-log.json.
+# Shell guard for Bash commands that target execution-log.json.
 # The "# des-hook:pre-bash;" prefix is a shell comment (no-op) that serves
 # as a DES marker string for is_des_hook_entry detection.
+# Fast path: a POSIX `case` on the raw JSON payload exits 0 without
+# starting python3 unless "execution-log" occurs anywhere in it (JSON
+# encoders leave ASCII letters unescaped, so the substring cannot hide).
+# Only then is tool_input.command extracted exactly and checked.
 _BASH_EXECUTION_LOG_GUARD = (
     "# des-hook:pre-bash\n"
     "INPUT=$(cat); "
+    'case "$INPUT" in *execution-log*) ;; *) exit 0 ;; esac; '
     'CMD=$(echo "$INPUT" | python3 -c '
     '"import sys,json; print(json.load(sys.stdin)'
     ".get('tool_input',{}).get('command',''))\"); "
@@ -58,10 +101,37 @@ _BASH_EXECUTION_LOG_GUARD = (
     "exit 2"
 )
 
+# Pre-filter predicates: the DES state each Agent handler reacts to.
+# Ordinary non-DES subagent traffic matches none of them, so the compiled
+# guard exits 0 without starting a DES interpreter.
+_DES_PROMPT = PayloadContains("DES-VALIDATION")
+_DES_TASK_ACTIVE = FileExists(".nwave/des/des-task-active*")
+_DELIVER_SESSION = FileExists(".nwave/des/deliver-session.json")
+
+# pre-task allows every prompt without DES markers unless
+# DesEnforcementPolicy finds a step id, and its pattern always contains
+# "step" (any case).
+_PRE_TASK_PREFILTER = (_DES_PROMPT, PayloadContains("step", ignore_case=True))
+
+# post-tool-use only injects context for DES prompts or after a DES step
+# recorded in the audit log; outside a deliver session and with no DES
+# subagent running, a non-DES Agent call is passed through.
+_POST_TOOL_USE_PREFILTER = (_DES_PROMPT, _DES_TASK_ACTIVE, _DELIVER_SESSION)
+
+# SubagentStop has no pre-filter: the gate also detects DES subagents from
+# markers in the transcript (not in the payload, and with no signal file),
+# and token-usage instrumentation records AGENT_USAGE_OBSERVED for every
+# subagent, DES or not.
+
 # Canonical hook event definitions -- the ONLY place these are defined.
 # Order matters: PreToolUse/Agent must come before Write/Edit guards.
 HOOK_EVENTS: tuple[HookEvent, ...] = (
-    HookEvent(event="PreToolUse", matcher="Agent", action="pre-task"),
+    HookEvent(
+        event="PreToolUse",
+        matcher="Agent",
+        action="pre-task",
+        prefilter=_PRE_TASK_PREFILTER,
+    ),
     HookEvent(event="PreToolUse", matcher="Write", action="pre-write", is_guard=True),
     HookEvent(event="PreToolUse", matcher="Edit", action="pre-edit", is_guard=True),
     HookEvent(
@@ -70,9 +140,15 @@ HOOK_EVENTS: tuple[HookEvent, ...] = (
         action="pre-bash",
         shell_command=_BASH_EXECUTION_LOG_GUARD,
     ),
-    HookEvent(event="PostToolUse", matcher="Agent", action="post-tool-use"),
-    HookEvent(event="SubagentStop", matcher=None, action="subagent-stop"),
-    HookEvent(event="SubagentStop", matcher=None, action="deliver-progress"),
+    HookEvent(
+        event="PostToolUse",
+        matcher="Agent",
+        action="post-tool-use",
+        prefilter=_POST_TOOL_USE_PREFILTER,
+    ),
+    # One process runs subagent-stop then deliver-progress over one parsed
+    # input and one transcript scan (subagent_stop_composite_handler).
+    HookEvent(event="SubagentStop", matcher=None, action="subagent-stop-composite"),
     HookEvent(event="SessionStart", matcher="startup", action="session-start"),
     HookEvent(event="SubagentStart", matcher=None, action="subagent-start"),
 )
@@ -94,6 +170,8 @@ def generate_hook_config(
         guard_command_fn: Optional callable(action: str) -> str for
             Write/Edit guard hooks that use shell fast-path. If None,
             guard hooks use command_fn instead (no fast-path).
+            Hooks with a prefilter wrap command_fn's command in the
+            compiled pre-filter guard.
 
     Returns:
         Dict mapping event names to lists of hook entries, matching
@@ -107,6 +185,10 @@ def generate_hook_config(
             command = hook_event.shell_command
         elif hook_event.is_guard and guard_command_fn is not None:
             command = guard_command_fn(hook_event.action)
+        elif hook_event.prefilter:
+            command = build_prefilter_command(
+                hook_event.prefilter, command_fn(hook_event.action)
+            )
         else:
             command = command_fn(hook_event.action)
 
@@ -144,6 +226,66 @@ def build_guard_command(python_cmd: str) -> str:
     ).format(python_cmd=python_cmd)
 
 
+# Characters that are literal in both a `case` pattern and a path.
+_SHELL_LITERAL = "A-Za-z0-9._/-"
+_SAFE_PATH = re.compile(f"[{_SHELL_LITERAL}]+\\*?")
+_PATTERN_CHUNK = re.compile(f"([{_SHELL_LITERAL}]+)|([^{_SHELL_LITERAL}]+)")
+
+
+def _case_pattern(predicate: PayloadContains) -> str:
+    """Compile a PayloadContains predicate into a POSIX `case` pattern."""
+    pattern = ""
+    for literal, special in _PATTERN_CHUNK.findall(predicate.text):
+        if special:
+            pattern += "'" + special.replace("'", "'\\''") + "'"
+        elif predicate.ignore_case:
+            pattern += "".join(
+                f"[{c.upper()}{c.lower()}]" if c.isalpha() else c for c in literal
+            )
+        else:
+            pattern += literal
+    return f"*{pattern}*"
+
+
+def _file_test(predicate: FileExists) -> str:
+    """Compile a FileExists predicate into a shell test (builtins only)."""
+    if not _SAFE_PATH.fullmatch(predicate.path):
+        raise ValueError(f"Unsupported pre-filter path: {predicate.path!r}")
+    if predicate.path.endswith("*"):
+        # An unmatched glob stays literal, so "$1" does not exist.
+        return f'{{ set -- {predicate.path}; test -e "$1"; }}'
+    return f"test -e {predicate.path}"
+
+
+def build_prefilter_command(prefilter: tuple[Prefilter, ...], python_cmd: str) -> str:
+    """Build a shell guard that starts *python_cmd* only if a predicate holds.
+
+    The guard:
+    1. Buffers stdin (hook input JSON)
+    2. Matches the payload against every PayloadContains with one `case`
+    3. Otherwise tests every FileExists path -- exits 0 if none exists
+    4. Pipes the buffered payload into Python for the full handler
+
+    Only shell builtins run before Python, so a filtered-out invocation
+    costs one shell and no interpreter start-up.
+
+    Args:
+        prefilter: Predicates from HookEvent.prefilter (at least one).
+        python_cmd: The full Python command string for the action.
+
+    Returns:
+        Shell command string.
+    """
+    patterns = [_case_pattern(p) for p in prefilter if isinstance(p, PayloadContains)]
+    file_tests = [_file_test(p) for p in prefilter if isinstance(p, FileExists)]
+    skip = " || ".join([*file_tests, "exit 0"])
+    if patterns:
+        guard = f'case "$INPUT" in {"|".join(patterns)}) ;; *) {skip} ;; esac; '
+    else:
+        guard = f"{skip}; "
+    return f"INPUT=$(cat); {guard}printf '%s\\n' \"$INPUT\" | {python_cmd}"
+
+
 def _is_des_command(command: str) -> bool:
     """Check if a command string belongs to DES.
 
@@ -27,43 +27,82 @@ New code should import from the specific layer packages:
   - from des.adapters.driven import EnvironmentConfigAdapter
 """
 
-# Re-export all key classes for backward compatibility
-from des.adapters.driven import (
-    ClaudeCodeTaskAdapter,
-    EnvironmentConfigAdapter,
-    InMemoryConfigAdapter,
-    MockedTaskAdapter,
-    RealFileSystem,
-    SilentLogger,
-    StructuredLogger,
-    SystemTimeProvider,
-)
-from des.application.config_loader import ConfigLoader
-from des.application.invocation_limits_validator import (
-    InvocationLimitsResult,
-    InvocationLimitsValidator,
-)
-from des.application.orchestrator import DESOrchestrator
-from des.application.validator import TDDPhaseValidator, TemplateValidator
-from des.domain import (
-    TimeoutMonitor,
-    TurnCounter,
-)
-from des.ports.driven_ports import (
-    ConfigPort,
-    FileSystemPort,
-    LoggingPort,
-    TaskInvocationPort,
-    TimeProvider,
-)
-from des.ports.driven_ports.hook_port import HookPort
-from des.ports.driver_ports import ValidatorPort
+from typing import TYPE_CHECKING
 
+from des._lazy import lazy_getattr
 
-# Backward compatibility aliases
-RealValidator = TemplateValidator
-RealFilesystem = RealFileSystem
-SystemTime = SystemTimeProvider
+
+if TYPE_CHECKING:
+    from des.adapters.driven import (
+        ClaudeCodeTaskAdapter,
+        EnvironmentConfigAdapter,
+        InMemoryConfigAdapter,
+        MockedTaskAdapter,
+        RealFileSystem,
+        SilentLogger,
+        StructuredLogger,
+        SystemTimeProvider,
+    )
+    from des.application.config_loader import ConfigLoader
+    from des.application.invocation_limits_validator import (
+        InvocationLimitsResult,
+        InvocationLimitsValidator,
+    )
+    from des.application.orchestrator import DESOrchestrator
+    from des.application.validator import TDDPhaseValidator, TemplateValidator
+    from des.domain import (
+        TimeoutMonitor,
+        TurnCounter,
+    )
+    from des.ports.driven_ports import (
+        ConfigPort,
+        FileSystemPort,
+        LoggingPort,
+        TaskInvocationPort,
+        TimeProvider,
+    )
+    from des.ports.driven_ports.hook_port import HookPort
+    from des.ports.driver_ports import ValidatorPort
+
+    # Backward compatibility aliases
+    RealValidator = TemplateValidator
+    RealFilesystem = RealFileSystem
+    SystemTime = SystemTimeProvider
+
+
+# Re-exports resolve on first access (see des._lazy): importing any des.*
+# module, e.g. a single hook handler, must not load the whole package.
+_EXPORTS = {
+    "ClaudeCodeTaskAdapter": "des.adapters.driven.task_invocation.claude_code_task_adapter",
+    "EnvironmentConfigAdapter": "des.adapters.driven.config.environment_config_adapter",
+    "InMemoryConfigAdapter": "des.adapters.driven.config.in_memory_config_adapter",
+    "MockedTaskAdapter": "des.adapters.driven.task_invocation.mocked_task_adapter",
+    "RealFileSystem": "des.adapters.driven.filesystem.real_filesystem",
+    "SilentLogger": "des.adapters.driven.logging.silent_logger",
+    "StructuredLogger": "des.adapters.driven.logging.structured_logger",
+    "SystemTimeProvider": "des.adapters.driven.time.system_time",
+    "ConfigLoader": "des.application.config_loader",
+    "InvocationLimitsResult": "des.application.invocation_limits_validator",
+    "InvocationLimitsValidator": "des.application.invocation_limits_validator",
+    "DESOrchestrator": "des.application.orchestrator",
+    "TDDPhaseValidator": "des.application.validator",
+    "TemplateValidator": "des.application.validator",
+    "TimeoutMonitor": "des.domain.timeout_monitor",
+    "TurnCounter": "des.domain.turn_counter",
+    "ConfigPort": "des.ports.driven_ports.config_port",
+    "FileSystemPort": "des.ports.driven_ports.filesystem_port",
+    "LoggingPort": "des.ports.driven_ports.logging_port",
+    "TaskInvocationPort": "des.ports.driven_ports.task_invocation_port",
+    "TimeProvider": "des.ports.driven_ports.time_provider_port",
+    "HookPort": "des.ports.driven_ports.hook_port",
+    "ValidatorPort": "des.ports.driver_ports.validator_port",
+    # Backward compatibility aliases
+    "RealValidator": "des.application.validator:TemplateValidator",
+    "RealFilesystem": "des.adapters.driven.filesystem.real_filesystem:RealFileSystem",
+    "SystemTime": "des.adapters.driven.time.system_time:SystemTimeProvider",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "ClaudeCodeTaskAdapter",
@@ -0,0 +1,49 @@
+"""Lazy re-exports for DES package ``__init__`` modules (PEP 562).
+
+DES packages re-export their key classes for backward compatibility
+(``from des import DESOrchestrator``). Importing every one of them eagerly
+means that *any* ``des.*`` import — including a one-shot hook process that
+needs a single handler — pays for the orchestrator, validators, git
+adapters and their stdlib dependencies.
+
+Package ``__init__`` modules instead declare what they re-export and bind
+``__getattr__ = lazy_getattr(__name__, _EXPORTS)``. The target module is
+imported on first attribute access and the value is cached in the package
+namespace, so subsequent lookups cost a dict hit and ``unittest.mock.patch``
+keeps working on the package attribute.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def lazy_getattr(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module-level ``__getattr__`` resolving *exports* on demand.
+
+    Args:
+        package: ``__name__`` of the package defining the re-exports.
+        exports: Public name -> ``"module.path"`` (attribute of the same
+            name) or ``"module.path:attribute"`` (aliases).
+
+    Returns:
+        A ``__getattr__(name)`` function suitable for assignment at module
+        level in the package ``__init__``.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_path, _, attribute = target.partition(":")
+        value = getattr(importlib.import_module(module_path), attribute or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
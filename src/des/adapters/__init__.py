@@ -6,17 +6,36 @@ for both production and test environments. Organized into driver (inbound)
 and driven (outbound) adapters following hexagonal architecture.
 """
 
-from des.adapters.driven import (
-    ClaudeCodeTaskAdapter,
-    EnvironmentConfigAdapter,
-    InMemoryConfigAdapter,
-    MockedTaskAdapter,
-    RealFileSystem,
-    SilentLogger,
-    StructuredLogger,
-    SystemTime,
-)
+from typing import TYPE_CHECKING
 
+from des._lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven import (
+        ClaudeCodeTaskAdapter,
+        EnvironmentConfigAdapter,
+        InMemoryConfigAdapter,
+        MockedTaskAdapter,
+        RealFileSystem,
+        SilentLogger,
+        StructuredLogger,
+        SystemTime,
+    )
+
+
+_EXPORTS = {
+    "ClaudeCodeTaskAdapter": "des.adapters.driven.task_invocation.claude_code_task_adapter",
+    "EnvironmentConfigAdapter": "des.adapters.driven.config.environment_config_adapter",
+    "InMemoryConfigAdapter": "des.adapters.driven.config.in_memory_config_adapter",
+    "MockedTaskAdapter": "des.adapters.driven.task_invocation.mocked_task_adapter",
+    "RealFileSystem": "des.adapters.driven.filesystem.real_filesystem",
+    "SilentLogger": "des.adapters.driven.logging.silent_logger",
+    "StructuredLogger": "des.adapters.driven.logging.structured_logger",
+    "SystemTime": "des.adapters.driven.time.system_time:SystemTimeProvider",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "ClaudeCodeTaskAdapter",
@@ -1,6 +1,10 @@
 """Config driven adapters."""
 
-from des.adapters.driven.config.des_config import DESConfig
+from des.adapters.driven.config.des_config import (
+    DESConfig,
+    clear_des_config_cache,
+    load_des_config,
+)
 from des.adapters.driven.config.environment_config_adapter import (
     EnvironmentConfigAdapter,
 )
@@ -9,4 +13,10 @@ from des.adapters.driven.config.in_memory_config_adapter import (
 )
 
 
-__all__ = ["DESConfig", "EnvironmentConfigAdapter", "InMemoryConfigAdapter"]
+__all__ = [
+    "DESConfig",
+    "EnvironmentConfigAdapter",
+    "InMemoryConfigAdapter",
+    "clear_des_config_cache",
+    "load_des_config",
+]
@@ -17,6 +17,7 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from des.domain.atomic_write import write_atomic
 from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
 
 
@@ -333,3 +334,83 @@ class DESConfig:
             path.unlink()
         except FileNotFoundError:
             pass
+
+    # --- Cached update-check verdict (written by the background worker) ---
+
+    @property
+    def update_verdict_path(self) -> Path:
+        """Path to the cached update-check verdict, next to the project config."""
+        return self._config_path.parent / "update-verdict.json"
+
+    def save_update_verdict(self, verdict: dict[str, Any]) -> None:
+        """Persist the latest update-check verdict.
+
+        Written to a temporary file and renamed into place, so a SessionStart
+        reading concurrently never sees a partial verdict.
+        """
+        path = self.update_verdict_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_nwave_gitignore(path.parent)
+        write_atomic(path, json.dumps(verdict, indent=2))
+
+    def read_update_verdict(self) -> dict[str, Any] | None:
+        """Read the cached verdict. Returns None if missing or invalid JSON."""
+        verdict = self._load_json_file(self.update_verdict_path)
+        return verdict if isinstance(verdict, dict) and verdict else None
+
+    def clear_update_verdict(self) -> None:
+        """Remove the cached verdict. Idempotent (no error if absent)."""
+        self.update_verdict_path.unlink(missing_ok=True)
+
+
+# --- Process-scoped snapshot cache ---
+#
+# A hook process (or the resident hook server) asks for DES configuration
+# several times per invocation: audit writer factory, skill tracking, and
+# every log_* helper. Each DESConfig() reads and parses two JSON files.
+# Snapshots are keyed on (mtime_ns, size) of both files so a config edit —
+# including DESConfig's own writes — is picked up on the next lookup.
+
+_StatKey = tuple[int, int] | None
+
+_snapshots: dict[Path, tuple[tuple[_StatKey, _StatKey], DESConfig]] = {}
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_des_config(cwd: Path | None = None) -> DESConfig:
+    """Return the process-wide DESConfig snapshot for *cwd*.
+
+    Reuses the previously loaded instance while neither the project nor the
+    global config file has changed; otherwise loads a fresh DESConfig.
+    Environment overrides are unaffected: DESConfig reads them on access.
+
+    Args:
+        cwd: Working directory (defaults to Path.cwd())
+
+    Returns:
+        DESConfig for the current state of the config files
+    """
+    effective_cwd = cwd or Path.cwd()
+    project_path = effective_cwd / ".nwave" / "des-config.json"
+    fingerprint = (
+        _stat_key(project_path),
+        _stat_key(DESConfig._DEFAULT_GLOBAL_CONFIG_PATH),
+    )
+    cached = _snapshots.get(effective_cwd)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    config = DESConfig(cwd=effective_cwd)
+    _snapshots[effective_cwd] = (fingerprint, config)
+    return config
+
+
+def clear_des_config_cache() -> None:
+    """Drop all cached DESConfig snapshots (tests, server reloads)."""
+    _snapshots.clear()
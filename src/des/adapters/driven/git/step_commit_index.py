@@ -0,0 +1,184 @@
+"""Incremental Step-ID -> commit index for GitCommitVerifier.
+
+``git log --grep="Step-ID: <id>" -1`` walks the whole history whenever the
+step has no commit yet -- the common failure path -- and times out on
+repositories with six-figure commit counts. The index maps every Step-ID
+trailer value to the newest commit carrying it, so a lookup is one dict
+access.
+
+It lives in ``.nwave/des/step-commit-index.json`` under the project:
+
+    {"version": 1, "head": "<sha>",
+     "steps": {"01-01": ["<sha>", "<author date>", "<subject>"], ...}}
+
+Each refresh compares HEAD with the indexed head. If the indexed head is an
+ancestor of HEAD, only ``<indexed head>..HEAD`` is scanned and its Step-IDs
+take precedence. Otherwise (rebase, reset, branch switch) the index is
+rebuilt from the full history once. The rebuild walks every commit, just as
+one missed ``--grep`` lookup used to, so it gets a longer timeout.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from des.domain.atomic_write import write_atomic
+from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
+
+
+INDEX_RELATIVE_PATH = Path(".nwave") / "des" / "step-commit-index.json"
+
+GIT_TIMEOUT_SECONDS = 5
+REBUILD_TIMEOUT_SECONDS = 60
+
+_VERSION = 1
+_STEP_ID = re.compile(r"Step-ID: (\S+)")
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+_LOG_FORMAT = f"--format=%H{_FIELD_SEP}%ai{_FIELD_SEP}%s{_FIELD_SEP}%B{_RECORD_SEP}"
+
+
+class StepCommitIndexError(Exception):
+    """A git command needed to refresh the index failed."""
+
+
+@dataclass(frozen=True)
+class IndexedCommit:
+    """The newest commit carrying a given Step-ID trailer."""
+
+    commit_hash: str
+    commit_date: str
+    commit_subject: str
+
+
+@dataclass(frozen=True)
+class StepCommitIndex:
+    """Step-ID -> newest commit, as of commit ``head``."""
+
+    head: str
+    steps: dict[str, IndexedCommit]
+
+    def lookup(self, step_id: str) -> IndexedCommit | None:
+        """Return the newest commit with trailer ``Step-ID: <step_id>``."""
+        return self.steps.get(step_id)
+
+
+def _git(cwd: str, args: list[str], timeout: float) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=cwd,
+    )
+
+
+def _checked_git(cwd: str, args: list[str], timeout: float) -> str:
+    result = _git(cwd, args, timeout)
+    if result.returncode != 0:
+        raise StepCommitIndexError(f"git command failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def scan_step_commits(
+    cwd: str, revision_range: str, timeout: float = REBUILD_TIMEOUT_SECONDS
+) -> dict[str, IndexedCommit]:
+    """Map each Step-ID in *revision_range* to its newest commit.
+
+    Only commits mentioning "Step-ID: " are printed by git, so the output
+    stays small however long the range is.
+
+    Raises:
+        StepCommitIndexError: If git log fails
+    """
+    output = _checked_git(
+        cwd,
+        ["log", "--fixed-strings", "--grep=Step-ID: ", _LOG_FORMAT, revision_range],
+        timeout,
+    )
+    steps: dict[str, IndexedCommit] = {}
+    for record in output.split(_RECORD_SEP):
+        fields = record.lstrip("\n").split(_FIELD_SEP, 3)
+        if len(fields) != 4:
+            continue
+        commit_hash, commit_date, subject, message = fields
+        for step_id in _STEP_ID.findall(message):
+            # git log lists newest first; keep the first commit per step
+            steps.setdefault(step_id, IndexedCommit(commit_hash, commit_date, subject))
+    return steps
+
+
+def load_index(path: Path) -> StepCommitIndex | None:
+    """Read the index at *path*; missing or malformed files yield None."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != _VERSION:
+            return None
+        return StepCommitIndex(
+            head=str(data["head"]),
+            steps={
+                step_id: IndexedCommit(*commit)
+                for step_id, commit in data["steps"].items()
+            },
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_index(path: Path, index: StepCommitIndex) -> None:
+    """Write *index* to *path* (write to tmp, then rename).
+
+    Raises:
+        OSError: If the index cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_nwave_gitignore(path.parent)
+    payload = {
+        "version": _VERSION,
+        "head": index.head,
+        "steps": {
+            step_id: [c.commit_hash, c.commit_date, c.commit_subject]
+            for step_id, c in index.steps.items()
+        },
+    }
+    write_atomic(path, json.dumps(payload))
+
+
+def refresh_index(cwd: str) -> StepCommitIndex:
+    """Return the index of the repository at *cwd*, up to date with HEAD.
+
+    Raises:
+        StepCommitIndexError: If a git command fails (e.g. not a repository,
+            or no commits yet)
+        subprocess.TimeoutExpired: If git exceeds its timeout
+    """
+    path = Path(cwd) / INDEX_RELATIVE_PATH
+    index = load_index(path)
+    head = _checked_git(cwd, ["rev-parse", "HEAD"], GIT_TIMEOUT_SECONDS).strip()
+    if index is not None and index.head == head:
+        return index
+
+    if index is not None and _is_ancestor(cwd, index.head, head):
+        new_steps = scan_step_commits(cwd, f"{index.head}..{head}", GIT_TIMEOUT_SECONDS)
+        steps = {**index.steps, **new_steps}
+    else:
+        steps = scan_step_commits(cwd, head, REBUILD_TIMEOUT_SECONDS)
+
+    index = StepCommitIndex(head=head, steps=steps)
+    try:
+        save_index(path, index)
+    except OSError:
+        pass  # Fail-open: the next refresh rescans from the last saved head
+    return index
+
+
+def _is_ancestor(cwd: str, ancestor: str, head: str) -> bool:
+    """True if *ancestor* exists and is reachable from *head*."""
+    result = _git(
+        cwd, ["merge-base", "--is-ancestor", ancestor, head], GIT_TIMEOUT_SECONDS
+    )
+    return result.returncode == 0
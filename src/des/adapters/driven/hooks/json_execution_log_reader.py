@@ -7,6 +7,15 @@ Supports two event formats via PhaseEventParser.parse_auto():
 - v2.0: pipe-delimited strings ("step_id|phase|status|data|timestamp")
 - v3.0: structured JSON dicts ({sid, p, s, d, t} with optional tu, tk)
 
+and both storage layouts via execution_log_store.load_execution_log():
+- v2.0/v3.0: events embedded in execution-log.json
+- v4.0: header in execution-log.json, events in execution-log.events.jsonl
+
+Parsed logs are cached per process, keyed by path and the (inode, mtime_ns,
+size) of the log files, together with a per-step PhaseEvent index: repeated
+queries against an unchanged log (one SubagentStop validation, or many in a
+resident hook server) cost two stat calls and no parsing.
+
 Infrastructure details (JSON format, file I/O) are hidden behind the port interface.
 The application layer only sees PhaseEvent domain objects.
 """
@@ -14,7 +23,10 @@ The application layer only sees PhaseEvent domain objects.
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field
+from pathlib import Path
 
+from des.domain.execution_log_store import events_path_for, load_execution_log
 from des.domain.phase_event import PhaseEvent, PhaseEventParser
 from des.ports.driven_ports.execution_log_reader import (
     ExecutionLogReader,
@@ -23,6 +35,35 @@ from des.ports.driven_ports.execution_log_reader import (
 )
 
 
+_StatKey = tuple[int, int, int] | None
+
+
+@dataclass
+class _ParsedLog:
+    """Parsed execution log: raw document plus PhaseEvents indexed by step."""
+
+    fingerprint: tuple[_StatKey, _StatKey]
+    document: dict
+    events: list[PhaseEvent]
+    by_step: dict[str, list[PhaseEvent]] = field(default_factory=dict)
+
+
+_parsed_logs: dict[str, _ParsedLog] = {}
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_execution_log_cache() -> None:
+    """Drop all cached parsed execution logs (tests, server reloads)."""
+    _parsed_logs.clear()
+
+
 class JsonExecutionLogReader(ExecutionLogReader):
     """Reads execution log data from JSON files.
 
@@ -34,6 +75,10 @@ class JsonExecutionLogReader(ExecutionLogReader):
 
     File format (Schema v3.0 - structured JSON objects):
         {"schema_version": "3.0", "events": [{"sid": "01-01", "p": "PREPARE", ...}]}
+
+    File format (Schema v4.0 - append-only):
+        {"schema_version": "4.0", "events_file": "execution-log.events.jsonl"}
+        plus one v3.0 event object per line in the events file
     """
 
     def __init__(self) -> None:
@@ -52,7 +97,7 @@ class JsonExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_json(log_path)
+        data = self._load_parsed(log_path).document
         # Schema v3.0 uses "feature_id"; fall back to "project_id" for compat
         return data.get("feature_id") or data.get("project_id")
 
@@ -73,9 +118,7 @@ class JsonExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_json(log_path)
-        raw_events = data.get("events", [])
-        return self._parser.parse_many(raw_events, step_id)
+        return list(self._load_parsed(log_path).by_step.get(step_id, ()))
 
     def read_all_events(self, log_path: str) -> list[PhaseEvent]:
         """Read and parse all phase events without step_id filtering.
@@ -90,37 +133,54 @@ class JsonExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_json(log_path)
-        raw_events = data.get("events", [])
-        return self._parser.parse_all(raw_events)
+        return list(self._load_parsed(log_path).events)
+
+    def _load_parsed(self, log_path: str) -> _ParsedLog:
+        """Return the cached parse of *log_path*, re-parsing if it changed.
+
+        Raises:
+            LogFileNotFound: If the log file does not exist
+            LogFileCorrupted: If the log file cannot be parsed
+        """
+        path = Path(log_path)
+        fingerprint = (_stat_key(path), _stat_key(events_path_for(path)))
+        cached = _parsed_logs.get(log_path)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+
+        document = self._load_json(log_path)
+        parsed = _ParsedLog(
+            fingerprint=fingerprint,
+            document=document,
+            events=self._parser.parse_all(document.get("events", [])),
+        )
+        for event in parsed.events:
+            parsed.by_step.setdefault(event.step_id, []).append(event)
+        if fingerprint[0] is not None:
+            _parsed_logs[log_path] = parsed
+        return parsed
 
     def _load_json(self, log_path: str) -> dict:
-        """Load and parse a JSON file.
+        """Load and parse an execution log of any schema version.
 
         Args:
             log_path: Absolute path to the JSON file
 
         Returns:
-            Parsed JSON data as a dictionary
+            Parsed log as a dictionary (v4.0 events resolved into "events")
 
         Raises:
             LogFileNotFound: If the file does not exist
             LogFileCorrupted: If the JSON cannot be parsed
         """
         try:
-            with open(log_path, encoding="utf-8") as f:
-                data = json.load(f)
+            return load_execution_log(Path(log_path))
         except FileNotFoundError:
             raise LogFileNotFound(f"Execution log not found: {log_path}")
         except json.JSONDecodeError as e:
             raise LogFileCorrupted(f"Invalid JSON in execution log: {e}")
-
-        if not isinstance(data, dict):
-            raise LogFileCorrupted(
-                f"Execution log must be a JSON object, got {type(data).__name__}"
-            )
-
-        return data
+        except ValueError as e:
+            raise LogFileCorrupted(str(e))
 
 
 # Backward-compatible alias
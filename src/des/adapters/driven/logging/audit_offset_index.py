@@ -0,0 +1,259 @@
+"""Sidecar byte-offset index for daily JSONL audit logs.
+
+``audit-YYYY-MM-DD.log.idx`` maps lookup keys to the byte offset of the
+most recent matching line in ``audit-YYYY-MM-DD.log``, so
+``JsonlAuditLogReader.read_last_entry`` can answer with one seek instead of
+a scan. Keys are the prefixes of (event_type, feature_name, step_id):
+``(event)``, ``(event, feature)`` and ``(event, feature, step)``.
+
+The index is itself append-only JSONL: a header line carrying the log's
+inode, then one record per indexed batch covering log bytes
+``[start, end)`` with the offsets of the keys seen there. Records chain
+(each ``start`` is the previous ``end``), so the covered prefix is always
+complete; readers fold the records and scan only the uncovered tail.
+Writers update it while holding the log's ``flock``: they read the header
+and the last record, stream any lines appended by non-indexing writers
+since then, and append one record. Once the index grows past the header's
+``compact_at`` size it is rewritten as a single folded record, and the next
+compaction is due at twice the compacted size (at least
+``COMPACT_THRESHOLD_BYTES``).
+A missing, corrupt or foreign index is ignored (readers fall back to a
+reverse scan); a torn or non-chaining record ends the covered prefix.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from des.domain.atomic_write import write_atomic
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 2
+
+# Minimum index size past which a writer folds all records into one.
+COMPACT_THRESHOLD_BYTES = 256 * 1024
+
+_TAIL_BLOCK_SIZE = 4096
+
+
+@dataclass
+class AuditOffsetIndex:
+    """Offsets of the last line per lookup key within the first *size* bytes."""
+
+    inode: int
+    size: int = 0
+    offsets: dict[str, int] = field(default_factory=dict)
+
+
+def index_path_for(log_file: Path) -> Path:
+    """Return the sidecar index path for *log_file*."""
+    return log_file.with_name(log_file.name + INDEX_SUFFIX)
+
+
+def lookup_key(
+    event_type: str | None, feature_name: str | None, step_id: str | None
+) -> str | None:
+    """Return the index key for a query, or None if the shape is not indexed.
+
+    Empty filters are wildcards (as in ``JsonlAuditLogReader``); only
+    ``(event)``, ``(event, feature)`` and ``(event, feature, step)`` queries
+    are indexed.
+    """
+    parts = [event_type or None, feature_name or None, step_id or None]
+    while parts and parts[-1] is None:
+        parts.pop()
+    if not parts or None in parts:
+        return None
+    return json.dumps(parts)
+
+
+def entry_keys(entry: dict[str, Any]) -> list[str]:
+    """Return every index key a serialized audit entry answers."""
+    keys: list[str] = []
+    parts: list[str] = []
+    for name in ("event", "feature_name", "step_id"):
+        value = entry.get(name)
+        if not value:
+            break
+        parts.append(str(value))
+        keys.append(json.dumps(parts))
+    return keys
+
+
+def load_index(log_file: Path, inode: int) -> AuditOffsetIndex | None:
+    """Load and fold the sidecar for *log_file*; None if missing, corrupt or stale.
+
+    Args:
+        log_file: The audit log the index describes
+        inode: Inode of the open log file (guards against replaced logs)
+    """
+    try:
+        with open(index_path_for(log_file), "rb") as index_file:
+            if not _is_header(_parse_line(index_file.readline()), inode):
+                return None
+            index = AuditOffsetIndex(inode=inode)
+            for line in index_file:
+                record = _parse_line(line) if line.endswith(b"\n") else None
+                if not _is_record(record) or record["start"] != index.size:
+                    break
+                index.offsets.update(record["offsets"])
+                index.size = record["end"]
+    except OSError:
+        return None
+    return index
+
+
+def record_batch(
+    log_file: Path,
+    fd: int,
+    batch_start: int,
+    batch_end: int,
+    entries: Iterable[tuple[int, dict[str, Any]]],
+) -> None:
+    """Append a record for a just-written batch to the sidecar index.
+
+    Must be called while holding the exclusive lock on *fd*.
+
+    Args:
+        log_file: The audit log that was appended to
+        fd: Descriptor of *log_file* (used for fstat)
+        batch_start: File offset where the batch landed
+        batch_end: File offset just past the batch
+        entries: (offset relative to batch_start, entry dict) per line
+    """
+    inode = os.fstat(fd).st_ino
+    path = index_path_for(log_file)
+    covered, compact_at = _covered_size(path, inode)
+    if covered is None or covered > batch_start:
+        path.write_bytes(_encode(_header(inode, COMPACT_THRESHOLD_BYTES)))
+        covered, compact_at = 0, COMPACT_THRESHOLD_BYTES
+
+    # Lines appended by non-indexing writers since the last record.
+    offsets = _scan_gap(log_file, covered, batch_start)
+    for relative, entry in entries:
+        for key in entry_keys(entry):
+            offsets[key] = batch_start + relative
+
+    record = {"start": covered, "end": batch_end, "offsets": offsets}
+    with open(path, "ab") as index_file:
+        index_file.write(_encode(record))
+        index_size = index_file.tell()
+    if index_size > compact_at:
+        _compact(log_file, inode)
+
+
+def _covered_size(path: Path, inode: int) -> tuple[int | None, int]:
+    """Return (covered log bytes, compaction size) from header and last record.
+
+    The covered size is None when the index is missing, foreign or torn and
+    must be rebuilt.
+    """
+    try:
+        with open(path, "rb") as index_file:
+            header_line = index_file.readline()
+            header = _parse_line(header_line)
+            if not _is_header(header, inode):
+                return None, COMPACT_THRESHOLD_BYTES
+            last_line = _last_line(index_file)
+    except OSError:
+        return None, COMPACT_THRESHOLD_BYTES
+    compact_at = header.get("compact_at")
+    if not isinstance(compact_at, int):
+        compact_at = COMPACT_THRESHOLD_BYTES
+    if last_line is None:
+        return None, compact_at
+    if last_line == header_line:
+        return 0, compact_at
+    record = _parse_line(last_line)
+    return (record["end"] if _is_record(record) else None), compact_at
+
+
+def _last_line(index_file: BinaryIO) -> bytes | None:
+    """Return the last line of *index_file*; None if it is torn (no newline)."""
+    end = index_file.seek(0, os.SEEK_END)
+    position = end
+    tail = b""
+    while position > 0:
+        size = min(_TAIL_BLOCK_SIZE, position)
+        position -= size
+        index_file.seek(position)
+        tail = index_file.read(size) + tail
+        if not tail.endswith(b"\n"):
+            return None
+        newline = tail.rfind(b"\n", 0, len(tail) - 1)
+        if newline >= 0:
+            return tail[newline + 1 :]
+    return tail or None
+
+
+def _scan_gap(log_file: Path, start: int, end: int) -> dict[str, int]:
+    """Index the lines of log_file[start:end], streaming one line at a time."""
+    offsets: dict[str, int] = {}
+    if start >= end:
+        return offsets
+    with open(log_file, "rb") as log:
+        log.seek(start)
+        offset = start
+        while offset < end:
+            line = log.readline(end - offset)
+            if not line:
+                break
+            if line.endswith(b"\n"):
+                entry = _parse_line(line)
+                if isinstance(entry, dict):
+                    for key in entry_keys(entry):
+                        offsets[key] = offset
+            offset += len(line)
+    return offsets
+
+
+def _compact(log_file: Path, inode: int) -> None:
+    """Rewrite the index as its header plus one folded record."""
+    index = load_index(log_file, inode)
+    if index is None:
+        return
+    path = index_path_for(log_file)
+    record = _encode({"start": 0, "end": index.size, "offsets": index.offsets})
+    compact_at = max(COMPACT_THRESHOLD_BYTES, 2 * len(record))
+    write_atomic(path, _encode(_header(inode, compact_at)) + record)
+
+
+def _header(inode: int, compact_at: int) -> dict[str, Any]:
+    return {"version": _INDEX_VERSION, "inode": inode, "compact_at": compact_at}
+
+
+def _encode(data: dict[str, Any]) -> bytes:
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _parse_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _is_header(data: Any, inode: int) -> bool:
+    return (
+        isinstance(data, dict)
+        and data.get("version") == _INDEX_VERSION
+        and data.get("inode") == inode
+    )
+
+
+def _is_record(data: Any) -> bool:
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("start"), int)
+        and isinstance(data.get("end"), int)
+        and isinstance(data.get("offsets"), dict)
+    )
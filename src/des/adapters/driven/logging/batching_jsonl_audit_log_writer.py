@@ -0,0 +1,199 @@
+"""BatchingJsonlAuditLogWriter - buffered JSONL audit writer for hook processes.
+
+JsonlAuditLogWriter opens, appends and closes the daily log for every event.
+A SubagentStop hook emits dozens of events per invocation, so this writer
+keeps one ``O_APPEND`` descriptor per log file, buffers serialized lines and
+writes each batch with a single ``write()``:
+
+- at ``flush()`` (hook handler exit) and ``close()`` (process exit, atexit)
+- as soon as the buffer reaches ``flush_threshold_bytes``
+
+Line atomicity across concurrent hook processes appending to the same file:
+batches contain whole lines only, ``O_APPEND`` makes every ``write()`` land
+at end-of-file, and on POSIX the batch is written under an exclusive
+``flock`` so a short write cannot be interleaved with another process.
+
+With ``offset_index=True`` (POSIX only) the writer also maintains the
+sidecar offset index (see audit_offset_index) under the same lock.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+from des.adapters.driven.logging import audit_offset_index
+from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from des.ports.driven_ports.audit_log_writer import AuditEvent
+
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+# Live writers, closed (and therefore flushed) when the interpreter exits.
+_live_writers: weakref.WeakSet[BatchingJsonlAuditLogWriter] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_writers() -> None:
+    for writer in list(_live_writers):
+        try:
+            writer.close()
+        except OSError:
+            pass  # Fail-open: audit logging must never fail the hook
+
+
+class BatchingJsonlAuditLogWriter(JsonlAuditLogWriter):
+    """Buffers audit events and appends them in batches through one fd.
+
+    Same file layout and line format as JsonlAuditLogWriter; events become
+    visible to readers when the batch is flushed.
+    """
+
+    DEFAULT_FLUSH_THRESHOLD_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        log_dir: str | Path | None = None,
+        cwd: str | Path | None = None,
+        *,
+        flush_threshold_bytes: int = DEFAULT_FLUSH_THRESHOLD_BYTES,
+        offset_index: bool = False,
+    ) -> None:
+        """Initialize the writer and register it for the exit-time flush.
+
+        Args:
+            log_dir: Directory for audit log files (see JsonlAuditLogWriter)
+            cwd: Working directory override for deterministic resolution
+            flush_threshold_bytes: Buffered size that triggers a flush
+            offset_index: Maintain the sidecar offset index for readers
+        """
+        super().__init__(log_dir=log_dir, cwd=cwd)
+        self._flush_threshold_bytes = flush_threshold_bytes
+        self._offset_index = offset_index and fcntl is not None
+        # Per log file: (encoded line, entry dict when indexing) in order.
+        self._pending: dict[Path, list[tuple[bytes, dict | None]]] = {}
+        self._pending_bytes = 0
+        self._descriptors: dict[Path, int] = {}
+        self._lock = threading.Lock()
+        _live_writers.add(self)
+
+    def log_event(self, event: AuditEvent) -> None:
+        """Buffer a single audit event; flush when the threshold is reached.
+
+        The target file is chosen when the event is logged, so a batch that
+        straddles midnight still rotates correctly.
+
+        Args:
+            event: The audit event to log
+        """
+        entry = self._build_entry(event)
+        line = (self._encode(entry) + "\n").encode("utf-8")
+        indexed = entry if self._offset_index else None
+        with self._lock:
+            self._pending.setdefault(self._get_log_file(), []).append((line, indexed))
+            self._pending_bytes += len(line)
+            if self._pending_bytes >= self._flush_threshold_bytes:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Append all buffered events to their log files."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush buffered events and close every open descriptor. Idempotent."""
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                for fd in self._descriptors.values():
+                    os.close(fd)
+                self._descriptors.clear()
+
+    def _flush_locked(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._pending_bytes = 0
+        for log_file, lines in pending.items():
+            fd = self._descriptor(log_file)
+            data = b"".join(line for line, _ in lines)
+            on_written = None
+            if self._offset_index:
+                on_written = self._index_updater(log_file, fd, lines)
+            _append_batch(fd, data, on_written)
+
+    @staticmethod
+    def _index_updater(
+        log_file: Path, fd: int, lines: list[tuple[bytes, dict | None]]
+    ) -> Callable[[int, int], None]:
+        def update(start: int, end: int) -> None:
+            entries = []
+            relative = 0
+            for line, entry in lines:
+                entries.append((relative, entry))
+                relative += len(line)
+            try:
+                audit_offset_index.record_batch(log_file, fd, start, end, entries)
+            except OSError:
+                pass  # Fail-open: readers fall back to a reverse scan
+
+        return update
+
+    def _descriptor(self, log_file: Path) -> int:
+        """Return an open append descriptor for *log_file*.
+
+        Reopens when the file was deleted or replaced since it was opened
+        (log cleanup, housekeeping), so batches never land in an unlinked
+        inode.
+        """
+        fd = self._descriptors.get(log_file)
+        if fd is not None:
+            try:
+                if os.fstat(fd).st_ino == log_file.stat().st_ino:
+                    return fd
+            except OSError:
+                pass
+            os.close(fd)
+            del self._descriptors[log_file]
+
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(log_file, _OPEN_FLAGS, 0o644)
+        self._descriptors[log_file] = fd
+        return fd
+
+
+def _append_batch(
+    fd: int, data: bytes, on_written: Callable[[int, int], None] | None = None
+) -> None:
+    """Write *data* at end-of-file as one batch of whole lines.
+
+    *on_written(start, end)* runs while the lock is still held, with the
+    file offsets the batch landed at.
+    """
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if on_written is not None:
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+            on_written(end - len(data), end)
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
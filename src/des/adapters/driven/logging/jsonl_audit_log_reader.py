@@ -7,22 +7,29 @@ Uses the same log directory resolution as JsonlAuditLogWriter.
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
+from des.adapters.driven.logging import audit_offset_index
 from des.domain.audit_log_path_resolver import AuditLogPathResolver
 from des.ports.driven_ports.audit_log_reader import AuditLogReader
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
+_BLOCK_SIZE = 64 * 1024
+
+
 class JsonlAuditLogReader(AuditLogReader):
     """Reads audit events from JSONL files.
 
-    Scans today's log file backward to find the most recent matching entry.
-    Uses shared AuditLogPathResolver for consistent path resolution with writer.
+    Scans today's log file backward to find the most recent matching entry,
+    using the sidecar offset index written by BatchingJsonlAuditLogWriter
+    when present. Uses shared AuditLogPathResolver for consistent path resolution with writer.
     """
 
     def __init__(
@@ -39,35 +46,107 @@ class JsonlAuditLogReader(AuditLogReader):
     ) -> dict[str, Any] | None:
         """Read the most recent audit entry matching the given filters.
 
-        Scans today's log file from end to start for efficiency.
+        Reads today's log file backward from EOF in blocks and stops at the
+        first match. When a sidecar offset index covers the log, only the
+        unindexed tail is scanned and the indexed answer costs one seek.
 
         Returns:
             Most recent matching entry as dict, or None if not found.
         """
         log_file = self._get_today_log_file()
-        if log_file is None or not log_file.exists():
+        if log_file is None:
             return None
 
         try:
-            lines = log_file.read_text().strip().splitlines()
-        except (OSError, PermissionError):
+            with open(log_file, "rb") as log:
+                return self._find_last(log, log_file, event_type, feature_name, step_id)
+        except OSError:
             return None
 
-        # Scan backward for most recent match
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if self._matches(entry, event_type, feature_name, step_id):
+    def _find_last(
+        self,
+        log: BinaryIO,
+        log_file: Path,
+        event_type: str | None,
+        feature_name: str | None,
+        step_id: str | None,
+    ) -> dict[str, Any] | None:
+        stat = os.fstat(log.fileno())
+        key = audit_offset_index.lookup_key(event_type, feature_name, step_id)
+        index = None
+        if key is not None:
+            index = audit_offset_index.load_index(log_file, stat.st_ino)
+        if index is None or index.size > stat.st_size:
+            return self._scan_backward(
+                log,
+                0,
+                stat.st_size,
+                event_type=event_type,
+                feature_name=feature_name,
+                step_id=step_id,
+            )
+
+        # Lines appended after the index was last updated come first.
+        entry = self._scan_backward(
+            log,
+            index.size,
+            stat.st_size,
+            event_type=event_type,
+            feature_name=feature_name,
+            step_id=step_id,
+        )
+        if entry is not None:
+            return entry
+
+        offset = index.offsets.get(key)
+        if offset is None:
+            return None
+        log.seek(offset)
+        entry = self._parse(log.readline())
+        if entry is not None and self._matches(
+            entry, event_type, feature_name, step_id
+        ):
+            return entry
+        # Index disagrees with the log: trust the log.
+        return self._scan_backward(
+            log,
+            0,
+            index.size,
+            event_type=event_type,
+            feature_name=feature_name,
+            step_id=step_id,
+        )
+
+    def _scan_backward(
+        self,
+        log: BinaryIO,
+        start: int,
+        end: int,
+        *,
+        event_type: str | None,
+        feature_name: str | None,
+        step_id: str | None,
+    ) -> dict[str, Any] | None:
+        """Return the last matching entry between byte offsets start and end."""
+        for line in iter_lines_backward(log, start, end):
+            entry = self._parse(line)
+            if entry is not None and self._matches(
+                entry, event_type, feature_name, step_id
+            ):
                 return entry
-
         return None
 
+    @staticmethod
+    def _parse(line: bytes) -> dict[str, Any] | None:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        return entry if isinstance(entry, dict) else None
+
     def _matches(
         self,
         entry: dict,
@@ -88,3 +167,25 @@ class JsonlAuditLogReader(AuditLogReader):
             return None
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         return self._log_dir / f"audit-{today}.log"
+
+
+def iter_lines_backward(
+    log: BinaryIO, start: int, end: int, block_size: int = _BLOCK_SIZE
+) -> Iterator[bytes]:
+    """Yield the lines of log[start:end] from last to first.
+
+    Reads fixed-size blocks backward from *end*, so the cost is proportional
+    to the distance from EOF to the line the caller stops at. *start* must
+    be a line boundary.
+    """
+    position = end
+    partial = b""
+    while position > start:
+        size = min(block_size, position - start)
+        position -= size
+        log.seek(position)
+        lines = (log.read(size) + partial).split(b"\n")
+        partial = lines[0]
+        yield from reversed(lines[1:])
+    if partial:
+        yield partial
@@ -70,7 +70,26 @@ class JsonlAuditLogWriter(AuditLogWriter):
         # Ensure log directory exists (handles temp dir cleanup)
         self._log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Build the JSON entry from the port-defined AuditEvent
+        json_line = self._serialize(event)
+
+        # Append to today's log file
+        log_file = self._get_log_file()
+        with open(log_file, "a") as f:
+            f.write(json_line + "\n")
+
+    @classmethod
+    def _serialize(cls, event: AuditEvent) -> str:
+        """Serialize an AuditEvent to one compact, key-sorted JSON line."""
+        return cls._encode(cls._build_entry(event))
+
+    @staticmethod
+    def _encode(entry: dict) -> str:
+        """Encode an entry dict as compact JSONL."""
+        return json.dumps(entry, separators=(",", ":"), sort_keys=True)
+
+    @staticmethod
+    def _build_entry(event: AuditEvent) -> dict:
+        """Build the JSON entry from the port-defined AuditEvent."""
         entry = {
             "event": event.event_type,
             "timestamp": event.timestamp,
@@ -86,14 +105,7 @@ class JsonlAuditLogWriter(AuditLogWriter):
 
         # Merge additional event-specific data
         entry.update(event.data)
-
-        # Serialize to compact JSONL
-        json_line = json.dumps(entry, separators=(",", ":"), sort_keys=True)
-
-        # Append to today's log file
-        log_file = self._get_log_file()
-        with open(log_file, "a") as f:
-            f.write(json_line + "\n")
+        return entry
 
     def _get_log_file(self) -> Path:
         """Get today's log file path with date-based naming.
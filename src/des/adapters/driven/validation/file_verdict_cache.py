@@ -0,0 +1,166 @@
+"""On-disk PreToolUse verdict cache, addressed by invocation content.
+
+After a transient failure the orchestrator re-dispatches the very same step
+prompt, and PreToolUseService used to parse markers, run every policy and
+re-validate the full template on identical text. FileVerdictCache keeps one
+small JSON file per decision under ``.nwave/des/cache/pre-tool-use/``, named
+by the SHA-256 of:
+
+- the prompt and the subagent type
+- the content of ``step-tdd-cycle-schema.json`` and of the project's
+  ``.nwave/des-config.json``
+- the size and mtime of every module in the ``des`` package
+
+Editing the schema or the config, or upgrading DES, therefore changes every
+key: the old entries can no longer be hit and age out. Each hit refreshes the
+entry's mtime, and a store beyond MAX_ENTRIES deletes the least recently used
+entries. Every failure degrades to a miss; the cache never blocks a hook.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from des.domain.atomic_write import write_atomic
+from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
+from des.ports.driven_ports.verdict_cache import VerdictCache
+from des.ports.driver_ports.pre_tool_use_port import HookDecision
+
+
+if TYPE_CHECKING:
+    from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
+
+
+CACHE_RELATIVE_PATH = Path(".nwave") / "des" / "cache" / "pre-tool-use"
+MAX_ENTRIES = 256
+
+_VERSION = 1
+_DES_ROOT = Path(__file__).resolve().parents[3]
+
+
+@functools.cache
+def _des_code_stamp() -> str:
+    """Size and mtime of every des module, read once per process."""
+    entries = []
+    for module in sorted(_DES_ROOT.rglob("*.py")):
+        try:
+            stat = module.stat()
+        except OSError:
+            continue  # Removed mid-upgrade: the other entries still differ
+        entries.append(
+            f"{module.relative_to(_DES_ROOT)}:{stat.st_size}:{stat.st_mtime_ns}"
+        )
+    return ";".join(entries)
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+class FileVerdictCache(VerdictCache):
+    """VerdictCache storing one JSON file per decision, evicted LRU."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        *,
+        schema_path: Path | None = None,
+        config_path: Path | None = None,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the entries (default:
+                ``<cwd>/.nwave/des/cache/pre-tool-use``)
+            schema_path: TDD schema file the validator loads (default: the
+                TDDSchemaLoader default path)
+            config_path: Project DES config (default: ``<cwd>/.nwave/des-config.json``)
+            max_entries: Entries kept before the least recently used are deleted
+        """
+        if schema_path is None:
+            from des.domain.tdd_schema import TDDSchemaLoader
+
+            schema_path = TDDSchemaLoader().schema_path
+        self._cache_dir = cache_dir or Path.cwd() / CACHE_RELATIVE_PATH
+        self._schema_path = schema_path
+        self._config_path = config_path or Path.cwd() / ".nwave" / "des-config.json"
+        self._max_entries = max_entries
+        self._last_entry: tuple[PreToolUseInput, Path] | None = None
+
+    def _entry_path(self, input_data: PreToolUseInput) -> Path:
+        # A miss is followed by a put for the same input: hash it once
+        if self._last_entry is not None and self._last_entry[0] is input_data:
+            return self._last_entry[1]
+        digest = hashlib.sha256()
+        for part in (
+            str(_VERSION),
+            _des_code_stamp(),
+            _file_digest(self._schema_path),
+            _file_digest(self._config_path),
+            input_data.subagent_type or "",
+            input_data.prompt,
+        ):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        path = self._cache_dir / f"{digest.hexdigest()}.json"
+        self._last_entry = (input_data, path)
+        return path
+
+    def get(self, input_data: PreToolUseInput) -> HookDecision | None:
+        """Return the stored decision for *input_data*, or None on a miss."""
+        path = self._entry_path(input_data)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["action"] == "allow":
+                decision = HookDecision.allow()
+            else:
+                decision = HookDecision.block(
+                    reason=data["reason"],
+                    recovery_suggestions=list(data["recovery_suggestions"]),
+                )
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return decision
+
+    def put(self, input_data: PreToolUseInput, decision: HookDecision) -> None:
+        """Store *decision* for *input_data*, then evict beyond max_entries."""
+        path = self._entry_path(input_data)
+        payload = {
+            "action": decision.action,
+            "reason": decision.reason,
+            "recovery_suggestions": decision.recovery_suggestions,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_nwave_gitignore(path.parent)
+            write_atomic(path, json.dumps(payload))
+            self._evict()
+        except OSError:
+            pass  # Best-effort: the next dispatch is validated again
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond max_entries."""
+        entries = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue  # Deleted by a concurrent eviction
+        if len(entries) <= self._max_entries:
+            return
+        entries.sort()
+        for _, stale in entries[: len(entries) - self._max_entries]:
+            Path(stale).unlink(missing_ok=True)
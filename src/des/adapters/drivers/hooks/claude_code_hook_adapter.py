@@ -14,7 +14,8 @@ All handler logic lives in dedicated modules:
 
 Routing lives in hook_router.py. This facade re-exports handler functions
 so that existing test imports (``from ... import adapter; adapter.handle_*``)
-continue to work.
+continue to work. Re-exports are lazy: running the entry point imports only
+the handler module selected by the command.
 
 Exit Codes:
   0 = allow/continue
@@ -24,6 +25,7 @@ Exit Codes:
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 
 # Add project root to sys.path for standalone script execution
@@ -32,36 +34,58 @@ if __name__ == "__main__":
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
 
-# Re-export handler functions for backward compatibility with tests
-from des.adapters.drivers.hooks.deliver_progress_handler import (  # noqa: F401
-    handle_deliver_progress,
-)
+from des._lazy import lazy_getattr
 from des.adapters.drivers.hooks.hook_router import main
-from des.adapters.drivers.hooks.post_tool_use_handler import (  # noqa: F401
-    handle_post_tool_use,
-)
-from des.adapters.drivers.hooks.pre_tool_use_handler import (  # noqa: F401
-    handle_pre_tool_use,
-)
-from des.adapters.drivers.hooks.pre_write_handler import (  # noqa: F401
-    handle_pre_write,
-)
 
-# Re-export service factory functions for test patching
-from des.adapters.drivers.hooks.service_factory import (  # noqa: F401
-    create_pre_tool_use_service,
-    create_subagent_stop_service,
-)
-from des.adapters.drivers.hooks.session_start_handler import (  # noqa: F401
-    handle_session_start,
-)
-from des.adapters.drivers.hooks.subagent_start_handler import (  # noqa: F401
-    handle_subagent_start,
-)
-from des.adapters.drivers.hooks.subagent_stop_handler import (  # noqa: F401
-    extract_des_context_from_transcript,
-    handle_subagent_stop,
-)
+
+if TYPE_CHECKING:
+    from des.adapters.drivers.hooks.deliver_progress_handler import (  # noqa: F401
+        handle_deliver_progress,
+    )
+    from des.adapters.drivers.hooks.post_tool_use_handler import (  # noqa: F401
+        handle_post_tool_use,
+    )
+    from des.adapters.drivers.hooks.pre_tool_use_handler import (  # noqa: F401
+        handle_pre_tool_use,
+    )
+    from des.adapters.drivers.hooks.pre_write_handler import (  # noqa: F401
+        handle_pre_write,
+    )
+    from des.adapters.drivers.hooks.service_factory import (  # noqa: F401
+        create_pre_tool_use_service,
+        create_subagent_stop_service,
+    )
+    from des.adapters.drivers.hooks.session_start_handler import (  # noqa: F401
+        handle_session_start,
+    )
+    from des.adapters.drivers.hooks.subagent_start_handler import (  # noqa: F401
+        handle_subagent_start,
+    )
+    from des.adapters.drivers.hooks.subagent_stop_handler import (  # noqa: F401
+        extract_des_context_from_transcript,
+        handle_subagent_stop,
+    )
+
+
+# Re-exports for backward compatibility with tests, resolved on first
+# access so the installed entry point imports only the routed handler.
+_EXPORTS = {
+    "handle_deliver_progress": "des.adapters.drivers.hooks.deliver_progress_handler",
+    "handle_post_tool_use": "des.adapters.drivers.hooks.post_tool_use_handler",
+    "handle_pre_tool_use": "des.adapters.drivers.hooks.pre_tool_use_handler",
+    "handle_pre_write": "des.adapters.drivers.hooks.pre_write_handler",
+    # Service factory functions, re-exported for test patching
+    "create_pre_tool_use_service": "des.adapters.drivers.hooks.service_factory",
+    "create_subagent_stop_service": "des.adapters.drivers.hooks.service_factory",
+    "handle_session_start": "des.adapters.drivers.hooks.session_start_handler",
+    "handle_subagent_start": "des.adapters.drivers.hooks.subagent_start_handler",
+    "extract_des_context_from_transcript": (
+        "des.adapters.drivers.hooks.subagent_stop_handler"
+    ),
+    "handle_subagent_stop": "des.adapters.drivers.hooks.subagent_stop_handler",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@
 Integrates with Claude Code's SubagentStop hook event to track which roadmap
 steps have been completed. When all steps are done, prints a reminder about
 remaining orchestrator phases (3-9) to stderr.
+
+In the composite SubagentStop hook it runs after subagent-stop and reuses
+that handler's parsed input and transcript scan (SubagentStopEvent).
 """
 
 from __future__ import annotations
@@ -13,6 +16,7 @@ from pathlib import Path
 
 from des.adapters.drivers.hooks.execution_log_resolver import resolve_execution_log_path
 from des.adapters.drivers.hooks.subagent_stop_handler import (
+    SubagentStopEvent,
     extract_des_context_from_transcript,
 )
 from des.domain.deliver_progress_tracker import save_progress, track_progress
@@ -48,27 +52,40 @@ def _resolve_deliver_paths(cwd: str, project_id: str) -> tuple[Path, Path, Path]
     )
 
 
-def handle_deliver_progress() -> int:
+def handle_deliver_progress(event: SubagentStopEvent | None = None) -> int:
     """Handle deliver progress tracking on SubagentStop.
 
     Always returns 0 (never blocks). Reads stdin JSON, extracts DES context
     from agent transcript. If non-DES agent, returns immediately. Otherwise
     tracks progress and saves state. When all steps done, prints reminder.
-    """
-    raw = sys.stdin.read().strip()
-    if not raw:
-        return 0
 
-    try:
-        hook_input = json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
-        return 0
+    Args:
+        event: Hook input already parsed (and possibly its transcript
+            already scanned) by an earlier handler of a composite
+            invocation. None reads stdin directly.
+    """
+    if event is not None and event.stdin_result is not None:
+        hook_input = event.stdin_result.hook_input
+        if not isinstance(hook_input, dict):
+            return 0
+    else:
+        raw = sys.stdin.read().strip()
+        if not raw:
+            return 0
+
+        try:
+            hook_input = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return 0
 
     transcript_path = hook_input.get("agent_transcript_path")
     if not transcript_path:
         return 0
 
-    des_context = extract_des_context_from_transcript(transcript_path)
+    if event is not None and event.transcript_scanned:
+        des_context = event.des_context
+    else:
+        des_context = extract_des_context_from_transcript(transcript_path)
     if des_context is None:
         return 0
 
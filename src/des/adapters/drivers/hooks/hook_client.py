@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Thin DES hook client — forwards one hook invocation to the resident server.
+
+Intended to be executed by file path so that no DES module is imported on
+the fast path:
+
+  python3 <lib>/des/adapters/drivers/hooks/hook_client.py <command>
+
+The client reads the hook payload from stdin, sends it together with argv,
+cwd and the DES-relevant environment to the hook server listening on
+``.nwave/des/hook-server.sock`` (see hook_server.py), then relays the
+server's stdout, stderr and exit code verbatim.
+
+When no server accepts the connection the client falls back to in-process
+execution through hook_router.main(), so switching a hook command to this
+entry point is always safe: behaviour is identical, only latency differs.
+Once the server has accepted a request the handler may already have run
+(and appended to the audit log, execution log or transcript checkpoint), so
+a failure after that point is reported as a hook error, never re-run.
+
+Only the standard library is imported at module level. Wire-format helpers
+live here (not in hook_server.py) so both sides share one definition
+without the client paying for the server's imports.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+
+
+# Relative to the hook's cwd (Claude Code runs hooks from the project root).
+# Relative binding also keeps the path well below the AF_UNIX length limit.
+DEFAULT_SOCKET_PATH = os.path.join(".nwave", "des", "hook-server.sock")
+
+# Connecting to a live local socket takes microseconds; anything slower
+# means the server is wedged and in-process execution is the better bet.
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+# Upper bound for a single handler run on the server (SubagentStop git
+# probes alone may take 2 x 5 s).
+RESPONSE_TIMEOUT_SECONDS = 60.0
+
+# Environment variables that influence handler behaviour and must therefore
+# travel with the request (DES_AUDIT_LOG_DIR, NW_LOG_LEVEL, ...).
+FORWARDED_ENV_PREFIXES = ("DES_", "NW_", "NWAVE_", "CLAUDE_")
+
+_RECV_CHUNK = 65536
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialize a wire message (request or response) to bytes."""
+    return json.dumps(message).encode("utf-8")
+
+
+def decode_message(raw: bytes) -> dict:
+    """Deserialize a wire message; raises ValueError on malformed input."""
+    message = json.loads(raw.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("hook server message must be a JSON object")
+    return message
+
+
+def recv_all(sock: socket.socket) -> bytes:
+    """Read from *sock* until the peer shuts down its write side."""
+    chunks: list[bytes] = []
+    while True:
+        chunk = sock.recv(_RECV_CHUNK)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def forwarded_environment(environ: dict[str, str] | None = None) -> dict[str, str]:
+    """Return the subset of *environ* that handlers are sensitive to."""
+    source = os.environ if environ is None else environ
+    return {k: v for k, v in source.items() if k.startswith(FORWARDED_ENV_PREFIXES)}
+
+
+def request(
+    message: dict,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    *,
+    timeout: float = RESPONSE_TIMEOUT_SECONDS,
+) -> dict | None:
+    """Send *message* to the hook server and return its decoded response.
+
+    Returns None when no server accepts the connection (missing socket,
+    stale socket, refused, connect timeout). Errors after the request was
+    accepted are raised so the caller can decide how to recover.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+        sock.settimeout(timeout)
+        sock.sendall(encode_message(message))
+        sock.shutdown(socket.SHUT_WR)
+        return decode_message(recv_all(sock))
+    finally:
+        sock.close()
+
+
+def run_in_process(argv: list[str], stdin_data: str) -> int:
+    """Execute the hook in this process via hook_router (no server)."""
+    import io
+    from pathlib import Path
+
+    # <root>/des/adapters/drivers/hooks/hook_client.py -> <root>
+    project_root = str(Path(__file__).resolve().parents[4])
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    from des.adapters.drivers.hooks import hook_router
+
+    sys.stdin = io.StringIO(stdin_data)
+    sys.argv = ["claude_code_hook_adapter", *argv]
+    try:
+        hook_router.main()
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    return 0
+
+
+def _report_server_failure(reason: str) -> int:
+    """Emit a hook error response, as handlers do for unexpected errors."""
+    print(json.dumps({"status": "error", "reason": reason}))
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Client entry point. Returns the hook exit code."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    stdin_data = sys.stdin.read()
+
+    try:
+        response = request(
+            {
+                "op": "run",
+                "argv": args,
+                "stdin": stdin_data,
+                "cwd": os.getcwd(),
+                "env": forwarded_environment(),
+            }
+        )
+    except (OSError, ValueError) as exc:
+        # Server accepted then failed (crash, timeout, garbage): the handler
+        # may have run, so running it again would repeat its side effects.
+        return _report_server_failure(f"Hook server failed: {exc!s}")
+
+    if response is None:
+        return run_in_process(args, stdin_data)
+    if "exit_code" not in response:
+        return _report_server_failure("Hook server returned no exit code")
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return int(response["exit_code"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,16 @@ function globals to a specific module.
 Extracted from claude_code_hook_adapter.py as part of P4 decomposition (step 4a).
 """
 
+import functools
 import json
+import os
 import sys
 from collections.abc import Callable
+from pathlib import Path
 
-from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
+from des.adapters.driven.logging.batching_jsonl_audit_log_writer import (
+    BatchingJsonlAuditLogWriter,
+)
 from des.adapters.driven.time.system_time import SystemTimeProvider
 from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
 
@@ -28,19 +33,81 @@ from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
 # ---------------------------------------------------------------------------
 
 
+# Process-scoped writer cache: (cwd, home, DES_AUDIT_LOG_DIR) -> (config, writer).
+# The writer is reused while the DESConfig snapshot it was built from is
+# still current, so one hook invocation resolves the log directory once and
+# appends all of its events through a single buffered descriptor.
+_audit_writer_cache: dict[
+    tuple[str, str, str | None], tuple[object, BatchingJsonlAuditLogWriter]
+] = {}
+
+
 def create_audit_writer() -> AuditLogWriter:
     """Create appropriate AuditLogWriter based on DES configuration.
 
-    Returns JsonlAuditLogWriter by default,
+    Returns BatchingJsonlAuditLogWriter by default,
     NullAuditLogWriter when explicitly disabled in .nwave/des-config.json.
+    The configuration snapshot and the writer are memoized per process and
+    rebuilt when the config files, working directory or
+    ``DES_AUDIT_LOG_DIR`` change. Buffered events are written when the
+    handler returns (see ``flushes_audit_log``) and at interpreter exit.
     """
-    from des.adapters.driven.config.des_config import DESConfig
+    from des.adapters.driven.config.des_config import load_des_config
     from des.adapters.driven.logging.null_audit_log_writer import NullAuditLogWriter
 
-    config = DESConfig()
+    config = load_des_config()
     if not config.audit_logging_enabled:
         return NullAuditLogWriter()
-    return JsonlAuditLogWriter()
+
+    key = (os.getcwd(), str(Path.home()), os.environ.get("DES_AUDIT_LOG_DIR"))
+    cached = _audit_writer_cache.get(key)
+    if cached is not None:
+        if cached[0] is config:
+            return cached[1]
+        cached[1].close()
+    writer = BatchingJsonlAuditLogWriter(offset_index=True)
+    _audit_writer_cache[key] = (config, writer)
+    return writer
+
+
+def flush_audit_writers() -> None:
+    """Write out events buffered by the memoized audit writers. Fail-open."""
+    for _, writer in list(_audit_writer_cache.values()):
+        try:
+            writer.flush()
+        except OSError:
+            pass  # Fail-open: audit logging must never change the hook verdict
+
+
+def flushes_audit_log(handler: Callable[..., int]) -> Callable[..., int]:
+    """Decorate a hook handler so its audit events are on disk when it returns.
+
+    Applied to every ``handle_*`` entry point, so the guarantee holds whether
+    the handler runs under ``hook_router``, the resident hook server, or a
+    direct call.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(*args: object, **kwargs: object) -> int:
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            flush_audit_writers()
+
+    return wrapper
+
+
+def clear_audit_writer_cache() -> None:
+    """Close memoized audit writers and drop DES configuration snapshots."""
+    from des.adapters.driven.config.des_config import clear_des_config_cache
+
+    for _, writer in list(_audit_writer_cache.values()):
+        try:
+            writer.close()
+        except OSError:
+            pass
+    _audit_writer_cache.clear()
+    clear_des_config_cache()
 
 
 # Type alias for the factory callable accepted by all audit-aware functions
@@ -3,19 +3,69 @@
 This is the thin dispatcher that replaces the monolithic main() function.
 Each handler is in its own module for single-responsibility.
 
+Handler modules are imported only when their command runs: a ``pre-write``
+invocation never loads git adapters, the TDD schema loader, transcript
+parsing or skill tracking. ``HANDLERS`` is the single dispatch table;
+handler functions stay reachable as module attributes (resolved lazily
+through ``__getattr__``) so ``patch.object(hook_router, "handle_...")``
+keeps working.
+
 Entry point: python3 -m des.adapters.drivers.hooks.claude_code_hook_adapter <command>
 """
 
+import importlib
 import json
 import sys
+from collections.abc import Callable
+
+
+_HANDLER_PACKAGE = "des.adapters.drivers.hooks"
+
+# Command -> (handler module, handler function). Aliases share an entry.
+HANDLERS: dict[str, tuple[str, str]] = {
+    "pre-tool-use": ("pre_tool_use_handler", "handle_pre_tool_use"),
+    # "pre-task" accepted for backward compatibility
+    "pre-task": ("pre_tool_use_handler", "handle_pre_tool_use"),
+    # Registered SubagentStop hook: both actions below in one process
+    "subagent-stop-composite": (
+        "subagent_stop_composite_handler",
+        "handle_subagent_stop_composite",
+    ),
+    # Single actions, still routed for settings written by older installers
+    "subagent-stop": ("subagent_stop_handler", "handle_subagent_stop"),
+    "deliver-progress": ("deliver_progress_handler", "handle_deliver_progress"),
+    "post-tool-use": ("post_tool_use_handler", "handle_post_tool_use"),
+    "pre-write": ("pre_write_handler", "handle_pre_write"),
+    "pre-edit": ("pre_write_handler", "handle_pre_write"),
+    "session-start": ("session_start_handler", "handle_session_start"),
+    "subagent-start": ("subagent_start_handler", "handle_subagent_start"),
+}
+
+# Handler function -> module, for lazy attribute resolution.
+_HANDLER_MODULES: dict[str, str] = {
+    function: module for module, function in HANDLERS.values()
+}
 
-from des.adapters.drivers.hooks.deliver_progress_handler import handle_deliver_progress
-from des.adapters.drivers.hooks.post_tool_use_handler import handle_post_tool_use
-from des.adapters.drivers.hooks.pre_tool_use_handler import handle_pre_tool_use
-from des.adapters.drivers.hooks.pre_write_handler import handle_pre_write
-from des.adapters.drivers.hooks.session_start_handler import handle_session_start
-from des.adapters.drivers.hooks.subagent_start_handler import handle_subagent_start
-from des.adapters.drivers.hooks.subagent_stop_handler import handle_subagent_stop
+
+def __getattr__(name: str) -> Callable[[], int]:
+    """Resolve ``handle_*`` attributes by importing their module on demand."""
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{_HANDLER_PACKAGE}.{module_name}")
+    handler = getattr(module, name)
+    globals()[name] = handler
+    return handler
+
+
+def resolve_handler(command: str) -> Callable[[], int] | None:
+    """Return the handler for *command*, importing only its module."""
+    entry = HANDLERS.get(command)
+    if entry is None:
+        return None
+    # Attribute lookup (not a direct import) so test patches on this
+    # module take precedence over the real handler.
+    return getattr(sys.modules[__name__], entry[1])
 
 
 def main() -> None:
@@ -33,23 +83,11 @@ def main() -> None:
 
     command = sys.argv[1]
 
-    if command in ("pre-tool-use", "pre-task"):
-        # "pre-task" accepted for backward compatibility
-        exit_code = handle_pre_tool_use()
-    elif command == "subagent-stop":
-        exit_code = handle_subagent_stop()
-    elif command == "deliver-progress":
-        exit_code = handle_deliver_progress()
-    elif command == "post-tool-use":
-        exit_code = handle_post_tool_use()
-    elif command in ("pre-write", "pre-edit"):
-        exit_code = handle_pre_write()
-    elif command == "session-start":
-        exit_code = handle_session_start()
-    elif command == "subagent-start":
-        exit_code = handle_subagent_start()
-    else:
+    handler = resolve_handler(command)
+    if handler is None:
         print(json.dumps({"status": "error", "reason": f"Unknown command: {command}"}))
         exit_code = 1
+    else:
+        exit_code = handler()
 
     sys.exit(exit_code)
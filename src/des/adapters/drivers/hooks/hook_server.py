@@ -0,0 +1,312 @@
+"""Resident DES hook server — keeps hook handlers warm between invocations.
+
+Opt-in companion to hook_client.py. A one-shot hook process spends most of
+its wall clock importing hook_router, every handler module and the
+service_factory graph before it reads a single byte of stdin. The server
+pays that cost once, then executes each forwarded invocation in-process
+through the very same hook_router.main() used by the one-shot entry point.
+
+Usage (from the project root):
+  python3 -m des.adapters.drivers.hooks.hook_server start    # detach
+  python3 -m des.adapters.drivers.hooks.hook_server status
+  python3 -m des.adapters.drivers.hooks.hook_server stop
+  python3 -m des.adapters.drivers.hooks.hook_server serve    # foreground
+
+Requests are handled strictly one at a time: each invocation temporarily
+owns the process-global cwd, environment, argv and stdio, exactly as a
+dedicated hook process would. The server exits on its own after an idle
+period so a long-forgotten daemon never serves stale code for long.
+
+Wire protocol (one request per connection, see hook_client.py):
+  request  {"op": "run", "argv": [...], "stdin": "...", "cwd": "...", "env": {...}}
+           {"op": "ping"} | {"op": "shutdown"}
+  response {"exit_code": int, "stdout": "...", "stderr": "..."}
+           {"status": "ok", "pid": int}
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from des.adapters.drivers.hooks import hook_client, hook_router, service_factory
+from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
+
+
+DEFAULT_SOCKET_PATH = Path(hook_client.DEFAULT_SOCKET_PATH)
+
+# Idle period after which the server shuts itself down.
+DEFAULT_IDLE_TIMEOUT_SECONDS = 1800.0
+
+# A client that connects but never finishes sending must not wedge the
+# single serving thread.
+_CLIENT_IO_TIMEOUT_SECONDS = 10.0
+
+# How long ``start`` waits for the detached server to answer a ping.
+_START_WAIT_SECONDS = 5.0
+
+
+def warm_up() -> None:
+    """Pre-load everything a hook invocation would otherwise load lazily.
+
+    hook_router is already imported (module level); this additionally
+    parses the TDD schema and imports the modules handlers defer.
+    """
+    from des.adapters.driven.config import des_config  # noqa: F401
+    from des.adapters.driven.logging import jsonl_audit_log_reader  # noqa: F401
+    from des.application import post_tool_use_service  # noqa: F401
+    from des.domain import log_integrity_validator  # noqa: F401
+
+    service_factory.load_tdd_schema()
+
+
+@contextlib.contextmanager
+def _invocation_context(cwd: str, env: dict[str, str]):
+    """Temporarily install the client's cwd and DES environment."""
+    previous_cwd = os.getcwd()
+    previous_env = {key: os.environ.get(key) for key in env}
+    stale_keys = [
+        key
+        for key in os.environ
+        if key.startswith(hook_client.FORWARDED_ENV_PREFIXES) and key not in env
+    ]
+    stale_values = {key: os.environ.pop(key) for key in stale_keys}
+    os.environ.update(env)
+    try:
+        if cwd:
+            os.chdir(cwd)
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for key, value in previous_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        os.environ.update(stale_values)
+
+
+def dispatch(
+    argv: list[str],
+    stdin_data: str,
+    cwd: str = "",
+    env: dict[str, str] | None = None,
+) -> dict:
+    """Run one hook invocation in-process and capture its observable output.
+
+    Returns:
+        {"exit_code": int, "stdout": str, "stderr": str} — what the
+        equivalent one-shot process would have produced.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_stdin, saved_argv = sys.stdin, sys.argv
+    exit_code = 0
+    try:
+        with (
+            _invocation_context(cwd, env or {}),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            sys.stdin = io.StringIO(stdin_data)
+            sys.argv = ["claude_code_hook_adapter", *argv]
+            try:
+                hook_router.main()
+            except SystemExit as exc:
+                code = exc.code
+                exit_code = (
+                    code if isinstance(code, int) else (0 if code is None else 1)
+                )
+            except Exception as exc:
+                # Mirror an uncaught exception in a one-shot process.
+                print(f"DES hook server error: {exc!s}", file=sys.stderr)
+                exit_code = 1
+    finally:
+        sys.stdin, sys.argv = saved_stdin, saved_argv
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+class HookServer:
+    """Single-threaded Unix-domain socket server for DES hook invocations."""
+
+    def __init__(
+        self,
+        socket_path: Path = DEFAULT_SOCKET_PATH,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._socket_path = socket_path
+        self._idle_timeout = idle_timeout
+        self._running = False
+
+    def serve_forever(self) -> None:
+        """Bind, warm up and serve until shutdown or idle timeout."""
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_nwave_gitignore(self._socket_path.parent)
+        if self._socket_path.exists():
+            if ping(self._socket_path) is not None:
+                return  # another server already owns this socket
+            self._socket_path.unlink()  # stale socket left by a crashed server
+
+        warm_up()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(self._socket_path))
+        finally:
+            os.umask(previous_umask)
+        server.listen(16)
+        server.settimeout(self._idle_timeout)
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    break
+                with conn:
+                    conn.settimeout(_CLIENT_IO_TIMEOUT_SECONDS)
+                    self._handle_connection(conn)
+        finally:
+            server.close()
+            with contextlib.suppress(OSError):
+                self._socket_path.unlink()
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        try:
+            message = hook_client.decode_message(hook_client.recv_all(conn))
+        except (OSError, ValueError):
+            return
+
+        op = message.get("op")
+        if op == "run":
+            response = dispatch(
+                list(message.get("argv", [])),
+                message.get("stdin", ""),
+                message.get("cwd", ""),
+                message.get("env") or {},
+            )
+        elif op == "ping":
+            response = {"status": "ok", "pid": os.getpid()}
+        elif op == "shutdown":
+            self._running = False
+            response = {"status": "ok", "pid": os.getpid()}
+        else:
+            response = {"status": "error", "reason": f"Unknown op: {op}"}
+
+        with contextlib.suppress(OSError):
+            conn.sendall(hook_client.encode_message(response))
+
+
+def ping(socket_path: Path = DEFAULT_SOCKET_PATH) -> dict | None:
+    """Return the server's ping response, or None if it is not running."""
+    try:
+        return hook_client.request({"op": "ping"}, str(socket_path), timeout=2.0)
+    except (OSError, ValueError):
+        return None
+
+
+def _pythonpath_with_des_root() -> str:
+    """PYTHONPATH for the detached server: this DES install first."""
+    # <root>/des/adapters/drivers/hooks/hook_server.py -> <root>
+    des_root = str(Path(__file__).resolve().parents[4])
+    existing = os.environ.get("PYTHONPATH", "")
+    return os.pathsep.join(p for p in (des_root, existing) if p)
+
+
+def start(
+    socket_path: Path = DEFAULT_SOCKET_PATH,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+) -> dict | None:
+    """Spawn a detached server and wait until it answers a ping."""
+    status = ping(socket_path)
+    if status is not None:
+        return status
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "des.adapters.drivers.hooks.hook_server",
+            "serve",
+            "--socket",
+            str(socket_path),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env={**os.environ, "PYTHONPATH": _pythonpath_with_des_root()},
+    )
+    deadline = time.monotonic() + _START_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        status = ping(socket_path)
+        if status is not None:
+            return status
+        time.sleep(0.05)
+    return None
+
+
+def stop(socket_path: Path = DEFAULT_SOCKET_PATH) -> bool:
+    """Ask a running server to exit. Returns False if none was running."""
+    try:
+        return (
+            hook_client.request({"op": "shutdown"}, str(socket_path), timeout=2.0)
+            is not None
+        )
+    except (OSError, ValueError):
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for managing the resident hook server."""
+    parser = argparse.ArgumentParser(
+        prog="des-hook-server",
+        description="Resident DES hook server (opt-in hook latency optimization).",
+    )
+    parser.add_argument("command", choices=("serve", "start", "stop", "status"))
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT_SECONDS
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        HookServer(args.socket, args.idle_timeout).serve_forever()
+        return 0
+    if args.command == "start":
+        status = start(args.socket, args.idle_timeout)
+        if status is None:
+            print("DES hook server failed to start", file=sys.stderr)
+            return 1
+        print(f"DES hook server running (pid {status['pid']}) on {args.socket}")
+        return 0
+    if args.command == "stop":
+        if not stop(args.socket):
+            print("DES hook server not running")
+            return 0
+        print("DES hook server stopped")
+        return 0
+
+    status = ping(args.socket)
+    if status is None:
+        print("DES hook server not running")
+        return 1
+    print(f"DES hook server running (pid {status['pid']}) on {args.socket}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Persisted plugin scripts-root for the plugin hook bootstrap.
+
+Plugin hook commands (scripts/build_plugin.py) start with an inline
+``python3 -c`` bootstrap that must find the plugin's ``scripts/`` directory
+before it can import DES. Discovering it means globbing
+``~/.claude/plugins/cache/*/nw/*/scripts`` on every hook call, which grows
+with the number of cached plugin versions.
+
+Once discovered, the bootstrap calls ``remember`` to persist the path in
+``~/.nwave/plugin-scripts-<version>.path``. Later invocations of the same
+plugin version read that file and stat ``des/__init__.py`` under it; only
+a missing or stale entry sends them back to the glob.
+
+This module is imported by the bootstrap on the discovery path only, so
+it must stay stdlib-only and cheap to import; that is why it does not use
+des.domain.atomic_write.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from pathlib import Path
+
+
+def remember(cache_file: str, scripts_path: str) -> None:
+    """Persist *scripts_path* to *cache_file* (write to tmp, then rename).
+
+    Best effort: a read-only or missing home directory only means the next
+    hook invocation rediscovers the path, so OSError is swallowed.
+    """
+    target = Path(cache_file)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(scripts_path, encoding="utf-8")
+        tmp.replace(target)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
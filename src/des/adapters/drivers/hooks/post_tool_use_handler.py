@@ -17,6 +17,7 @@ from des.adapters.drivers.hooks import hook_protocol
 from des.adapters.drivers.hooks.hook_protocol import (
     EXIT_CODE_TO_DECISION,
     STDERR_CAPTURE_MAX_CHARS,
+    flushes_audit_log,
     log_hook_completed,
     log_hook_error,
     log_hook_invoked,
@@ -53,6 +54,7 @@ def _log_post_tool_use_decision(
         pass  # Decision logging must never break the hook
 
 
+@flushes_audit_log
 def handle_post_tool_use() -> int:
     """Handle post-tool-use command: notify parent of sub-agent failures.
 
@@ -17,6 +17,7 @@ from des.adapters.drivers.hooks import des_task_signal, service_factory
 from des.adapters.drivers.hooks.hook_protocol import (
     EXIT_CODE_TO_DECISION,
     STDERR_CAPTURE_MAX_CHARS,
+    flushes_audit_log,
     log_hook_completed,
     log_hook_error,
     log_hook_invoked,
@@ -26,6 +27,7 @@ from des.domain.des_marker_parser import DesMarkerParser
 from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
 
 
+@flushes_audit_log
 def handle_pre_tool_use() -> int:
     """Handle PreToolUse command: validate Task tool invocation.
 
@@ -18,6 +18,7 @@ from des.adapters.drivers.hooks import des_task_signal, hook_protocol
 from des.adapters.drivers.hooks.hook_protocol import (
     EXIT_CODE_TO_DECISION,
     STDERR_CAPTURE_MAX_CHARS,
+    flushes_audit_log,
     log_hook_completed,
     log_hook_error,
     log_hook_invoked,
@@ -27,6 +28,11 @@ from des.domain.session_guard_policy import SessionGuardPolicy
 from des.ports.driven_ports.audit_log_writer import AuditEvent
 
 
+# Only des-init-log / des-log-phase may write these (v4.0 logs keep their
+# events next to the header).
+_EXECUTION_LOG_FILES = ("execution-log.json", "execution-log.events.jsonl")
+
+
 def _log_pre_write_decision(
     hook_id: str,
     event_type: str,
@@ -51,6 +57,7 @@ def _log_pre_write_decision(
         pass  # Diagnostic logging must never break the hook
 
 
+@flushes_audit_log
 def handle_pre_write() -> int:
     """Handle PreToolUse for Write/Edit: guard source writes during deliver.
 
@@ -86,7 +93,7 @@ def handle_pre_write() -> int:
             file_path = tool_input.get("file_path", "")
 
             # --- Execution log guard: always block direct writes ---
-            if file_path and file_path.endswith("execution-log.json"):
+            if file_path and file_path.endswith(_EXECUTION_LOG_FILES):
                 project_dir = (
                     str(Path(file_path).parent) if file_path else "{project-dir}"
                 )
@@ -10,12 +10,14 @@ Extracted from claude_code_hook_adapter.py as part of P4 decomposition (step 4c)
 """
 
 from collections.abc import Callable
+from pathlib import Path
 
 from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
 from des.adapters.driven.hooks.json_execution_log_reader import (
     JsonExecutionLogReader,
 )
 from des.adapters.driven.time.system_time import SystemTimeProvider
+from des.adapters.driven.validation.file_verdict_cache import FileVerdictCache
 from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
 from des.adapters.drivers.hooks import hook_protocol
 from des.application.pre_tool_use_service import PreToolUseService
@@ -25,10 +27,39 @@ from des.domain.des_enforcement_policy import DesEnforcementPolicy
 from des.domain.des_marker_parser import DesMarkerParser
 from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
 from des.domain.step_completion_validator import StepCompletionValidator
-from des.domain.tdd_schema import TDDSchemaLoader
+from des.domain.tdd_schema import TDDSchema, TDDSchemaLoader
 from des.ports.driven_ports.audit_log_writer import AuditLogWriter
 
 
+# Process-lifetime schema cache: (schema path, (mtime_ns, size), schema).
+# A one-shot hook process loads the schema once either way; the resident
+# hook server reuses it across invocations until the schema file changes.
+_tdd_schema: tuple[Path, tuple[int, int] | None, TDDSchema] | None = None
+
+
+def load_tdd_schema() -> TDDSchema:
+    """Return the TDD schema, re-parsing step-tdd-cycle-schema.json when it changes."""
+    global _tdd_schema
+    if _tdd_schema is None:
+        schema_path = TDDSchemaLoader().schema_path
+    else:
+        schema_path = _tdd_schema[0]
+    try:
+        stat = schema_path.stat()
+        stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    if _tdd_schema is None or _tdd_schema[1] != stamp:
+        _tdd_schema = (schema_path, stamp, TDDSchemaLoader(schema_path).load())
+    return _tdd_schema[2]
+
+
+def clear_tdd_schema_cache() -> None:
+    """Drop the cached TDD schema (tests, or to re-resolve the schema path)."""
+    global _tdd_schema
+    _tdd_schema = None
+
+
 def create_pre_tool_use_service(
     *,
     audit_writer_factory: Callable[[], AuditLogWriter] | None = None,
@@ -53,6 +84,7 @@ def create_pre_tool_use_service(
         time_provider=time_provider,
         enforcement_policy=DesEnforcementPolicy(),
         completeness_policy=MarkerCompletenessPolicy(),
+        verdict_cache=FileVerdictCache(),
     )
 
 
@@ -74,7 +106,7 @@ def create_subagent_stop_service(
     factory = audit_writer_factory or hook_protocol._audit_writer_factory
     time_provider = SystemTimeProvider()
     audit_writer = factory()
-    schema = TDDSchemaLoader().load()
+    schema = load_tdd_schema()
 
     return SubagentStopService(
         log_reader=JsonExecutionLogReader(),
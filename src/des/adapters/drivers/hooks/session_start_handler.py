@@ -1,7 +1,12 @@
 """SessionStart hook handler for nWave update checks and housekeeping.
 
-Reads hook input JSON from stdin, runs housekeeping, invokes UpdateCheckService,
-and writes additionalContext JSON to stdout when UPDATE_AVAILABLE.
+Reads hook input JSON from stdin, runs housekeeping, reports the update-check
+verdict cached by the last background check, and writes additionalContext
+JSON to stdout when UPDATE_AVAILABLE.
+
+The network check itself never runs here: when the frequency policy says a
+check is due, a detached update_check_worker runs it and caches the verdict
+for the next session, so SessionStart latency does not depend on PyPI.
 
 Fail-open: any exception exits 0 so session is never blocked.
 Housekeeping and update check run in independent try/except blocks.
@@ -118,6 +123,13 @@ def _build_update_check_service(des_config):
     return UpdateCheckService(des_config=des_config)
 
 
+def _spawn_update_check_worker(des_config) -> None:
+    """Refresh the cached verdict in a detached worker process."""
+    from des.adapters.drivers.hooks import update_check_worker
+
+    update_check_worker.spawn(des_config)
+
+
 def _build_update_message(local: str, latest: str, changelog: str | None) -> str:
     """Format the additionalContext message for an available update."""
     changes = changelog or ""
@@ -125,11 +137,12 @@ def _build_update_message(local: str, latest: str, changelog: str | None) -> str
 
 
 def handle_session_start() -> int:
-    """Handle session-start hook: run housekeeping then check for nWave updates.
+    """Handle session-start hook: run housekeeping then report nWave updates.
 
     Reads JSON from stdin (Claude Code hook protocol), runs housekeeping,
-    calls UpdateCheckService, and writes additionalContext to stdout when an
-    update is available. DESConfig is shared between both operations.
+    takes the cached update-check verdict, and writes additionalContext to
+    stdout when an update is available. Spawns the background check when one
+    is due. DESConfig is shared between both operations.
 
     Returns:
         0 always (fail-open: session must never be blocked).
@@ -152,7 +165,7 @@ def handle_session_start() -> int:
 
     try:
         service = _build_update_check_service(des_config)
-        result = service.check_for_updates()
+        result = service.take_cached_result()
 
         from des.application.update_check_service import UpdateStatus
 
@@ -164,6 +177,9 @@ def handle_session_start() -> int:
             )
             print(json.dumps({"additionalContext": message}))
 
+        if service.is_check_due():
+            _spawn_update_check_worker(des_config)
+
     except Exception:
         pass
 
@@ -6,9 +6,17 @@ All tracking is fail-open — never blocks agent execution.
 Extracted from claude_code_hook_adapter.py as part of P4 decomposition (step 4d).
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from des.adapters.driven.time.system_time import SystemTimeProvider
 
 
+if TYPE_CHECKING:
+    from des.application.skill_tracking_service import SkillTrackingService
+
+
 def maybe_track_skill_load(hook_input: dict) -> None:
     """Track skill file reads for observability. Fail-open, never blocks.
 
@@ -19,9 +27,9 @@ def maybe_track_skill_load(hook_input: dict) -> None:
         hook_input: Raw hook input dict with tool_name and tool_input
     """
     try:
-        from des.adapters.driven.config.des_config import DESConfig
+        from des.adapters.driven.config.des_config import load_des_config
 
-        config = DESConfig()
+        config = load_des_config()
         if not config.skill_tracking_enabled:
             return
 
@@ -52,22 +60,64 @@ def maybe_track_skill_loads(transcript_path: str) -> None:
         transcript_path: Path to the sub-agent's JSONL transcript file.
     """
     try:
-        from des.adapters.driven.config.des_config import DESConfig
+        service = _transcript_tracking_service()
+        if service is not None:
+            service.track_from_transcript(transcript_path)
+    except Exception:
+        pass  # Fail-open: tracking must never block sub-agent completion
 
-        config = DESConfig()
-        if not config.skill_tracking_enabled:
+
+class SkillLoadVisitor:
+    """Transcript visitor collecting skill Read calls during a single pass.
+
+    Collected calls are logged by track(), so the caller decides whether
+    the sub-agent's skill loads are recorded. Fail-open: a malformed entry
+    drops everything collected so far and stops the visitor.
+    """
+
+    needles = (b"tool_use",)
+
+    def __init__(self, service: SkillTrackingService) -> None:
+        self._service = service
+        self._skill_reads: list[dict] = []
+        self.done = False
+
+    def visit(self, entry: dict) -> None:
+        try:
+            skill_read = self._service.skill_read_from_entry(entry)
+        except Exception:
+            self._skill_reads.clear()
+            self.done = True
             return
+        if skill_read is not None:
+            self._skill_reads.append(skill_read)
 
-        from des.adapters.driven.tracking.jsonl_skill_tracker import JsonlSkillTracker
-        from des.application.skill_tracking_service import SkillTrackingService
+    def track(self) -> None:
+        """Log the collected skill loads. Fail-open."""
+        self._service.track_skill_reads(self._skill_reads)
 
-        tracker = JsonlSkillTracker()
-        service = SkillTrackingService(
-            tracker=tracker,
-            time_provider=SystemTimeProvider(),
-            strategy=config.skill_tracking_strategy,
-        )
 
-        service.track_from_transcript(transcript_path)
+def skill_load_visitor() -> SkillLoadVisitor | None:
+    """Return a transcript visitor for skill loads, or None when disabled."""
+    try:
+        service = _transcript_tracking_service()
     except Exception:
-        pass  # Fail-open: tracking must never block sub-agent completion
+        return None  # Fail-open: tracking must never block sub-agent completion
+    return SkillLoadVisitor(service) if service is not None else None
+
+
+def _transcript_tracking_service() -> SkillTrackingService | None:
+    from des.adapters.driven.config.des_config import load_des_config
+
+    config = load_des_config()
+    if not config.skill_tracking_enabled:
+        return None
+
+    from des.adapters.driven.tracking.jsonl_skill_tracker import JsonlSkillTracker
+    from des.application.skill_tracking_service import SkillTrackingService
+
+    return SkillTrackingService(
+        tracker=JsonlSkillTracker(),
+        time_provider=SystemTimeProvider(),
+        strategy=config.skill_tracking_strategy,
+    )
@@ -0,0 +1,45 @@
+"""Composite SubagentStop handler — subagent-stop and deliver-progress in one process.
+
+SubagentStop used to be registered twice, once per action. Each
+registration started its own interpreter, read stdin and walked the same
+agent transcript. This handler runs both actions over one parsed hook
+input and one transcript scan, shared through a SubagentStopEvent.
+
+Exit codes are aggregated by severity (2 block > 1 error > 0 allow), so the
+composite blocks exactly when one of its handlers would have on its own.
+deliver-progress never blocks: its failures are reported on stderr and do
+not affect the subagent-stop decision printed on stdout.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from des.adapters.drivers.hooks.deliver_progress_handler import (
+    handle_deliver_progress,
+)
+from des.adapters.drivers.hooks.subagent_stop_handler import (
+    SubagentStopEvent,
+    handle_subagent_stop,
+)
+
+
+def aggregate_exit_codes(exit_codes: list[int]) -> int:
+    """Combine handler exit codes, keeping the most severe decision."""
+    return max(exit_codes, default=0)
+
+
+def handle_subagent_stop_composite() -> int:
+    """Run subagent-stop, then deliver-progress, over one hook input.
+
+    Returns:
+        The aggregated exit code of both handlers (see module docstring).
+    """
+    event = SubagentStopEvent()
+    exit_codes = [handle_subagent_stop(event)]
+    try:
+        exit_codes.append(handle_deliver_progress(event))
+    except Exception as exc:
+        # deliver-progress is fail-open on its own; keep it that way here
+        print(f"[deliver-progress] non-fatal error: {exc}", file=sys.stderr)
+    return aggregate_exit_codes(exit_codes)
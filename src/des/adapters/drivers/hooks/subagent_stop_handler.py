@@ -4,6 +4,12 @@ Translates Claude Code's SubagentStop hook event (JSON stdin) into
 SubagentStopService decisions (allow/block). Extracts DES context from
 agent transcripts, manages signal file lifecycle, and emits audit events.
 
+The agent transcript is read once: DES marker extraction, token-usage
+instrumentation and skill-load tracking run as visitors of a single
+streaming pass (see transcript_scanner). When run as part of the
+composite SubagentStop hook, the parsed stdin and the transcript's DES
+context are left on a shared SubagentStopEvent for the next handler.
+
 Extracted from claude_code_hook_adapter.py as part of P4 decomposition.
 """
 
@@ -14,6 +20,7 @@ import os
 import sys
 import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 
 from des.adapters.driven.logging.audit_events import (
@@ -21,26 +28,66 @@ from des.adapters.driven.logging.audit_events import (
     EventType,
 )
 from des.adapters.driven.time.system_time import SystemTimeProvider
-from des.adapters.drivers.hooks import des_task_signal, hook_protocol, service_factory
+from des.adapters.drivers.hooks import (
+    des_task_signal,
+    hook_protocol,
+    service_factory,
+    transcript_checkpoint,
+)
 from des.adapters.drivers.hooks.execution_log_resolver import resolve_execution_log_path
 from des.adapters.drivers.hooks.hook_protocol import (
     EXIT_CODE_TO_DECISION,
     STDERR_CAPTURE_MAX_CHARS,
+    StdinParseResult,
+    flushes_audit_log,
     log_hook_completed,
     log_hook_error,
     log_hook_invoked,
     read_and_parse_stdin,
 )
 from des.adapters.drivers.hooks.skill_tracking_hooks import (
-    maybe_track_skill_loads as _maybe_track_skill_loads,
+    SkillLoadVisitor,
+    skill_load_visitor,
 )
-from des.adapters.drivers.hooks.token_usage_extractor import (
-    extract_token_usage_events,
+from des.adapters.drivers.hooks.token_usage_extractor import TokenUsageVisitor
+from des.adapters.drivers.hooks.transcript_scanner import (
+    TranscriptVisitor,
+    scan_transcript,
 )
 from des.domain.des_marker_parser import DesMarkerParser
 from des.ports.driven_ports.audit_log_writer import AuditEvent
 
 
+# ---------------------------------------------------------------------------
+# Shared hook input (composite SubagentStop invocation)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SubagentStopEvent:
+    """One SubagentStop hook input, shared by the handlers of one process.
+
+    The first handler parses stdin and scans the agent transcript; later
+    handlers reuse both instead of reading stdin again (it is already
+    consumed) or re-walking the transcript.
+
+    Attributes:
+        stdin_result: Parsed hook input, None until a handler reads stdin
+        transcript_scanned: True once the agent transcript has been walked
+        des_context: DES markers found by that walk, or None
+    """
+
+    stdin_result: StdinParseResult | None = None
+    transcript_scanned: bool = False
+    des_context: dict | None = None
+
+    def parse_stdin(self, handler: str) -> StdinParseResult:
+        """Return the parsed hook input, reading stdin on first use."""
+        if self.stdin_result is None:
+            self.stdin_result = read_and_parse_stdin(handler)
+        return self.stdin_result
+
+
 # ---------------------------------------------------------------------------
 # Transcript DES context extraction
 # ---------------------------------------------------------------------------
@@ -73,7 +120,36 @@ def _log_transcript_audit(
         pass
 
 
-def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
+class _DesMarkerVisitor:
+    """Transcript visitor for the first message carrying DES-VALIDATION."""
+
+    needles = (b"DES-VALIDATION",)
+
+    def __init__(self) -> None:
+        self.done = False
+        self.context: dict | None = None
+
+    def visit(self, entry: dict) -> None:
+        message = entry.get("message", {})
+        if not isinstance(message, dict):
+            return
+
+        content = _normalize_message_content(message.get("content", ""))
+        if "DES-VALIDATION" not in content:
+            return
+
+        self.done = True
+        markers = DesMarkerParser().parse(content)
+        if markers.is_des_task and markers.project_id and markers.step_id:
+            self.context = {
+                "project_id": markers.project_id,
+                "step_id": markers.step_id,
+            }
+
+
+def extract_des_context_from_transcript(
+    transcript_path: str, visitors: tuple[TranscriptVisitor, ...] = ()
+) -> dict | None:
     """Extract DES markers from an agent's transcript file.
 
     Reads the JSONL transcript, finds the first user message (which contains
@@ -81,46 +157,42 @@ def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
 
     Args:
         transcript_path: Absolute path to the agent's transcript JSONL file
+        visitors: Further transcript visitors fed during the same pass
 
     Returns:
         dict with "project_id" and "step_id" if DES markers found, None otherwise
     """
+    marker_visitor = _DesMarkerVisitor()
+    _scan_for_des_context(transcript_path, marker_visitor, visitors)
+    return marker_visitor.context
+
+
+def _scan_for_des_context(
+    transcript_path: str,
+    marker_visitor: _DesMarkerVisitor,
+    visitors: tuple[TranscriptVisitor, ...],
+    start: int = 0,
+) -> int | None:
+    """Scan the transcript from *start*, auditing missing markers or errors.
+
+    Returns:
+        Byte offset where the scan stopped, or None if the transcript is
+        missing or unreadable (the marker visitor's context is then None).
+    """
     if not Path(transcript_path).exists():
+        marker_visitor.context = None
         return None
 
     try:
-        with open(transcript_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                message = entry.get("message", {})
-                if not isinstance(message, dict):
-                    continue
-
-                content = _normalize_message_content(message.get("content", ""))
-                if "DES-VALIDATION" not in content:
-                    continue
-
-                markers = DesMarkerParser().parse(content)
-                if markers.is_des_task and markers.project_id and markers.step_id:
-                    return {
-                        "project_id": markers.project_id,
-                        "step_id": markers.step_id,
-                    }
-                return None
-
+        end = scan_transcript(transcript_path, (marker_visitor, *visitors), start)
     except (OSError, PermissionError) as e:
         _log_transcript_audit("HOOK_TRANSCRIPT_ERROR", transcript_path, error=str(e))
+        marker_visitor.context = None
         return None
 
-    _log_transcript_audit("HOOK_TRANSCRIPT_NO_MARKERS", transcript_path)
-    return None
+    if not marker_visitor.done:
+        _log_transcript_audit("HOOK_TRANSCRIPT_NO_MARKERS", transcript_path)
+    return end
 
 
 # ---------------------------------------------------------------------------
@@ -130,12 +202,14 @@ def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
 
 def _resolve_des_context(
     hook_input: dict,
+    des_context: dict | None,
 ) -> tuple[str, str, str] | tuple[None, dict, int]:
     """Resolve DES context (execution_log_path, project_id, step_id) from hook input.
 
     Supports two protocols:
     1. Direct DES format (CLI testing): {"executionLogPath", "projectId", "stepId"}
-    2. Claude Code protocol (live hooks): {"agent_transcript_path", "cwd", ...}
+    2. Claude Code protocol (live hooks): {"agent_transcript_path", "cwd", ...},
+       with *des_context* already extracted from the agent transcript
 
     Returns:
         On success: (execution_log_path, project_id, step_id)
@@ -168,14 +242,9 @@ def _resolve_des_context(
             )
         return execution_log_path, project_id, step_id
 
-    # Claude Code protocol - extract DES context from transcript
-    agent_transcript_path = hook_input.get("agent_transcript_path")
+    # Claude Code protocol - DES context comes from the transcript
     cwd = hook_input.get("cwd", "")
 
-    des_context = None
-    if agent_transcript_path:
-        des_context = extract_des_context_from_transcript(agent_transcript_path)
-
     if des_context is None:
         return None, {"decision": "allow"}, 0
 
@@ -232,63 +301,73 @@ Never write log entries for phases that were not actually executed."""
     }
 
 
-def _read_transcript_entries(transcript_path: str) -> list[dict]:
-    """Parse a transcript JSONL file into a list of dict entries.
+def _scan_agent_transcript(
+    transcript_path: str | None, *, agent_name: str | None, cwd: str = ""
+) -> tuple[dict | None, SkillLoadVisitor | None]:
+    """Walk the agent transcript once for DES markers, token usage and skills.
 
-    Fail-open: malformed lines are skipped silently. Missing file yields
-    empty list. Never raises.
-    """
-    path = Path(transcript_path)
-    if not path.exists():
-        return []
-    entries: list[dict] = []
-    try:
-        with open(path) as f:
-            for line in f:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                try:
-                    entry = json.loads(stripped)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(entry, dict):
-                    entries.append(entry)
-    except (OSError, PermissionError):
-        return []
-    return entries
-
-
-def _emit_token_usage_events(
-    transcript_path: str | None,
-    *,
-    agent_name: str | None,
-    feature_id: str | None = None,
-    wave: str | None = None,
-) -> None:
-    """Read transcript, extract token-usage events, write each via the audit port.
+    Token-usage events (L1 instrumentation, additive per D2) are written to
+    the audit log during the pass; skill loads are only collected, so the
+    caller tracks them once the DES step is validated.
+
+    With a project *cwd*, the pass resumes from the transcript checkpoint
+    in .nwave/des/, so a revisited transcript only has its appended lines
+    visited and no usage event is emitted twice.
 
-    Per D4 (fail-open): any failure inside this routine is swallowed so
-    the SubagentStop hook itself is never blocked by token instrumentation.
+    Returns:
+        (des_context, skill_visitor): DES markers or None, and the visitor
+        holding collected skill loads (None when tracking is disabled).
     """
     if not transcript_path:
-        return
+        return None, None
+
+    visitors: list[TranscriptVisitor] = []
+    token_visitor = _token_usage_visitor(agent_name)
+    if token_visitor is not None:
+        visitors.append(token_visitor)
+    skill_visitor = skill_load_visitor()
+    if skill_visitor is not None:
+        visitors.append(skill_visitor)
+
+    des_dir = Path(cwd) / des_task_signal.DES_SESSION_DIR if cwd else None
+    marker_visitor = _DesMarkerVisitor()
+    start = 0
+    if des_dir is not None:
+        checkpoint = transcript_checkpoint.load_checkpoint(des_dir, transcript_path)
+        if checkpoint is not None:
+            start = checkpoint.offset
+            marker_visitor.done = checkpoint.markers_done
+            marker_visitor.context = checkpoint.des_context
+
+    end = _scan_for_des_context(transcript_path, marker_visitor, tuple(visitors), start)
+    if des_dir is not None and end is not None:
+        try:
+            transcript_checkpoint.save_checkpoint(
+                des_dir,
+                transcript_path,
+                end,
+                marker_visitor.context,
+                marker_visitor.done,
+            )
+        except OSError:
+            pass  # Fail-open: the next visit rescans from byte zero
+    return marker_visitor.context, skill_visitor
+
+
+def _token_usage_visitor(agent_name: str | None) -> TokenUsageVisitor | None:
+    """Build the visitor writing token-usage events via the audit port.
+
+    Per D4 (fail-open): if the audit writer is unavailable, token
+    instrumentation is skipped rather than blocking the SubagentStop hook.
+    """
     try:
-        entries = _read_transcript_entries(transcript_path)
-        events = extract_token_usage_events(
-            entries,
-            agent_name=agent_name or "unknown",
-            feature_id=feature_id,
-            wave=wave,
-        )
-        if not events:
-            return
         writer = hook_protocol.get_audit_writer()
-        for event in events:
-            writer.log_event(_to_audit_event(event))
     except Exception:
-        # Fail-open: token instrumentation must never block the hook.
-        pass
+        return None
+    return TokenUsageVisitor(
+        lambda event: writer.log_event(_to_audit_event(event)),
+        agent_name=agent_name or "unknown",
+    )
 
 
 def _to_audit_event(event: AgentUsageObservedEvent) -> AuditEvent:
@@ -328,7 +407,8 @@ def _extract_execution_stats(hook_input: dict) -> tuple[int | None, int | None]:
 # ---------------------------------------------------------------------------
 
 
-def handle_subagent_stop() -> int:
+@flushes_audit_log
+def handle_subagent_stop(event: SubagentStopEvent | None = None) -> int:
     """Handle subagent-stop command: validate step completion.
 
     Protocol translation only -- all decisions delegated to SubagentStopService.
@@ -337,6 +417,11 @@ def handle_subagent_stop() -> int:
     DES context (project_id, step_id) is extracted from the agent's transcript.
     Non-DES agents (no markers in transcript) are allowed through.
 
+    Args:
+        event: Hook input shared with other handlers of a composite
+            invocation. Parsed stdin and the transcript's DES context are
+            recorded on it. None for a standalone invocation.
+
     Returns:
         0 if gate passes or non-DES agent
         1 if error occurs (fail-closed)
@@ -349,9 +434,10 @@ def handle_subagent_stop() -> int:
     turns_used: int | None = None
     tokens_used: int | None = None
     stderr_buffer = io.StringIO()
+    event = event if event is not None else SubagentStopEvent()
     try:
         with contextlib.redirect_stderr(stderr_buffer):
-            stdin_result = read_and_parse_stdin("subagent_stop")
+            stdin_result = event.parse_stdin("subagent_stop")
 
             if stdin_result.is_empty:
                 return 0
@@ -379,15 +465,20 @@ def handle_subagent_stop() -> int:
                 hook_id=hook_id,
             )
 
-            # L1 token instrumentation — additive walk of the same transcript.
-            # Fail-open per D4: never blocks the hook on instrumentation errors.
-            _emit_token_usage_events(
+            # Single transcript pass: DES markers, L1 token instrumentation
+            # (fail-open per D4) and skill loads.
+            transcript_des_context, skill_visitor = _scan_agent_transcript(
                 hook_input.get("agent_transcript_path"),
                 agent_name=hook_input.get("agent_type"),
+                cwd=hook_input.get("cwd", ""),
             )
+            event.transcript_scanned = True
+            event.des_context = transcript_des_context
 
             # Resolve DES context from either protocol
-            des_context_result = _resolve_des_context(hook_input)
+            des_context_result = _resolve_des_context(
+                hook_input, transcript_des_context
+            )
             if des_context_result[0] is None:
                 # Error or non-DES passthrough -- log it for diagnostics
                 _, response, exit_code = des_context_result
@@ -441,10 +532,9 @@ def handle_subagent_stop() -> int:
                 hook_id=hook_id,
             )
 
-            # Track skill loads from sub-agent transcript (fail-open)
-            transcript_path = hook_input.get("agent_transcript_path")
-            if transcript_path:
-                _maybe_track_skill_loads(transcript_path)
+            # Track skill loads collected from the transcript (fail-open)
+            if skill_visitor is not None:
+                skill_visitor.track()
 
             # Translate HookDecision to protocol response
             if decision.action == "allow":
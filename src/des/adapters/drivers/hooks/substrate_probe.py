@@ -2,6 +2,9 @@
 
 Returns a one-line advisory if any install health checks fail, or an empty
 string on a healthy install or any exception (fire-and-forget safety).
+Doctor results are reused while the installation is unchanged, so most
+sessions only pay for a fingerprint (see nwave_ai.doctor.cache). A check that
+times out is inconclusive rather than an install issue and is not counted.
 
 Design note: nwave_ai imports are intentionally deferred inside run_probe()
 and guarded by try/except ImportError.  This preserves the fail-open contract
@@ -28,15 +31,15 @@ def run_probe(context: object = None) -> str:
         # ImportError → fail-open (return "") so hooks always stay responsive.
         try:
             from nwave_ai.doctor.context import DoctorContext
-            from nwave_ai.doctor.runner import run_doctor
+            from nwave_ai.doctor.runner import run_doctor_cached
         except ImportError:
             return ""
 
         resolved_context = (
             context if context is not None else DoctorContext.from_defaults()
         )
-        results = run_doctor(resolved_context)
-        failed_count = sum(1 for r in results if not r.passed)
+        results = run_doctor_cached(resolved_context)
+        failed_count = sum(1 for r in results if not r.passed and not r.timed_out)
         if failed_count == 0:
             return ""
         noun = "issue" if failed_count == 1 else "issues"
@@ -11,15 +11,22 @@ Per D5: per-message granularity. Aggregation deferred to analytics layer.
 
 This module lives next to subagent_stop_handler.py — same code path that
 already walks transcripts for DES markers (D2: additive only).
+TokenUsageVisitor runs the same extraction as an incremental visitor of
+that single transcript pass (see transcript_scanner).
 """
 
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from des.adapters.driven.logging.audit_events import AgentUsageObservedEvent
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
 _logger = logging.getLogger(__name__)
 
 _REQUIRED_USAGE_FIELDS = (
@@ -65,6 +72,46 @@ def extract_token_usage_events(
     ]
 
 
+class TokenUsageVisitor:
+    """Transcript visitor emitting one event per assistant message with usage.
+
+    Events are handed to ``emit`` as they are found, so nothing accumulates
+    across the transcript. Fail-open: the first exception raised by
+    ``emit`` stops the visitor instead of propagating.
+    """
+
+    needles = (b'"usage"',)
+
+    def __init__(
+        self,
+        emit: Callable[[AgentUsageObservedEvent], None],
+        *,
+        agent_name: str,
+        feature_id: str | None = None,
+        wave: str | None = None,
+    ) -> None:
+        self._emit = emit
+        self._agent_name = agent_name
+        self._feature_id = feature_id
+        self._wave = wave
+        self.done = False
+
+    def visit(self, entry: dict) -> None:
+        event = _maybe_event_from_entry(
+            entry,
+            agent_name=self._agent_name,
+            feature_id=self._feature_id,
+            wave=self._wave,
+        )
+        if event is None:
+            return
+        try:
+            self._emit(event)
+        except Exception:
+            # Fail-open: token instrumentation must never block the hook.
+            self.done = True
+
+
 def _maybe_event_from_entry(
     entry: dict,
     *,
@@ -0,0 +1,130 @@
+"""Per-transcript scan checkpoints for repeated SubagentStop events.
+
+The same agent transcript can reach SubagentStop more than once (retries
+after a block decision). A checkpoint records how far the previous scan
+got, so the next one resumes there: only appended lines are visited and
+token usage already reported is not emitted again.
+
+Checkpoints live in ``.nwave/des/transcript-checkpoints/``, one JSON file
+per transcript (named by a hash of its path):
+
+    {"version": 1, "offset": 18342, "prefix_digest": "<sha256>",
+     "des_context": {"project_id": "...", "step_id": "..."} | null,
+     "markers_done": true}
+
+``prefix_digest`` hashes the offset and the first and last 4 KiB before
+it. A transcript that was truncated, rewritten or replaced no longer
+matches and is scanned again from byte zero. Checking it costs two small
+reads, whatever the transcript length.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from des.domain.atomic_write import write_atomic
+from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
+
+
+CHECKPOINT_DIRNAME = "transcript-checkpoints"
+
+_VERSION = 1
+_DIGEST_WINDOW = 4096
+
+
+@dataclass(frozen=True)
+class TranscriptCheckpoint:
+    """Scan state of one transcript after a SubagentStop pass.
+
+    Attributes:
+        offset: Byte offset just past the last line processed
+        prefix_digest: Digest of the transcript bytes before ``offset``
+        des_context: DES markers found in the transcript, or None
+        markers_done: True once the DES-VALIDATION message has been seen
+    """
+
+    offset: int
+    prefix_digest: str
+    des_context: dict | None
+    markers_done: bool
+
+
+def checkpoint_path_for(des_dir: Path, transcript_path: str) -> Path:
+    """Return the checkpoint file for *transcript_path* under *des_dir*."""
+    key = hashlib.sha256(str(Path(transcript_path).absolute()).encode()).hexdigest()
+    return des_dir / CHECKPOINT_DIRNAME / f"{key[:32]}.json"
+
+
+def prefix_digest(transcript_path: str, offset: int) -> str | None:
+    """Digest the transcript prefix ending at *offset*.
+
+    Returns:
+        Hex digest, or None if the transcript is shorter than *offset*.
+
+    Raises:
+        OSError: If the transcript cannot be read
+    """
+    with open(transcript_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < offset:
+            return None
+        head = f.read(min(offset, _DIGEST_WINDOW))
+        tail_start = max(offset - _DIGEST_WINDOW, 0)
+        f.seek(tail_start)
+        tail = f.read(offset - tail_start)
+    digest = hashlib.sha256(str(offset).encode())
+    digest.update(head)
+    digest.update(tail)
+    return digest.hexdigest()
+
+
+def load_checkpoint(des_dir: Path, transcript_path: str) -> TranscriptCheckpoint | None:
+    """Return the checkpoint for *transcript_path* if it still matches.
+
+    Missing, unreadable or malformed checkpoints, and checkpoints whose
+    prefix digest no longer matches the transcript, yield None.
+    """
+    try:
+        data = json.loads(
+            checkpoint_path_for(des_dir, transcript_path).read_text(encoding="utf-8")
+        )
+        if data.get("version") != _VERSION:
+            return None
+        checkpoint = TranscriptCheckpoint(
+            offset=int(data["offset"]),
+            prefix_digest=str(data["prefix_digest"]),
+            des_context=data.get("des_context"),
+            markers_done=bool(data.get("markers_done")),
+        )
+        if checkpoint.prefix_digest != prefix_digest(
+            transcript_path, checkpoint.offset
+        ):
+            return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return checkpoint
+
+
+def save_checkpoint(
+    des_dir: Path,
+    transcript_path: str,
+    offset: int,
+    des_context: dict | None,
+    markers_done: bool,
+) -> None:
+    """Record the scan state of *transcript_path* (write to tmp, then rename).
+
+    Raises:
+        OSError: If the transcript cannot be read or the checkpoint written
+    """
+    digest = prefix_digest(transcript_path, offset)
+    if digest is None:
+        return
+    checkpoint = TranscriptCheckpoint(offset, digest, des_context, markers_done)
+    path = checkpoint_path_for(des_dir, transcript_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_nwave_gitignore(path.parent)
+    write_atomic(path, json.dumps({"version": _VERSION, **asdict(checkpoint)}))
@@ -0,0 +1,110 @@
+"""Single-pass streaming scanner for agent transcripts (JSONL).
+
+SubagentStop needs several things from the same transcript: the DES
+markers in the Task prompt, per-message token usage and skill-file Read
+calls. Instead of one walk per consumer, scan_transcript() reads the file
+once, line by line, and hands each decoded entry to every visitor that is
+still active.
+
+A visitor declares the byte ``needles`` a raw line must contain for the
+visitor to care about it; lines no active visitor wants are never
+JSON-decoded. Memory is bounded by the longest line, not the file size.
+
+A scan can start at a byte offset and reports where it stopped, so a
+caller can checkpoint the transcript and later process only the lines
+appended since (see transcript_checkpoint).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Protocol
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class TranscriptVisitor(Protocol):
+    """Incremental consumer of transcript entries.
+
+    Attributes:
+        needles: Byte substrings of which at least one must occur in a raw
+            line for it to be relevant; empty means every line.
+        done: Set by the visitor once it needs no further entries.
+    """
+
+    needles: tuple[bytes, ...]
+    done: bool
+
+    def visit(self, entry: dict) -> None:
+        """Consume one decoded transcript entry."""
+
+
+def scan_transcript(
+    transcript_path: str, visitors: Iterable[TranscriptVisitor], start: int = 0
+) -> int:
+    """Feed every entry of the transcript to the visitors in a single pass.
+
+    Stops reading as soon as all visitors are done. Visitors handle their
+    own failures; exceptions they raise propagate to the caller.
+
+    Args:
+        transcript_path: Path to the JSONL transcript
+        visitors: Visitors to feed, in order, with each entry
+        start: Byte offset of a line start to resume from
+
+    Returns:
+        Byte offset just past the last line consumed. A trailing line
+        without newline counts only if it decodes, so a line still being
+        written is seen again by the next scan.
+
+    Raises:
+        OSError: If the transcript cannot be opened or read
+    """
+    offset = start
+    active = [visitor for visitor in visitors if not visitor.done]
+    if not active:
+        return offset
+    needles = _union_needles(active)
+    with open(transcript_path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            complete = line.endswith(b"\n")
+            if needles and not any(needle in line for needle in needles):
+                if complete:
+                    offset += len(line)
+                continue
+            entry = _decode(line)
+            if complete or entry is not None:
+                offset += len(line)
+            if entry is None:
+                continue
+            for visitor in active:
+                visitor.visit(entry)
+            if any(visitor.done for visitor in active):
+                active = [visitor for visitor in active if not visitor.done]
+                if not active:
+                    break
+                needles = _union_needles(active)
+    return offset
+
+
+def _decode(line: bytes) -> dict | None:
+    """Decode one JSONL line; blank, malformed and non-object lines give None."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        # JSONDecodeError and UnicodeDecodeError
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _union_needles(visitors: list[TranscriptVisitor]) -> tuple[bytes, ...]:
+    """Needles of all visitors; empty if any visitor wants every line."""
+    if any(not visitor.needles for visitor in visitors):
+        return ()
+    return tuple(dict.fromkeys(n for visitor in visitors for n in visitor.needles))
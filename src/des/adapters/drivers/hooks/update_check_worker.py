@@ -0,0 +1,141 @@
+"""Detached worker that refreshes the cached nWave update-check verdict.
+
+SessionStart used to run UpdateCheckService.check_for_updates() inline. On a
+due day that is a PyPI fetch plus a GitHub changelog fetch on the critical
+path of every new session, each of which can hang until the HTTP timeout
+behind a stalled proxy. SessionStart now only reads the verdict the previous
+check cached next to the project config (see DESConfig.update_verdict_path)
+and, when a check is due, spawns this module in its own session to run the
+check and cache the next verdict.
+
+A lock file next to the verdict keeps concurrent SessionStarts from spawning
+a second worker while one is still running. A lock older than
+LOCK_STALE_SECONDS belongs to a worker that died and is taken over.
+
+Usage:
+    python -m des.adapters.drivers.hooks.update_check_worker [--pypi-url URL]
+        [--github-releases-url URL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from des.adapters.driven.config.des_config import DESConfig
+
+
+# Comfortably above two HTTP fetches at UpdateCheckService's 5 s timeout
+LOCK_STALE_SECONDS = 60
+
+
+def lock_path(des_config: DESConfig) -> Path:
+    """Path of the lock held while a worker runs for *des_config*'s project."""
+    return des_config.update_verdict_path.with_name("update-check.lock")
+
+
+def _acquire_lock(lock: Path) -> bool:
+    """Create *lock* exclusively, taking over a stale one. False if held."""
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                age = time.time() - lock.stat().st_mtime
+            except OSError:
+                continue  # Released meanwhile; retry once
+            if age < LOCK_STALE_SECONDS:
+                return False
+            lock.unlink(missing_ok=True)
+    return False
+
+
+def _pythonpath_with_des_root() -> str:
+    """PYTHONPATH for the detached worker: this DES install first."""
+    # <root>/des/adapters/drivers/hooks/update_check_worker.py -> <root>
+    des_root = str(Path(__file__).resolve().parents[4])
+    existing = os.environ.get("PYTHONPATH", "")
+    return os.pathsep.join(p for p in (des_root, existing) if p)
+
+
+def spawn(des_config: DESConfig, extra_args: Sequence[str] = ()) -> bool:
+    """Start a detached worker for the current project unless one is running.
+
+    Returns immediately; the worker outlives the calling hook process.
+
+    Args:
+        des_config: Configuration of the project whose verdict is refreshed
+        extra_args: Additional worker command-line arguments
+
+    Returns:
+        True if a worker was started, False if one already holds the lock.
+
+    Raises:
+        OSError: If the lock cannot be created or the worker cannot start
+    """
+    from des.domain.nwave_dir_gitignore import ensure_nwave_gitignore
+
+    lock = lock_path(des_config)
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    ensure_nwave_gitignore(lock.parent)
+    if not _acquire_lock(lock):
+        return False
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "des.adapters.drivers.hooks.update_check_worker",
+                *extra_args,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            env={**os.environ, "PYTHONPATH": _pythonpath_with_des_root()},
+        )
+    except OSError:
+        lock.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run one update check for the project in the working directory."""
+    from des.adapters.driven.config.des_config import DESConfig
+    from des.application.update_check_service import UpdateCheckService
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pypi-url")
+    parser.add_argument("--github-releases-url")
+    args = parser.parse_args(argv)
+
+    urls = {
+        name: url
+        for name, url in (
+            ("pypi_url", args.pypi_url),
+            ("github_releases_url", args.github_releases_url),
+        )
+        if url is not None
+    }
+    des_config = DESConfig()
+    try:
+        # Never raises: network and persistence failures yield SKIP
+        UpdateCheckService(des_config=des_config, **urls).check_for_updates()
+    finally:
+        lock_path(des_config).unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
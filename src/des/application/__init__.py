@@ -4,14 +4,30 @@ DES Application Layer - Use cases and orchestration.
 Exports all application-layer services and orchestrator.
 """
 
-from des.application.config_loader import ConfigLoader
-from des.application.invocation_limits_validator import (
-    InvocationLimitsResult,
-    InvocationLimitsValidator,
-)
-from des.application.orchestrator import DESOrchestrator
-from des.application.validator import TDDPhaseValidator
+from typing import TYPE_CHECKING
 
+from des._lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from des.application.config_loader import ConfigLoader
+    from des.application.invocation_limits_validator import (
+        InvocationLimitsResult,
+        InvocationLimitsValidator,
+    )
+    from des.application.orchestrator import DESOrchestrator
+    from des.application.validator import TDDPhaseValidator
+
+
+_EXPORTS = {
+    "ConfigLoader": "des.application.config_loader",
+    "InvocationLimitsResult": "des.application.invocation_limits_validator",
+    "InvocationLimitsValidator": "des.application.invocation_limits_validator",
+    "DESOrchestrator": "des.application.orchestrator",
+    "TDDPhaseValidator": "des.application.validator",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "ConfigLoader",
@@ -135,10 +135,12 @@ class HousekeepingService:
             if file_date == today:
                 continue
             if file_date < cutoff:
-                try:
-                    log_file.unlink()
-                except OSError:
-                    pass
+                # The sidecar offset index (audit-YYYY-MM-DD.log.idx) goes too.
+                for path in (log_file, log_file.with_name(name + ".idx")):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
 
     @staticmethod
     def _clean_signal_files(
@@ -147,9 +149,10 @@ class HousekeepingService:
     ) -> None:
         """Remove stale signal files left by crashed sessions.
 
-        Scans .nwave/des/ for des-task-active* files and deliver-session.json.
-        Files older than signal_staleness_hours are deleted. Recent files are
-        preserved to protect concurrent active sessions.
+        Scans .nwave/des/ for des-task-active* files, deliver-session.json and
+        SubagentStop transcript checkpoints. Files older than
+        signal_staleness_hours are deleted. Recent files are preserved to
+        protect concurrent active sessions.
         """
         des_dir = config.nwave_dir / "des"
         if not des_dir.exists():
@@ -160,6 +163,7 @@ class HousekeepingService:
         cutoff_ts = now_ts - threshold_seconds
 
         candidates: list[Path] = list(des_dir.glob("des-task-active*"))
+        candidates.extend(des_dir.glob("transcript-checkpoints/*.json"))
         deliver_session = des_dir / "deliver-session.json"
         if deliver_session.exists():
             candidates.append(deliver_session)
@@ -1,7 +1,8 @@
 """PreToolUseService - application service for Agent tool invocation validation.
 
 Orchestrates domain logic (DesMarkerParser, MarkerCompletenessPolicy) and driven ports
-(ValidatorPort, AuditLogWriter, TimeProvider) to produce allow/block decisions.
+(ValidatorPort, AuditLogWriter, TimeProvider, VerdictCache) to produce allow/block
+decisions.
 
 This service implements the PreToolUsePort driver port interface.
 """
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
     from des.domain.des_marker_parser import DesMarkerParser
     from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
     from des.ports.driven_ports.time_provider_port import TimeProvider
+    from des.ports.driven_ports.verdict_cache import VerdictCache
     from des.ports.driver_ports.validator_port import ValidatorPort
 
 
@@ -41,6 +43,12 @@ class PreToolUseService(PreToolUsePort):
       5. Validate prompt structure via ValidatorPort
          - If invalid: log HOOK_PRE_TOOL_USE_BLOCKED, return block
          - If valid: log HOOK_PRE_TOOL_USE_ALLOWED, return allow
+
+    With a VerdictCache, an invocation identical to one already validated in
+    step 5 skips the validator: the stored decision is returned and its audit
+    event emitted again, with a fresh timestamp and this call's hook_id.
+    Steps 1-4 are cheap and decided by the prompt alone, so the cache is only
+    consulted (and its key only computed) once they have passed.
     """
 
     def __init__(
@@ -51,6 +59,8 @@ class PreToolUseService(PreToolUsePort):
         time_provider: TimeProvider,
         enforcement_policy: DesEnforcementPolicy | None = None,
         completeness_policy: MarkerCompletenessPolicy | None = None,
+        *,
+        verdict_cache: VerdictCache | None = None,
     ) -> None:
         self._marker_parser = marker_parser
         self._prompt_validator = prompt_validator
@@ -58,6 +68,7 @@ class PreToolUseService(PreToolUsePort):
         self._time_provider = time_provider
         self._enforcement_policy = enforcement_policy
         self._completeness_policy = completeness_policy
+        self._verdict_cache = verdict_cache
 
     def validate(
         self,
@@ -112,16 +123,30 @@ class PreToolUseService(PreToolUsePort):
             self._log_allowed(context="orchestrator_mode", hook_id=hook_id)
             return HookDecision.allow()
 
-        # Step 5: Validate DES prompt structure
+        # Step 5: Validate DES prompt structure (unless already validated)
+        if self._verdict_cache is not None:
+            cached = self._verdict_cache.get(input_data)
+            if cached is not None:
+                self._log_validated(cached, hook_id=hook_id)
+                return cached
+
         validation_result = self._prompt_validator.validate_prompt(input_data.prompt)
 
         if validation_result.task_invocation_allowed:
+            decision = HookDecision.allow()
+        else:
+            decision = HookDecision.block(reason="; ".join(validation_result.errors))
+        if self._verdict_cache is not None:
+            self._verdict_cache.put(input_data, decision)
+        self._log_validated(decision, hook_id=hook_id)
+        return decision
+
+    def _log_validated(self, decision: HookDecision, hook_id: str | None) -> None:
+        """Log the audit event of a step 5 decision (fresh or cached)."""
+        if decision.action == "allow":
             self._log_allowed(context="des_validated", hook_id=hook_id)
-            return HookDecision.allow()
         else:
-            reason = "; ".join(validation_result.errors)
-            self._log_blocked(reason, hook_id=hook_id)
-            return HookDecision.block(reason=reason)
+            self._log_blocked(decision.reason or "", hook_id=hook_id)
 
     def _log_allowed(self, context: str, hook_id: str | None = None) -> None:
         """Log an allowed invocation to the audit trail."""
@@ -0,0 +1,90 @@
+"""
+Prompt Scan - one pass over a DES prompt shared by all template checkers
+
+TemplateValidator runs four checkers over the same orchestrator prompt, and
+a rendered /nw-execute prompt with pasted design context is 10-200 KB. Each
+checker used to search the whole prompt on its own: nine substring scans for
+the mandatory sections, a full split of the prompt per TDD phase, and six
+more scans for the execution-log sections.
+
+scan_prompt() finds every "# NAME" section marker in a single regex pass and
+records the offset of its first occurrence. Lines mentioning a TDD phase are
+located with str.find() on first request and memoized, so the phase table is
+built once per prompt no matter how many checkers ask.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+
+# Marker names are upper-case identifiers; "# " never occurs inside a match,
+# so non-overlapping matching still sees every marker in the prompt.
+_SECTION_MARKER = re.compile(r"# ([A-Z0-9_]+)")
+
+
+@dataclass(frozen=True)
+class PromptScan:
+    """Section offsets and TDD-phase mentions of one prompt."""
+
+    prompt: str
+    section_offsets: dict[str, int]  # marker name -> offset of first "# NAME"
+    _phase_lines: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def section_offset(self, name: str) -> int:
+        """
+        Offset of the first "# {name}" in the prompt, or -1 if absent.
+
+        Matches exactly like prompt.find(f"# {name}"): a marker whose name
+        extends *name* (e.g. "# TDD_PHASES_V2" for "TDD_PHASES") also counts.
+        """
+        offsets = [
+            offset
+            for marker, offset in self.section_offsets.items()
+            if marker.startswith(name)
+        ]
+        return min(offsets, default=-1)
+
+    def has_section(self, name: str) -> bool:
+        """Whether "# {name}" occurs anywhere in the prompt."""
+        return self.section_offset(name) != -1
+
+    def lines_mentioning(self, phase: str) -> tuple[str, ...]:
+        """Stripped prompt lines containing *phase*, in prompt order."""
+        lines = self._phase_lines.get(phase)
+        if lines is None:
+            lines = self._phase_lines[phase] = _lines_containing(self.prompt, phase)
+        return lines
+
+
+def _lines_containing(text: str, needle: str) -> tuple[str, ...]:
+    """Stripped lines of *text* that contain *needle* (each line once)."""
+    lines: list[str] = []
+    start = text.find(needle)
+    while start != -1:
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        lines.append(text[line_start:line_end].strip())
+        start = text.find(needle, line_end)
+    return tuple(lines)
+
+
+def scan_prompt(prompt: str) -> PromptScan:
+    """
+    Build the section map of *prompt* in a single pass.
+
+    Args:
+        prompt: The full prompt text
+
+    Returns:
+        PromptScan shared by the template checkers
+    """
+    offsets: dict[str, int] = {}
+    for match in _SECTION_MARKER.finditer(prompt):
+        offsets.setdefault(match.group(1), match.start())
+    return PromptScan(prompt=prompt, section_offsets=offsets)
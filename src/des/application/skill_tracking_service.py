@@ -6,6 +6,8 @@ Intercepts Read tool calls to skill files and logs tracking events.
 Two entry points:
 - maybe_track(): called per tool invocation (post-tool-use hook)
 - track_from_transcript(): called at subagent-stop with full JSONL transcript
+  (or skill_read_from_entry() + track_skill_reads() when the caller already
+  streams the transcript entries)
 
 Fail-open: never raises exceptions that could block agent execution.
 """
@@ -169,7 +171,40 @@ class SkillTrackingService:
         """
         try:
             tool_calls = self._read_transcript_tool_calls(transcript_path)
-            skill_reads = self._filter_skill_reads(tool_calls)
+        except Exception:
+            return []  # Fail-open: tracking must never block
+        return self.track_skill_reads(self._filter_skill_reads(tool_calls))
+
+    def skill_read_from_entry(self, entry: dict) -> dict | None:
+        """Return the tool_use block of a transcript entry that reads a skill.
+
+        Args:
+            entry: One decoded transcript JSONL entry.
+
+        Returns:
+            The tool_use dict if it is a Read of a skill file, else None.
+        """
+        tool_call = self._extract_tool_call(entry)
+        if tool_call is None:
+            return None
+        if not self._is_skill_read(
+            tool_call.get("name", ""), tool_call.get("input", {})
+        ):
+            return None
+        return tool_call
+
+    def track_skill_reads(self, skill_reads: list[dict]) -> list[SkillLoadEvent]:
+        """Log skill Read calls already extracted from a transcript.
+
+        Fail-open: returns empty list on any error.
+
+        Args:
+            skill_reads: tool_use dicts from skill_read_from_entry().
+
+        Returns:
+            List of SkillLoadEvent objects logged.
+        """
+        try:
             events = self._build_events(skill_reads)
             self._log_events(events)
             return events
@@ -9,6 +9,8 @@ This service implements the SubagentStopPort driver port interface.
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,6 +28,8 @@ from des.ports.driver_ports.subagent_stop_port import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from des.domain.log_integrity_validator import (
         CorrectableEntry,
         LogIntegrityValidator,
@@ -35,10 +39,32 @@ if TYPE_CHECKING:
         CommitVerificationResult,
         CommitVerifier,
     )
-    from des.ports.driven_ports.scope_checker import ScopeChecker
+    from des.ports.driven_ports.scope_checker import ScopeChecker, ScopeCheckResult
     from des.ports.driven_ports.time_provider_port import TimeProvider
 
 
+def _start_daemon_probe(
+    probe: Callable[[SubagentStopContext], ScopeCheckResult],
+    context: SubagentStopContext,
+) -> Future[ScopeCheckResult]:
+    """Run ``probe(context)`` on a daemon thread and return its Future.
+
+    Unlike a ThreadPoolExecutor worker, a daemon thread is not joined at
+    interpreter exit, so a hook that no longer needs the result exits
+    without waiting for it.
+    """
+    future: Future[ScopeCheckResult] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(probe(context))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="des-scope-probe", daemon=True).start()
+    return future
+
+
 class SubagentStopService(SubagentStopPort):
     """Validates step completion when a subagent finishes.
 
@@ -53,6 +79,7 @@ class SubagentStopService(SubagentStopPort):
          - If no matching commit: return block (COMMIT_NOT_VERIFIED)
          - Fail-closed: git errors also block
       4. Check scope via ScopeChecker.check_scope()
+         - Runs concurrently with 3.5; both are independent git probes
          - If violations: log SCOPE_VIOLATION (warning, does not block)
       5. Log HOOK_SUBAGENT_STOP_PASSED, return allow
     """
@@ -182,6 +209,10 @@ class SubagentStopService(SubagentStopPort):
 
         # Step 3.5: Verify git commit exists (only if phases passed and cwd provided)
         if context.cwd and self._commit_verifier:
+            # Steps 3.5 and 4 each run git. The scope probe starts in the
+            # background so the hook waits for the slower probe, not for
+            # both; a blocked commit returns without waiting for it.
+            scope_probe = _start_daemon_probe(self._check_scope, context)
             commit_result = self._commit_verifier.verify_commit(
                 context.step_id, context.cwd
             )
@@ -196,9 +227,12 @@ class SubagentStopService(SubagentStopPort):
                     ],
                 )
             self._log_commit_verified(context, commit_result, hook_id=hook_id)
+            scope_result = scope_probe.result()
+        else:
+            scope_result = self._check_scope(context)
 
         # Step 4: Check scope (warning only, does not block)
-        self._check_and_log_scope(context)
+        self._log_scope_violations(context, scope_result)
 
         # Step 5: All valid
         self._log_passed(
@@ -275,6 +309,8 @@ class SubagentStopService(SubagentStopPort):
         import json
         from datetime import datetime, timezone
 
+        from des.domain.execution_log_store import is_append_only
+
         corrected_indices: set[int] = set()
 
         # Determine time window
@@ -311,6 +347,10 @@ class SubagentStopService(SubagentStopPort):
         except Exception:
             return corrected_indices
 
+        # v4.0 logs are append-only: entries are never rewritten in place.
+        if is_append_only(raw_data):
+            return corrected_indices
+
         raw_events = raw_data.get("events", [])
 
         # Replace timestamps in raw event strings
@@ -352,18 +392,22 @@ class SubagentStopService(SubagentStopPort):
 
         return corrected_indices
 
-    def _check_and_log_scope(self, context: SubagentStopContext) -> None:
-        """Check scope violations and log warnings."""
+    def _check_scope(self, context: SubagentStopContext) -> ScopeCheckResult:
+        """Check which modified files fall outside the step's scope."""
         log_path = Path(context.execution_log_path)
         # execution-log.json is in docs/feature/{project}/
         project_root = log_path.parent.parent.parent
 
-        scope_result = self._scope_checker.check_scope(
+        return self._scope_checker.check_scope(
             project_root=project_root,
             # TODO: Extract allowed patterns from roadmap.json
             allowed_patterns=["**/*"],
         )
 
+    def _log_scope_violations(
+        self, context: SubagentStopContext, scope_result: ScopeCheckResult
+    ) -> None:
+        """Log one SCOPE_VIOLATION warning per out-of-scope file."""
         if scope_result.has_violations:
             for file_path in scope_result.out_of_scope_files:
                 self._audit_writer.log_event(
@@ -5,7 +5,9 @@ importlib.metadata, and returns a structured result. On timeout or any
 network/JSON error, returns a silent-skip result (no exception propagates).
 
 Integrates UpdateCheckPolicy for frequency gating. Persists last_checked
-via DESConfig after each successful network check.
+and the resulting verdict via DESConfig after each successful network check.
+The network check runs in a detached worker (update_check_worker); the
+SessionStart hook only consumes the cached verdict via take_cached_result().
 
 Architecture: application layer service.
 - Driving port: check_for_updates() public method
@@ -78,7 +80,7 @@ class UpdateCheckService:
 
     When des_config is provided, the service:
     - Evaluates UpdateCheckPolicy before making any network calls (frequency gate)
-    - Persists last_checked timestamp after a successful PyPI fetch
+    - Persists last_checked timestamp and verdict after a successful PyPI fetch
     - Passes skipped_versions from config to the policy
     """
 
@@ -116,7 +118,8 @@ class UpdateCheckService:
 
         When des_config is provided:
         - Evaluates frequency policy before any network calls.
-        - Persists last_checked after a successful UP_TO_DATE or UPDATE_AVAILABLE result.
+        - Persists last_checked and the verdict after a successful
+          UP_TO_DATE or UPDATE_AVAILABLE result.
 
         Returns:
             UpdateCheckResult with status UP_TO_DATE, UPDATE_AVAILABLE, or SKIP.
@@ -147,12 +150,58 @@ class UpdateCheckService:
         else:
             result = UpdateCheckResult(status=UpdateStatus.UP_TO_DATE)
 
-        # Persist last_checked after successful network fetch
+        # Persist last_checked and the verdict after successful network fetch
         if self._des_config is not None:
             self._persist_last_checked()
+            self._persist_verdict(result)
 
         return result
 
+    def is_check_due(self) -> bool:
+        """Return True when the frequency policy allows a network check now.
+
+        Reads DESConfig only; never touches the network. Always True without
+        des_config, matching check_for_updates().
+        """
+        return self._evaluate_policy() == CheckDecision.CHECK
+
+    def take_cached_result(self) -> UpdateCheckResult:
+        """Return the verdict cached by the last network check, then clear it.
+
+        Each verdict is reported once, as check_for_updates() results were
+        when it ran inline. A cached update is dropped when it is no longer
+        newer than the local version, its version has been skipped since,
+        or update checks have been turned off.
+
+        Returns:
+            UpdateCheckResult with status UPDATE_AVAILABLE or SKIP.
+            Never raises an exception.
+        """
+        if self._des_config is None:
+            return UpdateCheckResult(status=UpdateStatus.SKIP)
+        try:
+            verdict = self._des_config.read_update_verdict()
+            if verdict is None:
+                return UpdateCheckResult(status=UpdateStatus.SKIP)
+            self._des_config.clear_update_verdict()
+        except Exception:
+            return UpdateCheckResult(status=UpdateStatus.SKIP)
+
+        latest = verdict.get("latest")
+        changelog = verdict.get("changelog")
+        if (
+            not isinstance(latest, str)
+            or not _is_newer(latest, self._local_version)
+            or latest in self._des_config.update_check_skipped_versions
+            or self._des_config.update_check_frequency == "never"
+        ):
+            return UpdateCheckResult(status=UpdateStatus.SKIP)
+        return UpdateCheckResult(
+            status=UpdateStatus.UPDATE_AVAILABLE,
+            latest=latest,
+            changelog=changelog if isinstance(changelog, str) else None,
+        )
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -197,6 +246,27 @@ class UpdateCheckService:
         except Exception:
             pass  # State persistence is best-effort; never block the service
 
+    def _persist_verdict(self, result: UpdateCheckResult) -> None:
+        """Cache an available update for the next SessionStart, or clear it.
+
+        Silently ignores any errors.
+        """
+        if self._des_config is None:
+            return
+        try:
+            if result.status == UpdateStatus.UPDATE_AVAILABLE:
+                self._des_config.save_update_verdict(
+                    {
+                        "latest": result.latest,
+                        "changelog": result.changelog,
+                        "checked_at": datetime.now(tz=timezone.utc).isoformat(),
+                    }
+                )
+            else:
+                self._des_config.clear_update_verdict()
+        except Exception:
+            pass  # Verdict caching is best-effort; never block the service
+
     def _fetch_json(
         self, url: str, extra_headers: dict[str, str] | None = None
     ) -> bytes | None:
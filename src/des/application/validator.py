@@ -23,15 +23,20 @@ MANDATORY TDD PHASES (5 from schema):
 5. COMMIT (absorbs FINAL_VALIDATE)
 Note: REVIEW moved to deliver-level Phase 4 (Adversarial Review via /nw-review)
 Note: REFACTOR moved to deliver-level Phase 3 (Complete Refactoring L1-L4 via /nw-refactor)
+
+validate_prompt() scans the prompt once (see des.application.prompt_scan) and
+every checker reads that scan; all patterns are compiled at import time.
 """
 
 from __future__ import annotations
 
+import functools
 import re
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from des.application.prompt_scan import PromptScan, scan_prompt
 from des.domain.value_objects import PhaseStatus
 
 
@@ -39,6 +44,49 @@ if TYPE_CHECKING:
     from des.domain.tdd_schema import TDDSchema
 
 
+_PHASE_SHORTHAND = re.compile(
+    r"(?i)all\s+\d+\s+phases?\s+(listed|mentioned|included|present)"
+)
+_DES_VALIDATION_MARKER = re.compile(r"<!--\s*DES-VALIDATION\s*:\s*(\w+)\s*-->")
+
+_EXECUTION_LOG_SECTIONS = (
+    "EXECUTION_LOG_STATUS",
+    "EXECUTION_LOG_ISSUE",
+    "EXECUTION_LOG_PROBLEM",
+    "EXECUTION_LOG_ERRORS",
+    "EXECUTION_LOG_WITH_SKIP",
+    "EXECUTION_LOG_COMPLETE",
+)
+_LOG_STATUSES = ("EXECUTED", "SKIPPED", "IN_PROGRESS", "NOT_EXECUTED")
+_NARRATIVE_ENTRY = re.compile(r"Phase\s+(\w+)\s+status:\s+(\w+)")
+# One pattern per status: "EXECUTED" also matches inside "NOT_EXECUTED: ..."
+_LIST_ENTRIES = tuple(
+    (
+        status,
+        re.compile(
+            status
+            + r":\s+([A-Z0-9_,\s\-]+?)(?=\n|$|EXECUTED|SKIPPED|IN_PROGRESS|NOT_EXECUTED)"
+        ),
+    )
+    for status in _LOG_STATUSES
+)
+_PHASE_NAME = re.compile(r"^[A-Z0-9_\-]+$")
+_KEY_VALUE_ENTRY = re.compile(
+    r"Phase\s+(\w+):\s+status=(\w+)(?:,\s+outcome=(\w+))?(?:,\s+blocked_by=([^\n,]+))?"
+)
+
+
+@functools.cache
+def _missing_context_pattern(phase: str) -> re.Pattern[str]:
+    """Compile (once per phase) the pattern for 'phase is missing' mentions."""
+    name = re.escape(phase)
+    return re.compile(
+        rf"\(.*\b{name}\b.*\)"  # (missing COMMIT) format
+        rf"|(?i:\b(without|missing|no)\s+{name}\b)"  # descriptive text
+        rf"|# MISSING:\s*{name}"  # comment format
+    )
+
+
 @dataclass
 class ValidationResult:
     """Result of template validation."""
@@ -89,21 +137,22 @@ class MandatorySectionChecker:
         "TIMEOUT_INSTRUCTION": "Add TIMEOUT_INSTRUCTION section with turn budget guidance",
     }
 
-    def validate(self, prompt: str) -> list[str]:
+    def validate(self, prompt: str, scan: PromptScan | None = None) -> list[str]:
         """
         Validate that all mandatory sections are present in prompt.
 
         Args:
             prompt: The full prompt text to validate
+            scan: Section map of prompt, if already built
 
         Returns:
             List of error messages (empty if all sections present)
         """
+        scan = scan or scan_prompt(prompt)
         errors = []
 
         for section in self.MANDATORY_SECTIONS:
-            section_marker = f"# {section}"
-            if section_marker not in prompt:
+            if not scan.has_section(section):
                 errors.append(f"MISSING: Mandatory section '{section}' not found")
 
         return errors
@@ -161,7 +210,7 @@ class TDDPhaseValidator:
         self._schema = resolve_schema_or_default(schema)
         self.MANDATORY_PHASES = self._schema.tdd_phases
 
-    def validate(self, prompt: str) -> list[str]:
+    def validate(self, prompt: str, scan: PromptScan | None = None) -> list[str]:
         """
         Validate that all required TDD phases are mentioned in prompt.
 
@@ -176,49 +225,36 @@ class TDDPhaseValidator:
 
         Args:
             prompt: The full prompt text to validate
+            scan: Section map of prompt, if already built
 
         Returns:
             List of error messages (empty if all phases present)
         """
-        # Check for shorthand pattern (count-agnostic)
-        shorthand_pattern = (
-            r"(?i)all\s+\d+\s+phases?\s+(listed|mentioned|included|present)"
-        )
-        if re.search(shorthand_pattern, prompt):
-            return []  # Accept shorthand as valid
-
+        scan = scan or scan_prompt(prompt)
         errors = []
 
         for phase in self.MANDATORY_PHASES:
-            if not self._is_phase_present_in_prompt(phase, prompt):
+            if not self._is_phase_present_in_prompt(phase, scan):
                 errors.append(f"INCOMPLETE: TDD phase '{phase}' not mentioned")
 
+        # Shorthand pattern (count-agnostic) accepts the prompt as valid. Only
+        # needed when a phase is missing: it is the costliest regex here.
+        if errors and _PHASE_SHORTHAND.search(prompt):
+            return []
+
         return errors
 
-    def _is_phase_present_in_prompt(self, phase: str, prompt: str) -> bool:
+    def _is_phase_present_in_prompt(self, phase: str, scan: PromptScan) -> bool:
         """Check if a phase is mentioned in a non-missing context within the prompt."""
-        lines_containing_phase = [
-            line.strip() for line in prompt.split("\n") if phase in line
-        ]
-
-        for line in lines_containing_phase:
-            if self._is_missing_context(phase, line):
-                continue
-            if phase in line:
-                return True
-
-        return False
+        return any(
+            not self._is_missing_context(phase, line)
+            for line in scan.lines_mentioning(phase)
+        )
 
     @staticmethod
     def _is_missing_context(phase: str, line: str) -> bool:
         """Check if a line only mentions the phase in a 'missing' context."""
-        return bool(
-            re.search(rf"\(.*\b{phase}\b.*\)", line)  # (missing COMMIT) format
-            or re.search(
-                rf"\b(without|missing|no)\s+{phase}\b", line, re.IGNORECASE
-            )  # descriptive text
-            or re.search(rf"# MISSING:\s*{phase}", line)  # comment format
-        )
+        return _missing_context_pattern(phase).search(line) is not None
 
 
 class DESMarkerValidator:
@@ -244,8 +280,7 @@ class DESMarkerValidator:
         errors = []
 
         # Pattern for DES-VALIDATION marker: <!-- DES-VALIDATION: value -->
-        pattern = r"<!--\s*DES-VALIDATION\s*:\s*(\w+)\s*-->"
-        match = re.search(pattern, prompt)
+        match = _DES_VALIDATION_MARKER.search(prompt)
 
         if not match:
             # Marker not found
@@ -463,17 +498,20 @@ class TemplateValidator:
         """
         start_time = time.perf_counter()
 
+        # One pass over the prompt, shared by the checkers below
+        scan = scan_prompt(prompt)
+
         # Check marker (first - foundational validation)
         marker_errors = self.marker_validator.validate(prompt)
 
         # Check sections
-        section_errors = self.section_checker.validate(prompt)
+        section_errors = self.section_checker.validate(prompt, scan)
 
         # Check phases (uses canonical 7-phase schema)
-        phase_errors = self.phase_validator.validate(prompt)
+        phase_errors = self.phase_validator.validate(prompt, scan)
 
         # Extract and parse phase_execution_log from prompt
-        execution_log_data = self._extract_execution_log_from_prompt(prompt)
+        execution_log_data = self._extract_execution_log_from_prompt(prompt, scan)
         # Validate with schema (always v4.0)
         execution_log_errors = self.execution_log_validator.validate(
             execution_log_data, schema_version="4.0"
@@ -510,7 +548,9 @@ class TemplateValidator:
             recovery_guidance=recovery_guidance,
         )
 
-    def _extract_execution_log_from_prompt(self, prompt: str) -> list[dict]:
+    def _extract_execution_log_from_prompt(
+        self, prompt: str, scan: PromptScan | None = None
+    ) -> list[dict]:
         """
         Extract and parse phase execution log from prompt text.
 
@@ -534,6 +574,7 @@ class TemplateValidator:
 
         Args:
             prompt: The full prompt text containing execution log sections
+            scan: Section map of prompt, if already built
 
         Returns:
             List[dict] where each dict has:
@@ -544,21 +585,17 @@ class TemplateValidator:
 
             Returns empty list if no execution log sections found
         """
+        scan = scan or scan_prompt(prompt)
         phase_log = []
-        section_markers = [
-            "# EXECUTION_LOG_STATUS",
-            "# EXECUTION_LOG_ISSUE",
-            "# EXECUTION_LOG_PROBLEM",
-            "# EXECUTION_LOG_ERRORS",
-            "# EXECUTION_LOG_WITH_SKIP",
-            "# EXECUTION_LOG_COMPLETE",
-        ]
-
-        for marker in section_markers:
-            if marker not in prompt:
+
+        for section in _EXECUTION_LOG_SECTIONS:
+            marker_index = scan.section_offset(section)
+            if marker_index == -1:
                 continue
 
-            section_content = self._extract_section_content(prompt, marker)
+            section_content = self._extract_section_content(
+                prompt, marker_index, f"# {section}"
+            )
             if not section_content:
                 continue
 
@@ -569,12 +606,8 @@ class TemplateValidator:
         return self._deduplicate_phase_log(phase_log)
 
     @staticmethod
-    def _extract_section_content(prompt: str, marker: str) -> str:
+    def _extract_section_content(prompt: str, marker_index: int, marker: str) -> str:
         """Extract text content between a section marker and the next section."""
-        marker_index = prompt.find(marker)
-        if marker_index == -1:
-            return ""
-
         section_start = marker_index + len(marker)
         next_marker_index = prompt.find("\n#", section_start)
         if next_marker_index == -1:
@@ -585,7 +618,7 @@ class TemplateValidator:
     def _parse_narrative_format(section_content: str) -> list[dict]:
         """Parse Format A: 'Phase PHASE_NAME status: STATUS (optional context)'."""
         entries = []
-        matches = re.findall(r"Phase\s+(\w+)\s+status:\s+(\w+)", section_content)
+        matches = _NARRATIVE_ENTRY.findall(section_content)
         for phase_name, status in matches:
             entries.append({"phase_name": phase_name, "status": status})
         return entries
@@ -594,17 +627,12 @@ class TemplateValidator:
     def _parse_list_format(section_content: str) -> list[dict]:
         """Parse Format B: 'STATUS: PHASE1, PHASE2, ...'."""
         entries = []
-        statuses = ["EXECUTED", "SKIPPED", "IN_PROGRESS", "NOT_EXECUTED"]
-        for status in statuses:
-            pattern = (
-                status
-                + r":\s+([A-Z0-9_,\s\-]+?)(?=\n|$|EXECUTED|SKIPPED|IN_PROGRESS|NOT_EXECUTED)"
-            )
-            matches = re.findall(pattern, section_content)
+        for status, pattern in _LIST_ENTRIES:
+            matches = pattern.findall(section_content)
             for match in matches:
                 phase_names = [p.strip() for p in match.split(",") if p.strip()]
                 for phase_name in phase_names:
-                    if phase_name and re.match(r"^[A-Z0-9_\-]+$", phase_name):
+                    if phase_name and _PHASE_NAME.match(phase_name):
                         entries.append({"phase_name": phase_name, "status": status})
         return entries
 
@@ -612,8 +640,7 @@ class TemplateValidator:
     def _parse_key_value_format(section_content: str) -> list[dict]:
         """Parse Format C: 'Phase PHASE_NAME: status=STATUS, outcome=VALUE, blocked_by=REASON'."""
         entries = []
-        pattern = r"Phase\s+(\w+):\s+status=(\w+)(?:,\s+outcome=(\w+))?(?:,\s+blocked_by=([^\n,]+))?"
-        matches = re.findall(pattern, section_content)
+        matches = _KEY_VALUE_ENTRY.findall(section_content)
         for phase_name, status, outcome, blocked_by in matches:
             entry = {"phase_name": phase_name, "status": status}
 
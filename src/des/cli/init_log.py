@@ -7,6 +7,9 @@ Usage:
 
 Creates: {"schema_version": "3.0", "feature_id": "my-feature", "events": []}
 
+With --schema-version 4.0 the log is append-only: execution-log.json holds
+only the header and events go to execution-log.events.jsonl.
+
 Exit codes:
     0 = Success, file created
     1 = Validation error (file already exists, directory missing)
@@ -16,10 +19,15 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from des.domain.execution_log_store import (
+    APPEND_ONLY_SCHEMA_VERSION,
+    LEGACY_SCHEMA_VERSION,
+    create_execution_log,
+)
+
 
 def _build_parser() -> argparse.ArgumentParser:
     """Build the argument parser for init_log CLI."""
@@ -37,6 +45,12 @@ def _build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Feature identifier (kebab-case, e.g., my-feature)",
     )
+    parser.add_argument(
+        "--schema-version",
+        choices=[LEGACY_SCHEMA_VERSION, APPEND_ONLY_SCHEMA_VERSION],
+        default=LEGACY_SCHEMA_VERSION,
+        help="Log format: 3.0 (single JSON document) or 4.0 (append-only)",
+    )
     return parser
 
 
@@ -66,13 +80,11 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error: execution-log.json already exists at {log_path}")
         return 1
 
-    # Create execution log with v3.0 schema
-    log_data = {
-        "schema_version": "3.0",
-        "feature_id": args.feature_id,
-        "events": [],
-    }
-    log_path.write_text(json.dumps(log_data, indent=2))
+    create_execution_log(
+        log_path,
+        {"feature_id": args.feature_id},
+        schema_version=args.schema_version,
+    )
 
     print(f"Created execution-log.json at {log_path}")
     return 0
@@ -11,6 +11,10 @@ Usage:
 Writes structured JSON objects (schema v3.0):
     {"sid": "02-03", "p": "GREEN", "s": "EXECUTED", "d": "PASS", "t": "2026-02-10T20:28:18Z"}
 
+Schema v4.0 logs (append-only, see des.domain.execution_log_store) get a
+locked single-line append to execution-log.events.jsonl; v2.0/v3.0 logs are
+rewritten in place as before. --fsync forces the entry to stable storage.
+
 stdout (agent sees structured representation):
     sid=02-03 p=GREEN s=EXECUTED d=PASS t=2026-02-10T20:28:18Z
 
@@ -28,6 +32,7 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from des.domain.execution_log_store import append_event
 from des.domain.tdd_schema import TDDSchemaLoader
 
 
@@ -75,6 +80,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional: number of tokens consumed during this step",
     )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="Optional: fsync the log after appending (durable across crashes)",
+    )
     return parser
 
 
@@ -135,15 +145,11 @@ def main(argv: list[str] | None = None) -> int:
         entry["tu"] = args.turns_used
         entry["tk"] = args.tokens_used
 
-    # JSON read-modify-write
-    log_data = json.loads(log_path.read_text())
-    if log_data is None:
-        log_data = {}
-    if "events" not in log_data:
-        log_data["events"] = []
-    log_data["events"].append(entry)
-    log_data["schema_version"] = "3.0"
-    log_path.write_text(json.dumps(log_data, indent=2))
+    try:
+        append_event(log_path, entry, fsync=args.fsync)
+    except json.JSONDecodeError as e:
+        print(f"Error: execution-log.json is not valid JSON: {e}")
+        return 1
 
     # Print entry to stdout (human-readable key=value format)
     parts = [
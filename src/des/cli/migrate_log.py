@@ -0,0 +1,75 @@
+"""CLI: Migrate execution-log.json to the append-only v4.0 format.
+
+Usage:
+    python -m des.cli.migrate_log \\
+      --project-dir docs/feature/my-feature/deliver
+
+Rewrites execution-log.json as a v4.0 header and moves its events, verbatim
+and in order, to execution-log.events.jsonl. Run it when no agent is
+logging phases for the feature.
+
+Exit codes:
+    0 = Success (migrated, or already v4.0)
+    1 = Validation error (missing or unreadable log file)
+    2 = Usage error (argparse default for missing/invalid arguments)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from des.domain.execution_log_store import events_path_for, migrate_to_append_only
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for migrate_log CLI."""
+    parser = argparse.ArgumentParser(
+        prog="des.cli.migrate_log",
+        description="Migrate execution-log.json to the append-only v4.0 format.",
+    )
+    parser.add_argument(
+        "--project-dir",
+        required=True,
+        help="Path to the project directory containing execution-log.json",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the migrate_log CLI tool.
+
+    Args:
+        argv: Command-line arguments. Uses sys.argv[1:] if None.
+
+    Returns:
+        Exit code: 0=success, 1=validation error, 2=usage error.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    log_path = Path(args.project_dir) / "execution-log.json"
+    if not log_path.exists():
+        print(f"Error: execution-log.json not found at {log_path}")
+        return 1
+
+    try:
+        migrated = migrate_to_append_only(log_path)
+    except ValueError as e:
+        # json.JSONDecodeError is a ValueError
+        print(f"Error: cannot read {log_path}: {e}")
+        return 1
+
+    if migrated < 0:
+        print(f"{log_path} is already schema v4.0")
+    else:
+        print(
+            f"Migrated {migrated} event(s) from {log_path} "
+            f"to {events_path_for(log_path).name}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
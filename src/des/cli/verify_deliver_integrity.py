@@ -25,6 +25,7 @@ from des.domain._roadmap_helpers import (
     extract_step_ids as _extract_step_ids,
 )
 from des.domain.deliver_integrity_verifier import DeliverIntegrityVerifier
+from des.domain.execution_log_store import load_execution_log
 from des.domain.roadmap_schema import get_roadmap_schema
 from des.domain.roadmap_validator import RoadmapValidator
 from des.domain.tdd_schema import TDDSchemaLoader
@@ -37,7 +38,8 @@ def _parse_execution_log(exec_log: dict) -> dict[str, list[str]]:
     """Parse execution-log.json events into step_id -> list[phase_name] mapping.
 
     Supports both v2.0 pipe format ("sid|phase|status|data|ts")
-    and v3.0 structured format ({sid, p, s, d, t}).
+    and v3.0 structured format ({sid, p, s, d, t}); v4.0 logs arrive here
+    already resolved by load_execution_log.
     """
     entries: dict[str, list[str]] = {}
     for event in exec_log.get("events", []):
@@ -140,7 +142,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error: execution-log.json not found at {exec_log_path}")
         return 2
 
-    exec_log = json.loads(exec_log_path.read_text())
+    exec_log = load_execution_log(exec_log_path)
 
     step_ids = _extract_step_ids(roadmap)
     entries = _parse_execution_log(exec_log)
@@ -4,18 +4,38 @@ DES Domain Layer - Business logic and entities.
 Exports all domain-layer entities and services.
 """
 
-from des.domain.tdd_schema import (
-    TDDSchema,
-    TDDSchemaLoader,
-    TDDSchemaProtocol,
-    get_tdd_schema,
-    get_tdd_schema_loader,
-    reset_global_schema_loader,
-)
-from des.domain.timeout_monitor import TimeoutMonitor
-from des.domain.turn_config import TurnLimitConfig
-from des.domain.turn_counter import TurnCounter
+from typing import TYPE_CHECKING
 
+from des._lazy import lazy_getattr
+
+
+if TYPE_CHECKING:
+    from des.domain.tdd_schema import (
+        TDDSchema,
+        TDDSchemaLoader,
+        TDDSchemaProtocol,
+        get_tdd_schema,
+        get_tdd_schema_loader,
+        reset_global_schema_loader,
+    )
+    from des.domain.timeout_monitor import TimeoutMonitor
+    from des.domain.turn_config import TurnLimitConfig
+    from des.domain.turn_counter import TurnCounter
+
+
+_EXPORTS = {
+    "TDDSchema": "des.domain.tdd_schema",
+    "TDDSchemaLoader": "des.domain.tdd_schema",
+    "TDDSchemaProtocol": "des.domain.tdd_schema",
+    "get_tdd_schema": "des.domain.tdd_schema",
+    "get_tdd_schema_loader": "des.domain.tdd_schema",
+    "reset_global_schema_loader": "des.domain.tdd_schema",
+    "TimeoutMonitor": "des.domain.timeout_monitor",
+    "TurnLimitConfig": "des.domain.turn_config",
+    "TurnCounter": "des.domain.turn_counter",
+}
+
+__getattr__ = lazy_getattr(__name__, _EXPORTS)
 
 __all__ = [
     "TDDSchema",
@@ -14,6 +14,7 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from des.domain._roadmap_helpers import extract_step_ids as _extract_step_ids
+from des.domain.execution_log_store import load_execution_log
 
 
 @dataclass(frozen=True)
@@ -72,9 +73,9 @@ def track_progress(
     committed: set[str] = set()
     if execution_log_path.exists():
         try:
-            exec_log = json.loads(execution_log_path.read_text(encoding="utf-8"))
+            exec_log = load_execution_log(execution_log_path)
             committed = _find_committed_step_ids(exec_log)
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             committed = set()
 
     completed_ids = tuple(sid for sid in all_step_ids if sid in committed)
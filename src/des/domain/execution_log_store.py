@@ -0,0 +1,220 @@
+"""Execution-log storage: legacy JSON document (v2/v3) and append-only v4.
+
+v2.0 / v3.0 keep everything in ``execution-log.json``:
+    {"schema_version": "3.0", "feature_id": "...", "events": [...]}
+Appending means parsing and rewriting the whole document.
+
+v4.0 splits the log in two files next to each other:
+    execution-log.json          small header, never rewritten by appends
+        {"schema_version": "4.0", "feature_id": "...",
+         "events_file": "execution-log.events.jsonl"}
+    execution-log.events.jsonl  one event per line (v3.0 dict, or a v2.0
+                                pipe string carried over by migration)
+
+Appends open the events file with ``O_APPEND``, take an exclusive ``flock``
+(POSIX) and write one line, optionally followed by ``fsync``; cost is
+independent of the log size and concurrent agents cannot lose each other's
+entries. A trailing line without newline (crash mid-write) is ignored.
+
+``execution-log.json`` stays the path every caller passes around:
+``load_execution_log`` returns the v2/v3 document shape for any version, so
+existing consumers keep iterating ``document["events"]``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+from des.domain.atomic_write import write_atomic
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+APPEND_ONLY_SCHEMA_VERSION = "4.0"
+LEGACY_SCHEMA_VERSION = "3.0"
+EVENTS_FILE_SUFFIX = ".events.jsonl"
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def events_path_for(log_path: Path) -> Path:
+    """Return the v4 events file that belongs to *log_path*."""
+    return log_path.with_name(log_path.stem + EVENTS_FILE_SUFFIX)
+
+
+def is_append_only(header: dict[str, Any]) -> bool:
+    """True when *header* describes a v4 (append-only) execution log."""
+    return header.get("schema_version") == APPEND_ONLY_SCHEMA_VERSION
+
+
+def read_header(log_path: Path) -> dict[str, Any]:
+    """Read ``execution-log.json`` without resolving v4 events.
+
+    Raises:
+        FileNotFoundError: If the log does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the JSON is not an object
+    """
+    data = json.loads(log_path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"Execution log must be a JSON object, got {type(data).__name__}"
+        )
+    return data
+
+
+def load_execution_log(log_path: Path) -> dict[str, Any]:
+    """Load an execution log of any schema version as a v3-shaped document.
+
+    For v4 logs the events file is read and exposed as ``"events"``.
+
+    Raises:
+        FileNotFoundError: If the log does not exist
+        json.JSONDecodeError: If the header or an events line is not valid JSON
+        ValueError: If the header is not a JSON object
+    """
+    document = read_header(log_path)
+    if is_append_only(document):
+        document["events"] = read_events(events_path_for(log_path))
+    return document
+
+
+def read_events(events_path: Path) -> list[Any]:
+    """Parse a v4 events file; a missing file holds no events.
+
+    Raises:
+        json.JSONDecodeError: If a complete (newline-terminated) line is corrupt
+    """
+    try:
+        raw = events_path.read_bytes()
+    except FileNotFoundError:
+        return []
+    lines = raw.split(b"\n")
+    # The last element is b"" for a complete file, or an unterminated line
+    # left by an interrupted append: skip it either way.
+    return [json.loads(line) for line in lines[:-1] if line.strip()]
+
+
+def create_execution_log(
+    log_path: Path,
+    header: dict[str, Any],
+    events: list[Any] | None = None,
+    *,
+    schema_version: str = APPEND_ONLY_SCHEMA_VERSION,
+) -> None:
+    """Write a new execution log (header plus events) in *schema_version*.
+
+    Files are written to a temporary name and renamed into place, events
+    file first, so readers never observe a v4 header without its events.
+    """
+    document = {"schema_version": schema_version}
+    document.update(
+        (k, v) for k, v in header.items() if k not in ("events", "schema_version")
+    )
+    if schema_version != APPEND_ONLY_SCHEMA_VERSION:
+        document["events"] = list(events or [])
+        _replace(log_path, json.dumps(document, indent=2))
+        return
+
+    events_path = events_path_for(log_path)
+    document["events_file"] = events_path.name
+    _replace(events_path, "".join(_encode(event) for event in events or []))
+    _replace(log_path, json.dumps(document, indent=2))
+
+
+def append_event(log_path: Path, entry: Any, *, fsync: bool = False) -> None:
+    """Append one event to the execution log at *log_path*.
+
+    v4 logs get a locked single-line append to the events file. v2/v3 logs
+    keep the legacy read-modify-write (upgraded to schema v3.0), serialized
+    by a lock on the document.
+
+    Args:
+        log_path: Path to execution-log.json
+        entry: Event to append (v3.0 dict)
+        fsync: Flush the write to stable storage before returning
+
+    Raises:
+        FileNotFoundError: If the log does not exist
+        json.JSONDecodeError: If the existing log is not valid JSON
+    """
+    if is_append_only(read_header(log_path)):
+        _append_line(events_path_for(log_path), _encode(entry).encode(), fsync)
+        return
+
+    with open(log_path, "r+", encoding="utf-8") as log:
+        _lock(log.fileno())
+        try:
+            log_data = json.loads(log.read()) or {}
+            log_data.setdefault("events", []).append(entry)
+            log_data["schema_version"] = LEGACY_SCHEMA_VERSION
+            log.seek(0)
+            log.write(json.dumps(log_data, indent=2))
+            log.truncate()
+            log.flush()
+            if fsync:
+                os.fsync(log.fileno())
+        finally:
+            _unlock(log.fileno())
+
+
+def migrate_to_append_only(log_path: Path) -> int:
+    """Convert a v2/v3 execution log to v4 in place.
+
+    Events are carried over verbatim (v2.0 pipe strings stay strings), and
+    the previous version is recorded as ``migrated_from``.
+
+    Returns:
+        Number of events migrated, or -1 if the log already is v4.
+    """
+    document = read_header(log_path)
+    if is_append_only(document):
+        return -1
+    events = document.pop("events", None) or []
+    document["migrated_from"] = document.get("schema_version", "unknown")
+    create_execution_log(log_path, document, events)
+    return len(events)
+
+
+def _encode(event: Any) -> str:
+    return json.dumps(event, separators=(",", ":")) + "\n"
+
+
+def _append_line(events_path: Path, line: bytes, fsync: bool) -> None:
+    fd = os.open(events_path, _APPEND_FLAGS, 0o644)
+    try:
+        _lock(fd)
+        try:
+            view = memoryview(line)
+            while view:
+                view = view[os.write(fd, view) :]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def _replace(path: Path, content: str) -> None:
+    write_atomic(path, content)
+
+
+def _lock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -13,10 +13,15 @@ v3.0 structured YAML dicts:
   Format: {sid: step_id, p: phase, s: status, d: data, t: timestamp}
   Optional: {tu: turns_used, tk: tokens_used}
   Example: {sid: "01-01", p: "PREPARE", s: "EXECUTED", d: "PASS", t: "2026-02-02T10:00:00Z"}
+
+v4.0 append-only JSONL lines (execution-log.events.jsonl):
+  Each line is a JSON-encoded v3.0 dict (or v2.0 string, after migration).
+  Example: '{"sid":"01-01","p":"PREPARE","s":"EXECUTED","d":"PASS","t":"..."}'
 """
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
 
@@ -46,9 +51,10 @@ class PhaseEvent:
 class PhaseEventParser:
     """Parses event entries into PhaseEvent domain objects.
 
-    Supports two formats:
+    Supports three formats:
     - v2.0: pipe-delimited strings ("step_id|phase|status|data|timestamp")
     - v3.0: structured dicts ({sid, p, s, d, t} with optional tu, tk)
+    - v4.0: raw JSONL lines holding a v3.0 dict or v2.0 string
 
     This is a stateless parser with no I/O dependencies.
     """
@@ -123,21 +129,43 @@ class PhaseEventParser:
     def parse_auto(self, event: str | dict) -> PhaseEvent | None:
         """Auto-detect event format and parse accordingly.
 
-        Routes string events to parse() (v2.0 pipe format) and
-        dict events to parse_structured() (v3.0 structured format).
+        Routes JSON object/string lines to parse_line() (v4.0 JSONL), other
+        string events to parse() (v2.0 pipe format) and dict events to
+        parse_structured() (v3.0 structured format).
 
         Args:
-            event: Either a pipe-delimited string or a structured dict.
+            event: A pipe-delimited string, a structured dict or a JSONL line.
 
         Returns:
             PhaseEvent if parsing succeeds, None otherwise.
         """
         if isinstance(event, str):
+            if event[:1] in ("{", '"'):
+                return self.parse_line(event)
             return self.parse(event)
         if isinstance(event, dict):
             return self.parse_structured(event)
         return None
 
+    def parse_line(self, line: str) -> PhaseEvent | None:
+        """Parse one v4.0 JSONL line (a JSON-encoded v3.0 dict or v2.0 string).
+
+        Args:
+            line: Raw line from execution-log.events.jsonl.
+
+        Returns:
+            PhaseEvent if the line decodes to a valid event, None otherwise.
+        """
+        try:
+            decoded = json.loads(line)
+        except ValueError:
+            return None
+        if isinstance(decoded, str):
+            return self.parse(decoded)
+        if isinstance(decoded, dict):
+            return self.parse_structured(decoded)
+        return None
+
     def parse_many(self, event_entries: list, step_id: str) -> list[PhaseEvent]:
         """Parse multiple events, filtering by step_id.
 
@@ -0,0 +1,39 @@
+"""VerdictCache - driven port for reusing PreToolUse verdicts.
+
+Abstract interface defining how PreToolUseService stores and looks up the
+decision its prompt validation reached for a given Agent invocation, so that
+an identical re-dispatch (same prompt, same subagent type, same validation
+rules) is not validated again.
+
+Defined by: Application layer PreToolUse validation needs.
+Implemented by: FileVerdictCache (infrastructure adapter).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from des.ports.driver_ports.pre_tool_use_port import HookDecision, PreToolUseInput
+
+
+class VerdictCache(ABC):
+    """Driven port: remembers PreToolUse decisions by invocation content.
+
+    The application layer decides WHICH decisions are worth keeping.
+    The adapter decides HOW they are keyed, stored, evicted and invalidated
+    when the rules behind them change. Neither method may raise: a cache
+    failure degrades to a miss.
+    """
+
+    @abstractmethod
+    def get(self, input_data: PreToolUseInput) -> HookDecision | None:
+        """Return the stored decision for *input_data*, or None on a miss."""
+        ...
+
+    @abstractmethod
+    def put(self, input_data: PreToolUseInput, decision: HookDecision) -> None:
+        """Store *decision* (with its recovery suggestions) for *input_data*."""
+        ...
@@ -80,9 +80,9 @@ Feature: DES Bundle with Hooks Generation
 
   # --- Edge Cases ---
 
-  Scenario: Plugin does not ship compiled Python files
+  Scenario: Plugin ships precompiled bytecode for the DES module
     When the plugin assembler builds the plugin
-    Then the plugin does not ship compiled Python files
+    Then the plugin ships current unchecked-hash bytecode for the DES module
 
   @property
   Scenario: DES import rewriting is complete for any source tree
@@ -304,15 +304,14 @@ def build_fails_hook_config(build_result: dict[str, Any]):
 # ---------------------------------------------------------------------------
 
 
-@then("the plugin does not ship compiled Python files")
-def no_compiled_python_in_plugin(build_result: dict[str, Any]):
-    """Verify no bytecode cache directories exist in the plugin."""
-    plugin_dir = build_result["plugin_dir"]
-    des_dir = plugin_dir / "scripts" / "des"
-    pycache_dirs = list(des_dir.rglob("__pycache__"))
-    assert len(pycache_dirs) == 0, (
-        f"Found {len(pycache_dirs)} compiled Python directories in DES bundle"
-    )
+@then("the plugin ships current unchecked-hash bytecode for the DES module")
+def des_bytecode_current(build_result: dict[str, Any]):
+    """Verify every DES module has current, source-independent bytecode."""
+    from scripts.shared.bytecode import bytecode_problems
+
+    des_dir = build_result["plugin_dir"] / "scripts" / "des"
+    problems = bytecode_problems(des_dir)
+    assert problems == [], f"DES bytecode problems: {problems[:5]}"
 
 
 @then("every rewritten DES file is syntactically valid Python")
@@ -183,11 +183,21 @@ def plugin_is_standalone(build_result: dict[str, Any]):
 
 @then("the plugin directory does not contain development-only files")
 def no_dev_files_in_plugin(build_result: dict[str, Any]):
-    """Verify no dev artifacts in plugin."""
+    """Verify no dev artifacts in plugin.
+
+    Bytecode is only allowed under scripts/des/, where the build ships it
+    deliberately (precompiled unchecked-hash .pyc).
+    """
     plugin_dir = build_result["plugin_dir"]
+    des_dir = plugin_dir / "scripts" / "des"
+    stray_bytecode = [
+        p
+        for pattern in ("*.pyc", "__pycache__")
+        for p in plugin_dir.rglob(pattern)
+        if not p.is_relative_to(des_dir)
+    ]
+    assert stray_bytecode == [], f"Dev file found in plugin: {stray_bytecode}"
     dev_patterns = [
-        "*.pyc",
-        "__pycache__",
         ".git",
         "Pipfile",
         "pyproject.toml",
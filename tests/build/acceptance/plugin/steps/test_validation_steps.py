@@ -7,6 +7,7 @@ Driving port: PluginValidator
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any
 
 from pytest_bdd import given, parsers, scenarios, then, when
@@ -146,6 +147,9 @@ def minimal_valid_plugin(plugin_output_dir: Path, build_result: dict[str, Any]):
     des = plugin_output_dir / "scripts" / "des"
     des.mkdir(parents=True)
     (des / "__init__.py").write_text("", encoding="utf-8")
+    from scripts.shared.bytecode import compile_tree
+
+    assert compile_tree(des, [sys.executable]) is None
 
     build_result["plugin_dir"] = plugin_output_dir
 
@@ -0,0 +1,125 @@
+"""Tests for precompiled DES bytecode (scripts/shared/bytecode.py).
+
+Driving port: compile_tree() and bytecode_problems() (pure functions over
+a package directory), plus DESPlugin._install_des_module for the installer.
+
+Test Budget: 5 distinct behaviors x 2 = 10 max unit tests.
+Behaviors:
+  1. compile_tree writes unchecked-hash bytecode that validates clean
+  2. Compilation is reproducible across build locations
+  3. bytecode_problems reports missing and stale bytecode
+  4. The installer precompiles the installed DES module
+  5. available_interpreters skips PATH interpreters that cannot run, so
+     compile_tree never invokes a broken version-manager shim
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from scripts.install.plugins.base import InstallContext
+from scripts.install.plugins.des_plugin import DESPlugin
+from scripts.shared.bytecode import (
+    available_interpreters,
+    bytecode_problems,
+    compile_tree,
+)
+
+
+_SOURCES = {
+    "__init__.py": "",
+    "domain/__init__.py": "",
+    "domain/rules.py": "RULES = frozenset({'a', 'b', 'c'})\n\ndef check(x):\n    return x in RULES\n",
+}
+
+
+def _make_package(base: Path) -> Path:
+    root = base / "des"
+    for relative, content in _SOURCES.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return root
+
+
+def _pyc(source: Path) -> Path:
+    return Path(importlib.util.cache_from_source(str(source)))
+
+
+class TestCompileTree:
+    def test_compiled_tree_has_current_unchecked_hash_bytecode(self, tmp_path):
+        root = _make_package(tmp_path)
+
+        assert compile_tree(root, [sys.executable]) is None
+
+        assert bytecode_problems(root) == []
+        header = _pyc(root / "domain" / "rules.py").read_bytes()[:8]
+        assert int.from_bytes(header[4:8], "little") == 0b01
+
+    def test_compilation_is_reproducible_across_locations(self, tmp_path):
+        first = _make_package(tmp_path / "a")
+        second = _make_package(tmp_path / "b" / "nested")
+
+        compile_tree(first, [sys.executable])
+        compile_tree(second, [sys.executable])
+
+        for relative in _SOURCES:
+            assert (
+                _pyc(first / relative).read_bytes()
+                == _pyc(second / relative).read_bytes()
+            )
+
+
+class TestBytecodeProblems:
+    def test_reports_missing_bytecode(self, tmp_path):
+        root = _make_package(tmp_path)
+
+        problems = bytecode_problems(root)
+
+        assert "Missing bytecode: des/domain/rules.py" in problems
+
+    def test_reports_stale_bytecode_after_source_edit(self, tmp_path):
+        root = _make_package(tmp_path)
+        compile_tree(root, [sys.executable])
+        (root / "domain" / "rules.py").write_text("RULES = ()\n", encoding="utf-8")
+
+        assert bytecode_problems(root) == ["Stale bytecode: des/domain/rules.py"]
+
+
+class TestInstallerPrecompiles:
+    def test_installed_des_module_ships_current_bytecode(self, tmp_path):
+        source_root = tmp_path / "source"
+        _make_package(source_root / "lib" / "python")
+        claude_dir = tmp_path / ".claude"
+        context = InstallContext(
+            claude_dir=claude_dir,
+            scripts_dir=tmp_path / "scripts",
+            templates_dir=tmp_path / "templates",
+            logger=MagicMock(),
+            project_root=tmp_path / "project",
+            framework_source=source_root,
+        )
+
+        result = DESPlugin()._install_des_module(context)
+
+        assert result.success, result.message
+        assert bytecode_problems(claude_dir / "lib" / "python" / "des") == []
+
+
+class TestAvailableInterpreters:
+    def test_skips_version_manager_shims_without_an_installed_version(
+        self, tmp_path, monkeypatch
+    ):
+        current = f"{sys.version_info.major}.{sys.version_info.minor}"
+        other = "3.10" if current != "3.10" else "3.11"
+        shim = tmp_path / f"python{other}"
+        shim.write_text(
+            f"#!/bin/sh\necho 'pyenv: python{other}: not found' >&2\nexit 127\n"
+        )
+        shim.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert available_interpreters() == [sys.executable]
@@ -4,9 +4,9 @@ Driving port: hook_definitions module (pure functions).
 Tests verify the canonical hook definitions produce correct configs
 for both distribution paths (plugin and installer).
 
-Test Budget: 10 distinct behaviors x 2 = 20 max unit tests.
+Test Budget: 11 distinct behaviors x 2 = 22 max unit tests.
 Behaviors:
-  1. Hook events define all 9 required registrations
+  1. Hook events define all 8 required registrations
   2. Hook event types cover all 5 distinct event types
   3. generate_hook_config produces correct structure for standard hooks
   4. generate_hook_config uses guard_command_fn for guard hooks
@@ -16,12 +16,15 @@ Behaviors:
   8. Bash guard shell command has correct structure and content
   9. Bash guard integration: allows non-execution-log commands
   10. Bash guard integration: blocks/allows based on des.cli presence
+  11. Bash guard fast path: no python3 unless the payload mentions execution-log
 """
 
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import sys
 
 import pytest
 
@@ -38,9 +41,9 @@ from scripts.shared.hook_definitions import (
 class TestHookEventDefinitions:
     """Verify the canonical hook event definitions are complete and correct."""
 
-    def test_defines_all_nine_hook_registrations(self):
-        """All 9 hook registrations are defined (4 PreToolUse + 5 others)."""
-        assert len(HOOK_EVENTS) == 9
+    def test_defines_all_eight_hook_registrations(self):
+        """All 8 hook registrations are defined (4 PreToolUse + 4 others)."""
+        assert len(HOOK_EVENTS) == 8
 
         # Verify exact event/matcher/action triples
         events_matchers = [(h.event, h.matcher, h.action) for h in HOOK_EVENTS]
@@ -49,8 +52,7 @@ class TestHookEventDefinitions:
         assert ("PreToolUse", "Edit", "pre-edit") in events_matchers
         assert ("PreToolUse", "Bash", "pre-bash") in events_matchers
         assert ("PostToolUse", "Agent", "post-tool-use") in events_matchers
-        assert ("SubagentStop", None, "subagent-stop") in events_matchers
-        assert ("SubagentStop", None, "deliver-progress") in events_matchers
+        assert ("SubagentStop", None, "subagent-stop-composite") in events_matchers
         assert ("SessionStart", "startup", "session-start") in events_matchers
         assert ("SubagentStart", None, "subagent-start") in events_matchers
 
@@ -137,11 +139,14 @@ class TestGenerateHookConfig:
         assert write_entry["hooks"][0]["command"] == "GUARD:pre-write"
         assert edit_entry["hooks"][0]["command"] == "GUARD:pre-edit"
 
-        # Agent should NOT use guard_fn
+        # Agent should NOT use guard_fn (only its own pre-filter guard)
         agent_entry = next(
             e for e in config["PreToolUse"] if e.get("matcher") == "Agent"
         )
-        assert agent_entry["hooks"][0]["command"] == "python3 -m des.hook pre-task"
+        assert agent_entry["hooks"][0]["command"].endswith(
+            "| python3 -m des.hook pre-task"
+        )
+        assert guard_calls == ["pre-write", "pre-edit"]
 
     def test_bash_hook_uses_shell_command_verbatim(self):
         """Bash entry command matches _BASH_EXECUTION_LOG_GUARD exactly."""
@@ -311,6 +316,47 @@ class TestBashGuardIntegration:
         assert result.returncode == 0
 
 
+class TestBashGuardFastPath:
+    """The guard only starts python3 when the raw payload mentions execution-log."""
+
+    @staticmethod
+    def _run_with_python_spy(tmp_path, shell: str, command: str):
+        """Run the guard under `shell` with a python3 on PATH that records calls."""
+        calls = tmp_path / "python3-calls"
+        spy = tmp_path / "python3"
+        spy.write_text(
+            f'#!/bin/sh\necho x >> "{calls}"\nexec "{sys.executable}" "$@"\n'
+        )
+        spy.chmod(0o755)
+        result = subprocess.run(
+            [shell, "-c", _BASH_EXECUTION_LOG_GUARD],
+            input=json.dumps({"tool_name": "Bash", "tool_input": {"command": command}}),
+            capture_output=True,
+            text=True,
+            timeout=5,
+            env={**os.environ, "PATH": f"{tmp_path}{os.pathsep}{os.environ['PATH']}"},
+        )
+        return result, calls.exists()
+
+    @pytest.mark.parametrize("shell", ["sh", "bash"])
+    def test_unrelated_command_exits_without_python(self, tmp_path, shell):
+        result, python_started = self._run_with_python_spy(
+            tmp_path, shell, "git status && pytest -q"
+        )
+
+        assert result.returncode == 0
+        assert not python_started
+
+    @pytest.mark.parametrize("shell", ["sh", "bash"])
+    def test_execution_log_mention_still_blocks(self, tmp_path, shell):
+        result, python_started = self._run_with_python_spy(
+            tmp_path, shell, "sed -i s/a/b/ execution-log.json"
+        )
+
+        assert result.returncode == 2
+        assert python_started
+
+
 class TestIsDESHookEntry:
     """Verify DES hook detection in both old and new formats."""
 
@@ -0,0 +1,248 @@
+"""Tests for declarative hook pre-filters (scripts/shared/hook_definitions.py).
+
+Driving port: build_prefilter_command() and the commands generate_hook_config()
+emits for PreToolUse/Agent, PostToolUse/Agent and SubagentStop, run through a
+real shell against the real DES hook adapter. SubagentStop is not filtered.
+
+Test Budget: 4 distinct behaviors x 2 = 8 max unit tests.
+Behaviors:
+  1. PayloadContains predicates compile to `case` patterns (any case, quoting)
+  2. FileExists predicates compile to builtin tests (plain paths and globs)
+  3. Guarded commands decide exactly as the full Python handlers
+  4. Ordinary non-DES Agent calls never start Python; every SubagentStop
+     does (transcript-only DES markers, token-usage instrumentation)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.shared.hook_definitions import (
+    FileExists,
+    PayloadContains,
+    build_prefilter_command,
+    generate_hook_config,
+)
+
+
+_SRC = Path(__file__).resolve().parents[4] / "src"
+
+_DES_PROMPT = (
+    "<!-- DES-VALIDATION : required -->\n"
+    "<!-- DES-PROJECT-ID : demo -->\n"
+    "<!-- DES-STEP-ID : 01-01 -->\n"
+    "Execute step"
+)
+
+
+def _run_shell(command: str, payload: str, cwd: Path, shell: str = "sh"):
+    return subprocess.run(
+        [shell, "-c", command],
+        input=payload,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        timeout=30,
+        env={**os.environ, "HOME": str(cwd), "PYTHONPATH": str(_SRC)},
+    )
+
+
+class TestPrefilterCompilation:
+    @pytest.mark.parametrize("shell", ["sh", "bash"])
+    def test_payload_predicates_match_any_case_and_quoted_text(self, tmp_path, shell):
+        command = build_prefilter_command(
+            (
+                PayloadContains("step", ignore_case=True),
+                PayloadContains('"flag": it\'s'),
+            ),
+            "echo started",
+        )
+
+        def started(payload: str) -> bool:
+            return _run_shell(command, payload, tmp_path, shell).stdout == "started\n"
+
+        assert started('{"prompt": "Run STEP 02-03"}')
+        assert started('{"flag": it\'s}')
+        assert not started('{"prompt": "Summarize the README"}')
+        assert not started('{"flag": its}')
+
+    @pytest.mark.parametrize("shell", ["sh", "bash"])
+    def test_file_predicates_test_paths_and_prefix_globs(self, tmp_path, shell):
+        command = build_prefilter_command(
+            (FileExists(".nwave/des/session"), FileExists(".nwave/des/task-*")),
+            "echo started",
+        )
+        des_dir = tmp_path / ".nwave" / "des"
+        des_dir.mkdir(parents=True)
+
+        def started() -> bool:
+            return _run_shell(command, "{}", tmp_path, shell).stdout == "started\n"
+
+        assert not started()
+        (des_dir / "task-demo--01-01").write_text("{}")
+        assert started()
+        (des_dir / "task-demo--01-01").unlink()
+        (des_dir / "session").write_text("{}")
+        assert started()
+
+
+def _agent_payload(prompt: str) -> str:
+    return json.dumps(
+        {
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Agent",
+            "tool_input": {"subagent_type": "software-crafter", "prompt": prompt},
+        }
+    )
+
+
+def _stop_payload(project: Path, prompt: str):
+    transcript = project / "agent.jsonl"
+    message = {"type": "user", "message": {"role": "user", "content": prompt}}
+    transcript.write_text(json.dumps(message) + "\n")
+    payload = {
+        "hook_event_name": "SubagentStop",
+        "agent_id": "agent-1",
+        "agent_type": "software-crafter",
+        "agent_transcript_path": str(transcript),
+        "stop_hook_active": False,
+        "cwd": str(project),
+    }
+    return json.dumps(payload)
+
+
+def _incomplete_step(project: Path, *, signal: bool) -> None:
+    deliver = project / "docs" / "feature" / "demo" / "deliver"
+    deliver.mkdir(parents=True)
+    (deliver / "roadmap.json").write_text(json.dumps({"steps": [{"id": "01-01"}]}))
+    (deliver / "execution-log.json").write_text(
+        json.dumps(
+            {
+                "project_id": "demo",
+                "events": ["01-01|PREPARE|EXECUTED|PASS|2026-02-06T10:00:00Z"],
+            }
+        )
+    )
+    if signal:
+        des_dir = project / ".nwave" / "des"
+        des_dir.mkdir(parents=True, exist_ok=True)
+        (des_dir / "des-task-active-demo--01-01").write_text("{}")
+
+
+def _deliver_session(project: Path) -> None:
+    des_dir = project / ".nwave" / "des"
+    des_dir.mkdir(parents=True, exist_ok=True)
+    (des_dir / "deliver-session.json").write_text("{}")
+
+
+# (case id, action, setup(project) -> payload, python expected to start)
+_PARITY_CASES = [
+    (
+        "pre-task-plain-prompt",
+        "pre-task",
+        lambda p: _agent_payload("Summarize the README for me"),
+        False,
+    ),
+    (
+        "pre-task-unmarked-step-id",
+        "pre-task",
+        lambda p: _agent_payload("Implement STEP 01-02 from the roadmap"),
+        True,
+    ),
+    ("pre-task-des-prompt", "pre-task", lambda p: _agent_payload(_DES_PROMPT), True),
+    (
+        "post-tool-use-plain-prompt",
+        "post-tool-use",
+        lambda p: _agent_payload("Summarize the README for me"),
+        False,
+    ),
+    (
+        "post-tool-use-in-deliver-session",
+        "post-tool-use",
+        lambda p: _deliver_session(p) or _agent_payload("Summarize the README"),
+        True,
+    ),
+    (
+        "post-tool-use-des-prompt",
+        "post-tool-use",
+        lambda p: _agent_payload(_DES_PROMPT),
+        True,
+    ),
+    (
+        "subagent-stop-plain-agent",
+        "subagent-stop-composite",
+        lambda p: _stop_payload(p, "Summarize the README"),
+        True,
+    ),
+    (
+        "subagent-stop-des-agent",
+        "subagent-stop-composite",
+        lambda p: _incomplete_step(p, signal=True) or _stop_payload(p, _DES_PROMPT),
+        True,
+    ),
+    (
+        "subagent-stop-des-transcript-without-signal",
+        "subagent-stop-composite",
+        lambda p: _incomplete_step(p, signal=False) or _stop_payload(p, _DES_PROMPT),
+        True,
+    ),
+]
+
+
+def _python_spy(tmp_path: Path) -> tuple[Path, Path]:
+    """An interpreter wrapper that records each start before exec-ing Python."""
+    calls = tmp_path / "python-calls"
+    spy = tmp_path / "python-spy"
+    spy.write_text(f'#!/bin/sh\necho x >> "{calls}"\nexec "{sys.executable}" "$@"\n')
+    spy.chmod(0o755)
+    return spy, calls
+
+
+def _decision(result: subprocess.CompletedProcess, project: Path) -> tuple:
+    """Exit code and response, with the project path and no-op output normalized."""
+    stdout = result.stdout.replace(str(project), "<project>").strip()
+    response = json.loads(stdout) if stdout not in ("", "{}") else None
+    return result.returncode, response
+
+
+class TestGuardedHooksMatchPythonHandlers:
+    @pytest.mark.parametrize(
+        "action,setup,starts_python",
+        [case[1:] for case in _PARITY_CASES],
+        ids=[case[0] for case in _PARITY_CASES],
+    )
+    def test_guarded_decision_equals_full_handler(
+        self, tmp_path, action, setup, starts_python
+    ):
+        spy, calls = _python_spy(tmp_path)
+        python_cmd = (
+            f"{shlex.quote(str(spy))} -m "
+            f"des.adapters.drivers.hooks.claude_code_hook_adapter {action}"
+        )
+        config = generate_hook_config(lambda a: python_cmd.replace(action, a))
+        guarded = next(
+            entry["hooks"][0]["command"]
+            for entries in config.values()
+            for entry in entries
+            if entry["hooks"][0]["command"].endswith(f" {action}")
+        )
+        guarded_project = tmp_path / "guarded"
+        direct_project = tmp_path / "direct"
+        guarded_project.mkdir()
+        direct_project.mkdir()
+
+        via_guard = _run_shell(guarded, setup(guarded_project), guarded_project)
+        python_started = calls.exists()
+        via_python = _run_shell(python_cmd, setup(direct_project), direct_project)
+
+        assert python_started is starts_python
+        assert _decision(via_guard, guarded_project) == _decision(
+            via_python, direct_project
+        )
@@ -0,0 +1,126 @@
+"""Tests for the cached scripts-root in the plugin hook bootstrap.
+
+Driving port: build_plugin._PLUGIN_DISCOVERY_SCRIPT, run in a subprocess
+against a fake HOME with a populated ~/.claude/plugins/cache.
+
+Test Budget: 3 distinct behaviors x 2 = 6 max unit tests.
+Behaviors:
+  1. First invocation discovers this version's scripts root and caches it
+  2. Warm invocations do a bounded number of filesystem calls, independent
+     of how many plugin versions are cached
+  3. A stale cached path is rediscovered
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.build_plugin import _PLUGIN_DISCOVERY_SCRIPT
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_VERSION = "9.9.9"
+
+# Counts filesystem calls under HOME, ignoring the import system's own
+# traffic (source/bytecode opens, os.listdir of package directories), and
+# prints the tally plus the chosen sys.path[0] on exit.
+_PROBE = """\
+import atexit, json, os, sys
+_home = os.environ["HOME"]
+_calls = {"stat": 0, "open": 0, "listdir": 0}
+def _audit(event, args):
+    if event == "open" and str(args[0]).startswith(_home):
+        _calls["open"] += not str(args[0]).endswith((".py", ".pyc"))
+    elif event in ("os.scandir", "glob.glob"):
+        _calls["listdir"] += 1
+sys.addaudithook(_audit)
+_stat = os.stat
+def _counting_stat(path, *a, **kw):
+    if str(path).startswith(_home):
+        _calls["stat"] += 1
+    return _stat(path, *a, **kw)
+os.stat = _counting_stat
+atexit.register(lambda: print(json.dumps({"calls": _calls, "path": sys.path[0]})))
+"""
+
+_STUB_ADAPTER = "def main():\n    pass\n"
+
+
+def _install_plugin_version(home: Path, version: str) -> Path:
+    scripts = home / ".claude/plugins/cache/nwave-marketplace/nw" / version / "scripts"
+    hooks = scripts / "des/adapters/drivers/hooks"
+    hooks.mkdir(parents=True)
+    for package in (hooks, hooks.parent, hooks.parent.parent, scripts / "des"):
+        (package / "__init__.py").write_text("")
+    (hooks / "claude_code_hook_adapter.py").write_text(_STUB_ADAPTER)
+    shutil.copy(
+        _REPO_ROOT / "src/des/adapters/drivers/hooks/plugin_scripts_cache.py", hooks
+    )
+    return scripts
+
+
+def _populate(home: Path, other_versions: int) -> Path:
+    for n in range(other_versions):
+        _install_plugin_version(home, f"1.{n}.0")
+    return _install_plugin_version(home, _VERSION)
+
+
+def _run_bootstrap(home: Path) -> dict:
+    script = _PLUGIN_DISCOVERY_SCRIPT.format(action="pre-task", version=_VERSION)
+    env = {k: v for k, v in os.environ.items() if k != "CLAUDE_PLUGIN_ROOT"}
+    env.update(HOME=str(home), PYTHONDONTWRITEBYTECODE="1")
+    env.pop("PYTHONPATH", None)
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE + script],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=home,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _cache_file(home: Path) -> Path:
+    return home / ".nwave" / f"plugin-scripts-{_VERSION}.path"
+
+
+class TestPluginBootstrapCache:
+    def test_first_run_discovers_this_version_and_caches_it(self, tmp_path):
+        scripts = _populate(tmp_path, other_versions=3)
+
+        outcome = _run_bootstrap(tmp_path)
+
+        assert outcome["path"] == str(scripts)
+        assert outcome["calls"]["listdir"] > 0
+        assert _cache_file(tmp_path).read_text() == str(scripts)
+
+    @pytest.mark.parametrize("other_versions", [1, 40])
+    def test_warm_run_is_bounded_regardless_of_cached_versions(
+        self, tmp_path, other_versions
+    ):
+        scripts = _populate(tmp_path, other_versions)
+        _run_bootstrap(tmp_path)
+
+        outcome = _run_bootstrap(tmp_path)
+
+        assert outcome["path"] == str(scripts)
+        assert outcome["calls"] == {"stat": 2, "open": 1, "listdir": 0}
+
+    def test_stale_cached_path_is_rediscovered(self, tmp_path):
+        scripts = _populate(tmp_path, other_versions=2)
+        _cache_file(tmp_path).parent.mkdir(parents=True)
+        _cache_file(tmp_path).write_text(str(tmp_path / "removed/scripts"))
+
+        outcome = _run_bootstrap(tmp_path)
+
+        assert outcome["path"] == str(scripts)
+        assert _cache_file(tmp_path).read_text() == str(scripts)
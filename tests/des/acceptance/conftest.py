@@ -38,6 +38,20 @@ def _silence_probe_acceptance(request):
         yield
 
 
+@pytest.fixture(autouse=True)
+def _no_update_check_worker():
+    """Never spawn the detached update-check worker from SessionStart.
+
+    The real worker would query PyPI and leave a lock file in the working
+    directory. Tests that exercise it patch _spawn_update_check_worker
+    themselves.
+    """
+    with patch(
+        "des.adapters.drivers.hooks.session_start_handler._spawn_update_check_worker"
+    ):
+        yield
+
+
 class FakeTimeProvider:
     """Test double for TimeProvider enabling deterministic timestamp testing."""
 
@@ -569,8 +569,8 @@ class TestHookInstallIdempotency:
         assert matchers.count("Write") == 1, f"Duplicate Write hooks: {matchers}"
         assert matchers.count("Edit") == 1, f"Duplicate Edit hooks: {matchers}"
 
-        # Exactly 2 SubagentStop (subagent-stop + deliver-progress) and 1 PostToolUse
-        assert len(config["hooks"]["SubagentStop"]) == 2
+        # Exactly 1 SubagentStop (subagent-stop-composite) and 1 PostToolUse
+        assert len(config["hooks"]["SubagentStop"]) == 1
         assert len(config["hooks"]["PostToolUse"]) == 1
 
 
@@ -895,7 +895,7 @@ class TestHousekeepingOrchestration:
             ) as mock_hk,
         ):
             mock_service = MagicMock()
-            mock_service.check_for_updates.return_value = update_result
+            mock_service.take_cached_result.return_value = update_result
             mock_factory.return_value = mock_service
 
             exit_code = handle_session_start()
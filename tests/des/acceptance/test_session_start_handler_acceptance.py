@@ -30,7 +30,7 @@ class TestSessionStartHandlerAcceptance:
             "des.adapters.drivers.hooks.session_start_handler._build_update_check_service"
         ) as mock_factory:
             mock_service = MagicMock()
-            mock_service.check_for_updates.return_value = update_result
+            mock_service.take_cached_result.return_value = update_result
             mock_factory.return_value = mock_service
 
             # Simulate stdin with empty JSON hook input
@@ -61,7 +61,7 @@ class TestSessionStartHandlerAcceptance:
             "des.adapters.drivers.hooks.session_start_handler._build_update_check_service"
         ) as mock_factory:
             mock_service = MagicMock()
-            mock_service.check_for_updates.return_value = update_result
+            mock_service.take_cached_result.return_value = update_result
             mock_factory.return_value = mock_service
 
             with patch("sys.stdin", io.StringIO("{}")):
@@ -84,7 +84,7 @@ class TestSessionStartHandlerAcceptance:
             "des.adapters.drivers.hooks.session_start_handler._build_update_check_service"
         ) as mock_factory:
             mock_service = MagicMock()
-            mock_service.check_for_updates.return_value = update_result
+            mock_service.take_cached_result.return_value = update_result
             mock_factory.return_value = mock_service
 
             with patch("sys.stdin", io.StringIO("{}")):
@@ -135,7 +135,7 @@ class TestSessionStartHandlerAcceptance:
             ),
         ):
             mock_service = MagicMock()
-            mock_service.check_for_updates.return_value = update_result
+            mock_service.take_cached_result.return_value = update_result
             mock_factory.return_value = mock_service
 
             with patch("sys.stdin", io.StringIO("{}")):
@@ -59,7 +59,7 @@ def _invoke_with_call_recorder(tmp_path, calls: list[str]):
         svc = MagicMock()
         result = MagicMock()
         result.status = "UP_TO_DATE"
-        svc.check_for_updates.return_value = result
+        svc.take_cached_result.return_value = result
         return svc
 
     with (
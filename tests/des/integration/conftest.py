@@ -23,3 +23,17 @@ def _silence_probe_integration(request):
         return_value="",
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _no_update_check_worker():
+    """Never spawn the detached update-check worker from SessionStart.
+
+    The real worker would query PyPI and leave a lock file in the working
+    directory. Tests that exercise it patch _spawn_update_check_worker
+    themselves.
+    """
+    with patch(
+        "des.adapters.drivers.hooks.session_start_handler._spawn_update_check_worker"
+    ):
+        yield
@@ -2,7 +2,8 @@
 
 Covers the complete session-start path:
   DESConfig (reads frequency) -> UpdateCheckPolicy (gates) ->
-  UpdateCheckService (PyPI + GitHub) -> session_start_handler (stdout JSON)
+  UpdateCheckService (PyPI + GitHub, run by the background worker) ->
+  cached verdict -> session_start_handler (stdout JSON)
 
 Tests validate all AC scenarios:
 1. UPDATE_AVAILABLE produces additionalContext JSON on stdout
@@ -63,7 +64,10 @@ def _invoke_handler(
     urlopen_side_effect=None,
     urlopen_return_value=None,
 ) -> tuple[int, str]:
-    """Invoke handle_session_start with injected config and captured stdout.
+    """Run the background update check, then the next SessionStart.
+
+    The check is what the detached update_check_worker spawned by an earlier
+    session runs; SessionStart then reports the verdict it cached.
 
     Patches:
     - urllib.request.urlopen: controlled HTTP responses
@@ -109,6 +113,7 @@ def _invoke_handler(
         ),
         patch("urllib.request.urlopen", **urlopen_kwargs),
     ):
+        _build_service_for_test().check_for_updates()
         exit_code = handle_session_start()
 
     return exit_code, captured.getvalue()
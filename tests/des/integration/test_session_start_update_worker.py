@@ -0,0 +1,148 @@
+"""Integration tests for the background update check behind SessionStart.
+
+Covers the detached path end to end, against a local HTTP stand-in for PyPI
+and GitHub that answers only after a delay:
+
+  session_start_handler (reads cached verdict, spawns worker) ->
+  update_check_worker (real detached process) -> UpdateCheckService ->
+  cached verdict -> next session_start_handler (stdout JSON)
+
+Tests validate:
+1. SessionStart returns well before a slow remote answers
+2. The worker's verdict is reported by the next SessionStart
+3. A running worker is not spawned twice
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_REMOTE_DELAY_SECONDS = 2.0
+_LATEST = "999.0.0"
+
+
+class _SlowRemoteHandler(BaseHTTPRequestHandler):
+    """PyPI JSON at /pypi, a GitHub release at /releases, after a delay."""
+
+    def do_GET(self) -> None:
+        time.sleep(_REMOTE_DELAY_SECONDS)
+        if self.path.startswith("/releases"):
+            payload = {"tag_name": f"v{_LATEST}", "body": "- Faster hooks"}
+        else:
+            payload = {"info": {"version": _LATEST}}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def slow_remote():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowRemoteHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch) -> Path:
+    config = tmp_path / ".nwave" / "des-config.json"
+    config.parent.mkdir()
+    config.write_text(
+        json.dumps(
+            {"update_check": {"frequency": "every_session", "skipped_versions": []}}
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _session_start(remote_url: str) -> tuple[str, float, MagicMock]:
+    """Run one SessionStart; return (stdout, seconds, spawn spy)."""
+    from des.adapters.drivers.hooks import session_start_handler, update_check_worker
+
+    spawn = MagicMock(
+        side_effect=lambda des_config: update_check_worker.spawn(
+            des_config,
+            [
+                "--pypi-url",
+                f"{remote_url}/pypi",
+                "--github-releases-url",
+                f"{remote_url}/releases",
+            ],
+        )
+    )
+    mock_stdin = MagicMock()
+    mock_stdin.read.return_value = "{}"
+    captured = StringIO()
+    with (
+        patch("sys.stdin", mock_stdin),
+        patch("sys.stdout", captured),
+        patch.object(session_start_handler, "_run_housekeeping"),
+        patch.object(session_start_handler, "_spawn_update_check_worker", spawn),
+    ):
+        start = time.perf_counter()
+        session_start_handler.handle_session_start()
+        elapsed = time.perf_counter() - start
+    return captured.getvalue(), elapsed, spawn
+
+
+def _wait_for_worker(project: Path, timeout: float = 30.0) -> None:
+    lock = project / ".nwave" / "update-check.lock"
+    deadline = time.monotonic() + timeout
+    while lock.exists():
+        assert time.monotonic() < deadline, "update-check worker did not finish"
+        time.sleep(0.05)
+
+
+class TestSessionStartBackgroundUpdateCheck:
+    def test_session_start_does_not_wait_for_slow_remote(self, project, slow_remote):
+        stdout, elapsed, spawn = _session_start(slow_remote)
+        _wait_for_worker(project)
+
+        assert stdout == ""
+        assert spawn.call_count == 1
+        assert elapsed < _REMOTE_DELAY_SECONDS / 2, (
+            f"SessionStart took {elapsed:.2f}s with a {_REMOTE_DELAY_SECONDS}s remote"
+        )
+
+    def test_next_session_reports_worker_verdict(self, project, slow_remote):
+        _session_start(slow_remote)
+        _wait_for_worker(project)
+
+        stdout, elapsed, _ = _session_start(slow_remote)
+        _wait_for_worker(project)
+
+        message = json.loads(stdout)["additionalContext"]
+        assert _LATEST in message
+        assert "Faster hooks" in message
+        assert elapsed < _REMOTE_DELAY_SECONDS / 2
+
+    def test_running_worker_is_not_spawned_twice(self, project, slow_remote):
+        from des.adapters.driven.config.des_config import DESConfig
+        from des.adapters.drivers.hooks import update_check_worker
+
+        _session_start(slow_remote)
+        second = update_check_worker.spawn(DESConfig())
+        _wait_for_worker(project)
+
+        assert second is False
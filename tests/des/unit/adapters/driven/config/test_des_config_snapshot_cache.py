@@ -0,0 +1,63 @@
+"""Unit tests for the process-scoped DESConfig snapshot cache.
+
+Test Budget: 3 behaviors x 2 = 6 max. Actual: 4 tests.
+
+Behaviors:
+1. Repeated lookups for the same cwd return the same instance
+2. A change to the project config file yields a fresh snapshot
+3. Snapshots are per working directory
+"""
+
+import json
+
+import pytest
+
+from des.adapters.driven.config.des_config import (
+    clear_des_config_cache,
+    load_des_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache():
+    clear_des_config_cache()
+    yield
+    clear_des_config_cache()
+
+
+def _write_config(project, data):
+    config_file = project / ".nwave" / "des-config.json"
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text(json.dumps(data), encoding="utf-8")
+    return config_file
+
+
+class TestSnapshotReuse:
+    def test_same_cwd_returns_same_instance(self, tmp_path):
+        _write_config(tmp_path, {"audit_logging_enabled": True})
+
+        assert load_des_config(tmp_path) is load_des_config(tmp_path)
+
+    def test_missing_config_is_cached_too(self, tmp_path):
+        assert load_des_config(tmp_path) is load_des_config(tmp_path)
+
+
+class TestSnapshotInvalidation:
+    def test_config_edit_is_picked_up(self, tmp_path):
+        _write_config(tmp_path, {"audit_logging_enabled": True})
+        first = load_des_config(tmp_path)
+
+        _write_config(tmp_path, {"audit_logging_enabled": False, "x": 1})
+        second = load_des_config(tmp_path)
+
+        assert second is not first
+        assert second.audit_logging_enabled is False
+
+    def test_snapshots_are_per_cwd(self, tmp_path):
+        project_a = tmp_path / "a"
+        project_b = tmp_path / "b"
+        _write_config(project_a, {"audit_logging_enabled": False})
+        project_b.mkdir()
+
+        assert load_des_config(project_a).audit_logging_enabled is False
+        assert load_des_config(project_b).audit_logging_enabled is True
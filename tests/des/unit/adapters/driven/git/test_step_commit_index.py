@@ -0,0 +1,119 @@
+"""Unit tests for the incremental Step-ID commit index behind GitCommitVerifier.
+
+Test budget: 4 behaviors x 2 = 8 unit tests max. Actual: 6 tests.
+
+B1: verify_commit finds the newest commit with the Step-ID trailer
+B2: a missing step is reported without walking history again
+B3: only commits added since the indexed head are scanned
+B4: a rewritten history, corrupt index or non-repository is handled safely
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from des.adapters.driven.git import step_commit_index
+from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
+
+
+def _git(repo, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _init(repo) -> None:
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    _commit(repo, "Initial commit")
+
+
+def _commit(repo, subject: str, step_id: str | None = None) -> str:
+    message = subject if step_id is None else f"{subject}\n\nStep-ID: {step_id}"
+    _git(repo, "commit", "-q", "--allow-empty", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+class TestLookup:
+    def test_finds_newest_commit_with_step_id_trailer(self, tmp_path):
+        _init(tmp_path)
+        _commit(tmp_path, "feat: first attempt", "01-01")
+        newest = _commit(tmp_path, "feat: second attempt", "01-01")
+        _commit(tmp_path, "feat: other step", "01-02")
+
+        result = GitCommitVerifier().verify_commit("01-01", str(tmp_path))
+
+        assert result.verified
+        assert result.commit_hash == newest
+        assert result.commit_subject == "feat: second attempt"
+        assert result.commit_date == _git(tmp_path, "log", "-1", "--format=%ai", newest)
+
+    def test_missing_step_is_answered_from_the_index(self, tmp_path):
+        _init(tmp_path)
+        _commit(tmp_path, "feat: step one", "01-01")
+        verifier = GitCommitVerifier()
+        verifier.verify_commit("01-01", str(tmp_path))
+
+        with patch.object(
+            step_commit_index,
+            "scan_step_commits",
+            side_effect=AssertionError("history walked again"),
+        ):
+            result = verifier.verify_commit("09-09", str(tmp_path))
+
+        assert not result.verified
+        assert result.error_reason == "No commit found with Step-ID: 09-09"
+
+
+class TestIncrementalRefresh:
+    def test_scans_only_commits_since_indexed_head(self, tmp_path):
+        _init(tmp_path)
+        indexed_head = _commit(tmp_path, "feat: step one", "01-01")
+        GitCommitVerifier().verify_commit("01-01", str(tmp_path))
+        new_head = _commit(tmp_path, "feat: step two", "01-02")
+        real_scan = step_commit_index.scan_step_commits
+
+        with patch.object(
+            step_commit_index, "scan_step_commits", side_effect=real_scan
+        ) as scan:
+            result = GitCommitVerifier().verify_commit("01-02", str(tmp_path))
+
+        assert result.verified
+        assert scan.call_args.args[1] == f"{indexed_head}..{new_head}"
+        assert GitCommitVerifier().verify_commit("01-01", str(tmp_path)).verified
+
+
+class TestRobustness:
+    def test_rewritten_history_rebuilds_the_index(self, tmp_path):
+        _init(tmp_path)
+        base = _commit(tmp_path, "chore: base")
+        _commit(tmp_path, "feat: step one", "01-01")
+        GitCommitVerifier().verify_commit("01-01", str(tmp_path))
+        _git(tmp_path, "reset", "-q", "--hard", base)
+        _commit(tmp_path, "feat: redone", "01-02")
+
+        verifier = GitCommitVerifier()
+
+        assert not verifier.verify_commit("01-01", str(tmp_path)).verified
+        assert verifier.verify_commit("01-02", str(tmp_path)).verified
+
+    def test_corrupt_index_file_is_rebuilt(self, tmp_path):
+        _init(tmp_path)
+        commit = _commit(tmp_path, "feat: step one", "01-01")
+        index_file = tmp_path / step_commit_index.INDEX_RELATIVE_PATH
+        index_file.parent.mkdir(parents=True)
+        index_file.write_text("{not json")
+
+        result = GitCommitVerifier().verify_commit("01-01", str(tmp_path))
+
+        assert result.commit_hash == commit
+        assert json.loads(index_file.read_text())["head"] == commit
+
+    def test_non_repository_reports_git_failure(self, tmp_path):
+        result = GitCommitVerifier().verify_commit("01-01", str(tmp_path))
+
+        assert not result.verified
+        assert result.error_reason.startswith("git command failed:")
@@ -0,0 +1,101 @@
+"""Unit tests for the JsonExecutionLogReader parsed-log cache.
+
+Test Budget: 3 behaviors x 2 = 6 max tests. Using 5.
+- Repeated queries on an unchanged log parse it once, across reader instances (2 tests)
+- Appends (v3 rewrite and v4 events line) invalidate the cached parse (2 tests)
+- Callers cannot corrupt the cache by mutating returned lists (1 test)
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from des.adapters.driven.hooks import json_execution_log_reader
+from des.adapters.driven.hooks.json_execution_log_reader import (
+    JsonExecutionLogReader,
+    clear_execution_log_cache,
+)
+from des.domain.execution_log_store import append_event, create_execution_log
+from des.domain.phase_event import PhaseEventParser
+
+
+def _event(step_id: str, phase: str) -> dict:
+    return {"sid": step_id, "p": phase, "s": "EXECUTED", "d": "PASS", "t": "T"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_execution_log_cache()
+    yield
+    clear_execution_log_cache()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Count raw event entries parsed into PhaseEvents."""
+    calls: list[object] = []
+    original = PhaseEventParser.parse_auto
+
+    def counting(self, event):
+        calls.append(event)
+        return original(self, event)
+
+    monkeypatch.setattr(PhaseEventParser, "parse_auto", counting)
+    return calls
+
+
+def _log(tmp_path, schema_version: str = "3.0") -> str:
+    log_path = tmp_path / "execution-log.json"
+    create_execution_log(
+        log_path,
+        {"feature_id": "feat"},
+        [_event("01-01", "PREPARE"), _event("01-02", "PREPARE")],
+        schema_version=schema_version,
+    )
+    return str(log_path)
+
+
+class TestRepeatedQueries:
+    def test_validation_queries_parse_each_event_once(self, tmp_path, parse_calls):
+        log_path = _log(tmp_path)
+        reader = JsonExecutionLogReader()
+
+        assert reader.read_project_id(log_path) == "feat"
+        assert len(reader.read_step_events(log_path, "01-01")) == 1
+        assert len(reader.read_step_events(log_path, "01-02")) == 1
+        assert len(reader.read_all_events(log_path)) == 2
+
+        assert len(parse_calls) == 2
+
+    def test_cache_is_shared_across_reader_instances(self, tmp_path, parse_calls):
+        log_path = _log(tmp_path, schema_version="4.0")
+
+        JsonExecutionLogReader().read_all_events(log_path)
+        JsonExecutionLogReader().read_step_events(log_path, "01-01")
+
+        assert len(parse_calls) == 2
+
+
+class TestInvalidation:
+    @pytest.mark.parametrize("schema_version", ["3.0", "4.0"])
+    def test_append_is_visible_to_next_query(self, tmp_path, schema_version):
+        log_path = _log(tmp_path, schema_version=schema_version)
+        reader = JsonExecutionLogReader()
+        reader.read_step_events(log_path, "01-01")
+
+        append_event(tmp_path / "execution-log.json", _event("01-01", "RED"))
+
+        phases = [e.phase_name for e in reader.read_step_events(log_path, "01-01")]
+        assert phases == ["PREPARE", "RED"]
+
+
+class TestIsolation:
+    def test_mutating_result_does_not_change_cache(self, tmp_path):
+        log_path = _log(tmp_path)
+        reader = JsonExecutionLogReader()
+
+        reader.read_step_events(log_path, "01-01").clear()
+        reader.read_all_events(log_path).clear()
+
+        assert len(reader.read_step_events(log_path, "01-01")) == 1
+        assert len(json_execution_log_reader._parsed_logs) == 1
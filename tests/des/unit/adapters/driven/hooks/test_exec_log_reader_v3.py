@@ -3,11 +3,12 @@
 Tests that the reader auto-detects schema_version and correctly parses
 both v2.0 (pipe-delimited) and v3.0 (structured dict) event formats.
 
-Test Budget: 3 behaviors x 2 = 6 max tests. Using 4.
+Test Budget: 4 behaviors x 2 = 8 max tests. Using 5.
 - Reader reads v3.0 structured events (1 test)
 - Reader reads v3.0 with stats tu/tk (1 test)
 - Reader auto-detects v2.0 vs v3.0 via schema_version (1 test)
 - Reader handles mixed format in single log (1 test)
+- Reader reads v4.0 append-only logs (header + events file) (1 test)
 """
 
 from __future__ import annotations
@@ -15,6 +16,7 @@ from __future__ import annotations
 import json
 
 from des.adapters.driven.hooks.json_execution_log_reader import JsonExecutionLogReader
+from des.domain.execution_log_store import append_event, create_execution_log
 
 
 def _write_log(tmp_path, events, schema_version="3.0"):
@@ -130,3 +132,22 @@ class TestYamlExecutionLogReaderV3:
         assert len(events) == 2
         assert events[0].phase_name == "PREPARE"
         assert events[1].phase_name == "GREEN"
+
+
+class TestJsonExecutionLogReaderV4:
+    """JsonExecutionLogReader resolves v4.0 events from the events file."""
+
+    def test_read_step_events_from_append_only_log(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"})
+        for sid, phase in (("08-01", "PREPARE"), ("09-01", "GREEN")):
+            append_event(
+                log_path,
+                {"sid": sid, "p": phase, "s": "EXECUTED", "d": "PASS", "t": "T"},
+            )
+
+        reader = JsonExecutionLogReader()
+
+        assert reader.read_project_id(str(log_path)) == "feat"
+        events = reader.read_step_events(str(log_path), "09-01")
+        assert [e.phase_name for e in events] == ["GREEN"]
@@ -0,0 +1,139 @@
+"""Unit tests for BatchingJsonlAuditLogWriter.
+
+Test budget: 4 behaviors x 2 = 8 unit tests max. Actual: 6 tests.
+
+B1: events are buffered until flush() or the size threshold
+B2: one descriptor serves every batch; a deleted log file is recreated
+B3: output is line-for-line identical to JsonlAuditLogWriter
+B4: concurrent writer processes never interleave or tear lines
+"""
+
+import json
+import multiprocessing
+
+from des.adapters.driven.logging.batching_jsonl_audit_log_writer import (
+    BatchingJsonlAuditLogWriter,
+)
+from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
+from des.ports.driven_ports.audit_log_writer import AuditEvent
+
+
+_STRESS_PROCESSES = 8
+_STRESS_EVENTS = 400
+
+
+def _event(index: int, payload: str = "") -> AuditEvent:
+    return AuditEvent(
+        event_type="AGENT_USAGE_OBSERVED",
+        timestamp="2026-02-06T12:00:00.000Z",
+        feature_name="audit-batching",
+        step_id="01-01",
+        data={"index": index, "payload": payload},
+    )
+
+
+def _read_lines(writer: JsonlAuditLogWriter) -> list[str]:
+    log_file = writer._get_log_file()
+    if not log_file.exists():
+        return []
+    return log_file.read_text(encoding="utf-8").splitlines()
+
+
+def _stress_worker(log_dir: str, worker: int) -> None:
+    # Small threshold: many flushes per process, racing with the others.
+    writer = BatchingJsonlAuditLogWriter(log_dir=log_dir, flush_threshold_bytes=4096)
+    padding = "x" * (64 + worker * 97)
+    for index in range(_STRESS_EVENTS):
+        writer.log_event(
+            AuditEvent(
+                event_type="AGENT_USAGE_OBSERVED",
+                timestamp="2026-02-06T12:00:00.000Z",
+                data={"worker": worker, "index": index, "payload": padding},
+            )
+        )
+    writer.close()
+
+
+class TestBuffering:
+    def test_events_are_invisible_until_flush(self, tmp_path):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path)
+
+        writer.log_event(_event(1))
+        writer.log_event(_event(2))
+        assert _read_lines(writer) == []
+
+        writer.flush()
+        assert [json.loads(line)["index"] for line in _read_lines(writer)] == [1, 2]
+
+    def test_threshold_triggers_flush(self, tmp_path):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path, flush_threshold_bytes=1)
+
+        writer.log_event(_event(1))
+
+        assert len(_read_lines(writer)) == 1
+
+
+class TestDescriptorReuse:
+    def test_batches_share_one_descriptor(self, tmp_path):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path)
+
+        writer.log_event(_event(1))
+        writer.flush()
+        first_fds = dict(writer._descriptors)
+        writer.log_event(_event(2))
+        writer.flush()
+
+        assert writer._descriptors == first_fds
+        assert len(_read_lines(writer)) == 2
+        writer.close()
+
+    def test_deleted_log_file_is_recreated(self, tmp_path):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path)
+        writer.log_event(_event(1))
+        writer.flush()
+
+        writer._get_log_file().unlink()
+        writer.log_event(_event(2))
+        writer.close()
+
+        assert [json.loads(line)["index"] for line in _read_lines(writer)] == [2]
+
+
+class TestFormatCompatibility:
+    def test_lines_match_unbuffered_writer(self, tmp_path):
+        plain = JsonlAuditLogWriter(log_dir=tmp_path / "plain")
+        batching = BatchingJsonlAuditLogWriter(log_dir=tmp_path / "batching")
+
+        for index in range(3):
+            plain.log_event(_event(index, "ü"))
+            batching.log_event(_event(index, "ü"))
+        batching.close()
+
+        assert _read_lines(batching) == _read_lines(plain)
+
+
+class TestConcurrentProcesses:
+    def test_concurrent_writers_never_interleave_lines(self, tmp_path):
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_stress_worker, args=(str(tmp_path), worker))
+            for worker in range(_STRESS_PROCESSES)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=120)
+            assert process.exitcode == 0
+
+        lines = _read_lines(BatchingJsonlAuditLogWriter(log_dir=tmp_path))
+        entries = [json.loads(line) for line in lines]  # torn lines fail here
+
+        assert len(entries) == _STRESS_PROCESSES * _STRESS_EVENTS
+        for worker in range(_STRESS_PROCESSES):
+            indices = [e["index"] for e in entries if e["worker"] == worker]
+            assert indices == list(range(_STRESS_EVENTS))
+            assert all(
+                len(e["payload"]) == 64 + worker * 97
+                for e in entries
+                if e["worker"] == worker
+            )
@@ -0,0 +1,151 @@
+"""Unit tests for JsonlAuditLogReader.read_last_entry.
+
+Test budget: 4 behaviors x 2 = 8 unit tests max. Actual: 8 tests.
+
+B1: backward block scan returns the most recent match, across block edges
+B2: corrupt lines are skipped; no match returns None
+B3: with a sidecar offset index, only the unindexed tail is scanned; each
+    flush appends one index record covering lines written since the last
+B4: a stale or contradicting index never changes the answer
+"""
+
+import json
+
+import pytest
+
+from des.adapters.driven.logging import audit_offset_index, jsonl_audit_log_reader
+from des.adapters.driven.logging.batching_jsonl_audit_log_writer import (
+    BatchingJsonlAuditLogWriter,
+)
+from des.adapters.driven.logging.jsonl_audit_log_reader import (
+    JsonlAuditLogReader,
+    iter_lines_backward,
+)
+from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
+from des.ports.driven_ports.audit_log_writer import AuditEvent
+
+
+def _event(event_type: str, step_id: str, n: int) -> AuditEvent:
+    return AuditEvent(
+        event_type=event_type,
+        timestamp=f"2026-02-06T12:00:{n:02d}.000Z",
+        feature_name="feat",
+        step_id=step_id,
+        data={"n": n},
+    )
+
+
+@pytest.fixture
+def scanned_ranges(monkeypatch):
+    """Record the (start, end) byte ranges the reader scans backward."""
+    ranges: list[tuple[int, int]] = []
+
+    def recording(log, start, end, *args):
+        ranges.append((start, end))
+        return iter_lines_backward(log, start, end, *args)
+
+    monkeypatch.setattr(jsonl_audit_log_reader, "iter_lines_backward", recording)
+    return ranges
+
+
+class TestBackwardScan:
+    def test_returns_most_recent_matching_entry(self, tmp_path):
+        writer = JsonlAuditLogWriter(log_dir=tmp_path)
+        for n in range(5):
+            writer.log_event(_event("PASSED", f"01-0{n % 2}", n))
+
+        entry = JsonlAuditLogReader(log_dir=tmp_path).read_last_entry(
+            event_type="PASSED", step_id="01-00"
+        )
+
+        assert entry["n"] == 4
+
+    def test_block_boundaries_do_not_split_lines(self, tmp_path):
+        log_file = tmp_path / "log"
+        lines = [json.dumps({"n": n, "pad": "x" * n}).encode() for n in range(30)]
+        log_file.write_bytes(b"\n".join(lines) + b"\n")
+
+        with open(log_file, "rb") as log:
+            seen = list(
+                iter_lines_backward(log, 0, log_file.stat().st_size, block_size=7)
+            )
+
+        assert [line for line in seen if line] == lines[::-1]
+
+
+class TestCorruptAndMissing:
+    def test_corrupt_lines_are_skipped(self, tmp_path):
+        writer = JsonlAuditLogWriter(log_dir=tmp_path)
+        writer.log_event(_event("PASSED", "01-01", 1))
+        with open(writer._get_log_file(), "a") as f:
+            f.write('{"event": "PASSED", trunc\n')
+
+        entry = JsonlAuditLogReader(log_dir=tmp_path).read_last_entry("PASSED")
+
+        assert entry["n"] == 1
+
+    def test_no_match_returns_none(self, tmp_path):
+        JsonlAuditLogWriter(log_dir=tmp_path).log_event(_event("PASSED", "01-01", 1))
+
+        assert JsonlAuditLogReader(log_dir=tmp_path).read_last_entry("FAILED") is None
+
+
+class TestOffsetIndex:
+    def test_indexed_lookup_scans_no_log_lines(self, tmp_path, scanned_ranges):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path, offset_index=True)
+        for n in range(50):
+            writer.log_event(_event("PASSED" if n % 3 else "FAILED", "01-01", n))
+        writer.close()
+
+        entry = JsonlAuditLogReader(log_dir=tmp_path).read_last_entry("FAILED")
+
+        assert entry["n"] == 48
+        assert all(start == end for start, end in scanned_ranges)
+
+    def test_unindexed_tail_is_scanned_first(self, tmp_path, scanned_ranges):
+        batching = BatchingJsonlAuditLogWriter(log_dir=tmp_path, offset_index=True)
+        batching.log_event(_event("PASSED", "01-01", 1))
+        batching.close()
+        JsonlAuditLogWriter(log_dir=tmp_path).log_event(_event("PASSED", "01-01", 2))
+
+        entry = JsonlAuditLogReader(log_dir=tmp_path).read_last_entry(
+            "PASSED", "feat", "01-01"
+        )
+
+        assert entry["n"] == 2
+        assert scanned_ranges[0][0] > 0
+
+    def test_each_flush_appends_one_chained_record(self, tmp_path):
+        batching = BatchingJsonlAuditLogWriter(log_dir=tmp_path, offset_index=True)
+        batching.log_event(_event("PASSED", "01-01", 1))
+        batching.flush()
+        JsonlAuditLogWriter(log_dir=tmp_path).log_event(_event("FAILED", "01-02", 2))
+        batching.log_event(_event("PASSED", "01-03", 3))
+        batching.close()
+        log_file = batching._get_log_file()
+
+        lines = audit_offset_index.index_path_for(log_file).read_text().splitlines()
+        first, second = (json.loads(line) for line in lines[1:])
+        index = audit_offset_index.load_index(log_file, log_file.stat().st_ino)
+
+        assert len(lines) == 3
+        assert second["start"] == first["end"]
+        assert index.size == log_file.stat().st_size
+        assert json.dumps(["FAILED", "feat", "01-02"]) in second["offsets"]
+
+
+class TestStaleIndex:
+    def test_contradicting_index_falls_back_to_scan(self, tmp_path):
+        writer = BatchingJsonlAuditLogWriter(log_dir=tmp_path, offset_index=True)
+        writer.log_event(_event("PASSED", "01-01", 1))
+        writer.log_event(_event("FAILED", "01-01", 2))
+        writer.close()
+        index_file = audit_offset_index.index_path_for(writer._get_log_file())
+        end = json.loads(index_file.read_text().splitlines()[-1])["end"]
+        with open(index_file, "a") as f:
+            record = {"start": end, "end": end, "offsets": {'["FAILED"]': 0}}
+            f.write(json.dumps(record) + "\n")
+
+        entry = JsonlAuditLogReader(log_dir=tmp_path).read_last_entry("FAILED")
+
+        assert entry["n"] == 2
@@ -0,0 +1,129 @@
+"""Unit tests for the on-disk PreToolUse verdict cache.
+
+Test budget: 5 behaviors x 2 = 10 unit tests max. Actual: 8 tests.
+
+B1: a stored decision, with its recovery suggestions, is returned for the
+    same prompt and subagent type only
+B2: changing the TDD schema, the DES config or any des module invalidates
+    stored decisions
+B3: beyond max_entries the least recently used entries are evicted
+B4: an unreadable entry is a miss
+B5: a store that fails to write leaves no temporary file behind
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from des.adapters.driven.validation import file_verdict_cache
+from des.adapters.driven.validation.file_verdict_cache import FileVerdictCache
+from des.ports.driver_ports.pre_tool_use_port import HookDecision, PreToolUseInput
+
+
+_BLOCK = HookDecision.block(
+    reason="MISSING: Mandatory section 'QUALITY_GATES' not found",
+    recovery_suggestions=["Add QUALITY_GATES section"],
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".nwave").mkdir()
+    (tmp_path / ".nwave" / "des-config.json").write_text("{}")
+    (tmp_path / "schema.json").write_text('{"schema_version": "4.0"}')
+    return tmp_path
+
+
+def _cache(project, **kwargs) -> FileVerdictCache:
+    return FileVerdictCache(
+        project / ".nwave" / "des" / "cache" / "pre-tool-use",
+        schema_path=project / "schema.json",
+        config_path=project / ".nwave" / "des-config.json",
+        **kwargs,
+    )
+
+
+def _input(prompt: str = "<!-- DES-VALIDATION : required -->", agent="crafter"):
+    return PreToolUseInput(prompt=prompt, subagent_type=agent)
+
+
+class TestLookup:
+    def test_stored_block_round_trips_with_recovery(self, project):
+        _cache(project).put(_input(), _BLOCK)
+
+        assert _cache(project).get(_input()) == _BLOCK
+
+    @pytest.mark.parametrize(
+        "other", [_input(prompt="different prompt"), _input(agent="researcher")]
+    )
+    def test_different_invocation_misses(self, project, other):
+        cache = _cache(project)
+        cache.put(_input(), HookDecision.allow())
+
+        assert cache.get(other) is None
+
+
+class TestInvalidation:
+    @pytest.mark.parametrize("changed", ["schema.json", ".nwave/des-config.json"])
+    def test_rule_file_change_invalidates(self, project, changed):
+        _cache(project).put(_input(), HookDecision.allow())
+
+        (project / changed).write_text('{"changed": true}')
+
+        assert _cache(project).get(_input()) is None
+
+    def test_any_des_module_change_invalidates(self, project, monkeypatch):
+        package = project / "des"
+        (package / "adapters").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        monkeypatch.setattr(file_verdict_cache, "_DES_ROOT", package)
+        stamp = file_verdict_cache._des_code_stamp
+        stamp.cache_clear()
+        _cache(project).put(_input(), HookDecision.allow())
+
+        (package / "adapters" / "new_rule.py").write_text("RULE = 1\n")
+        stamp.cache_clear()
+        try:
+            assert _cache(project).get(_input()) is None
+        finally:
+            monkeypatch.undo()
+            stamp.cache_clear()
+
+
+class TestEviction:
+    def test_least_recently_used_entry_is_evicted(self, project):
+        cache = _cache(project, max_entries=2)
+        for age, prompt in enumerate(["a", "b"]):
+            cache.put(_input(prompt), HookDecision.allow())
+            entry = cache._entry_path(_input(prompt))
+            os.utime(entry, ns=(age * 10**9, age * 10**9))
+
+        assert cache.get(_input("a")) is not None  # "a" becomes most recent
+        cache.put(_input("c"), HookDecision.allow())
+
+        assert cache.get(_input("b")) is None
+        assert cache.get(_input("a")) is not None
+        assert cache.get(_input("c")) is not None
+
+
+class TestCorruption:
+    def test_unreadable_entry_is_a_miss(self, project):
+        cache = _cache(project)
+        cache.put(_input(), HookDecision.allow())
+        cache._entry_path(_input()).write_text("{not json")
+
+        assert cache.get(_input()) is None
+
+    def test_failed_store_leaves_no_temporary_file(self, project, monkeypatch):
+        cache = _cache(project)
+
+        def disk_full(self, target):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(Path, "replace", disk_full)
+        cache.put(_input(), HookDecision.allow())
+
+        assert list(cache._entry_path(_input()).parent.iterdir()) == []
@@ -0,0 +1,74 @@
+"""Unit tests for the memoized hook audit writer factory.
+
+Test budget: 3 behaviors x 2 = 6 unit tests max.
+
+B1: one hook process reuses a single writer across create_audit_writer calls
+B2: the writer is rebuilt when the config, cwd or DES_AUDIT_LOG_DIR changes
+B3: buffered audit events are on disk when a handler returns
+"""
+
+import json
+
+import pytest
+
+from des.adapters.driven.logging.null_audit_log_writer import NullAuditLogWriter
+from des.adapters.drivers.hooks import hook_protocol
+from des.ports.driven_ports.audit_log_writer import AuditEvent
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DES_AUDIT_LOG_DIR", raising=False)
+    monkeypatch.delenv("DES_AUDIT_LOGGING_ENABLED", raising=False)
+    hook_protocol.clear_audit_writer_cache()
+    yield
+    hook_protocol.clear_audit_writer_cache()
+
+
+class TestWriterReuse:
+    def test_repeated_calls_share_one_writer(self):
+        assert hook_protocol.create_audit_writer() is (
+            hook_protocol.create_audit_writer()
+        )
+
+
+class TestWriterInvalidation:
+    def test_log_dir_env_change_builds_new_writer(self, tmp_path, monkeypatch):
+        first = hook_protocol.create_audit_writer()
+
+        monkeypatch.setenv("DES_AUDIT_LOG_DIR", str(tmp_path / "elsewhere"))
+
+        assert hook_protocol.create_audit_writer() is not first
+
+    def test_disabling_audit_in_config_is_honoured(self, tmp_path):
+        hook_protocol.create_audit_writer()
+        config_file = tmp_path / ".nwave" / "des-config.json"
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        config_file.write_text(json.dumps({"audit_logging_enabled": False}))
+
+        assert isinstance(hook_protocol.create_audit_writer(), NullAuditLogWriter)
+
+    def test_cwd_change_builds_new_writer(self, tmp_path, monkeypatch):
+        first = hook_protocol.create_audit_writer()
+        other = tmp_path / "other"
+        other.mkdir()
+
+        monkeypatch.chdir(other)
+
+        assert hook_protocol.create_audit_writer() is not first
+
+
+class TestFlushAtHandlerExit:
+    def test_handler_events_are_written_when_it_returns(self):
+        @hook_protocol.flushes_audit_log
+        def handler():
+            hook_protocol.create_audit_writer().log_event(
+                AuditEvent(event_type="HOOK_INVOKED", timestamp="2026-01-01T00:00Z")
+            )
+            return 0
+
+        assert handler() == 0
+
+        log_file = hook_protocol.create_audit_writer()._get_log_file()
+        assert json.loads(log_file.read_text())["event"] == "HOOK_INVOKED"
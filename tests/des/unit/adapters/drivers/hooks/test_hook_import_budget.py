@@ -0,0 +1,109 @@
+"""Import budget for each hook command.
+
+Every Claude Code tool call pays the hook's import cost before a byte of
+stdin is read, so each command may only load its own handler module.
+The budget caps the number of modules -- des, stdlib and third-party alike --
+that the entry point plus the lazily routed handler add to a bare
+interpreter (``python -c pass`` with the same environment). Module counts are
+deterministic where wall-clock import time is not. Caps sit ~15% above the
+current counts.
+
+Test budget: 2 behaviors x 8 commands (parametrized).
+"""
+
+import functools
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import des
+
+
+_SRC_ROOT = Path(des.__file__).resolve().parents[1]
+
+# Command -> maximum number of modules loaded beyond a bare interpreter.
+IMPORT_BUDGET_MODULES: dict[str, int] = {
+    "pre-write": 117,
+    "post-tool-use": 116,
+    "session-start": 90,
+    "subagent-start": 90,
+    "pre-task": 168,
+    "subagent-stop": 175,
+    "deliver-progress": 193,
+    "subagent-stop-composite": 194,
+}
+
+# Heavy modules that only the SubagentStop path legitimately needs.
+_SUBAGENT_STOP_ONLY = (
+    "des.adapters.driven.git.git_commit_verifier",
+    "des.adapters.drivers.hooks.token_usage_extractor",
+    "des.adapters.drivers.hooks.skill_tracking_hooks",
+)
+
+FORBIDDEN_MODULES: dict[str, tuple[str, ...]] = {
+    "pre-write": (*_SUBAGENT_STOP_ONLY, "des.domain.tdd_schema"),
+    "session-start": (*_SUBAGENT_STOP_ONLY, "des.domain.tdd_schema"),
+    "subagent-start": (*_SUBAGENT_STOP_ONLY, "des.domain.tdd_schema"),
+    "post-tool-use": (
+        "des.adapters.driven.git.git_commit_verifier",
+        "des.adapters.drivers.hooks.token_usage_extractor",
+        "des.domain.tdd_schema",
+    ),
+}
+
+_BARE = "import sys\nprint('\\n'.join(sorted(sys.modules)))\n"
+
+_PROBE = (
+    "import sys\n"
+    "import des.adapters.drivers.hooks.claude_code_hook_adapter\n"
+    "from des.adapters.drivers.hooks import hook_router\n"
+    "hook_router.resolve_handler(sys.argv[1])\n"
+    "print('\\n'.join(sorted(sys.modules)))\n"
+)
+
+
+def _run_probe(*args: str) -> set[str]:
+    """Return the module names loaded by ``python -c *args``."""
+    env = {**os.environ, "PYTHONPATH": str(_SRC_ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-c", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(_SRC_ROOT),
+        timeout=60,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@functools.cache
+def _bare_modules() -> frozenset[str]:
+    """Modules an interpreter has loaded before running any code."""
+    return frozenset(_run_probe(_BARE))
+
+
+def _loaded_modules(command: str) -> set[str]:
+    """Return the module names loaded to route *command*."""
+    return _run_probe(_PROBE, command)
+
+
+@pytest.mark.parametrize("command", sorted(IMPORT_BUDGET_MODULES))
+def test_hook_command_module_count_within_budget(command):
+    added = sorted(_loaded_modules(command) - _bare_modules())
+
+    assert len(added) <= IMPORT_BUDGET_MODULES[command], (
+        f"{command} loads {len(added)} modules "
+        f"(budget {IMPORT_BUDGET_MODULES[command]}): {added}"
+    )
+
+
+@pytest.mark.parametrize("command", sorted(FORBIDDEN_MODULES))
+def test_hook_command_does_not_import_unrelated_handlers(command):
+    modules = _loaded_modules(command)
+
+    leaked = sorted(set(FORBIDDEN_MODULES[command]) & modules)
+    assert not leaked, f"{command} imports modules it never uses: {leaked}"
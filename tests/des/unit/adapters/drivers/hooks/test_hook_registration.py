@@ -1,13 +1,14 @@
-"""Unit tests for deliver-progress hook registration and routing.
+"""Unit tests for SubagentStop hook registration and routing.
 
-Step 01-02: Register deliver-progress as second SubagentStop hook event
-and wire router dispatch.
+deliver-progress runs inside the single composite SubagentStop entry
+(subagent-stop-composite); the single actions stay routable for settings
+written by older installers.
 
 Test Budget: 3 behaviors x 2 = 6 unit tests max.
 Behaviors:
-  B1: HOOK_EVENTS has 2 SubagentStop entries with correct actions/matchers
+  B1: HOOK_EVENTS has 1 composite SubagentStop entry without matcher
   B2: Router dispatches deliver-progress to handle_deliver_progress
-  B3: generate_hook_config produces 2 SubagentStop entries without matcher
+  B3: generate_hook_config produces 1 composite SubagentStop entry
 """
 
 from __future__ import annotations
@@ -30,25 +31,18 @@ def _capture_exit(module, argv):
 
 
 class TestHookEventsSubagentStopEntries:
-    """B1: HOOK_EVENTS has exactly 2 SubagentStop entries."""
+    """B1: HOOK_EVENTS has exactly 1 composite SubagentStop entry."""
 
-    def test_two_subagent_stop_entries_exist(self):
-        """HOOK_EVENTS contains exactly 2 SubagentStop entries."""
-        from scripts.shared.hook_definitions import HOOK_EVENTS
-
-        subagent_stop_events = [h for h in HOOK_EVENTS if h.event == "SubagentStop"]
-        assert len(subagent_stop_events) == 2
-
-    def test_subagent_stop_actions_are_correct(self):
-        """SubagentStop entries have actions 'subagent-stop' and 'deliver-progress'."""
+    def test_single_composite_subagent_stop_entry(self):
+        """SubagentStop is registered once, with the composite action."""
         from scripts.shared.hook_definitions import HOOK_EVENTS
 
         subagent_stop_events = [h for h in HOOK_EVENTS if h.event == "SubagentStop"]
         actions = [h.action for h in subagent_stop_events]
-        assert actions == ["subagent-stop", "deliver-progress"]
+        assert actions == ["subagent-stop-composite"]
 
     def test_subagent_stop_entries_have_no_matcher(self):
-        """Both SubagentStop entries have matcher=None."""
+        """The SubagentStop entry has matcher=None."""
         from scripts.shared.hook_definitions import HOOK_EVENTS
 
         subagent_stop_events = [h for h in HOOK_EVENTS if h.event == "SubagentStop"]
@@ -86,20 +80,16 @@ class TestRouterDeliverProgressDispatch:
 
 
 class TestGenerateHookConfigSubagentStop:
-    """B3: generate_hook_config produces 2 SubagentStop entries without matcher."""
+    """B3: generate_hook_config produces 1 composite SubagentStop entry."""
 
-    def test_config_has_two_subagent_stop_hooks(self):
-        """SubagentStop list in generated config contains exactly 2 entries."""
+    def test_config_has_one_composite_subagent_stop_hook(self):
+        """SubagentStop list in generated config holds only the composite."""
         from scripts.shared.hook_definitions import generate_hook_config
 
         config = generate_hook_config(command_fn=lambda action: f"cmd {action}")
         subagent_stop_entries = config["SubagentStop"]
-        assert len(subagent_stop_entries) == 2
-
-        # Neither entry has a matcher field
-        for entry in subagent_stop_entries:
-            assert "matcher" not in entry
 
-        # Verify correct action commands are wired
-        commands = [entry["hooks"][0]["command"] for entry in subagent_stop_entries]
-        assert commands == ["cmd subagent-stop", "cmd deliver-progress"]
+        assert [e["hooks"][0]["command"] for e in subagent_stop_entries] == [
+            "cmd subagent-stop-composite"
+        ]
+        assert "matcher" not in subagent_stop_entries[0]
@@ -0,0 +1,138 @@
+"""Unit tests for the resident DES hook server and its thin client.
+
+Test budget: 5 behaviors x 2 = 10 unit tests max.
+
+B1: dispatch() reproduces a one-shot invocation (stdout + exit code)
+B2: client relays the server's stdout and exit code
+B3: client falls back to in-process execution when no server is running
+B4: server restores cwd and DES environment after each invocation
+B5: client reports a hook error, without re-running the handler, when the
+    server fails after accepting the request
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from des.adapters.drivers.hooks import hook_client, hook_server
+
+
+_NW_AGENT = json.dumps({"agent_type": "nw-software-crafter"})
+
+
+@pytest.fixture
+def running_server(tmp_path, monkeypatch):
+    """Serve from a background thread on a socket relative to tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    socket_path = Path(".nwave") / "des" / "hook-server.sock"
+    server = hook_server.HookServer(socket_path=socket_path, idle_timeout=30)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while hook_server.ping(socket_path) is None:
+        assert time.monotonic() < deadline, "hook server did not start"
+        time.sleep(0.02)
+    yield socket_path
+    hook_server.stop(socket_path)
+    thread.join(timeout=5)
+
+
+class TestDispatch:
+    def test_dispatch_captures_stdout_and_exit_code(self, tmp_path):
+        result = hook_server.dispatch(["subagent-start"], _NW_AGENT, str(tmp_path))
+
+        assert result["exit_code"] == 0
+        assert (
+            "nw-software-crafter" in json.loads(result["stdout"])["additionalContext"]
+        )
+
+    def test_dispatch_unknown_command_exits_1(self, tmp_path):
+        result = hook_server.dispatch(["no-such-command"], "{}", str(tmp_path))
+
+        assert result["exit_code"] == 1
+        assert json.loads(result["stdout"])["status"] == "error"
+
+
+class TestClientWithServer:
+    def test_client_relays_server_response(self, running_server, monkeypatch, capsys):
+        monkeypatch.setattr("sys.stdin", io.StringIO(_NW_AGENT))
+        monkeypatch.setattr(
+            hook_client, "run_in_process", lambda *a: pytest.fail("fell back")
+        )
+
+        exit_code = hook_client.main(["subagent-start"])
+
+        assert exit_code == 0
+        assert "nw-software-crafter" in capsys.readouterr().out
+
+    def test_server_reports_its_pid(self, running_server):
+        assert hook_server.ping(running_server)["pid"] == os.getpid()
+
+
+class TestClientFallback:
+    def test_client_runs_in_process_without_server(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("sys.stdin", io.StringIO(_NW_AGENT))
+
+        exit_code = hook_client.main(["subagent-start"])
+
+        assert exit_code == 0
+        assert "nw-software-crafter" in capsys.readouterr().out
+
+    def test_request_returns_none_for_stale_socket_file(self, tmp_path):
+        stale = tmp_path / "stale.sock"
+        stale.touch()
+
+        assert hook_client.request({"op": "ping"}, str(stale)) is None
+
+
+class TestServerFailureAfterAccept:
+    def test_client_reports_error_without_running_handler_again(
+        self, monkeypatch, capsys
+    ):
+        def reset(*_args, **_kwargs):
+            raise ConnectionResetError("connection reset by peer")
+
+        monkeypatch.setattr("sys.stdin", io.StringIO(_NW_AGENT))
+        monkeypatch.setattr(hook_client, "request", reset)
+        monkeypatch.setattr(
+            hook_client, "run_in_process", lambda *a: pytest.fail("re-ran handler")
+        )
+
+        exit_code = hook_client.main(["subagent-start"])
+
+        assert exit_code == 1
+        assert json.loads(capsys.readouterr().out)["status"] == "error"
+
+
+class TestInvocationIsolation:
+    def test_dispatch_restores_cwd(self, tmp_path):
+        before = os.getcwd()
+
+        hook_server.dispatch(["subagent-start"], _NW_AGENT, str(tmp_path))
+
+        assert os.getcwd() == before
+
+    def test_dispatch_applies_and_restores_forwarded_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DES_LEFTOVER_FROM_SERVER_START", "1")
+        seen: dict = {}
+
+        def fake_main():
+            seen.update(os.environ)
+            raise SystemExit(0)
+
+        monkeypatch.setattr(hook_server.hook_router, "main", fake_main)
+
+        hook_server.dispatch(
+            ["pre-write"], "{}", str(tmp_path), {"DES_AUDIT_LOG_DIR": "/x"}
+        )
+
+        assert seen["DES_AUDIT_LOG_DIR"] == "/x"
+        assert "DES_LEFTOVER_FROM_SERVER_START" not in seen
+        assert os.environ["DES_LEFTOVER_FROM_SERVER_START"] == "1"
+        assert "DES_AUDIT_LOG_DIR" not in os.environ
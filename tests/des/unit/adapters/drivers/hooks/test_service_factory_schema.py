@@ -0,0 +1,45 @@
+"""Unit tests for the process-scoped TDD schema cache in service_factory.
+
+Test budget: 1 behavior x 2 = 2 unit tests max.
+
+B1: load_tdd_schema reuses the parsed schema until the schema file changes
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from des.adapters.drivers.hooks import service_factory
+from des.domain.tdd_schema import TDDSchemaLoader
+
+
+@pytest.fixture
+def schema_file(tmp_path, monkeypatch):
+    """A private copy of step-tdd-cycle-schema.json used as the default path."""
+    copy = tmp_path / "step-tdd-cycle-schema.json"
+    shutil.copy(TDDSchemaLoader().schema_path, copy)
+    monkeypatch.setattr(
+        TDDSchemaLoader, "_resolve_default_schema_path", staticmethod(lambda: copy)
+    )
+    service_factory.clear_tdd_schema_cache()
+    yield copy
+    service_factory.clear_tdd_schema_cache()
+
+
+class TestSchemaReload:
+    def test_unchanged_schema_is_parsed_once(self, schema_file):
+        assert service_factory.load_tdd_schema() is service_factory.load_tdd_schema()
+
+    def test_edited_schema_is_parsed_again(self, schema_file):
+        first = service_factory.load_tdd_schema()
+        data = json.loads(schema_file.read_text(encoding="utf-8"))
+        data["tdd_cycle"]["phase_execution_log"].pop()
+        schema_file.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(schema_file, ns=(0, 0))
+
+        reloaded = service_factory.load_tdd_schema()
+
+        assert "COMMIT" in first.tdd_phases
+        assert "COMMIT" not in reloaded.tdd_phases
@@ -1,9 +1,10 @@
 """Unit tests for SessionStart hook handler.
 
 Tests all behaviors via handle_session_start() driving port.
-Test budget: 11 behaviors x 2 = 22 unit tests max.
+Test budget: 12 behaviors x 2 = 24 unit tests max.
 (3 new behaviors added for housekeeping integration: B6, B7, B8)
 (2 new behaviors added for substrate probe wiring: B10, B11)
+(1 new behavior added for the background update check: B12)
 """
 
 import io
@@ -32,6 +33,15 @@ def _silence_probe(request):
         yield
 
 
+@pytest.fixture(autouse=True)
+def _spawn_worker():
+    """Record update-check worker spawns instead of starting real processes."""
+    with patch(
+        "des.adapters.drivers.hooks.session_start_handler._spawn_update_check_worker"
+    ) as spawn:
+        yield spawn
+
+
 class TestSessionStartHandlerUpdateAvailable:
     """B1: UPDATE_AVAILABLE writes additionalContext JSON to stdout."""
 
@@ -58,7 +68,7 @@ class TestSessionStartHandlerUpdateAvailable:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -91,7 +101,7 @@ class TestSessionStartHandlerUpdateAvailable:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             handle_session_start()
@@ -122,7 +132,7 @@ class TestSessionStartHandlerUpToDate:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -149,7 +159,7 @@ class TestSessionStartHandlerSkip:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -179,8 +189,8 @@ class TestSessionStartHandlerFailOpen:
         assert exit_code == 0
         assert capsys.readouterr().out.strip() == ""
 
-    def test_exception_in_check_for_updates_exits_0_with_no_output(self, capsys):
-        """Exception in check_for_updates: exits 0, no stdout output."""
+    def test_exception_in_take_cached_result_exits_0_with_no_output(self, capsys):
+        """Exception reading the cached verdict: exits 0, no stdout output."""
         from des.adapters.drivers.hooks.session_start_handler import (
             handle_session_start,
         )
@@ -192,7 +202,7 @@ class TestSessionStartHandlerFailOpen:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.side_effect = RuntimeError("network error")
+            mock_svc.take_cached_result.side_effect = RuntimeError("network error")
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -227,7 +237,7 @@ class TestSessionStartHandlerOutputFormat:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             handle_session_start()
@@ -260,7 +270,7 @@ class TestSessionStartHandlerOutputFormat:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             handle_session_start()
@@ -292,7 +302,7 @@ class TestSessionStartHandlerHousekeepingIntegration:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -319,13 +329,13 @@ class TestSessionStartHandlerHousekeepingIntegration:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
 
         assert exit_code == 0
-        mock_svc.check_for_updates.assert_called_once()
+        mock_svc.take_cached_result.assert_called_once()
 
     def test_housekeeping_runs_before_update_check(self):
         """B8: _run_housekeeping is called before update check service is built."""
@@ -343,7 +353,7 @@ class TestSessionStartHandlerHousekeepingIntegration:
         def record_update_check_build(des_config):
             call_order.append("update_check")
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             return mock_svc
 
         with (
@@ -382,7 +392,7 @@ class TestSessionStartHandlerHousekeepingIntegration:
         def capture_update_check_config(des_config):
             captured["update_check_config"] = des_config
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             return mock_svc
 
         with (
@@ -433,7 +443,7 @@ class TestSessionStartHandlerSubstrateProbe:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -465,7 +475,7 @@ class TestSessionStartHandlerSubstrateProbe:
             patch("sys.stdin", io.StringIO("{}")),
         ):
             mock_svc = MagicMock()
-            mock_svc.check_for_updates.return_value = result
+            mock_svc.take_cached_result.return_value = result
             mock_factory.return_value = mock_svc
 
             exit_code = handle_session_start()
@@ -474,3 +484,33 @@ class TestSessionStartHandlerSubstrateProbe:
         out = capsys.readouterr().out
         # When update check returns UP_TO_DATE and probe returns empty, stdout has nothing
         assert out == ""
+
+
+class TestSessionStartHandlerBackgroundCheck:
+    """B12: The network check is spawned in the background only when due."""
+
+    @pytest.mark.parametrize("due", [True, False])
+    def test_worker_spawned_only_when_check_due(self, _spawn_worker, due):
+        """The cached verdict is always read; the worker starts only when due."""
+        from des.adapters.drivers.hooks.session_start_handler import (
+            handle_session_start,
+        )
+
+        with (
+            patch(
+                "des.adapters.drivers.hooks.session_start_handler._build_update_check_service"
+            ) as mock_factory,
+            patch("sys.stdin", io.StringIO("{}")),
+        ):
+            mock_svc = MagicMock()
+            mock_svc.take_cached_result.return_value = UpdateCheckResult(
+                status=UpdateStatus.SKIP
+            )
+            mock_svc.is_check_due.return_value = due
+            mock_factory.return_value = mock_svc
+
+            exit_code = handle_session_start()
+
+        assert exit_code == 0
+        mock_svc.check_for_updates.assert_not_called()
+        assert _spawn_worker.called is due
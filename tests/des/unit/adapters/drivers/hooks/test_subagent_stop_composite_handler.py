@@ -0,0 +1,136 @@
+"""Tests for the composite SubagentStop handler (subagent-stop + deliver-progress).
+
+Driving port: handle_subagent_stop_composite() with Claude Code SubagentStop
+JSON on stdin.
+
+Test Budget: 3 behaviors x 2 = 6 unit tests max.
+Behaviors:
+  B1: Both handlers run over one stdin read and one transcript scan
+  B2: The subagent-stop block decision is kept (stdout JSON, exit 0)
+  B3: Exit codes aggregate by severity; deliver-progress failures never block
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from des.adapters.drivers.hooks import (
+    subagent_stop_composite_handler,
+    subagent_stop_handler,
+)
+from des.adapters.drivers.hooks.subagent_stop_composite_handler import (
+    aggregate_exit_codes,
+    handle_subagent_stop_composite,
+)
+
+
+_PROMPT = (
+    "<!-- DES-VALIDATION: required -->\n"
+    "<!-- DES-PROJECT-ID: test-project -->\n"
+    "<!-- DES-STEP-ID: 01-01 -->\n"
+    "Execute step"
+)
+
+
+def _setup_step(cwd: Path) -> str:
+    """Write a DES transcript, a one-step roadmap and an incomplete log."""
+    transcript = cwd / "agent-test.jsonl"
+    transcript.write_text(
+        json.dumps({"type": "user", "message": {"role": "user", "content": _PROMPT}})
+        + "\n"
+    )
+    deliver_dir = cwd / "docs" / "feature" / "test-project" / "deliver"
+    deliver_dir.mkdir(parents=True)
+    (deliver_dir / "roadmap.json").write_text(json.dumps({"steps": [{"id": "01-01"}]}))
+    (deliver_dir / "execution-log.json").write_text(
+        json.dumps(
+            {
+                "project_id": "test-project",
+                "events": ["01-01|PREPARE|EXECUTED|PASS|2026-02-06T10:00:00Z"],
+            }
+        )
+    )
+    return str(transcript)
+
+
+def _run(monkeypatch, cwd: Path, transcript: str) -> tuple[int, list[str]]:
+    hook_input = json.dumps(
+        {
+            "hook_event_name": "SubagentStop",
+            "agent_id": "test-agent-123",
+            "agent_type": "software-crafter",
+            "agent_transcript_path": transcript,
+            "stop_hook_active": False,
+            "cwd": str(cwd),
+        }
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO(hook_input))
+    printed: list[str] = []
+    monkeypatch.setattr(
+        "builtins.print",
+        lambda *a, **kw: None if "file" in kw else printed.append(a[0]),
+    )
+    return handle_subagent_stop_composite(), printed
+
+
+class TestSharedInputAndScan:
+    def test_transcript_is_scanned_once_for_both_handlers(self, tmp_path, monkeypatch):
+        transcript = _setup_step(tmp_path)
+        real_scan = subagent_stop_handler.scan_transcript
+
+        with patch.object(
+            subagent_stop_handler, "scan_transcript", side_effect=real_scan
+        ) as scan:
+            _run(monkeypatch, tmp_path, transcript)
+
+        assert scan.call_count == 1
+        progress = tmp_path / "docs/feature/test-project/deliver/.develop-progress.json"
+        assert progress.exists(), "deliver-progress did not run on the shared input"
+
+    def test_non_des_agent_passes_through_both_handlers(self, tmp_path, monkeypatch):
+        transcript = tmp_path / "agent-test.jsonl"
+        transcript.write_text(
+            json.dumps({"message": {"role": "user", "content": "Just a task"}}) + "\n"
+        )
+
+        exit_code, printed = _run(monkeypatch, tmp_path, str(transcript))
+
+        assert exit_code == 0
+        assert printed == []
+
+
+class TestBlockSemantics:
+    def test_incomplete_step_is_blocked_as_by_subagent_stop_alone(
+        self, tmp_path, monkeypatch
+    ):
+        transcript = _setup_step(tmp_path)
+
+        exit_code, printed = _run(monkeypatch, tmp_path, transcript)
+
+        assert exit_code == 0
+        assert [json.loads(p)["decision"] for p in printed] == ["block"]
+
+
+class TestExitCodeAggregation:
+    def test_most_severe_exit_code_wins(self):
+        assert aggregate_exit_codes([0, 0]) == 0
+        assert aggregate_exit_codes([1, 0]) == 1
+        assert aggregate_exit_codes([2, 1, 0]) == 2
+
+    def test_deliver_progress_failure_keeps_subagent_stop_decision(
+        self, tmp_path, monkeypatch
+    ):
+        transcript = _setup_step(tmp_path)
+
+        with patch.object(
+            subagent_stop_composite_handler,
+            "handle_deliver_progress",
+            side_effect=RuntimeError("disk full"),
+        ):
+            exit_code, printed = _run(monkeypatch, tmp_path, transcript)
+
+        assert exit_code == 0
+        assert [json.loads(p)["decision"] for p in printed] == ["block"]
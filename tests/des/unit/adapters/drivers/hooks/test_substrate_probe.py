@@ -1,7 +1,8 @@
 """Unit tests for substrate_probe module.
 
 Tests run_probe() through its public function signature (driving port),
-monkeypatching run_doctor at the nwave_ai.doctor.runner driven port boundary.
+monkeypatching run_doctor_cached at the nwave_ai.doctor.runner driven port
+boundary.
 
 After the P0-A fix, nwave_ai imports are deferred inside run_probe() with
 try/except ImportError.  Monkeypatching therefore targets the source module
@@ -47,7 +48,7 @@ class TestRunProbe:
     ) -> None:
         """Healthy install → silent empty string."""
         monkeypatch.setattr(
-            runner_module, "run_doctor", lambda ctx: _make_results(7, 0)
+            runner_module, "run_doctor_cached", lambda ctx: _make_results(7, 0)
         )
 
         from src.des.adapters.drivers.hooks.substrate_probe import run_probe
@@ -61,7 +62,7 @@ class TestRunProbe:
     ) -> None:
         """1 failing check → advisory containing '1 issue'."""
         monkeypatch.setattr(
-            runner_module, "run_doctor", lambda ctx: _make_results(6, 1)
+            runner_module, "run_doctor_cached", lambda ctx: _make_results(6, 1)
         )
 
         from src.des.adapters.drivers.hooks.substrate_probe import run_probe
@@ -77,7 +78,7 @@ class TestRunProbe:
     ) -> None:
         """3 failing checks → advisory containing '3 issues'."""
         monkeypatch.setattr(
-            runner_module, "run_doctor", lambda ctx: _make_results(4, 3)
+            runner_module, "run_doctor_cached", lambda ctx: _make_results(4, 3)
         )
 
         from src.des.adapters.drivers.hooks.substrate_probe import run_probe
@@ -95,7 +96,7 @@ class TestRunProbe:
         def _raise(ctx: object) -> list[CheckResult]:
             raise RuntimeError("simulated failure")
 
-        monkeypatch.setattr(runner_module, "run_doctor", _raise)
+        monkeypatch.setattr(runner_module, "run_doctor_cached", _raise)
 
         from src.des.adapters.drivers.hooks.substrate_probe import run_probe
 
@@ -0,0 +1,138 @@
+"""Unit tests for incremental transcript checkpoints at SubagentStop.
+
+Test budget: 4 behaviors x 2 = 8 unit tests max. Actual: 5 tests.
+
+B1: a revisited transcript emits usage events only for appended lines
+B2: DES context survives a resume that starts past the Task prompt
+B3: a rewritten or truncated transcript is rescanned from byte zero
+B4: a trailing line still being written is picked up on the next visit
+"""
+
+from __future__ import annotations
+
+import json
+
+from des.adapters.drivers.hooks import subagent_stop_handler, transcript_checkpoint
+from des.adapters.drivers.hooks.transcript_scanner import scan_transcript
+
+
+_PROMPT = (
+    "<!-- DES-VALIDATION: required -->\n"
+    "<!-- DES-PROJECT-ID: feat -->\n"
+    "<!-- DES-STEP-ID: 01-01 -->\n"
+)
+
+
+def _line(entry: dict) -> str:
+    return json.dumps(entry) + "\n"
+
+
+def _prompt() -> str:
+    return _line({"type": "user", "message": {"content": _PROMPT}})
+
+
+def _assistant(n: int) -> str:
+    usage = {
+        "input_tokens": n,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 0,
+        "output_tokens": 1,
+    }
+    return _line(
+        {
+            "type": "assistant",
+            "timestamp": f"2026-02-06T21:00:{n:02d}Z",
+            "message": {"model": "model-x", "usage": usage},
+        }
+    )
+
+
+def _usage_inputs(audit_events) -> list[int]:
+    return [
+        e.data["input_tokens"]
+        for e in audit_events
+        if e.event_type == "AGENT_USAGE_OBSERVED"
+    ]
+
+
+def _scan(transcript, cwd):
+    return subagent_stop_handler._scan_agent_transcript(
+        str(transcript), agent_name="crafter", cwd=str(cwd)
+    )
+
+
+class TestIncrementalUsage:
+    def test_revisit_emits_only_appended_usage(self, tmp_path, audit_events):
+        transcript = tmp_path / "agent.jsonl"
+        transcript.write_text(_prompt() + _assistant(1) + _assistant(2))
+        _scan(transcript, tmp_path)
+
+        with open(transcript, "a") as f:
+            f.write(_assistant(3))
+        _scan(transcript, tmp_path)
+        _scan(transcript, tmp_path)
+
+        assert _usage_inputs(audit_events) == [1, 2, 3]
+
+    def test_des_context_is_restored_from_checkpoint(self, tmp_path, audit_events):
+        transcript = tmp_path / "agent.jsonl"
+        transcript.write_text(_prompt() + _assistant(1))
+        _scan(transcript, tmp_path)
+
+        des_context, _ = _scan(transcript, tmp_path)
+
+        assert des_context == {"project_id": "feat", "step_id": "01-01"}
+        assert transcript_checkpoint.checkpoint_path_for(
+            tmp_path / ".nwave" / "des", str(transcript)
+        ).exists()
+
+
+class TestInvalidation:
+    def test_rewritten_transcript_is_rescanned(self, tmp_path, audit_events):
+        transcript = tmp_path / "agent.jsonl"
+        transcript.write_text(_prompt() + _assistant(1) + _assistant(2))
+        _scan(transcript, tmp_path)
+
+        transcript.write_text(_prompt() + _assistant(7) + _assistant(8))
+        _scan(transcript, tmp_path)
+
+        assert _usage_inputs(audit_events) == [1, 2, 7, 8]
+
+    def test_truncated_transcript_is_rescanned(self, tmp_path, audit_events):
+        transcript = tmp_path / "agent.jsonl"
+        transcript.write_text(_prompt() + _assistant(1) + _assistant(2))
+        _scan(transcript, tmp_path)
+
+        transcript.write_text(_prompt() + _assistant(5))
+        _scan(transcript, tmp_path)
+
+        assert _usage_inputs(audit_events) == [1, 2, 5]
+
+
+class TestPartialLine:
+    def test_unterminated_line_is_not_consumed(self, tmp_path):
+        transcript = tmp_path / "agent.jsonl"
+        complete = _assistant(1)
+        transcript.write_text(complete + _assistant(2)[:20])
+
+        class Collector:
+            needles = ()
+            done = False
+
+            def __init__(self):
+                self.entries = []
+
+            def visit(self, entry):
+                self.entries.append(entry)
+
+        first = Collector()
+        offset = scan_transcript(str(transcript), [first])
+        transcript.write_text(complete + _assistant(2))
+        second = Collector()
+        scan_transcript(str(transcript), [second], offset)
+
+        assert offset == len(complete)
+        assert [e["timestamp"] for e in first.entries + second.entries] == [
+            "2026-02-06T21:00:01Z",
+            "2026-02-06T21:00:02Z",
+        ]
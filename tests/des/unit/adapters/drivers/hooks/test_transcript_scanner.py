@@ -0,0 +1,163 @@
+"""Unit tests for the single-pass transcript scanner used by SubagentStop.
+
+Test budget: 4 behaviors x 2 = 8 unit tests max. Actual: 5 tests.
+
+B1: one pass feeds DES markers, token usage and skill loads (one open)
+B2: lines no active visitor wants are never JSON-decoded
+B3: reading stops once every visitor is done
+B4: malformed entries and failing visitors never break the scan (fail-open)
+"""
+
+from __future__ import annotations
+
+import builtins
+import json
+
+import pytest
+
+from des.adapters.driven.config import des_config
+from des.adapters.drivers.hooks import subagent_stop_handler, transcript_scanner
+from des.adapters.drivers.hooks.token_usage_extractor import TokenUsageVisitor
+
+
+_PROMPT = (
+    "<!-- DES-VALIDATION: required -->\n"
+    "<!-- DES-PROJECT-ID: feat -->\n"
+    "<!-- DES-STEP-ID: 01-01 -->\n"
+)
+
+
+def _user(content: str) -> dict:
+    return {"type": "user", "message": {"role": "user", "content": content}}
+
+
+def _assistant(n: int) -> dict:
+    return {
+        "type": "assistant",
+        "timestamp": f"2026-02-06T21:00:{n:02d}Z",
+        "message": {
+            "model": "model-x",
+            "usage": {
+                "input_tokens": n,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 0,
+                "output_tokens": 1,
+            },
+        },
+    }
+
+
+_SKILL_READ = {
+    "type": "tool_use",
+    "name": "Read",
+    "input": {"file_path": "/home/u/.claude/skills/nw/crafter/tdd.md"},
+}
+
+
+def _write(tmp_path, entries: list) -> str:
+    path = tmp_path / "agent.jsonl"
+    path.write_text(
+        "".join((e if isinstance(e, str) else json.dumps(e)) + "\n" for e in entries)
+    )
+    return str(path)
+
+
+@pytest.fixture
+def decoded_lines(monkeypatch):
+    """Record every raw line the scanner JSON-decodes."""
+    lines: list[bytes] = []
+    original = transcript_scanner._decode
+
+    def recording(line):
+        lines.append(line)
+        return original(line)
+
+    monkeypatch.setattr(transcript_scanner, "_decode", recording)
+    return lines
+
+
+class _Collector:
+    def __init__(self, needles=(), stop_after=None):
+        self.needles = needles
+        self.done = False
+        self.entries: list[dict] = []
+        self._stop_after = stop_after
+
+    def visit(self, entry):
+        self.entries.append(entry)
+        if self._stop_after is not None and len(self.entries) >= self._stop_after:
+            self.done = True
+
+
+class TestSinglePass:
+    def test_markers_usage_and_skills_come_from_one_read(
+        self, tmp_path, monkeypatch, audit_events
+    ):
+        transcript = _write(
+            tmp_path, [_user(_PROMPT), _assistant(1), _SKILL_READ, _assistant(2)]
+        )
+        monkeypatch.setattr(
+            des_config.DESConfig, "skill_tracking_enabled", property(lambda _: True)
+        )
+        opened: list[str] = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if str(file) == transcript:
+                opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+
+        des_context, skill_visitor = subagent_stop_handler._scan_agent_transcript(
+            transcript, agent_name="crafter"
+        )
+
+        assert des_context == {"project_id": "feat", "step_id": "01-01"}
+        usage = [e for e in audit_events if e.event_type == "AGENT_USAGE_OBSERVED"]
+        assert len(usage) == 2
+        assert [r["name"] for r in skill_visitor._skill_reads] == ["Read"]
+        assert len(opened) == 1
+
+
+class TestNeedlePrefilter:
+    def test_irrelevant_lines_are_not_decoded(self, tmp_path, decoded_lines):
+        transcript = _write(tmp_path, [_user("hello")] * 50 + [_assistant(1)])
+        visitor = TokenUsageVisitor(lambda _: None, agent_name="a")
+
+        transcript_scanner.scan_transcript(transcript, [visitor])
+
+        assert len(decoded_lines) == 1
+
+    def test_reading_stops_when_all_visitors_are_done(self, tmp_path, decoded_lines):
+        transcript = _write(tmp_path, [_user("a")] * 10)
+        visitor = _Collector(stop_after=3)
+
+        transcript_scanner.scan_transcript(transcript, [visitor])
+
+        assert len(visitor.entries) == 3
+        assert len(decoded_lines) == 3
+
+
+class TestFailOpen:
+    def test_malformed_and_non_object_lines_are_skipped(self, tmp_path):
+        transcript = _write(tmp_path, ['{"type": "us', "[1, 2]", "", _user("ok")])
+        visitor = _Collector()
+
+        transcript_scanner.scan_transcript(transcript, [visitor])
+
+        assert visitor.entries == [_user("ok")]
+
+    def test_failing_token_emit_stops_only_that_visitor(self, tmp_path):
+        transcript = _write(tmp_path, [_assistant(1), _assistant(2), _user("x")])
+
+        def failing(_event):
+            raise OSError("disk full")
+
+        token_visitor = TokenUsageVisitor(failing, agent_name="a")
+        collector = _Collector()
+
+        transcript_scanner.scan_transcript(transcript, [token_visitor, collector])
+
+        assert token_visitor.done
+        assert len(collector.entries) == 3
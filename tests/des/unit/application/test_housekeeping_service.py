@@ -6,7 +6,7 @@ Task stubs (_clean_audit_logs, _clean_signal_files, _rotate_skill_log) are
 patched at the class boundary to verify orchestration behavior.
 
 Orchestration Test Budget: 4 distinct behaviors x 2 = 8 max. Actual: 4 tests.
-Signal File Test Budget: 5 distinct behaviors x 2 = 10 max. Actual: 5 tests.
+Signal File Test Budget: 6 distinct behaviors x 2 = 12 max. Actual: 6 tests.
 
 Orchestration Behaviors:
   1. Disabled config -> no tasks run
@@ -20,6 +20,7 @@ Signal File Behaviors:
   3. Stale deliver-session.json removed
   4. Missing des/ directory does not cause errors
   5. Custom staleness threshold respected
+  6. Stale SubagentStop transcript checkpoints removed
 """
 
 from __future__ import annotations
@@ -202,6 +203,25 @@ class TestCleanSignalFiles:
 
         assert not (des_dir / "deliver-session.json").exists()
 
+    def test_stale_transcript_checkpoint_is_removed(self, tmp_path: Path) -> None:
+        """Given a transcript checkpoint older than threshold, it is removed."""
+        from des.application.housekeeping_service import (
+            HousekeepingConfig,
+            HousekeepingService,
+        )
+
+        nwave_dir = tmp_path / ".nwave"
+        checkpoint_dir = nwave_dir / "des" / "transcript-checkpoints"
+        now = _NOW
+        stale = self._make_signal_file(checkpoint_dir, "a.json", 6, now)
+        recent = self._make_signal_file(checkpoint_dir, "b.json", 1, now)
+
+        config = HousekeepingConfig(nwave_dir=nwave_dir)
+        HousekeepingService.run_housekeeping(config, FixedTimeProvider(now))
+
+        assert not stale.exists()
+        assert recent.exists()
+
     def test_missing_des_dir_does_not_raise(self, tmp_path: Path) -> None:
         """Given .nwave/des/ does not exist, housekeeping completes without error."""
         from des.application.housekeeping_service import (
@@ -244,7 +264,8 @@ class TestCleanAuditLogs:
     Test Budget: 4 distinct behaviors x 2 = 8 max. Actual: 4 tests.
 
     Behaviors:
-      1. Files strictly before cutoff deleted; files at/after cutoff preserved
+      1. Files strictly before cutoff deleted (with their offset index);
+         files at/after cutoff preserved
       2. Today's log preserved regardless of retention setting (retention=0 edge case)
       3. Missing audit log directory does not raise
       4. PermissionError on individual file is silently skipped
@@ -273,6 +294,8 @@ class TestCleanAuditLogs:
 
         # 8 days old — strictly before cutoff → deleted
         old_log = self._make_log(logs_dir, "2026-02-18")
+        old_index = old_log.with_name(old_log.name + ".idx")
+        old_index.write_text("{}", encoding="utf-8")
         # 7 days old — exactly at cutoff → preserved
         boundary_log = self._make_log(logs_dir, "2026-02-19")
         # 6 days old — after cutoff → preserved
@@ -289,6 +312,7 @@ class TestCleanAuditLogs:
             HousekeepingService.run_housekeeping(config, FixedTimeProvider(_NOW))
 
         assert not old_log.exists(), "File 8 days old must be deleted"
+        assert not old_index.exists(), "Its sidecar offset index must go too"
         assert boundary_log.exists(), (
             "File exactly at cutoff (7 days) must be preserved"
         )
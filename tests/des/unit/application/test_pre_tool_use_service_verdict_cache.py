@@ -0,0 +1,212 @@
+"""Unit tests for PreToolUseService - verdict reuse through a VerdictCache.
+
+Tests enter through PreToolUseService.validate() (driving port) with real
+domain policies and TemplateValidator, and driven-port test doubles for the
+cache, audit writer and clock.
+
+Test Budget: 3 behaviors x 2 = 6 max unit tests. Actual: 5 tests.
+
+Behaviors:
+1. An identical re-dispatch reuses the stored verdict without re-validating
+2. A reused verdict emits the same audit event as the original
+3. Only verdicts reached by prompt validation touch the cache
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from des.application.pre_tool_use_service import PreToolUseService
+from des.application.validator import TemplateValidator
+from des.domain.des_enforcement_policy import DesEnforcementPolicy
+from des.domain.des_marker_parser import DesMarkerParser
+from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
+from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
+from des.ports.driven_ports.time_provider_port import TimeProvider
+from des.ports.driven_ports.verdict_cache import VerdictCache
+from des.ports.driver_ports.pre_tool_use_port import HookDecision, PreToolUseInput
+
+
+# --- Test doubles (driven port implementations) ---
+
+
+class InMemoryVerdictCache(VerdictCache):
+    """Dict-backed cache keyed by the invocation content."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], HookDecision] = {}
+
+    def get(self, input_data: PreToolUseInput) -> HookDecision | None:
+        return self.entries.get((input_data.prompt, input_data.subagent_type))
+
+    def put(self, input_data: PreToolUseInput, decision: HookDecision) -> None:
+        self.entries[(input_data.prompt, input_data.subagent_type)] = decision
+
+
+class UntouchableVerdictCache(VerdictCache):
+    """Cache that fails the test on any access."""
+
+    def get(self, input_data: PreToolUseInput) -> HookDecision | None:
+        raise AssertionError("verdict cache read")
+
+    def put(self, input_data: PreToolUseInput, decision: HookDecision) -> None:
+        raise AssertionError("verdict cache written")
+
+
+class CountingValidator(TemplateValidator):
+    """Real TemplateValidator that counts validate_prompt() calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate_prompt(self, prompt: str):
+        self.calls += 1
+        return super().validate_prompt(prompt)
+
+
+class SpyAuditWriter(AuditLogWriter):
+    """Spy that captures all logged audit events for assertion."""
+
+    def __init__(self) -> None:
+        self.events: list[AuditEvent] = []
+
+    def log_event(self, event: AuditEvent) -> None:
+        self.events.append(event)
+
+
+class StubTimeProvider(TimeProvider):
+    def now_utc(self) -> datetime:
+        return datetime(2026, 10, 16, 12, 0, 0, tzinfo=timezone.utc)
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def cache() -> InMemoryVerdictCache:
+    return InMemoryVerdictCache()
+
+
+@pytest.fixture
+def validator() -> CountingValidator:
+    return CountingValidator()
+
+
+@pytest.fixture
+def audit() -> SpyAuditWriter:
+    return SpyAuditWriter()
+
+
+@pytest.fixture
+def service(cache, validator, audit) -> PreToolUseService:
+    return PreToolUseService(
+        marker_parser=DesMarkerParser(),
+        prompt_validator=validator,
+        audit_writer=audit,
+        time_provider=StubTimeProvider(),
+        enforcement_policy=DesEnforcementPolicy(),
+        completeness_policy=MarkerCompletenessPolicy(),
+        verdict_cache=cache,
+    )
+
+
+@pytest.fixture
+def step_prompt(valid_prompt_v3):
+    def _build(**kwargs) -> str:
+        return valid_prompt_v3(**kwargs).replace(
+            "<!-- DES-VALIDATION: required -->",
+            "<!-- DES-VALIDATION : required -->\n"
+            "<!-- DES-PROJECT-ID : checkout -->\n"
+            "<!-- DES-STEP-ID : 01-01 -->",
+        )
+
+    return _build
+
+
+def _summary(event: AuditEvent) -> tuple:
+    return (event.event_type, event.hook_id, event.data)
+
+
+# --- Tests ---
+
+
+class TestVerdictReuse:
+    def test_identical_redispatch_skips_validation(
+        self, service, validator, step_prompt
+    ):
+        invocation = PreToolUseInput(prompt=step_prompt(), subagent_type="crafter")
+
+        first = service.validate(invocation)
+        second = service.validate(
+            PreToolUseInput(prompt=step_prompt(), subagent_type="crafter")
+        )
+
+        assert first.action == second.action == "allow"
+        assert validator.calls == 1
+
+    def test_blocked_verdict_replays_reason_and_audit_event(
+        self, service, validator, audit, step_prompt
+    ):
+        invocation = PreToolUseInput(
+            prompt=step_prompt(exclude_sections=["QUALITY_GATES"]),
+            subagent_type="crafter",
+        )
+
+        first = service.validate(invocation, hook_id="hook-1")
+        second = service.validate(invocation, hook_id="hook-2")
+
+        assert second == first
+        assert second.action == "block"
+        assert "QUALITY_GATES" in second.reason
+        assert validator.calls == 1
+        assert [_summary(e) for e in audit.events] == [
+            ("HOOK_PRE_TOOL_USE_BLOCKED", "hook-1", {"reason": first.reason}),
+            ("HOOK_PRE_TOOL_USE_BLOCKED", "hook-2", {"reason": first.reason}),
+        ]
+
+    def test_allowed_verdict_replays_audit_event(self, service, audit, step_prompt):
+        invocation = PreToolUseInput(prompt=step_prompt(), subagent_type="crafter")
+
+        service.validate(invocation, hook_id="hook-1")
+        service.validate(invocation, hook_id="hook-2")
+
+        assert [_summary(e) for e in audit.events] == [
+            ("HOOK_PRE_TOOL_USE_ALLOWED", "hook-1", {"context": "des_validated"}),
+            ("HOOK_PRE_TOOL_USE_ALLOWED", "hook-2", {"context": "des_validated"}),
+        ]
+
+
+class TestWhatIsStored:
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "Research the best caching strategy",  # non-DES task
+            "Execute step 01-01 of the roadmap",  # step reference without markers
+        ],
+    )
+    def test_verdicts_before_prompt_validation_are_not_stored(
+        self, service, cache, prompt
+    ):
+        service.validate(PreToolUseInput(prompt=prompt))
+
+        assert cache.entries == {}
+
+    def test_non_des_prompt_never_touches_the_cache(self, validator, audit):
+        service = PreToolUseService(
+            marker_parser=DesMarkerParser(),
+            prompt_validator=validator,
+            audit_writer=audit,
+            time_provider=StubTimeProvider(),
+            enforcement_policy=DesEnforcementPolicy(),
+            completeness_policy=MarkerCompletenessPolicy(),
+            verdict_cache=UntouchableVerdictCache(),
+        )
+
+        decision = service.validate(
+            PreToolUseInput(prompt="Research the best caching strategy")
+        )
+
+        assert decision.action == "allow"
@@ -0,0 +1,83 @@
+"""Unit tests for the single-pass prompt scan shared by TemplateValidator.
+
+Tests enter through scan_prompt() and TemplateValidator.validate_prompt() and
+compare the scan against the plain string searches it replaces.
+
+Test Budget: 3 behaviors x 2 = 6 max unit tests. Actual: 4 tests.
+
+Behaviors:
+1. Section offsets match str.find() of "# NAME", including prefix matches
+2. Phase mention lines match splitting the prompt and filtering lines
+3. validate_prompt() scans the prompt once for all checkers
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from des.application import validator as validator_module
+from des.application.prompt_scan import scan_prompt
+from des.application.validator import TemplateValidator
+
+
+_PROMPT = """<!-- DES-VALIDATION : required -->
+# DES_METADATA
+Step: 01-01
+## AGENT_IDENTITY
+Agent: crafter  # TASK_CONTEXT inline marker
+# TDD_PHASES_V2
+1. PREPARE
+2. RED_ACCEPTANCE (missing RED_UNIT)
+   GREEN then COMMIT
+# MISSING: REFACTOR
+# EXECUTION_LOG_STATUS
+Phase RED_UNIT status: IN_PROGRESS
+# DES_METADATA
+trailing GREEN"""
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "DES_METADATA",
+        "AGENT_IDENTITY",
+        "TASK_CONTEXT",
+        "TDD_PHASES",
+        "TDD_PHASES_V2",
+        "EXECUTION_LOG_STATUS",
+        "QUALITY_GATES",
+        "MISSING",
+    ],
+)
+def test_section_offset_matches_str_find(name):
+    assert scan_prompt(_PROMPT).section_offset(name) == _PROMPT.find(f"# {name}")
+
+
+@pytest.mark.parametrize("phase", ["GREEN", "RED_UNIT", "REFACTOR", "PREPARE_X"])
+def test_lines_mentioning_match_split_and_filter(phase):
+    expected = tuple(line.strip() for line in _PROMPT.split("\n") if phase in line)
+
+    assert scan_prompt(_PROMPT).lines_mentioning(phase) == expected
+
+
+def test_validate_prompt_scans_once(monkeypatch, valid_prompt_v3):
+    scans = []
+
+    def counting_scan(prompt):
+        scans.append(prompt)
+        return scan_prompt(prompt)
+
+    monkeypatch.setattr(validator_module, "scan_prompt", counting_scan)
+
+    result = TemplateValidator().validate_prompt(valid_prompt_v3())
+
+    assert result.status == "PASSED"
+    assert len(scans) == 1
+
+
+def test_validate_prompt_reports_same_errors_through_scan():
+    result = TemplateValidator().validate_prompt(_PROMPT)
+
+    assert "MISSING: Mandatory section 'QUALITY_GATES' not found" in result.errors
+    assert "MISSING: Mandatory section 'TDD_PHASES' not found" not in result.errors
+    assert any("Phase RED_UNIT left in IN_PROGRESS" in error for error in result.errors)
@@ -0,0 +1,204 @@
+"""Unit tests for SubagentStopService git probes (commit verification + scope).
+
+Tests that the CommitVerifier and ScopeChecker probes overlap in time, and
+that audit events and decisions stay the same as when they ran in sequence.
+
+Tested through the driving port (SubagentStopPort.validate) with test doubles
+at the driven port boundaries.
+
+Test Budget: 3 behaviors x 2 = 6 max unit tests.
+Behaviors:
+  1. Commit and scope probes run concurrently
+  2. Audit events keep their sequential order on a verified commit
+  3. An unverified commit blocks without logging scope results or waiting
+     for the scope probe
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from des.application.subagent_stop_service import SubagentStopService
+from des.domain.phase_event import PhaseEvent
+from des.domain.step_completion_validator import StepCompletionValidator
+from des.domain.tdd_schema import get_tdd_schema
+from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
+from des.ports.driven_ports.commit_verifier import (
+    CommitVerificationResult,
+    CommitVerifier,
+)
+from des.ports.driven_ports.execution_log_reader import ExecutionLogReader
+from des.ports.driven_ports.scope_checker import ScopeChecker, ScopeCheckResult
+from des.ports.driven_ports.time_provider_port import TimeProvider
+from des.ports.driver_ports.subagent_stop_port import SubagentStopContext
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_PHASES = [
+    ("PREPARE", "PASS"),
+    ("RED_ACCEPTANCE", "FAIL"),
+    ("RED_UNIT", "FAIL"),
+    ("GREEN", "PASS"),
+    ("COMMIT", "PASS"),
+]
+
+
+# --- Test doubles (driven port implementations) ---
+
+
+class SpyAuditWriter(AuditLogWriter):
+    def __init__(self) -> None:
+        self.events: list[AuditEvent] = []
+
+    def log_event(self, event: AuditEvent) -> None:
+        self.events.append(event)
+
+
+class StubTimeProvider(TimeProvider):
+    def now_utc(self) -> datetime:
+        return datetime(2026, 2, 6, 21, 0, 0, tzinfo=timezone.utc)
+
+
+class StubExecutionLogReader(ExecutionLogReader):
+    """Returns a complete TDD cycle for step 01-01 of project 'demo'."""
+
+    def read_project_id(self, log_path: str) -> str:
+        return "demo"
+
+    def read_step_events(self, log_path: str, step_id: str) -> list[PhaseEvent]:
+        return [
+            PhaseEvent(step_id, phase, "EXECUTED", outcome, "2026-02-06T21:00:00Z")
+            for phase, outcome in _PHASES
+        ]
+
+    def read_all_events(self, log_path: str) -> list[PhaseEvent]:
+        return self.read_step_events(log_path, "01-01")
+
+
+class RendezvousCommitVerifier(CommitVerifier):
+    """Waits at *barrier* (if any) before answering, like a slow git log."""
+
+    def __init__(self, verified: bool, barrier: threading.Barrier | None = None):
+        self._verified = verified
+        self._barrier = barrier
+
+    def verify_commit(self, step_id: str, cwd: str) -> CommitVerificationResult:
+        if self._barrier is not None:
+            self._barrier.wait()
+        if self._verified:
+            return CommitVerificationResult(
+                verified=True,
+                commit_hash="abc123",
+                commit_date="2026-02-06 21:05:00 +0000",
+                commit_subject="feat: step 01-01",
+            )
+        return CommitVerificationResult(
+            verified=False, error_reason="No commit found with Step-ID: 01-01"
+        )
+
+
+class GatedScopeChecker(ScopeChecker):
+    """Answers only once *release* is set, like a git diff that hangs."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def check_scope(
+        self, project_root: Path, allowed_patterns: list[str]
+    ) -> ScopeCheckResult:
+        self.release.wait(timeout=5)
+        self.finished.set()
+        return ScopeCheckResult(has_violations=False, out_of_scope_files=[])
+
+
+class RendezvousScopeChecker(ScopeChecker):
+    """Waits at *barrier* (if any) before answering, like a slow git diff."""
+
+    def __init__(self, violations: list[str], barrier: threading.Barrier | None = None):
+        self._violations = violations
+        self._barrier = barrier
+
+    def check_scope(
+        self, project_root: Path, allowed_patterns: list[str]
+    ) -> ScopeCheckResult:
+        if self._barrier is not None:
+            self._barrier.wait()
+        return ScopeCheckResult(
+            has_violations=bool(self._violations),
+            out_of_scope_files=self._violations,
+        )
+
+
+def _validate(commit_verifier: CommitVerifier, scope_checker: ScopeChecker):
+    audit_spy = SpyAuditWriter()
+    service = SubagentStopService(
+        log_reader=StubExecutionLogReader(),
+        completion_validator=StepCompletionValidator(schema=get_tdd_schema()),
+        scope_checker=scope_checker,
+        audit_writer=audit_spy,
+        time_provider=StubTimeProvider(),
+        commit_verifier=commit_verifier,
+    )
+    context = SubagentStopContext(
+        execution_log_path="/repo/docs/feature/demo/execution-log.json",
+        project_id="demo",
+        step_id="01-01",
+        cwd="/repo",
+    )
+    return service.validate(context), [e.event_type for e in audit_spy.events]
+
+
+class TestProbesRunConcurrently:
+    def test_commit_and_scope_probes_overlap(self) -> None:
+        # Each probe waits for the other; run in sequence, the barrier breaks
+        barrier = threading.Barrier(2, timeout=5)
+
+        decision, _ = _validate(
+            RendezvousCommitVerifier(verified=True, barrier=barrier),
+            RendezvousScopeChecker(violations=[], barrier=barrier),
+        )
+
+        assert decision.action == "allow"
+        assert not barrier.broken
+
+
+class TestDeterministicAuditTrail:
+    def test_verified_commit_logs_events_in_sequential_order(self) -> None:
+        decision, event_types = _validate(
+            RendezvousCommitVerifier(verified=True),
+            RendezvousScopeChecker(violations=["a.py", "b.py"]),
+        )
+
+        assert decision.action == "allow"
+        assert event_types == [
+            "COMMIT_VERIFIED",
+            "SCOPE_VIOLATION",
+            "SCOPE_VIOLATION",
+            "HOOK_SUBAGENT_STOP_PASSED",
+        ]
+
+    def test_unverified_commit_blocks_without_scope_events(self) -> None:
+        decision, event_types = _validate(
+            RendezvousCommitVerifier(verified=False),
+            RendezvousScopeChecker(violations=["a.py"]),
+        )
+
+        assert decision.action == "block"
+        assert "COMMIT_NOT_VERIFIED" in decision.reason
+        assert event_types == ["COMMIT_NOT_VERIFIED"]
+
+    def test_unverified_commit_returns_before_scope_probe_finishes(self) -> None:
+        scope_checker = GatedScopeChecker()
+
+        decision, _ = _validate(RendezvousCommitVerifier(verified=False), scope_checker)
+        returned_first = not scope_checker.finished.is_set()
+        scope_checker.release.set()
+
+        assert decision.action == "block"
+        assert returned_first
@@ -0,0 +1,147 @@
+"""Unit tests for UpdateCheckService - cached verdict for SessionStart.
+
+Tests the verdict the background check caches via DESConfig and the
+take_cached_result()/is_check_due() API SessionStart uses instead of a
+network call, through a local HTTP stand-in for PyPI and a real DESConfig.
+
+Test Budget: 4 behaviors x 2 = 8 max unit tests. Actual: 5 tests.
+
+Behaviors:
+1. An UPDATE_AVAILABLE check caches a verdict that is reported exactly once
+2. An UP_TO_DATE check clears a previously cached verdict
+3. A cached verdict is dropped when the update was installed or skipped since
+4. is_check_due() follows the frequency policy without network calls
+"""
+
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from des.adapters.driven.config.des_config import DESConfig
+from des.application.update_check_service import UpdateCheckService, UpdateStatus
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# ---------------------------------------------------------------------------
+# Test helpers
+# ---------------------------------------------------------------------------
+
+
+class _PyPIHandler(BaseHTTPRequestHandler):
+    """Returns a configurable PyPI version and counts requests."""
+
+    version: str = "2.0.0"
+    requests: int = 0
+
+    def do_GET(self) -> None:
+        self.__class__.requests += 1
+        body = json.dumps({"info": {"version": self.__class__.version}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def pypi():
+    """A local PyPI stand-in; yields its handler class and URL."""
+    handler = type("Handler", (_PyPIHandler,), {"requests": 0})
+    server = HTTPServer(("127.0.0.1", 0), handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _config(tmp_path: Path, frequency: str = "every_session", skipped=()):
+    config_path = tmp_path / ".nwave" / "des-config.json"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(
+        json.dumps(
+            {
+                "update_check": {
+                    "frequency": frequency,
+                    "skipped_versions": list(skipped),
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    return DESConfig(config_path=config_path)
+
+
+def _service(des_config: DESConfig, url: str, local_version: str = "1.0.0"):
+    return UpdateCheckService(
+        pypi_url=url,
+        github_releases_url=f"{url}/releases",
+        local_version=local_version,
+        des_config=des_config,
+        timeout=2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCachedVerdict:
+    def test_available_update_is_reported_once(self, tmp_path, pypi):
+        _, url = pypi
+        _service(_config(tmp_path), url).check_for_updates()
+
+        session = _service(_config(tmp_path), url)
+        first = session.take_cached_result()
+        second = session.take_cached_result()
+
+        assert first.status == UpdateStatus.UPDATE_AVAILABLE
+        assert first.latest == "2.0.0"
+        assert second.status == UpdateStatus.SKIP
+
+    def test_up_to_date_check_clears_cached_verdict(self, tmp_path, pypi):
+        handler, url = pypi
+        _service(_config(tmp_path), url).check_for_updates()
+        handler.version = "1.0.0"
+
+        _service(_config(tmp_path), url).check_for_updates()
+
+        result = _service(_config(tmp_path), url).take_cached_result()
+        assert result.status == UpdateStatus.SKIP
+
+    def test_verdict_dropped_once_update_installed(self, tmp_path, pypi):
+        _, url = pypi
+        _service(_config(tmp_path), url).check_for_updates()
+
+        upgraded = _service(_config(tmp_path), url, local_version="2.0.0")
+
+        assert upgraded.take_cached_result().status == UpdateStatus.SKIP
+
+    def test_verdict_dropped_once_version_skipped(self, tmp_path, pypi):
+        _, url = pypi
+        _service(_config(tmp_path), url).check_for_updates()
+
+        skipping = _service(_config(tmp_path, skipped=["2.0.0"]), url)
+
+        assert skipping.take_cached_result().status == UpdateStatus.SKIP
+
+
+class TestCheckDue:
+    @pytest.mark.parametrize(
+        "frequency,due", [("every_session", True), ("never", False)]
+    )
+    def test_check_due_follows_policy_offline(self, tmp_path, pypi, frequency, due):
+        handler, url = pypi
+
+        assert _service(_config(tmp_path, frequency), url).is_check_due() is due
+        assert handler.requests == 0
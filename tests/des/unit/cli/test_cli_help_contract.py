@@ -1,4 +1,4 @@
-"""Fast-gate CLI --help contract tests for all 5 DES CLI modules.
+"""Fast-gate CLI --help contract tests for all 6 DES CLI modules.
 
 Asserts that every DES CLI entry point accepts --help (and -h) and signals
 success (exit code 0). Two compliant implementation patterns exist:
@@ -24,6 +24,7 @@ _DES_CLI_MODULES = [
     "des.cli.verify_deliver_integrity",
     "des.cli.roadmap",
     "des.cli.health_check",
+    "des.cli.migrate_log",
 ]
 
 
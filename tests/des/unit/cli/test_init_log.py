@@ -3,13 +3,14 @@
 Tests the init_log CLI tool that initializes execution-log.json with
 schema v3.0 format. All tests use tmp_path fixture.
 
-Test Budget: 4 distinct behaviors x 1 = 4 tests.
+Test Budget: 5 distinct behaviors x 1 = 5 tests.
 
 Behaviors:
 1. Success: creates file with correct schema
 2. Fails if file already exists (exit 1)
 3. Fails if project directory doesn't exist (exit 1)
 4. Created file has correct JSON structure
+5. --schema-version 4.0 creates an append-only header plus events file
 """
 
 from __future__ import annotations
@@ -63,3 +64,24 @@ def test_json_structure_is_valid(tmp_path):
 
     data = json.loads((tmp_path / "execution-log.json").read_text())
     assert set(data.keys()) == {"schema_version", "feature_id", "events"}
+
+
+def test_schema_version_4_creates_append_only_log(tmp_path):
+    """--schema-version 4.0 writes a header without events and an empty events file."""
+    exit_code = main(
+        [
+            "--project-dir",
+            str(tmp_path),
+            "--feature-id",
+            "my-feature",
+            "--schema-version",
+            "4.0",
+        ]
+    )
+
+    assert exit_code == 0
+    header = json.loads((tmp_path / "execution-log.json").read_text())
+    assert header["schema_version"] == "4.0"
+    assert header["feature_id"] == "my-feature"
+    assert "events" not in header
+    assert (tmp_path / header["events_file"]).read_text() == ""
@@ -349,3 +349,37 @@ class TestLogPhaseExecStats:
         assert isinstance(entry, dict)
         assert "tu" not in entry
         assert "tk" not in entry
+
+
+class TestLogPhaseAppendOnlyLog:
+    """Test that v4.0 logs get a single-line append and an untouched header."""
+
+    def test_v4_entry_appended_to_events_file(self, tmp_path, mock_schema):
+        from des.cli.log_phase import main
+        from des.domain.execution_log_store import create_execution_log
+
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "test"})
+        header_before = log_path.read_text()
+
+        result = main(
+            [
+                "--project-dir",
+                str(tmp_path),
+                "--step-id",
+                "01-01",
+                "--phase",
+                "GREEN",
+                "--status",
+                "EXECUTED",
+                "--data",
+                "PASS",
+                "--fsync",
+            ]
+        )
+
+        assert result == 0
+        assert log_path.read_text() == header_before
+        lines = (tmp_path / "execution-log.events.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["p"] == "GREEN"
@@ -0,0 +1,49 @@
+"""Unit tests for des.cli.migrate_log CLI module.
+
+Test Budget: 3 distinct behaviors x 1 = 3 tests.
+
+Behaviors:
+1. Migrates a v3.0 log to v4.0, preserving events
+2. Already-v4.0 logs are left alone (exit 0)
+3. Missing log file fails with exit 1
+"""
+
+from __future__ import annotations
+
+import json
+
+from des.cli.migrate_log import main
+from des.domain.execution_log_store import load_execution_log
+
+
+def test_migrates_v3_log_to_append_only(tmp_path, capsys):
+    events = [{"sid": "01-01", "p": "GREEN", "s": "EXECUTED", "d": "PASS", "t": "T"}]
+    log_path = tmp_path / "execution-log.json"
+    log_path.write_text(
+        json.dumps({"schema_version": "3.0", "feature_id": "f", "events": events})
+    )
+
+    exit_code = main(["--project-dir", str(tmp_path)])
+
+    assert exit_code == 0
+    assert "Migrated 1 event(s)" in capsys.readouterr().out
+    assert json.loads(log_path.read_text())["schema_version"] == "4.0"
+    assert load_execution_log(log_path)["events"] == events
+
+
+def test_already_v4_log_is_left_alone(tmp_path, capsys):
+    (tmp_path / "execution-log.json").write_text(
+        json.dumps({"schema_version": "4.0", "feature_id": "f"})
+    )
+
+    exit_code = main(["--project-dir", str(tmp_path)])
+
+    assert exit_code == 0
+    assert "already schema v4.0" in capsys.readouterr().out
+
+
+def test_missing_log_file_fails(tmp_path, capsys):
+    exit_code = main(["--project-dir", str(tmp_path)])
+
+    assert exit_code == 1
+    assert "not found" in capsys.readouterr().out
@@ -0,0 +1,43 @@
+"""Unit tests for the shared write_atomic helper.
+
+Test Budget: 2 behaviors x 2 = 4 unit tests max. Actual: 3 tests.
+
+B1: the target ends up with exactly the new content (str or bytes)
+B2: a failed write leaves the target untouched and no temporary file behind
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from des.domain.atomic_write import write_atomic
+
+
+@pytest.mark.parametrize("content", ["new ✓", "new ✓".encode()])
+def test_replaces_existing_content(tmp_path: Path, content: str | bytes) -> None:
+    target = tmp_path / "cache.json"
+    target.write_text("old", encoding="utf-8")
+
+    write_atomic(target, content)
+
+    assert target.read_text(encoding="utf-8") == "new ✓"
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_failed_write_removes_temporary_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "cache.json"
+    target.write_text("old", encoding="utf-8")
+
+    def disk_full(self, target):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(Path, "replace", disk_full)
+    with pytest.raises(OSError):
+        write_atomic(target, "new")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
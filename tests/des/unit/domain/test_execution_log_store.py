@@ -0,0 +1,141 @@
+"""Unit tests for execution_log_store (v2/v3 JSON document and v4 append-only).
+
+Test Budget: 5 behaviors x 2 = 10 max tests. Using 8.
+- v4 append writes one line and never rewrites the header (2 tests)
+- load_execution_log returns the v3 document shape for v3 and v4 (1 test)
+- an unterminated trailing line (interrupted append) is ignored (1 test)
+- legacy v3 append keeps the read-modify-write format (1 test)
+- migration carries events over verbatim and is idempotent (2 tests)
+- concurrent appending processes never lose or tear entries (1 test)
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+from pathlib import Path
+
+from des.domain.execution_log_store import (
+    append_event,
+    create_execution_log,
+    events_path_for,
+    load_execution_log,
+    migrate_to_append_only,
+)
+
+
+_WORKERS = 6
+_APPENDS_PER_WORKER = 50
+
+
+def _event(step_id: str, phase: str = "GREEN") -> dict:
+    return {"sid": step_id, "p": phase, "s": "EXECUTED", "d": "PASS", "t": "T"}
+
+
+def _append_worker(log_path: str, worker: int) -> None:
+    for n in range(_APPENDS_PER_WORKER):
+        append_event(Path(log_path), _event(f"{worker:02d}-{n:02d}"))
+
+
+class TestAppendOnlyLog:
+    def test_append_adds_one_line_to_events_file(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"})
+
+        append_event(log_path, _event("01-01"))
+        append_event(log_path, _event("01-02"))
+
+        lines = events_path_for(log_path).read_text().splitlines()
+        assert [json.loads(line)["sid"] for line in lines] == ["01-01", "01-02"]
+
+    def test_append_never_rewrites_header(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"})
+        header_before = log_path.read_bytes()
+
+        append_event(log_path, _event("01-01"), fsync=True)
+
+        assert log_path.read_bytes() == header_before
+
+
+class TestLoadExecutionLog:
+    def test_v3_and_v4_load_to_same_document_shape(self, tmp_path):
+        events = [_event("01-01"), "01-01|COMMIT|EXECUTED|PASS|T"]
+        v3 = tmp_path / "v3" / "execution-log.json"
+        v4 = tmp_path / "v4" / "execution-log.json"
+        v3.parent.mkdir()
+        v4.parent.mkdir()
+        create_execution_log(v3, {"feature_id": "f"}, events, schema_version="3.0")
+        create_execution_log(v4, {"feature_id": "f"}, events)
+
+        assert load_execution_log(v3)["events"] == events
+        assert load_execution_log(v4)["events"] == events
+        assert load_execution_log(v4)["feature_id"] == "f"
+
+    def test_unterminated_trailing_line_is_ignored(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"}, [_event("01-01")])
+        with open(events_path_for(log_path), "a") as f:
+            f.write('{"sid": "01-02", "p": "GR')
+
+        assert [e["sid"] for e in load_execution_log(log_path)["events"]] == ["01-01"]
+
+
+class TestLegacyAppend:
+    def test_v2_log_is_rewritten_as_v3_document(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        log_path.write_text(json.dumps({"schema_version": "2.0", "events": []}))
+
+        append_event(log_path, _event("01-01"))
+
+        data = json.loads(log_path.read_text())
+        assert data["schema_version"] == "3.0"
+        assert data["events"] == [_event("01-01")]
+        assert not events_path_for(log_path).exists()
+
+
+class TestMigration:
+    def test_migration_preserves_events_and_metadata(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        events = ["01-01|PREPARE|EXECUTED|PASS|T", _event("01-01")]
+        log_path.write_text(
+            json.dumps(
+                {"schema_version": "3.0", "feature_id": "feat", "events": events}
+            )
+        )
+
+        assert migrate_to_append_only(log_path) == 2
+
+        header = json.loads(log_path.read_text())
+        assert header["schema_version"] == "4.0"
+        assert header["migrated_from"] == "3.0"
+        assert "events" not in header
+        assert load_execution_log(log_path)["events"] == events
+
+    def test_migrating_twice_is_a_no_op(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"}, [_event("01-01")])
+
+        assert migrate_to_append_only(log_path) == -1
+        assert len(load_execution_log(log_path)["events"]) == 1
+
+
+class TestConcurrentAppends:
+    def test_concurrent_processes_lose_no_entries(self, tmp_path):
+        log_path = tmp_path / "execution-log.json"
+        create_execution_log(log_path, {"feature_id": "feat"})
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_append_worker, args=(str(log_path), worker))
+            for worker in range(_WORKERS)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=120)
+            assert process.exitcode == 0
+
+        step_ids = [e["sid"] for e in load_execution_log(log_path)["events"]]
+
+        assert len(step_ids) == _WORKERS * _APPENDS_PER_WORKER
+        assert len(set(step_ids)) == len(step_ids)
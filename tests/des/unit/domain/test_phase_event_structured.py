@@ -3,10 +3,11 @@
 Tests parse_structured() for dict-based events and parse_auto() for
 automatic detection of string vs dict event formats.
 
-Test Budget: 3 behaviors x 2 = 6 max tests. Using 5.
+Test Budget: 3 behaviors x 2 = 6 max tests. Using 6.
 - parse_structured: basic dict -> PhaseEvent (1 test, parametrized)
 - parse_structured with stats: dict with tu/tk -> PhaseEvent with stats (1 test)
-- parse_auto: auto-detects string vs dict (1 parametrized test + 1 edge case)
+- parse_auto: auto-detects string vs dict vs v4.0 JSONL line
+  (2 parametrized tests + 1 edge case)
 - parse_structured invalid: missing keys -> None (1 test)
 """
 
@@ -134,3 +135,19 @@ class TestParseAuto:
         parser = PhaseEventParser()
         event = parser.parse_auto(12345)
         assert event is None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"sid":"08-01","p":"REVIEW","s":"EXECUTED","d":"PASS","t":"T"}',
+        '"08-01|REVIEW|EXECUTED|PASS|T"',
+    ],
+    ids=["jsonl-dict", "jsonl-migrated-pipe-string"],
+)
+def test_parse_auto_reads_v4_jsonl_lines(line):
+    """parse_auto decodes raw v4.0 JSONL lines holding either event format."""
+    event = PhaseEventParser().parse_auto(line)
+
+    assert event is not None
+    assert (event.step_id, event.phase_name) == ("08-01", "REVIEW")
@@ -0,0 +1,227 @@
+"""Unit tests for multi-file feature-delta validation.
+
+Test Budget: 5 distinct behaviors x 2 = 10 unit tests max.
+Using 7.
+
+Behaviors:
+  B1 — BatchValidator returns one report per file, in input order, with the
+       exit code and the output the single-file run would print
+  B2 — unchanged files are answered from the result cache; changed content
+       or changed settings are validated again; a module vanishing mid-run
+       does not abort the batch
+  B3 — JsonResultCache keeps reports across runs for files that still exist
+  B4 — the CLI expands glob patterns and emits one aggregate JSON document
+  B5 — both CLIs reject a --jobs value that is not a positive integer (exit 2)
+
+Ports: BatchValidator.validate() (application), JsonResultCache (adapter),
+main() / _handle_validate_feature_delta() (CLI).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from nwave_ai.feature_delta.adapters.result_cache import JsonResultCache
+from nwave_ai.feature_delta.application import batch
+from nwave_ai.feature_delta.application.batch import (
+    BatchValidator,
+    ValidationSettings,
+)
+
+
+_REPO_ROOT = Path(__file__).parents[3]
+_CORPUS_DIR = _REPO_ROOT / "tests" / "fixtures" / "h10-corpus"
+
+
+class InMemoryResultCache:
+    """ResultCachePort double recording lookups and stores."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[str, dict[str, Any]]] = {}
+        self.flushes = 0
+
+    def get(self, file: str, digest: str) -> dict[str, Any] | None:
+        stored = self.entries.get(file)
+        return stored[1] if stored and stored[0] == digest else None
+
+    def put(self, file: str, digest: str, entry: dict[str, Any]) -> None:
+        self.entries[file] = (digest, entry)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+@pytest.fixture
+def feature_tree(tmp_path: Path) -> list[Path]:
+    """Three feature-delta files: E5 violation, clean, E5 violation."""
+    paths = []
+    for name, fixture in (
+        ("billing", "fail_grpc_dropped.md"),
+        ("login", "pass_rest_preserved.md"),
+        ("events", "fail_kafka_dropped.md"),
+    ):
+        path = tmp_path / "docs" / "feature" / name / "feature-delta.md"
+        path.parent.mkdir(parents=True)
+        path.write_text((_CORPUS_DIR / fixture).read_text(encoding="utf-8"))
+        paths.append(path)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# B1 — per-file reports in input order, sequential and on a process pool
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_reports_follow_input_order_with_captured_output(
+    feature_tree: list[Path], jobs: int
+) -> None:
+    settings = ValidationSettings(mode="enforce")
+
+    reports = BatchValidator(settings, jobs=jobs).validate(feature_tree)
+
+    assert [r.file for r in reports] == [str(p) for p in feature_tree]
+    assert [r.exit_code for r in reports] == [1, 0, 1]
+    assert "[FAIL] [E5]" in reports[0].stderr
+    assert "gRPC" in reports[0].stderr
+    assert "[PASS] all checks" in reports[1].stderr
+    assert not any(r.cached for r in reports)
+
+
+# ---------------------------------------------------------------------------
+# B2 — content-hash result cache
+# ---------------------------------------------------------------------------
+
+
+def test_unchanged_files_are_served_from_cache(feature_tree: list[Path]) -> None:
+    cache = InMemoryResultCache()
+    validator = BatchValidator(ValidationSettings(), jobs=1, cache=cache)
+    first = validator.validate(feature_tree)
+
+    feature_tree[1].write_text(
+        (_CORPUS_DIR / "fail_rest_dropped.md").read_text(encoding="utf-8")
+    )
+    second = validator.validate(feature_tree)
+
+    assert [r.cached for r in second] == [True, False, True]
+    assert second[0].violations == first[0].violations
+    assert second[0].stderr == first[0].stderr
+    assert [v.offender for v in second[1].violations if v.rule == "E5"] == ["REST"]
+    assert cache.flushes == 2
+
+
+def test_changed_settings_revalidate_every_file(feature_tree: list[Path]) -> None:
+    cache = InMemoryResultCache()
+    BatchValidator(ValidationSettings(), jobs=1, cache=cache).validate(feature_tree)
+
+    reports = BatchValidator(
+        ValidationSettings(mode="enforce"), jobs=1, cache=cache
+    ).validate(feature_tree)
+
+    assert not any(r.cached for r in reports)
+    assert "[FAIL]" in reports[0].stderr
+
+
+def test_module_removed_mid_run_does_not_abort_batch(
+    feature_tree: list[Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = tmp_path / "feature_delta"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "removed.py").symlink_to(package / "upgraded_away.py")
+    monkeypatch.setattr(batch, "_FEATURE_DELTA_ROOT", package)
+    batch._code_stamp.cache_clear()
+    try:
+        reports = BatchValidator(
+            ValidationSettings(), jobs=1, cache=InMemoryResultCache()
+        ).validate(feature_tree)
+    finally:
+        monkeypatch.undo()
+        batch._code_stamp.cache_clear()
+
+    assert [r.exit_code for r in reports] == [0, 0, 0]
+
+
+# ---------------------------------------------------------------------------
+# B3 — JsonResultCache persistence
+# ---------------------------------------------------------------------------
+
+
+def test_json_cache_persists_reports_for_existing_files(tmp_path: Path) -> None:
+    kept = tmp_path / "kept.md"
+    kept.write_text("x")
+    cache_file = tmp_path / ".nwave" / "feature-delta-cache.json"
+    cache = JsonResultCache(cache_file)
+    cache.put(str(kept), "digest-1", {"exit_code": 0})
+    cache.put(str(tmp_path / "deleted.md"), "digest-2", {"exit_code": 1})
+    cache.flush()
+
+    reloaded = JsonResultCache(cache_file)
+
+    assert reloaded.get(str(kept), "digest-1") == {"exit_code": 0}
+    assert reloaded.get(str(kept), "digest-other") is None
+    assert reloaded.get(str(tmp_path / "deleted.md"), "digest-2") is None
+
+
+# ---------------------------------------------------------------------------
+# B4 — CLI glob expansion and aggregate JSON
+# ---------------------------------------------------------------------------
+
+
+def test_cli_glob_emits_aggregate_json(
+    feature_tree: list[Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from nwave_ai.feature_delta.adapters.schema import JsonSchemaFileLoader
+    from nwave_ai.feature_delta.cli import main
+
+    monkeypatch.chdir(tmp_path)
+    # The schema probe needs jsonschema; it has its own tests (test_schema_probe).
+    monkeypatch.setattr(JsonSchemaFileLoader, "probe", lambda self: None)
+
+    exit_code = main(
+        [
+            "validate-feature-delta",
+            "docs/feature/*/feature-delta.md",
+            "--format=json",
+            "--jobs=2",
+        ]
+    )
+
+    document = json.loads(capsys.readouterr().out)
+    assert exit_code == 1
+    assert [f["file"] for f in document["files"]] == [
+        "docs/feature/billing/feature-delta.md",
+        "docs/feature/events/feature-delta.md",
+        "docs/feature/login/feature-delta.md",
+    ]
+    assert [f["exit_code"] for f in document["files"]] == [1, 1, 0]
+    assert {"check", "file", "line", "offender"} <= set(document["results"][0])
+    assert document["summary"]["files"] == 3
+    assert (tmp_path / ".nwave" / "feature-delta-cache.json").exists()
+
+
+# ---------------------------------------------------------------------------
+# B5 — --jobs validation
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("jobs", ["abc", "0", "-2"])
+def test_cli_rejects_non_positive_jobs(
+    jobs: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from nwave_ai.cli import _handle_validate_feature_delta
+    from nwave_ai.feature_delta.cli import main
+
+    exit_codes = [
+        main(["validate-feature-delta", "a.md", f"--jobs={jobs}"]),
+        _handle_validate_feature_delta(["a.md", "--jobs", jobs]),
+    ]
+
+    assert exit_codes == [2, 2]
+    assert capsys.readouterr().err.count("--jobs expects a positive integer") == 2
@@ -0,0 +1,155 @@
+"""Unit tests for the shared feature-delta line tokenizer.
+
+Test Budget: 5 distinct behaviors x 2 = 10 unit tests max.
+Using 7.
+
+Behaviors:
+  B1 — tokenize() yields one event per str.splitlines() line, with 1-based
+       line numbers, document offsets and line kinds
+  B2 — the parser gives each WaveSection and CommitmentRow its source line
+  B3 — model rules (E4, E5) report the source line of the offending row
+  B4 — E1/E2 on pre-tokenized lines report what the raw-text API reports
+  B5 — heading case variants keep each consumer's pre-tokenizer semantics
+
+Ports: tokenize (pure domain), MarkdownSectionParser.parse_lines(),
+e1/e2 check_lines(), e4/e5 check().
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from nwave_ai.feature_delta.domain.parser import MarkdownSectionParser
+from nwave_ai.feature_delta.domain.rules import (
+    e1_section_present,
+    e2_columns_present,
+    e4_substantive_impact,
+    e5_protocol_surface,
+)
+from nwave_ai.feature_delta.domain.tokenizer import tokenize
+
+
+_REPO_ROOT = Path(__file__).parents[3]
+_CORPUS_DIR = _REPO_ROOT / "tests" / "fixtures" / "h10-corpus"
+
+_DOCUMENT = """\
+# Feature
+
+## Wave: DISCUSS
+
+### [REF] Inherited commitments
+
+| Origin | Commitment | DDD | Impact |
+|--------|------------|-----|--------|
+| n/a | gRPC service for billing | n/a | protocol surface established |
+
+## Wave : DESIGN
+
+### [REF] Inherited commitments
+
+| Origin | Commitment | Impact |
+|--------|------------|--------|
+| DISCUSS#row1 | message bus | tbd |
+"""
+
+
+# ---------------------------------------------------------------------------
+# B1 — line events
+# ---------------------------------------------------------------------------
+
+
+def test_tokenize_tracks_lines_offsets_and_kinds() -> None:
+    text = "# T\r\n\n## Wave: DISCUSS\n|---|\n| a | b |\n```gherkin\n```"
+
+    events = list(tokenize(text))
+
+    assert [e.text for e in events] == text.splitlines()
+    assert [e.lineno for e in events] == list(range(1, 8))
+    assert all(text[e.offset :].startswith(e.text) for e in events)
+    assert [e.kind for e in events] == [
+        "title",
+        "blank",
+        "wave_heading",
+        "table_separator",
+        "table_row",
+        "gherkin_open",
+        "fence_close",
+    ]
+    assert events[2].groups == ("DISCUSS",)
+
+
+# ---------------------------------------------------------------------------
+# B2 — parser line tracking
+# ---------------------------------------------------------------------------
+
+
+def test_parser_records_section_and_row_lines() -> None:
+    text = (_CORPUS_DIR / "fail_grpc_dropped.md").read_text(encoding="utf-8")
+
+    model = MarkdownSectionParser().parse_lines(tokenize(text))
+
+    assert [(s.name, s.line) for s in model.sections] == [
+        ("DISCUSS", 3),
+        ("DESIGN", 11),
+    ]
+    assert [r.line for s in model.sections for r in s.rows] == [9, 17]
+
+
+# ---------------------------------------------------------------------------
+# B3 — model rules report source lines
+# ---------------------------------------------------------------------------
+
+
+def test_model_rules_report_offending_row_line() -> None:
+    text = (_CORPUS_DIR / "fail_grpc_dropped.md").read_text(encoding="utf-8")
+    model = MarkdownSectionParser().parse(text)
+
+    e5 = e5_protocol_surface.check(model, ("gRPC",))
+    e4 = e4_substantive_impact.check_v1_0(model, ())
+
+    assert [(v.offender, v.line) for v in e5] == [("gRPC", 9)]
+    assert [v.line for v in e4] == [17]
+
+
+# ---------------------------------------------------------------------------
+# B4 — raw-text and token APIs agree
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "rule", [e1_section_present, e2_columns_present], ids=["E1", "E2"]
+)
+def test_check_lines_matches_text_check(rule) -> None:
+    from_text = rule.check(_DOCUMENT, "f.md")
+
+    from_lines = rule.check_lines(tuple(tokenize(_DOCUMENT)), "f.md")
+
+    assert from_lines == from_text
+    assert [v.line for v in from_lines] == [11 if rule is e1_section_present else 15]
+
+
+# ---------------------------------------------------------------------------
+# B5 — per-consumer heading semantics
+# ---------------------------------------------------------------------------
+
+
+def test_e1_flags_only_wave_headings_spelled_wave() -> None:
+    text = "# F\n\n## WAVE: DISCUSS\n\n## wave: discuss\n"
+
+    violations = e1_section_present.check(text, "f.md")
+
+    assert [v.line for v in violations] == [5]
+
+
+def test_commitments_heading_variants_split_e2_from_parser() -> None:
+    text = (
+        "# F\n\n## Wave: DISCUSS\n\n### [ref] inherited COMMITMENTS\n\n"
+        "| Origin | Commitment | Impact |\n| a | b | c | d |\n"
+    )
+
+    model = MarkdownSectionParser().parse(text)
+    violations = e2_columns_present.check(text, "f.md")
+
+    assert model.sections[0].rows == ()
+    assert [v.line for v in violations] == [7]
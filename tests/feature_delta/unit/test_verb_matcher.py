@@ -0,0 +1,90 @@
+"""Unit tests for the compiled verb matcher shared by E4 and E5.
+
+Test Budget: 3 distinct behaviors x 2 = 6 unit tests max.
+Using 5.
+
+Behaviors:
+  B1 — hits() and search() agree with ``fold(verb) in fold(text)`` for
+       nested, overlapping and differently-cased verbs
+  B2 — compile_verbs() builds one automaton per verb list
+  B3 — PlaintextVerbLoader returns the same tuple until a verb file changes,
+       and never reuses an empty framework list
+
+Ports: VerbMatcher / compile_verbs (pure domain), PlaintextVerbLoader.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from nwave_ai.feature_delta.adapters.verbs import PlaintextVerbLoader
+from nwave_ai.feature_delta.domain.verb_matcher import VerbMatcher, compile_verbs
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+_VERBS = ("GET", "get", "JSON-RPC", "RPC", "gRPC", "Web", "WebSocket", "ocket")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Expose a WebSocket and a JSON-RPC endpoint",
+        "target: grpc service with a GETTER",
+        "no protocol surface here",
+        "",
+    ],
+)
+@pytest.mark.parametrize("fold", [str.lower, str.upper])
+def test_hits_match_substring_semantics(text: str, fold) -> None:
+    matcher = VerbMatcher(_VERBS, fold)
+    expected = frozenset(verb for verb in _VERBS if fold(verb) in fold(text))
+
+    assert matcher.hits(text) == expected
+    assert matcher.search(text) is bool(expected)
+
+
+def test_empty_verb_matches_every_text_and_empty_list_matches_none() -> None:
+    assert VerbMatcher(("", "GET")).hits("") == frozenset({""})
+    assert VerbMatcher(()).search("GET /health") is False
+
+
+def test_compile_verbs_reuses_automaton_for_same_verb_list() -> None:
+    verbs = ("ratifies", "preserves")
+
+    assert compile_verbs(verbs) is compile_verbs(list(verbs))
+    assert compile_verbs(verbs) is not compile_verbs(verbs, fold=str.upper)
+
+
+def test_loader_reuses_verb_list_until_override_changes(tmp_path: Path) -> None:
+    override = tmp_path / ".nwave" / "protocol-verbs.txt"
+    override.parent.mkdir()
+    override.write_text("my-custom-verb\n", encoding="utf-8")
+    loader = PlaintextVerbLoader(cwd_root=tmp_path)
+
+    first = loader.load_protocol_verbs("en")
+    assert loader.load_protocol_verbs("en") is first
+
+    override.write_text("my-custom-verb\nanother-verb\n", encoding="utf-8")
+    os.utime(override, ns=(0, 0))
+
+    reloaded = loader.load_protocol_verbs("en")
+    assert "another-verb" in reloaded
+    assert "another-verb" not in first
+
+
+def test_loader_does_not_keep_missing_framework_list(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from nwave_ai.feature_delta.adapters import verbs as verbs_module
+
+    loader = PlaintextVerbLoader(cwd_root=tmp_path)
+    with monkeypatch.context() as patched:
+        patched.setattr(verbs_module, "_VERB_DIR", tmp_path / "missing")
+        assert loader.load_protocol_verbs("en") == ()
+
+    assert "REST" in loader.load_protocol_verbs("en")
@@ -1,6 +1,7 @@
-"""Parametrized test verifying all check classes expose the name/description protocol.
+"""Parametrized test verifying all check classes expose the check protocol.
 
-Each check must have non-empty `name` and `description` class attributes.
+Each check must have non-empty `name` and `description` class attributes and
+declare its I/O nature through a boolean `blocking_io` class attribute.
 This single parametrized test replaces 7 identical copies across check test files.
 """
 
@@ -29,8 +30,9 @@ from nwave_ai.doctor.checks.shims_deployed import ShimsDeployedCheck
     ],
 )
 def test_check_has_name_and_description(check_class: type) -> None:
-    """Every check class exposes non-empty name and description class attributes."""
+    """Every check class exposes name, description and blocking_io class attributes."""
     assert isinstance(check_class.name, str)
     assert len(check_class.name) > 0
     assert isinstance(check_class.description, str)
     assert len(check_class.description) > 0
+    assert isinstance(check_class.blocking_io, bool)
@@ -0,0 +1,117 @@
+"""Tests for fingerprint-cached doctor runs.
+
+Tests enter through run_doctor_cached() as the driving port against a staged
+~/.claude in tmp_path, counting real run_doctor() executions.
+
+Test Budget: 5 behaviors x 2 = 10 max. Using 7 tests.
+Behaviors:
+  1. An unchanged installation reuses the stored results
+  2. Install changes (settings, shims, interpreter) invalidate the results
+  3. refresh=True runs every check and replaces the stored results
+  4. Unusable or expired caches fall back to a full run
+  5. A run with a timed-out check is not stored
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+import nwave_ai.doctor.cache as cache_module
+import nwave_ai.doctor.runner as runner_module
+import pytest
+from nwave_ai.doctor.context import DoctorContext
+
+from tests.nwave_ai.doctor.test_runner import _stage_healthy_claude
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def context(tmp_path: Path) -> DoctorContext:
+    _stage_healthy_claude(tmp_path)
+    return DoctorContext(home_dir=tmp_path)
+
+
+@pytest.fixture
+def doctor_runs(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count real run_doctor() executions behind run_doctor_cached()."""
+    runs: list[int] = []
+    real_run_doctor = runner_module.run_doctor
+
+    def counting_run_doctor(ctx, **kwargs):
+        runs.append(1)
+        return real_run_doctor(ctx, **kwargs)
+
+    monkeypatch.setattr(runner_module, "run_doctor", counting_run_doctor)
+    return runs
+
+
+def test_unchanged_install_reuses_results(context, doctor_runs) -> None:
+    first = runner_module.run_doctor_cached(context)
+    second = runner_module.run_doctor_cached(context)
+
+    assert len(doctor_runs) == 1
+    assert second == first
+    assert second[0].check_name == "python_version"
+
+
+@pytest.mark.parametrize("change", ["settings", "shim_mode", "interpreter"])
+def test_install_change_invalidates_results(
+    context, doctor_runs, monkeypatch, change
+) -> None:
+    runner_module.run_doctor_cached(context)
+
+    if change == "settings":
+        context.settings_path.write_text(json.dumps({"hooks": {}}))
+    elif change == "shim_mode":
+        (context.claude_dir / "bin" / "des-roadmap").chmod(0o644)
+    else:
+        monkeypatch.setattr("sys.version", "3.99.0 (fake)")
+    runner_module.run_doctor_cached(context)
+
+    assert len(doctor_runs) == 2
+
+
+def test_refresh_runs_checks_and_replaces_results(context, doctor_runs) -> None:
+    runner_module.run_doctor_cached(context)
+    cache_module.cache_path(context).write_text("{}")
+
+    runner_module.run_doctor_cached(context, refresh=True)
+    runner_module.run_doctor_cached(context)
+
+    assert len(doctor_runs) == 2
+
+
+@pytest.mark.parametrize("stored", ["corrupt", "expired"])
+def test_unusable_cache_falls_back_to_full_run(context, doctor_runs, stored) -> None:
+    runner_module.run_doctor_cached(context)
+    path = cache_module.cache_path(context)
+    if stored == "corrupt":
+        path.write_text("{not json")
+    else:
+        data = json.loads(path.read_text())
+        data["created_at"] = time.time() - cache_module.MAX_AGE_SECONDS - 1
+        path.write_text(json.dumps(data))
+
+    results = runner_module.run_doctor_cached(context)
+
+    assert len(doctor_runs) == 2
+    assert len(results) == 8
+
+
+def test_timed_out_run_is_not_stored(context, doctor_runs, monkeypatch) -> None:
+    real_run_doctor = runner_module.run_doctor
+
+    def run_with_timeout(ctx):
+        results = real_run_doctor(ctx)
+        results[-1].timed_out = True
+        return results
+
+    monkeypatch.setattr(runner_module, "run_doctor", run_with_timeout)
+    runner_module.run_doctor_cached(context)
+
+    assert not cache_module.cache_path(context).exists()
@@ -133,3 +133,32 @@ def test_render_json_has_summary_dict() -> None:
     assert summary["total"] == 7
     assert summary["passed"] == 6
     assert summary["failed"] == 1
+
+
+def test_render_timings_lists_each_check_duration() -> None:
+    """render_timings() prints one duration per check and flags timeouts."""
+    results = _make_results()
+    results[0].duration_seconds = 0.0123
+    results[1].timed_out = True
+
+    lines = formatter.render_timings(results).splitlines()
+
+    assert lines[0] == "Timings:"
+    assert len(lines) == 8
+    assert lines[1].split() == ["12.3", "ms", "python_version"]
+    assert lines[2].endswith("des_module (timed out)")
+    assert lines[3].split() == ["-", "ms", "hooks_registered"]
+
+
+def test_render_json_with_timings_adds_duration_ms() -> None:
+    """render_json(timings=True) adds duration_ms and timed_out to every check."""
+    results = _make_results()
+    results[0].duration_seconds = 0.5
+
+    plain = json.loads(formatter.render_json(results))
+    timed = json.loads(formatter.render_json(results, timings=True))
+
+    assert "duration_ms" not in plain["checks"][0]
+    assert timed["checks"][0]["duration_ms"] == 500.0
+    assert timed["checks"][1]["duration_ms"] is None
+    assert timed["checks"][0]["timed_out"] is False
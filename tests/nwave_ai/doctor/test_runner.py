@@ -2,20 +2,26 @@
 
 Tests enter through run_doctor() as the driving port.
 Integration tests stage a fake ~/.claude in tmp_path for hermetic filesystem checks.
+Scheduling tests register stand-in checks whose run() blocks on an event.
 """
 
 from __future__ import annotations
 
 import json
 import sys
+import threading
+import time
 from typing import TYPE_CHECKING
 
+from nwave_ai.common.check_result import CheckResult
 from nwave_ai.doctor.runner import run_doctor
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pytest
+
 
 def _stage_healthy_claude(base: Path) -> Path:
     """Stage a minimal healthy ~/.claude directory under base.
@@ -106,3 +112,75 @@ def test_runner_preserves_check_order(tmp_path: Path) -> None:
     assert results[5].check_name == "path_env"
     assert results[6].check_name == "framework_files"
     assert results[7].check_name == "documentation_density"
+
+
+class _BlockingCheck:
+    """Stand-in blocking_io check that waits for *release* before passing."""
+
+    blocking_io = True
+
+    def __init__(self, name: str, release: threading.Event) -> None:
+        self.name = name
+        self._release = release
+
+    def run(self, context) -> CheckResult:
+        self._release.wait(timeout=10)
+        return CheckResult(
+            passed=True, error_code=None, message="done", remediation=None
+        )
+
+
+def test_runner_runs_blocking_checks_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Blocking checks overlap: each one only finishes once all have started."""
+    from nwave_ai.doctor.context import DoctorContext
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _RendezvousCheck(_BlockingCheck):
+        def run(self, context) -> CheckResult:
+            barrier.wait()
+            return super().run(context)
+
+    released = threading.Event()
+    released.set()
+    checks = [_RendezvousCheck(f"probe_{i}", released) for i in range(3)]
+    monkeypatch.setattr("nwave_ai.doctor.runner._CHECKS", checks)
+
+    results = run_doctor(DoctorContext(home_dir=tmp_path))
+
+    assert [r.check_name for r in results] == ["probe_0", "probe_1", "probe_2"]
+    assert all(r.passed and r.duration_seconds is not None for r in results)
+
+
+def test_runner_reports_stalled_check_as_timed_out(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A check past its deadline yields a timed_out result; the rest still report."""
+    from nwave_ai.doctor.context import DoctorContext
+
+    stalled = threading.Event()
+    released = threading.Event()
+    released.set()
+    monkeypatch.setattr(
+        "nwave_ai.doctor.runner._CHECKS",
+        [
+            _BlockingCheck("fast_before", released),
+            _BlockingCheck("stalled", stalled),
+            _BlockingCheck("fast_after", released),
+        ],
+    )
+
+    start = time.monotonic()
+    try:
+        results = run_doctor(DoctorContext(home_dir=tmp_path), timeout=0.2)
+    finally:
+        stalled.set()
+    elapsed = time.monotonic() - start
+
+    assert [r.check_name for r in results] == ["fast_before", "stalled", "fast_after"]
+    assert [r.timed_out for r in results] == [False, True, False]
+    assert results[1].passed is False
+    assert results[1].error_code == "CHECK_TIMED_OUT"
+    assert elapsed < 2
@@ -71,3 +71,49 @@ def test_doctor_help_shows_flags() -> None:
     assert "--json" in stdout or "json" in stdout.lower(), (
         f"Expected --json flag in help output: {stdout!r}"
     )
+
+
+def test_doctor_no_cache_flag_forces_a_full_run(tmp_path) -> None:
+    """nwave-ai doctor --no-cache runs every check even if results are cached."""
+    import nwave_ai.doctor.runner as runner_module
+    from nwave_ai.doctor.context import DoctorContext
+
+    runs: list[int] = []
+    real_run_doctor = runner_module.run_doctor
+
+    def counting_run_doctor(context):
+        runs.append(1)
+        return real_run_doctor(context)
+
+    with (
+        patch.object(
+            DoctorContext, "from_defaults", return_value=DoctorContext(tmp_path)
+        ),
+        patch.object(runner_module, "run_doctor", counting_run_doctor),
+    ):
+        _invoke(["doctor"])
+        _invoke(["doctor"])
+        exit_code, _ = _invoke(["doctor", "--no-cache"])
+        _, help_text = _invoke(["doctor", "--help"])
+
+    assert exit_code in (0, 1)
+    assert len(runs) == 2, "cached run should be reused; --no-cache should not"
+    assert "--no-cache" in help_text
+
+
+def test_doctor_timings_flag_reports_per_check_durations(tmp_path) -> None:
+    """nwave-ai doctor --timings runs every check and prints how long each took."""
+    from nwave_ai.doctor.context import DoctorContext
+
+    with patch.object(
+        DoctorContext, "from_defaults", return_value=DoctorContext(tmp_path)
+    ):
+        _invoke(["doctor"])
+        exit_code, stdout = _invoke(["doctor", "--timings"])
+        _, json_out = _invoke(["doctor", "--json", "--timings"])
+
+    assert exit_code in (0, 1)
+    assert "Timings:" in stdout
+    assert "ms  python_version" in stdout
+    checks = json.loads(json_out)["checks"]
+    assert all(isinstance(c["duration_ms"], float) for c in checks)
@@ -0,0 +1,124 @@
+"""Unit test: RegistryIndex answers collision checks like a linear scan.
+
+Driving port: ``CollisionDetector.check`` / ``check_against`` over a
+RegistryIndex built once per snapshot. The index must return exactly the
+Tier-1 ids and Tier-2 (id, score) pairs, in snapshot order, that a
+brute-force scan over every outcome returns — including scores sitting
+exactly on the 0.4 threshold that the size prune must keep.
+"""
+
+from __future__ import annotations
+
+import random
+
+from nwave_ai.outcomes.application.collision_detector import (
+    CollisionDetector,
+    TargetShape,
+)
+from nwave_ai.outcomes.application.registry_index import RegistryIndex
+from nwave_ai.outcomes.domain.jaccard import score, tokenize
+from nwave_ai.outcomes.domain.outcome import InputShape, Outcome, OutputShape
+from nwave_ai.outcomes.domain.shape import normalize_shape
+
+
+_VOCABULARY = ("alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa")
+_SHAPES = ("int", "str", "(a: int)", "( b : int )", "list[str]")
+
+
+def _outcome(
+    id_: str, input_shape: str, output_shape: str, keywords: tuple[str, ...]
+) -> Outcome:
+    return Outcome(
+        id=id_,
+        kind="specification",
+        summary="",
+        feature="f",
+        inputs=(InputShape(shape=input_shape),),
+        output=OutputShape(shape=output_shape),
+        keywords=keywords,
+        artifact="",
+        related=(),
+        superseded_by=None,
+    )
+
+
+def _linear_scan(target: TargetShape, snapshot: tuple[Outcome, ...]):
+    shape = (normalize_shape(target.input_shape), normalize_shape(target.output_shape))
+    tier1 = tuple(
+        o.id
+        for o in snapshot
+        if (normalize_shape(o.inputs[0].shape), normalize_shape(o.output.shape))
+        == shape
+    )
+    target_tokens = tokenize(" ".join(target.keywords))
+    tier2 = tuple(
+        (o.id, round(s, 2))
+        for o in snapshot
+        if (s := score(tokenize(" ".join(o.keywords)), target_tokens)) >= 0.4
+    )
+    return tier1, tier2
+
+
+def _random_outcome(rng: random.Random, n: int) -> Outcome:
+    keywords = tuple(rng.sample(_VOCABULARY, rng.randint(0, 5)))
+    return _outcome(f"OUT-{n}", rng.choice(_SHAPES), rng.choice(_SHAPES), keywords)
+
+
+def test_index_matches_linear_scan_on_random_registries() -> None:
+    rng = random.Random(20260210)
+    snapshot = tuple(_random_outcome(rng, n) for n in range(300))
+    detector = CollisionDetector()
+
+    for _ in range(100):
+        probe = _random_outcome(rng, -1)
+        target = TargetShape(
+            input_shape=probe.inputs[0].shape,
+            output_shape=probe.output.shape,
+            keywords=probe.keywords,
+        )
+
+        report = detector.check(target, snapshot)
+
+        assert (report.tier1_matches, report.tier2_matches) == _linear_scan(
+            target, snapshot
+        )
+
+
+def test_score_exactly_at_threshold_survives_size_prune() -> None:
+    # |A & B| = 2, |A | B| = 5 -> 0.4 exactly; size bound 2/5 == 0.4.
+    snapshot = (
+        _outcome(
+            "OUT-EDGE", "int", "str", ("alpha", "beta", "gamma", "delta", "omega")
+        ),
+        _outcome(
+            "OUT-BELOW",
+            "int",
+            "str",
+            ("alpha", "gamma", "delta", "omega", "sigma", "kappa"),
+        ),
+    )
+
+    report = CollisionDetector().check(
+        TargetShape(input_shape="x", output_shape="y", keywords=("alpha", "beta")),
+        snapshot,
+    )
+
+    assert report.tier2_matches == (("OUT-EDGE", 0.4),)
+
+
+def test_exclude_id_drops_only_that_outcome_from_both_tiers() -> None:
+    snapshot = (
+        _outcome("OUT-A", "int", "str", ("alpha", "beta")),
+        _outcome("OUT-B", "int", "str", ("alpha", "beta")),
+    )
+    index = RegistryIndex.build(snapshot)
+
+    report = CollisionDetector().check_against(
+        TargetShape(input_shape="int", output_shape="str", keywords=("alpha", "beta")),
+        index,
+        exclude_id="OUT-A",
+    )
+
+    assert report.tier1_matches == ("OUT-B",)
+    assert report.tier2_matches == (("OUT-B", 1.0),)
+    assert index.find("OUT-A") is snapshot[0]